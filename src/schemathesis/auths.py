@@ -116,37 +116,156 @@ class RequestsAuth(Generic[Auth]):
         case._auth = self.auth
 
 
+@dataclass
+class RefreshStatistic:
+    """Timings of auth data refreshes made by a caching provider."""
+
+    # Number of calls to the underlying provider
+    refreshes: int = 0
+    # How many of them happened in the background, before the cached data expired
+    background_refreshes: int = 0
+    failed_background_refreshes: int = 0
+    # Total & longest time spent in the underlying provider, in seconds
+    refresh_time: float = 0.0
+    max_refresh_time: float = 0.0
+    # Number of `get` calls that had to wait for fresh auth data & the total waiting time, in seconds
+    stalls: int = 0
+    stall_time: float = 0.0
+
+    def merge(self, other: RefreshStatistic) -> None:
+        self.refreshes += other.refreshes
+        self.background_refreshes += other.background_refreshes
+        self.failed_background_refreshes += other.failed_background_refreshes
+        self.refresh_time += other.refresh_time
+        self.max_refresh_time = max(self.max_refresh_time, other.max_refresh_time)
+        self.stalls += other.stalls
+        self.stall_time += other.stall_time
+
+
 @dataclass
 class CachingAuthProvider(Generic[Auth]):
-    """Caches the underlying auth provider."""
+    """Caches the underlying auth provider.
+
+    With `refresh_ahead`, cached data is refreshed in the background once it is that many seconds away from
+    expiration, while the still valid data is returned to callers. A failed background refresh is retried after
+    a quarter of `refresh_ahead`, so there are a few more attempts before the data expires.
+    """
 
     provider: AuthProvider
     refresh_interval: int = DEFAULT_REFRESH_INTERVAL
     cache_entry: CacheEntry[Auth] | None = None
     # The timer exists here to simplify testing
     timer: Callable[[], float] = time.monotonic
+    refresh_ahead: float | None = None
+    # Updated only with `_refresh_lock` held
+    statistic: RefreshStatistic = field(default_factory=RefreshStatistic)
     _refresh_lock: threading.Lock = field(default_factory=threading.Lock)
+    _background_refreshes: dict[str | int | None, threading.Thread] = field(default_factory=dict)
+    # When the last background refresh failed for each cache key
+    _failed_refreshes: dict[str | int | None, float] = field(default_factory=dict)
+    _background_lock: threading.Lock = field(default_factory=threading.Lock)
 
     def get(self, case: Case, context: AuthContext) -> Auth | None:
         """Get cached auth value."""
         __tracebackhide__ = True
         cache_entry = self._get_cache_entry(case, context)
         if cache_entry is None or self.timer() >= cache_entry.expires:
+            started = time.perf_counter()
             with self._refresh_lock:
-                cache_entry = self._get_cache_entry(case, context)
-                if not (cache_entry is None or self.timer() >= cache_entry.expires):
-                    # Another thread updated the cache
-                    return cache_entry.data
-                # We know that optional auth is possible only inside a higher-level wrapper
                 try:
-                    data: Auth = self.provider.get(case, context)  # type: ignore[assignment]
-                except Exception as exc:
-                    provider_name = self.provider.__class__.__name__
-                    raise AuthenticationError(provider_name, "get", str(exc)) from exc
-                self._set_cache_entry(data, case, context)
-                return data
+                    cache_entry = self._get_cache_entry(case, context)
+                    if not (cache_entry is None or self.timer() >= cache_entry.expires):
+                        # Another thread updated the cache
+                        return cache_entry.data
+                    return self._refresh(case, context)
+                finally:
+                    self.statistic.stalls += 1
+                    self.statistic.stall_time += time.perf_counter() - started
+        if self.refresh_ahead is not None and self.timer() >= cache_entry.expires - self.refresh_ahead:
+            self._refresh_in_background(case, context)
         return cache_entry.data
 
+    def _refresh(self, case: Case, context: AuthContext) -> Auth:
+        # Should be called with `_refresh_lock` held
+        started = time.perf_counter()
+        try:
+            # We know that optional auth is possible only inside a higher-level wrapper
+            data: Auth = self.provider.get(case, context)  # type: ignore[assignment]
+        except Exception as exc:
+            provider_name = self.provider.__class__.__name__
+            raise AuthenticationError(provider_name, "get", str(exc)) from exc
+        finally:
+            elapsed = time.perf_counter() - started
+            self.statistic.refreshes += 1
+            self.statistic.refresh_time += elapsed
+            self.statistic.max_refresh_time = max(self.statistic.max_refresh_time, elapsed)
+        self._set_cache_entry(data, case, context)
+        return data
+
+    def _refresh_in_background(self, case: Case, context: AuthContext) -> None:
+        key = self._cache_key(case, context)
+        with self._background_lock:
+            if key in self._background_refreshes:
+                return
+            failed_at = self._failed_refreshes.get(key)
+            assert self.refresh_ahead is not None
+            if failed_at is not None and self.timer() < failed_at + self.refresh_ahead / 4:
+                # Back off after a failed refresh instead of calling the provider on every access
+                return
+            thread = threading.Thread(
+                target=self._run_background_refresh,
+                args=(key, case, context),
+                name="SchemathesisAuthRefresh",
+                daemon=True,
+            )
+            self._background_refreshes[key] = thread
+        thread.start()
+
+    def _run_background_refresh(self, key: str | int | None, case: Case, context: AuthContext) -> None:
+        try:
+            with self._refresh_lock:
+                cache_entry = self._get_cache_entry(case, context)
+                assert self.refresh_ahead is not None
+                if cache_entry is not None and self.timer() < cache_entry.expires - self.refresh_ahead:
+                    # Already refreshed by another thread
+                    return
+                self.statistic.background_refreshes += 1
+                try:
+                    self._refresh(case, context)
+                except AuthenticationError:
+                    # The cached data is still valid, the refresh is retried after a delay
+                    self.statistic.failed_background_refreshes += 1
+                    with self._background_lock:
+                        self._failed_refreshes[key] = self.timer()
+                else:
+                    with self._background_lock:
+                        self._failed_refreshes.pop(key, None)
+        finally:
+            with self._background_lock:
+                self._background_refreshes.pop(key, None)
+
+    def fork(self) -> None:
+        """Prepare a copy inherited by a worker process.
+
+        Locks could be held by threads of the parent process, and its background refreshes do not run in the copy.
+        The copy counts only its own refreshes, so they can be merged back into the parent statistic.
+        """
+        self._refresh_lock = threading.Lock()
+        self._background_lock = threading.Lock()
+        self._background_refreshes = {}
+        self.statistic = RefreshStatistic()
+
+    def reset_statistic(self) -> None:
+        with self._refresh_lock:
+            self.statistic = RefreshStatistic()
+
+    def merge_statistic(self, statistic: RefreshStatistic) -> None:
+        with self._refresh_lock:
+            self.statistic.merge(statistic)
+
+    def _cache_key(self, case: Case, context: AuthContext) -> str | int | None:
+        return None
+
     def _get_cache_entry(self, case: Case, context: AuthContext) -> CacheEntry[Auth] | None:
         return self.cache_entry
 
@@ -171,12 +290,15 @@ class KeyedCachingAuthProvider(CachingAuthProvider[Auth]):
     cache_by_key: CacheKeyFunction = _noop_key_function
     cache_entries: dict[str | int, CacheEntry[Auth] | None] = field(default_factory=dict)
 
+    def _cache_key(self, case: Case, context: AuthContext) -> str | int:
+        return self.cache_by_key(case, context)
+
     def _get_cache_entry(self, case: Case, context: AuthContext) -> CacheEntry[Auth] | None:
-        key = self.cache_by_key(case, context)
+        key = self._cache_key(case, context)
         return self.cache_entries.get(key)
 
     def _set_cache_entry(self, data: Auth, case: Case, context: AuthContext) -> None:
-        key = self.cache_by_key(case, context)
+        key = self._cache_key(case, context)
         self.cache_entries[key] = CacheEntry(data=data, expires=self.timer() + self.refresh_interval)
 
 
@@ -315,6 +437,7 @@ class AuthStorage(Generic[Auth]):
         *,
         refresh_interval: int | None = DEFAULT_REFRESH_INTERVAL,
         cache_by_key: CacheKeyFunction | None = None,
+        refresh_ahead: float | None = None,
     ) -> FilterableRegisterAuth: ...
 
     @overload
@@ -324,6 +447,7 @@ class AuthStorage(Generic[Auth]):
         *,
         refresh_interval: int | None = DEFAULT_REFRESH_INTERVAL,
         cache_by_key: CacheKeyFunction | None = None,
+        refresh_ahead: float | None = None,
     ) -> FilterableApplyAuth: ...
 
     def __call__(
@@ -332,10 +456,16 @@ class AuthStorage(Generic[Auth]):
         *,
         refresh_interval: int | None = DEFAULT_REFRESH_INTERVAL,
         cache_by_key: CacheKeyFunction | None = None,
+        refresh_ahead: float | None = None,
     ) -> FilterableRegisterAuth | FilterableApplyAuth:
         if provider_class is not None:
-            return self.apply(provider_class, refresh_interval=refresh_interval, cache_by_key=cache_by_key)
-        return self.auth(refresh_interval=refresh_interval, cache_by_key=cache_by_key)
+            return self.apply(
+                provider_class,
+                refresh_interval=refresh_interval,
+                cache_by_key=cache_by_key,
+                refresh_ahead=refresh_ahead,
+            )
+        return self.auth(refresh_interval=refresh_interval, cache_by_key=cache_by_key, refresh_ahead=refresh_ahead)
 
     def set_from_requests(self, auth: requests.auth.AuthBase) -> FilterableRequestsAuth:
         """Use `requests` auth instance as an auth provider."""
@@ -355,6 +485,7 @@ class AuthStorage(Generic[Auth]):
         provider_class: type[AuthProvider],
         refresh_interval: int | None = DEFAULT_REFRESH_INTERVAL,
         cache_by_key: CacheKeyFunction | None = None,
+        refresh_ahead: float | None = None,
         filter_set: FilterSet,
     ) -> None:
         if not issubclass(provider_class, AuthProvider):
@@ -363,15 +494,17 @@ class AuthStorage(Generic[Auth]):
                 f"Auth providers must have `get` and `set` methods. "
                 f"See `schemathesis.AuthProvider` documentation for examples."
             )
+        if refresh_ahead is not None and (refresh_interval is None or not 0 < refresh_ahead < refresh_interval):
+            raise IncorrectUsage("`refresh_ahead` should be a positive number smaller than `refresh_interval`.")
         provider: AuthProvider
         # Apply caching if desired
         instance = provider_class()
         if refresh_interval is not None:
             if cache_by_key is None:
-                provider = CachingAuthProvider(instance, refresh_interval=refresh_interval)
+                provider = CachingAuthProvider(instance, refresh_interval=refresh_interval, refresh_ahead=refresh_ahead)
             else:
                 provider = KeyedCachingAuthProvider(
-                    instance, refresh_interval=refresh_interval, cache_by_key=cache_by_key
+                    instance, refresh_interval=refresh_interval, refresh_ahead=refresh_ahead, cache_by_key=cache_by_key
                 )
         else:
             provider = instance
@@ -385,6 +518,7 @@ class AuthStorage(Generic[Auth]):
         *,
         refresh_interval: int | None = DEFAULT_REFRESH_INTERVAL,
         cache_by_key: CacheKeyFunction | None = None,
+        refresh_ahead: float | None = None,
     ) -> FilterableRegisterAuth:
         filter_set = FilterSet()
 
@@ -394,6 +528,7 @@ class AuthStorage(Generic[Auth]):
                 refresh_interval=refresh_interval,
                 filter_set=filter_set,
                 cache_by_key=cache_by_key,
+                refresh_ahead=refresh_ahead,
             )
             return provider_class
 
@@ -415,6 +550,7 @@ class AuthStorage(Generic[Auth]):
         *,
         refresh_interval: int | None = DEFAULT_REFRESH_INTERVAL,
         cache_by_key: CacheKeyFunction | None = None,
+        refresh_ahead: float | None = None,
     ) -> FilterableApplyAuth:
         filter_set = FilterSet()
 
@@ -428,6 +564,7 @@ class AuthStorage(Generic[Auth]):
                 refresh_interval=refresh_interval,
                 filter_set=filter_set,
                 cache_by_key=cache_by_key,
+                refresh_ahead=refresh_ahead,
             )
             return test
 
@@ -436,6 +573,23 @@ class AuthStorage(Generic[Auth]):
 
         return wrapper  # type: ignore[return-value]
 
+    def caching_providers(self) -> list[CachingAuthProvider]:
+        providers = []
+        for provider in self.providers:
+            if isinstance(provider, SelectiveAuthProvider):
+                provider = provider.provider
+            if isinstance(provider, CachingAuthProvider):
+                providers.append(provider)
+        return providers
+
+    def refresh_statistic(self) -> RefreshStatistic | None:
+        """Combined refresh timings of providers that refresh ahead, if any of them called the underlying provider."""
+        combined = RefreshStatistic()
+        for provider in self.caching_providers():
+            if provider.refresh_ahead is not None:
+                combined.merge(provider.statistic)
+        return combined if combined.refreshes else None
+
     def set(self, case: Case, context: AuthContext) -> None:
         """Set authentication data on a generated test case."""
         __tracebackhide__ = True
@@ -524,12 +678,15 @@ def auth(
     *,
     refresh_interval: int | None = DEFAULT_REFRESH_INTERVAL,
     cache_by_key: CacheKeyFunction | None = None,
+    refresh_ahead: float | None = None,
 ) -> FilterableRegisterAuth:
     """Register a dynamic authentication provider for APIs with expiring tokens.
 
     Args:
         refresh_interval: Seconds between token refreshes. Default is `300`. Use `None` to disable caching
         cache_by_key: Function to generate cache keys for different auth contexts (e.g., OAuth scopes)
+        refresh_ahead: Seconds before expiration when tokens are refreshed in the background,
+            so tests keep using the current token instead of waiting for a new one
 
     Example:
         ```python
@@ -553,7 +710,9 @@ def auth(
         ```
 
     """
-    return GLOBAL_AUTH_STORAGE.auth(refresh_interval=refresh_interval, cache_by_key=cache_by_key)
+    return GLOBAL_AUTH_STORAGE.auth(
+        refresh_interval=refresh_interval, cache_by_key=cache_by_key, refresh_ahead=refresh_ahead
+    )
 
 
 auth.__dict__ = GLOBAL_AUTH_STORAGE.auth.__dict__
@@ -80,6 +80,18 @@ class CheckContext:
         if self._recorder is not None:
             yield from self._recorder.find_all_cases()
 
+    def _find_successful_cases(
+        self,
+        *,
+        operation_filter: Callable[[str, str], bool],
+        after: str | None = None,
+        before: str | None = None,
+    ) -> Iterator[Case]:
+        if self._recorder is not None:
+            yield from self._recorder.find_successful_cases(
+                operation_filter=operation_filter, after=after, before=before
+            )
+
     def _find_response(self, *, case_id: str) -> Response | None:
         if self._recorder is not None:
             return self._recorder.find_response(case_id=case_id)
@@ -7,6 +7,7 @@ from typing import Any
 import click
 
 from schemathesis.cli.commands.data import Data
+from schemathesis.cli.commands.merge import merge_reports as merge_command
 from schemathesis.cli.commands.run import run as run_command
 from schemathesis.cli.constants import EXTENSIONS_DOCUMENTATION_URL
 from schemathesis.cli.core import get_terminal_width
@@ -140,3 +141,9 @@ run = schemathesis.command(
     cls=CommandWithGroupedOptions,
     context_settings={"terminal_width": get_terminal_width(), **CONTEXT_SETTINGS},
 )(run_command)
+
+merge = schemathesis.command(
+    name="merge-reports",
+    short_help="Merge reports of test runs split with `--shard`",
+    context_settings=CONTEXT_SETTINGS,
+)(merge_command)
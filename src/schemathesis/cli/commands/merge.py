@@ -0,0 +1,240 @@
+"""Merging reports of a test run split into shards with `--shard`."""
+
+from __future__ import annotations
+
+import gzip
+import json
+from collections import Counter
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+from typing import IO, Any
+from xml.etree import ElementTree
+
+import click
+
+from schemathesis.config import ReportFormat
+
+VCR_INTERACTIONS_KEY = "http_interactions:"
+JUNIT_RESULT_TAGS = ("failure", "error", "skipped")
+# Events that are the same in all shards, taken only from the first report
+RUN_LEVEL_EVENTS = frozenset({"Initialize", "LoadingStarted", "LoadingFinished"})
+
+
+@click.argument(  # type: ignore[untyped-decorator]
+    "reports",
+    nargs=-1,
+    required=True,
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+)
+@click.option(  # type: ignore[untyped-decorator]
+    "--output",
+    "-o",
+    "output",
+    required=True,
+    help="Where to write the merged report",
+    metavar="PATH",
+    type=click.Path(dir_okay=False, writable=True, path_type=Path),
+)
+def merge_reports(reports: tuple[Path, ...], output: Path) -> None:
+    """Merge reports of the same format produced by sharded runs into a single report.
+
+    Supports NDJSON, JUnit XML, VCR and HAR reports.
+    """
+    formats = {path: detect_format(path) for path in reports}
+    unknown = [str(path) for path, format in formats.items() if format is None]
+    if unknown:
+        raise click.UsageError(f"Unable to detect the report format: {', '.join(unknown)}")
+    kinds = set(formats.values())
+    if len(kinds) > 1:
+        raise click.UsageError("All reports must have the same format")
+    (format,) = kinds
+    assert format is not None
+    output.parent.mkdir(parents=True, exist_ok=True)
+    summary = MERGERS[format](list(reports), output)
+    click.echo(f"Merged {len(reports)} {format.value.upper()} reports into {output}")
+    for name, value in summary.items():
+        click.echo(f"  {name}: {value}")
+
+
+def _open_text(path: Path) -> IO[str]:
+    """Open a report, decompressing cassettes written with `.gz` or `.zst` suffix."""
+    if path.suffix == ".gz":
+        return gzip.open(path, "rt", encoding="utf-8")
+    if path.suffix == ".zst":
+        try:
+            from compression import zstd
+        except ImportError:
+            raise click.UsageError(
+                f"Can't read `{path}`: Zstandard compression requires Python 3.14 or later"
+            ) from None
+
+        return zstd.open(path, "rt", encoding="utf-8")
+    return path.open(encoding="utf-8")
+
+
+def detect_format(path: Path) -> ReportFormat | None:
+    """Detect the report format from the file content."""
+    with _open_text(path) as fd:
+        head = fd.read(1024).lstrip()
+    if head.startswith("<"):
+        return ReportFormat.JUNIT
+    if head.startswith('{"Initialize"'):
+        return ReportFormat.NDJSON
+    if head.startswith("command:"):
+        return ReportFormat.VCR
+    if head.startswith("{"):
+        return ReportFormat.HAR
+    return None
+
+
+def merge_ndjson(reports: Sequence[Path], output: Path) -> dict[str, Any]:
+    """Concatenate events of all shards, keeping a single set of run-level events.
+
+    The merged run takes as long as the slowest shard.
+    """
+    statuses: Counter[str] = Counter()
+    labels = set()
+    engine_finished: dict[str, Any] | None = None
+    with output.open("w", encoding="utf-8") as fd:
+        for idx, path in enumerate(reports):
+            for line in _read_lines(path):
+                event = json.loads(line)
+                ((name, data),) = event.items()
+                if name == "EngineFinished":
+                    engine_finished = _merge_engine_finished(engine_finished, data)
+                    continue
+                if idx > 0 and name in RUN_LEVEL_EVENTS:
+                    continue
+                if name == "ScenarioFinished":
+                    statuses[data.get("status", "unknown")] += 1
+                    label = data.get("recorder", {}).get("label")
+                    if label is not None:
+                        labels.add(label)
+                fd.write(line)
+                fd.write("\n")
+        if engine_finished is not None:
+            fd.write(json.dumps({"EngineFinished": engine_finished}, separators=(",", ":")))
+            fd.write("\n")
+    summary: dict[str, Any] = {"Tested operations": len(labels)}
+    summary.update({f"Scenarios ({status})": count for status, count in sorted(statuses.items())})
+    if engine_finished is not None:
+        summary["Running time"] = f"{engine_finished.get('running_time', 0.0):.2f}s"
+    return summary
+
+
+def _read_lines(path: Path) -> Iterator[str]:
+    with path.open(encoding="utf-8") as fd:
+        for line in fd:
+            line = line.rstrip("\n")
+            if line:
+                yield line
+
+
+def _merge_engine_finished(target: dict[str, Any] | None, source: dict[str, Any]) -> dict[str, Any]:
+    if target is None:
+        return source
+    merged = dict(source)
+    merged["running_time"] = max(target.get("running_time", 0.0), source.get("running_time", 0.0))
+    merged["timestamp"] = max(target.get("timestamp", 0.0), source.get("timestamp", 0.0))
+    deduplications = [data["deduplication"] for data in (target, source) if data.get("deduplication")]
+    if deduplications:
+        keys = {key for deduplication in deduplications for key in deduplication}
+        merged["deduplication"] = {
+            key: sum(deduplication.get(key, 0) for deduplication in deduplications) for key in sorted(keys)
+        }
+    refreshes = [data["auth"] for data in (target, source) if data.get("auth")]
+    if refreshes:
+        keys = {key for refresh in refreshes for key in refresh}
+        merged["auth"] = {
+            key: (max if key == "max_refresh_time" else sum)(refresh.get(key, 0) for refresh in refreshes)
+            for key in sorted(keys)
+        }
+    return merged
+
+
+def merge_junit(reports: Sequence[Path], output: Path) -> dict[str, Any]:
+    """Combine test cases of all shards into a single test suite with recomputed counters."""
+    testcases: list[ElementTree.Element] = []
+    hostname = None
+    for path in reports:
+        root = ElementTree.parse(path).getroot()
+        for suite in root.iter("testsuite"):
+            hostname = hostname or suite.get("hostname")
+            testcases.extend(suite.findall("testcase"))
+    counts = {tag: sum(1 for testcase in testcases if testcase.find(tag) is not None) for tag in JUNIT_RESULT_TAGS}
+    elapsed = sum(float(testcase.get("time", 0.0)) for testcase in testcases)
+    attributes = {
+        "disabled": "0",
+        "errors": str(counts["error"]),
+        "failures": str(counts["failure"]),
+        "tests": str(len(testcases)),
+        "time": str(elapsed),
+    }
+    root = ElementTree.Element("testsuites", attributes)
+    suite = ElementTree.SubElement(
+        root,
+        "testsuite",
+        {
+            **attributes,
+            "name": "schemathesis",
+            "skipped": str(counts["skipped"]),
+            **({"hostname": hostname} if hostname else {}),
+        },
+    )
+    suite.extend(testcases)
+    tree = ElementTree.ElementTree(root)
+    ElementTree.indent(tree, space="\t")
+    tree.write(output, encoding="utf-8", xml_declaration=True)
+    return {
+        "Tests": len(testcases),
+        "Failures": counts["failure"],
+        "Errors": counts["error"],
+        "Skipped": counts["skipped"],
+    }
+
+
+def merge_vcr(reports: Sequence[Path], output: Path) -> dict[str, Any]:
+    """Append interactions of all shards after the header of the first cassette.
+
+    Interaction IDs are unique test case IDs, so they don't clash between shards.
+    """
+    interactions = 0
+    with output.open("w", encoding="utf-8") as fd:
+        for idx, path in enumerate(reports):
+            with _open_text(path) as report:
+                content = report.read()
+            header, _, body = content.partition(VCR_INTERACTIONS_KEY)
+            if idx == 0:
+                fd.write(header)
+                fd.write(VCR_INTERACTIONS_KEY)
+            body = body.rstrip("\n")
+            interactions += body.count("\n- id: ")
+            fd.write(body)
+        fd.write("\n")
+    return {"Interactions": interactions}
+
+
+def merge_har(reports: Sequence[Path], output: Path) -> dict[str, Any]:
+    """Combine entries of all shards ordered by their start time."""
+    merged: dict[str, Any] | None = None
+    entries: list[dict[str, Any]] = []
+    for path in reports:
+        with _open_text(path) as fd:
+            data = json.load(fd)
+        if merged is None:
+            merged = data
+        entries.extend(data["log"].get("entries", []))
+    assert merged is not None
+    entries.sort(key=lambda entry: entry.get("startedDateTime", ""))
+    merged["log"]["entries"] = entries
+    with output.open("w", encoding="utf-8") as fd:
+        json.dump(merged, fd, indent=2)
+    return {"Entries": len(entries)}
+
+
+MERGERS = {
+    ReportFormat.NDJSON: merge_ndjson,
+    ReportFormat.JUNIT: merge_junit,
+    ReportFormat.VCR: merge_vcr,
+    ReportFormat.HAR: merge_har,
+}
@@ -10,6 +10,7 @@ from click.utils import LazyFile
 from schemathesis.checks import CHECKS, load_all_checks
 from schemathesis.cli.commands.run import executor, validation
 from schemathesis.cli.commands.run.filters import with_filters
+from schemathesis.cli.commands.run.sharding import Shard, ShardStrategy
 from schemathesis.cli.constants import COLOR_OPTIONS_INVALID_USAGE_MESSAGE, MAX_WORKERS, MIN_WORKERS
 from schemathesis.cli.core import ensure_color
 from schemathesis.cli.ext.groups import group, grouped_option
@@ -22,10 +23,12 @@ from schemathesis.cli.ext.options import (
 from schemathesis.config import (
     DEFAULT_REPORT_DIRECTORY,
     HealthCheck,
+    HttpClient,
     ReportFormat,
     SchemathesisConfig,
     SchemathesisWarning,
     WarningsConfig,
+    WorkersMode,
 )
 from schemathesis.core import HYPOTHESIS_IN_MEMORY_DATABASE_IDENTIFIER
 from schemathesis.core.transport import DEFAULT_RESPONSE_TIMEOUT
@@ -67,6 +70,15 @@ DEFAULT_PHASES = ["examples", "coverage", "fuzzing", "stateful"]
     callback=validation.convert_workers,
     metavar="",
 )
+@grouped_option(
+    "--workers-mode",
+    "workers_mode",
+    help="Run workers as threads, or as separate processes for CPU-bound test generation",
+    type=click.Choice([item.value for item in WorkersMode]),
+    default=None,
+    callback=validation.validate_workers_mode,
+    metavar="",
+)
 @grouped_option(
     "--phases",
     help="A comma-separated list of test phases to run",
@@ -87,6 +99,15 @@ DEFAULT_PHASES = ["examples", "coverage", "fuzzing", "stateful"]
     default=None,
     envvar="SCHEMATHESIS_WAIT_FOR_SCHEMA",
 )
+@grouped_option(
+    "--schema-cache",
+    "schema_cache",
+    help="Directory for caching parsed schema documents between runs. Disabled by default",
+    type=click.Path(file_okay=False),
+    default=None,
+    metavar="DIRECTORY",
+    envvar="SCHEMATHESIS_SCHEMA_CACHE",
+)
 @grouped_option(
     "--warnings",
     help="Control warning display: 'off' to disable all, or comma-separated list of warning types to enable",
@@ -175,6 +196,37 @@ DEFAULT_PHASES = ["examples", "coverage", "fuzzing", "stateful"]
     default=None,
     show_default=True,
 )
+@grouped_option(
+    "--shard",
+    "shard",
+    help="Test only the INDEX-th of COUNT disjoint parts of the selected operations, e.g. `1/4`",
+    type=str,
+    metavar="INDEX/COUNT",
+    callback=validation.validate_shard,
+)
+@grouped_option(
+    "--shard-strategy",
+    "shard_strategy",
+    help="How operations are split into shards: by a stable hash of their labels, or by their estimated cost",
+    type=click.Choice([item.value for item in ShardStrategy]),
+    default=ShardStrategy.HASH.value,
+    show_default=True,
+    metavar="",
+)
+@grouped_option(
+    "--changed-since",
+    "changed_since",
+    help="Test only operations that changed since the given schema file or fingerprints manifest",
+    type=click.Path(exists=True, dir_okay=False),
+    metavar="PATH",
+)
+@grouped_option(
+    "--save-fingerprints",
+    "save_fingerprints_to",
+    help="Save fingerprints of all operations to a manifest file for later `--changed-since` runs",
+    type=click.Path(dir_okay=False),
+    metavar="PATH",
+)
 @group("Network requests options")
 @grouped_option(
     "--header",
@@ -212,7 +264,8 @@ DEFAULT_PHASES = ["examples", "coverage", "fuzzing", "stateful"]
 )
 @grouped_option(
     "--rate-limit",
-    help="Specify a rate limit for test requests in '<limit>/<duration>' format. "
+    help="Specify a rate limit for test requests in '<limit>/<duration>' format, "
+    "or 'adaptive[:<limit>/<duration>]' to adjust it to server feedback. "
     "Example - `100/m` for 100 requests per minute",
     type=str,
     callback=validation.validate_rate_limit,
@@ -246,6 +299,16 @@ DEFAULT_PHASES = ["examples", "coverage", "fuzzing", "stateful"]
     show_default=False,
     callback=validation.validate_request_cert_key,
 )
+@grouped_option(
+    "--http-client",
+    "http_client",
+    help="Send requests via a `requests` session per worker, or via an `httpx` client shared by all workers, "
+    "optionally with HTTP/2",
+    type=click.Choice([item.value for item in HttpClient]),
+    default=None,
+    callback=validation.validate_http_client,
+    metavar="",
+)
 @group("Output options")
 @grouped_option(
     "--report",
@@ -454,9 +517,15 @@ def run(
     include_by: Callable | None = None,
     exclude_by: Callable | None = None,
     exclude_deprecated: bool | None = None,
+    shard: Shard | None = None,
+    shard_strategy: str = ShardStrategy.HASH.value,
+    changed_since: str | None = None,
+    save_fingerprints_to: str | None = None,
     workers: int | None = None,
+    workers_mode: str | None = None,
     base_url: str | None,
     wait_for_schema: float | None = None,
+    schema_cache: str | None = None,
     suppress_health_check: list[HealthCheck] | None,
     warnings: bool | list[SchemathesisWarning] | None,
     rate_limit: str | None = None,
@@ -466,6 +535,7 @@ def run(
     request_cert: str | None = None,
     request_cert_key: str | None = None,
     request_proxy: str | None = None,
+    http_client: str | None = None,
     report_formats: list[ReportFormat] | None,
     report_directory: Path | str = DEFAULT_REPORT_DIRECTORY,
     report_junit_path: LazyFile | None = None,
@@ -523,6 +593,7 @@ def run(
         seed=generation_seed,
         wait_for_schema=wait_for_schema,
         max_failures=max_failures,
+        schema_cache=schema_cache,
     )
     config.output.sanitization.update(enabled=output_sanitize)
     config.output.truncation.update(enabled=output_truncate)
@@ -541,6 +612,7 @@ def run(
         headers=headers or None,
         basic_auth=auth,
         workers=workers,
+        workers_mode=workers_mode,
         continue_on_failure=continue_on_failure,
         rate_limit=rate_limit,
         max_redirects=max_redirects,
@@ -549,6 +621,7 @@ def run(
         request_cert=request_cert,
         request_cert_key=request_cert_key,
         proxy=request_proxy,
+        http_client=http_client,
         warnings=WarningsConfig.from_value([w.value for w in warnings] if isinstance(warnings, list) else warnings)
         if warnings is not None
         else None,
@@ -602,6 +675,10 @@ def run(
     executor.execute(
         location=location,
         filter_set=filter_set,
+        shard=shard,
+        shard_strategy=ShardStrategy(shard_strategy),
+        changed_since=changed_since,
+        save_fingerprints_to=save_fingerprints_to,
         # We don't the project yet, so pass the default config
         config=config.projects.get_default(),
         args=ctx.args,
@@ -36,6 +36,8 @@ class Statistic:
     total_cases: int
     cases_with_failures: int
     cases_without_checks: int
+    # Test cases skipped as duplicates of already executed ones
+    duplicate_cases: int
 
     __slots__ = (
         "failures",
@@ -45,6 +47,7 @@ class Statistic:
         "total_cases",
         "cases_with_failures",
         "cases_without_checks",
+        "duplicate_cases",
     )
 
     def __init__(self) -> None:
@@ -55,6 +58,7 @@ class Statistic:
         self.total_cases = 0
         self.cases_with_failures = 0
         self.cases_without_checks = 0
+        self.duplicate_cases = 0
 
     def on_scenario_finished(self, recorder: ScenarioRecorder) -> None:
         """Update statistics and store failures from a new batch of checks."""
@@ -235,6 +239,8 @@ class ExecutionContext:
             self.find_operation_by_label = event.find_operation_by_label
         if isinstance(event, events.ScenarioFinished):
             self.statistic.on_scenario_finished(event.recorder)
+        elif isinstance(event, events.EngineFinished) and event.deduplication is not None:
+            self.statistic.duplicate_cases = event.deduplication.hits
         elif isinstance(event, events.NonFatalError) or (
             isinstance(event, events.PhaseFinished)
             and event.phase.is_enabled
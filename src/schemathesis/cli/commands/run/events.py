@@ -32,6 +32,7 @@ class LoadingFinished(events.EngineEvent):
         "schema",
         "config",
         "find_operation_by_label",
+        "unchanged_operations",
     )
 
     def __init__(
@@ -46,6 +47,7 @@ class LoadingFinished(events.EngineEvent):
         schema: dict,
         config: ProjectConfig,
         find_operation_by_label: Callable[[str], APIOperation | None],
+        unchanged_operations: int | None = None,
     ) -> None:
         self.id = uuid.uuid4()
         self.timestamp = time.time()
@@ -58,3 +60,5 @@ class LoadingFinished(events.EngineEvent):
         self.base_path = base_path
         self.config = config
         self.find_operation_by_label = find_operation_by_label
+        # Selected operations skipped because they did not change since the previous schema version
+        self.unchanged_operations = unchanged_operations
@@ -8,15 +8,17 @@ import click
 
 from schemathesis.cli.commands.run.context import ExecutionContext
 from schemathesis.cli.commands.run.events import LoadingFinished, LoadingStarted
-from schemathesis.cli.commands.run.handlers import display_handler_error
 from schemathesis.cli.commands.run.handlers.base import EventHandler
 from schemathesis.cli.commands.run.handlers.cassettes import CassetteWriter
+from schemathesis.cli.commands.run.handlers.dispatch import EventDispatcher
 from schemathesis.cli.commands.run.handlers.junitxml import JunitXMLHandler
 from schemathesis.cli.commands.run.handlers.ndjson import NdjsonWriter
 from schemathesis.cli.commands.run.handlers.output import OutputHandler
+from schemathesis.cli.commands.run.incremental import apply_incremental
 from schemathesis.cli.commands.run.loaders import load_schema
+from schemathesis.cli.commands.run.sharding import Shard, ShardStrategy, apply_shard
 from schemathesis.cli.ext.fs import open_file
-from schemathesis.config import ProjectConfig, ReportFormat
+from schemathesis.config import ProjectConfig, ReportFormat, WorkersMode
 from schemathesis.core.errors import LoaderError
 from schemathesis.core.fs import file_exists
 from schemathesis.engine import from_schema
@@ -41,15 +43,40 @@ def execute(
     filter_set: dict[str, Any],
     args: list[str],
     params: dict[str, Any],
+    shard: Shard | None = None,
+    shard_strategy: ShardStrategy = ShardStrategy.HASH,
+    changed_since: str | None = None,
+    save_fingerprints_to: str | None = None,
 ) -> None:
-    event_stream = into_event_stream(location=location, config=config, filter_set=filter_set)
+    event_stream = into_event_stream(
+        location=location,
+        config=config,
+        filter_set=filter_set,
+        shard=shard,
+        shard_strategy=shard_strategy,
+        changed_since=changed_since,
+        save_fingerprints_to=save_fingerprints_to,
+    )
     _execute(event_stream, config=config, args=args, params=params)
 
 
 MISSING_BASE_URL_MESSAGE = "The `--url` option is required when specifying a schema via a file."
+PROCESS_WORKERS_RATE_LIMIT_MESSAGE = (
+    "`--rate-limit` can't be used with `--workers-mode=process`. "
+    "Worker processes can't share a rate limiter, so together they would exceed the configured rate."
+)
 
 
-def into_event_stream(*, location: str, config: ProjectConfig, filter_set: dict[str, Any]) -> EventGenerator:
+def into_event_stream(
+    *,
+    location: str,
+    config: ProjectConfig,
+    filter_set: dict[str, Any],
+    shard: Shard | None = None,
+    shard_strategy: ShardStrategy = ShardStrategy.HASH,
+    changed_since: str | None = None,
+    save_fingerprints_to: str | None = None,
+) -> EventGenerator:
     # The whole engine idea is that it communicates with the outside via events, so handlers can react to them
     # For this reason, even schema loading is done via a separate set of events.
     loading_started = LoadingStarted(location=location)
@@ -60,8 +87,17 @@ def into_event_stream(*, location: str, config: ProjectConfig, filter_set: dict[
         # Schemas don't (yet?) use configs for deciding what operations should be tested, so
         # a separate FilterSet passed there. It combines both config file filters + CLI options
         schema.filter_set = schema.config.operations.create_filter_set(**filter_set)
+        unchanged_operations = None
+        if changed_since is not None or save_fingerprints_to is not None:
+            unchanged_operations = apply_incremental(
+                schema, changed_since=changed_since, save_fingerprints_to=save_fingerprints_to
+            )
+        if shard is not None:
+            apply_shard(schema, shard, shard_strategy)
         if file_exists(location) and schema.config.base_url is None:
             raise click.UsageError(MISSING_BASE_URL_MESSAGE)
+        if schema.config.workers_mode == WorkersMode.PROCESS and _has_rate_limit(schema.config):
+            raise click.UsageError(PROCESS_WORKERS_RATE_LIMIT_MESSAGE)
     except KeyboardInterrupt:
         yield Interrupted(phase=None)
         return
@@ -79,6 +115,7 @@ def into_event_stream(*, location: str, config: ProjectConfig, filter_set: dict[
         config=schema.config,
         base_path=schema.base_path,
         find_operation_by_label=schema.find_operation_by_label,
+        unchanged_operations=unchanged_operations,
     )
 
     try:
@@ -87,6 +124,12 @@ def into_event_stream(*, location: str, config: ProjectConfig, filter_set: dict[
         yield FatalError(exception=exc)
 
 
+def _has_rate_limit(config: ProjectConfig) -> bool:
+    return config.rate_limit is not None or any(
+        operation.rate_limit is not None for operation in config.operations.operations
+    )
+
+
 def initialize_handlers(
     *,
     config: ProjectConfig,
@@ -131,31 +174,22 @@ def _execute(
     args: list[str],
     params: dict[str, Any],
 ) -> None:
-    handlers: list[EventHandler] = []
+    dispatcher: EventDispatcher | None = None
     ctx: ExecutionContext | None = None
 
     def shutdown() -> None:
-        if ctx is not None:
-            for _handler in handlers:
-                _handler.shutdown(ctx)
+        if ctx is not None and dispatcher is not None:
+            dispatcher.shutdown(ctx)
 
     try:
         handlers = initialize_handlers(config=config, args=args, params=params)
         ctx = ExecutionContext(config=config)
-
-        for handler in handlers:
-            handler.start(ctx)
+        dispatcher = EventDispatcher(handlers)
+        dispatcher.start(ctx)
 
         for event in event_stream:
             ctx.on_event(event)
-            for handler in handlers:
-                try:
-                    handler.handle_event(ctx, event)
-                except Exception as exc:
-                    # `Abort` is used for handled errors
-                    if not isinstance(exc, click.Abort):
-                        display_handler_error(handler, exc)
-                    raise
+            dispatcher.dispatch(ctx, event)
     except Exception as exc:
         if isinstance(exc, click.Abort):
             # To avoid showing "Aborted!" message, which is the default behavior in Click
@@ -12,6 +12,10 @@ if TYPE_CHECKING:
 
 
 class EventHandler:
+    # Process events in a separate thread, so a slow handler does not slow down the test run.
+    # Events arrive in order, but `ctx` may already reflect events that the handler has not received yet
+    threaded: bool = False
+
     def __init__(self, *args: Any, **params: Any) -> None: ...
 
     def handle_event(self, ctx: ExecutionContext, event: events.EngineEvent) -> None:
@@ -1,21 +1,25 @@
 from __future__ import annotations
 
 import datetime
+import gzip
+import io
 import json
 import sys
 import threading
 from collections.abc import Callable, Iterator
 from dataclasses import dataclass
 from http.cookies import SimpleCookie
-from queue import Queue
-from typing import IO
+from pathlib import Path
+from queue import Full, Queue
+from typing import IO, BinaryIO, cast
 from urllib.parse import parse_qsl, urlparse
 
 import harfile
 
 from schemathesis.cli.commands.run.context import ExecutionContext
-from schemathesis.cli.commands.run.handlers.base import EventHandler, TextOutput, open_text_output
-from schemathesis.config import ProjectConfig, ReportFormat, SchemathesisConfig
+from schemathesis.cli.commands.run.handlers.base import EventHandler, TextOutput
+from schemathesis.config import CassetteFilter, ProjectConfig, ReportFormat
+from schemathesis.core.errors import IncorrectUsage
 from schemathesis.core.output.sanitization import sanitize_url, sanitize_value
 from schemathesis.core.transforms import deepclone
 from schemathesis.core.transport import Response
@@ -26,6 +30,12 @@ from schemathesis.generation.meta import CoveragePhaseData
 
 # Wait until the worker terminates
 WRITER_WORKER_JOIN_TIMEOUT = 1
+# Maximum number of scenarios waiting to be written. When the writer falls behind, the test run waits for it
+WRITER_QUEUE_SIZE = 256
+# How often to check that the writer is still alive while waiting for a free slot in the queue
+WRITER_QUEUE_PUT_TIMEOUT = 1
+GZIP_SUFFIX = ".gz"
+ZSTD_SUFFIX = ".zst"
 
 
 @dataclass
@@ -50,7 +60,10 @@ class CassetteWriter(EventHandler):
         self.format = format
         self.output = output
         self.config = config
-        self.queue = queue or Queue()
+        if isinstance(output, Path):
+            # Fail early, the writer runs in a separate thread
+            _get_compressor(output)
+        self.queue = queue or Queue(maxsize=WRITER_QUEUE_SIZE)
 
         kwargs = {
             "output": self.output,
@@ -71,16 +84,31 @@ class CassetteWriter(EventHandler):
         self.worker.start()
 
     def start(self, ctx: ExecutionContext) -> None:
-        self.queue.put(Initialize(seed=ctx.config.seed))
+        self._put(Initialize(seed=ctx.config.seed))
 
     def handle_event(self, ctx: ExecutionContext, event: events.EngineEvent) -> None:
         if isinstance(event, events.ScenarioFinished):
-            self.queue.put(Process(recorder=event.recorder))
+            if self.config.reports.cassette_filter == CassetteFilter.FAILURES and event.status not in (
+                Status.FAILURE,
+                Status.ERROR,
+            ):
+                return
+            self._put(Process(recorder=event.recorder))
 
     def shutdown(self, ctx: ExecutionContext) -> None:
-        self.queue.put(Finalize())
+        self._put(Finalize())
         self._stop_worker()
 
+    def _put(self, item: Initialize | Process | Finalize) -> None:
+        # Blocks while the queue is full, unless the writer is gone and won't free any slots
+        while True:
+            try:
+                self.queue.put(item, timeout=WRITER_QUEUE_PUT_TIMEOUT)
+                return
+            except Full:
+                if not self.worker.is_alive():
+                    return
+
     def _stop_worker(self) -> None:
         self.worker.join(WRITER_WORKER_JOIN_TIMEOUT)
 
@@ -110,6 +138,76 @@ class Finalize:
     __slots__ = ()
 
 
+class CassetteFiles:
+    """Text stream for a cassette, optionally compressed and split into multiple files.
+
+    The compression is chosen by the file suffix - `.gz` for gzip and `.zst` for Zstandard (Python 3.14+).
+    With `max_size`, writers start a new file once the current one on disk exceeds it.
+    """
+
+    __slots__ = ("output", "max_size", "stream", "_raw", "_index")
+
+    def __init__(self, output: TextOutput, max_size: int | None = None) -> None:
+        self.output = output
+        self.max_size = max_size
+        self._raw: BinaryIO | None = None
+        self._index = 0
+        self.stream = self._open()
+
+    def _open(self) -> IO[str]:
+        if not isinstance(self.output, Path):
+            # Assume it's already a file-like object
+            return cast(IO[str], self.output)
+        path = _rotated_path(self.output, self._index)
+        compressor = _get_compressor(path)
+        raw = open(path, "wb")
+        self._raw = raw
+        binary: BinaryIO = raw if compressor is None else compressor(raw)
+        # Text goes straight to the buffered binary layer, so its `tell()` includes everything written so far
+        return io.TextIOWrapper(binary, encoding="utf-8", write_through=True)
+
+    @property
+    def should_rotate(self) -> bool:
+        return self.max_size is not None and self._raw is not None and self._raw.tell() >= self.max_size
+
+    def rotate(self) -> IO[str]:
+        """Close the current file and continue in the next one."""
+        self.close()
+        self._index += 1
+        self.stream = self._open()
+        return self.stream
+
+    def close(self) -> None:
+        if self._raw is not None:
+            # Closes the compressor too, so it writes its trailer before the file is closed
+            self.stream.close()
+            self._raw.close()
+            self._raw = None
+
+
+def _get_compressor(path: Path) -> Callable[[BinaryIO], BinaryIO] | None:
+    if path.suffix == GZIP_SUFFIX:
+        return lambda raw: cast(BinaryIO, gzip.GzipFile(fileobj=raw, mode="wb"))
+    if path.suffix == ZSTD_SUFFIX:
+        try:
+            from compression import zstd
+        except ImportError:
+            raise IncorrectUsage(
+                f"Can't write `{path}`: Zstandard compression requires Python 3.14 or later. Use `.gz` instead"
+            ) from None
+        return lambda raw: cast(BinaryIO, zstd.ZstdFile(raw, mode="wb"))
+    return None
+
+
+def _rotated_path(path: Path, index: int) -> Path:
+    """Path of the `index`-th file, e.g. `cassette.2.yaml.gz`."""
+    if index == 0:
+        return path
+    compression = path.suffix if path.suffix in (GZIP_SUFFIX, ZSTD_SUFFIX) else ""
+    base = path.with_suffix("") if compression else path
+    return base.with_name(f"{base.stem}.{index}{base.suffix}{compression}")
+
+
 def get_command_representation() -> str:
     """Get how Schemathesis was run."""
     # It is supposed to be executed from Schemathesis CLI, not via Click's `command.invoke`
@@ -189,7 +287,18 @@ def vcr_writer(output: TextOutput, config: ProjectConfig, queue: Queue) -> None:
                 stream.write(f"    body:\n      encoding: '{encoding}'\n      string: ")
                 write_double_quoted(stream, string)
 
-    with open_text_output(output) as stream:
+    def write_header(stream: IO, seed: int | None) -> None:
+        stream.write(
+            f"command: '{get_command_representation()}'\n"
+            f"recorded_with: 'Schemathesis {SCHEMATHESIS_VERSION}'\n"
+            f"seed: {seed}\n"
+            f"http_interactions:"
+        )
+
+    files = CassetteFiles(output, config.reports.cassette_max_size)
+    stream = files.stream
+    seed = None
+    try:
         while True:
             item = queue.get()
             if isinstance(item, Process):
@@ -286,15 +395,16 @@ def vcr_writer(output: TextOutput, config: ProjectConfig, queue: Queue) -> None:
                         stream.write("\n  response: null")
 
                     current_id += 1
+                if files.should_rotate:
+                    stream = files.rotate()
+                    write_header(stream, seed)
             elif isinstance(item, Initialize):
-                stream.write(
-                    f"command: '{get_command_representation()}'\n"
-                    f"recorded_with: 'Schemathesis {SCHEMATHESIS_VERSION}'\n"
-                    f"seed: {item.seed}\n"
-                    f"http_interactions:"
-                )
+                seed = item.seed
+                write_header(stream, seed)
             else:
                 break
+    finally:
+        files.close()
 
 
 def write_double_quoted(stream: IO, text: str | None) -> None:
@@ -340,8 +450,10 @@ def write_double_quoted(stream: IO, text: str | None) -> None:
     stream.write('"')
 
 
-def har_writer(output: TextOutput, config: SchemathesisConfig, queue: Queue) -> None:
-    with harfile.open(output) as har:
+def har_writer(output: TextOutput, config: ProjectConfig, queue: Queue) -> None:
+    files = CassetteFiles(output, config.reports.cassette_max_size)
+    har = harfile.open(files.stream)
+    try:
         while True:
             item = queue.get()
             if isinstance(item, Process):
@@ -425,8 +537,14 @@ def har_writer(output: TextOutput, config: SchemathesisConfig, queue: Queue) ->
                         response=response,
                         timings=harfile.Timings(send=0, wait=0, receive=time, blocked=0, dns=0, connect=0, ssl=0),
                     )
+                if files.should_rotate:
+                    har.close()
+                    har = harfile.open(files.rotate())
             elif isinstance(item, Finalize):
                 break
+    finally:
+        har.close()
+        files.close()
 
 
 HARFILE_NO_RESPONSE = harfile.Response(
@@ -0,0 +1,127 @@
+"""Delivery of engine events to CLI handlers.
+
+Handlers are called on the main thread by default, which is also the thread that drains events from test workers.
+Handlers with `threaded = True` receive events via a bounded queue processed by a dedicated thread, so a slow handler
+does not stall the test run until its queue is full.
+"""
+
+from __future__ import annotations
+
+import threading
+from queue import Queue
+from typing import TYPE_CHECKING
+
+import click
+
+from schemathesis.cli.commands.run.handlers import display_handler_error
+from schemathesis.cli.commands.run.handlers.base import EventHandler
+from schemathesis.engine import events
+
+if TYPE_CHECKING:
+    from schemathesis.cli.commands.run.context import ExecutionContext
+
+# Maximum number of events waiting to be processed by a threaded handler
+HANDLER_QUEUE_SIZE = 1000
+
+
+class Stop:
+    """Marks that there are no more events for a handler thread."""
+
+
+_STOP = Stop()
+
+
+def _report(handler: EventHandler, exc: BaseException) -> None:
+    # `Abort` is used for handled errors
+    if isinstance(exc, Exception) and not isinstance(exc, click.Abort):
+        display_handler_error(handler, exc)
+
+
+class HandlerThread:
+    """Delivers events to a handler in a separate thread, preserving their order."""
+
+    __slots__ = ("handler", "queue", "thread", "error", "_reported")
+
+    def __init__(self, handler: EventHandler, queue_size: int = HANDLER_QUEUE_SIZE) -> None:
+        self.handler = handler
+        self.queue: Queue[tuple[ExecutionContext, events.EngineEvent] | Stop] = Queue(maxsize=queue_size)
+        self.error: BaseException | None = None
+        self._reported = False
+        self.thread = threading.Thread(
+            name=f"SchemathesisHandler-{type(handler).__name__}", target=self._run, daemon=True
+        )
+        self.thread.start()
+
+    def _run(self) -> None:
+        while True:
+            item = self.queue.get()
+            try:
+                if isinstance(item, Stop):
+                    return
+                if self.error is None:
+                    ctx, event = item
+                    try:
+                        self.handler.handle_event(ctx, event)
+                    except BaseException as exc:
+                        # Keep draining the queue, so the main thread is never blocked by a failed handler
+                        self.error = exc
+            finally:
+                self.queue.task_done()
+
+    def put(self, ctx: ExecutionContext, event: events.EngineEvent) -> None:
+        self.raise_if_failed()
+        # Blocks if the handler is too far behind
+        self.queue.put((ctx, event))
+
+    def wait(self) -> None:
+        """Wait until all pending events are processed."""
+        self.queue.join()
+        self.raise_if_failed()
+
+    def raise_if_failed(self) -> None:
+        if self.error is not None and not self._reported:
+            self._reported = True
+            _report(self.handler, self.error)
+            raise self.error
+
+    def stop(self) -> None:
+        self.queue.put(_STOP)
+        self.thread.join()
+
+
+class EventDispatcher:
+    """Passes engine events to all handlers in order."""
+
+    __slots__ = ("handlers", "threads")
+
+    def __init__(self, handlers: list[EventHandler]) -> None:
+        self.handlers = handlers
+        self.threads: dict[int, HandlerThread] = {}
+
+    def start(self, ctx: ExecutionContext) -> None:
+        for handler in self.handlers:
+            handler.start(ctx)
+            if handler.threaded:
+                self.threads[id(handler)] = HandlerThread(handler)
+
+    def dispatch(self, ctx: ExecutionContext, event: events.EngineEvent) -> None:
+        for handler in self.handlers:
+            thread = self.threads.get(id(handler))
+            if thread is None:
+                try:
+                    handler.handle_event(ctx, event)
+                except Exception as exc:
+                    _report(handler, exc)
+                    raise
+            else:
+                thread.put(ctx, event)
+                if isinstance(event, events.EngineFinished):
+                    # Handlers that follow may render the results, e.g. summary lines added by this handler
+                    thread.wait()
+
+    def shutdown(self, ctx: ExecutionContext) -> None:
+        for handler in self.handlers:
+            thread = self.threads.pop(id(handler), None)
+            if thread is not None:
+                thread.stop()
+            handler.shutdown(ctx)
@@ -19,6 +19,9 @@ class JunitXMLHandler(EventHandler):
 
     __slots__ = ("path", "test_cases")
 
+    # The report is written only at the end of the run
+    threaded = True
+
     def __init__(self, output: TextOutput, test_cases: dict | None = None) -> None:
         self.output = output
         self.test_cases = test_cases or {}
@@ -29,7 +32,8 @@ class JunitXMLHandler(EventHandler):
             test_case = self.get_or_create_test_case(label)
             test_case.elapsed_sec += event.elapsed_time
             if event.status == Status.FAILURE and label in ctx.statistic.failures:
-                add_failure(test_case, ctx.statistic.failures[label].values(), ctx)
+                # Copy, as the main thread may record new failures meanwhile
+                add_failure(test_case, list(ctx.statistic.failures[label].values()), ctx)
             elif event.status == Status.SKIP and event.skip_reason is not None:
                 test_case.add_skipped_info(output=event.skip_reason)
         elif isinstance(event, events.NonFatalError):
@@ -161,6 +161,9 @@ class NdjsonWriter(EventHandler):
 
     __slots__ = ("output", "config", "queue", "worker")
 
+    # Only writes to a file, so it does not need to keep up with the test run
+    threaded = True
+
     def __init__(
         self,
         output: TextOutput,
@@ -26,7 +26,7 @@ from schemathesis.cli.output import (
 )
 from schemathesis.config import ProjectConfig, ReportFormat, SchemathesisWarning
 from schemathesis.core.errors import LoaderError, LoaderErrorKind, format_exception, split_traceback
-from schemathesis.core.failures import MessageBlock, Severity, format_failures
+from schemathesis.core.failures import Failure, MessageBlock, Severity, format_failures
 from schemathesis.core.output import prepare_response_payload
 from schemathesis.core.parameters import ParameterLocation
 from schemathesis.core.result import Ok
@@ -45,6 +45,7 @@ if TYPE_CHECKING:
     from rich.progress import Progress, TaskID
     from rich.text import Text
 
+    from schemathesis.auths import RefreshStatistic
     from schemathesis.generation.stateful.state_machine import ExtractionFailure
 
 DISCORD_LINK = "https://discord.gg/R9ASRAmHnA"
@@ -527,6 +528,7 @@ class StatefulProgressManager:
     scenarios: int
     links_covered: set[str]
     stats: dict[Status, int]
+    failures: set[Failure]
     is_interrupted: bool
 
     __slots__ = (
@@ -546,6 +548,7 @@ class StatefulProgressManager:
         "scenarios",
         "links_covered",
         "stats",
+        "failures",
         "is_interrupted",
     )
 
@@ -597,6 +600,7 @@ class StatefulProgressManager:
             Status.ERROR: 0,
             Status.SKIP: 0,
         }
+        self.failures = set()
         self.is_interrupted = False
 
     def start(self) -> None:
@@ -628,11 +632,19 @@ class StatefulProgressManager:
         if self.live:
             self.live.stop()
 
-    def update(self, links_covered: set[str], status: Status | None = None) -> None:
+    def update(
+        self, links_covered: set[str], status: Status | None = None, failures: set[Failure] | None = None
+    ) -> None:
         """Update progress and stats."""
         self.scenarios += 1
         self.links_covered.update(links_covered)
 
+        if status == Status.FAILURE and failures:
+            # Parallel workers may find the same failures, the ones already reported by another worker are
+            # not counted again, the same way as a single worker does not report them twice
+            if failures <= self.failures:
+                status = Status.SUCCESS
+            self.failures.update(failures)
         if status is not None:
             self.stats[status] += 1
 
@@ -710,6 +722,7 @@ class OutputHandler(EventHandler):
     stateful_tests_manager: StatefulProgressManager | None = None
 
     statistic: ApiStatistic | None = None
+    unchanged_operations: int | None = None
     skip_reasons: list[str] = field(default_factory=list)
     warnings: WarningData = field(default_factory=WarningData)
     errors: set[events.NonFatalError] = field(default_factory=set)
@@ -718,6 +731,10 @@ class OutputHandler(EventHandler):
     )
     console: Console = field(default_factory=make_console)
 
+    # Not threaded: progress should reflect the test run as it happens, and the final summary is rendered from `ctx`,
+    # which a handler thread may observe ahead of its own events. Rendering errors should also abort the run at once
+    threaded = False
+
     def handle_event(self, ctx: ExecutionContext, event: events.EngineEvent) -> None:
         if isinstance(event, events.PhaseStarted):
             self._on_phase_started(event)
@@ -777,6 +794,7 @@ class OutputHandler(EventHandler):
         self.console.print()
         self.loading_manager = None
         self.statistic = event.statistic
+        self.unchanged_operations = event.unchanged_operations
 
         table = Table(
             show_header=False,
@@ -790,7 +808,10 @@ class OutputHandler(EventHandler):
         table.add_row("Base URL:", event.base_url)
         table.add_row("Specification:", event.specification.name)
         statistic = event.statistic.operations
-        table.add_row("Operations:", f"{statistic.selected} selected / {statistic.total} total")
+        operations = f"{statistic.selected} selected / {statistic.total} total"
+        if event.unchanged_operations is not None:
+            operations += f" / {event.unchanged_operations} unchanged"
+        table.add_row("Operations:", operations)
         if event.config.config_path:
             table.add_row("Configuration:", event.config.config_path)
 
@@ -968,7 +989,13 @@ class OutputHandler(EventHandler):
                 for case in event.recorder.cases.values()
                 if case.transition is not None and case.is_transition_applied
             }
-            self.stateful_tests_manager.update(links_seen, event.status)
+            failures = {
+                check.failure_info.failure
+                for checks in event.recorder.checks.values()
+                for check in checks
+                if check.failure_info is not None
+            }
+            self.stateful_tests_manager.update(links_seen, event.status, failures)
             self._check_stateful_warnings(ctx, event)
 
     def _check_warnings(self, ctx: ExecutionContext, event: events.ScenarioFinished) -> None:
@@ -1394,6 +1421,8 @@ class OutputHandler(EventHandler):
             click.echo(_style(f"  Skipped: {click.style(str(total_skips), bold=True)}"))
             for reason in sorted(set(self.skip_reasons)):
                 click.echo(_style(f"    - {reason.rstrip('.')}"))
+        if self.unchanged_operations:
+            click.echo(_style(f"  Unchanged: {click.style(str(self.unchanged_operations), bold=True)}"))
         click.echo()
 
     def display_phases(self) -> None:
@@ -1449,6 +1478,29 @@ class OutputHandler(EventHandler):
             if ctx.statistic.cases_without_checks > 0:
                 parts.append(f"{click.style(str(ctx.statistic.cases_without_checks), bold=True)} skipped")
 
+        if ctx.statistic.duplicate_cases > 0:
+            parts.append(f"{click.style(str(ctx.statistic.duplicate_cases), bold=True)} duplicates skipped")
+
+        click.echo(_style(", ".join(parts) + "\n"))
+
+    def display_auth_refreshes(self, statistic: RefreshStatistic) -> None:
+        click.echo(_style("Auth refreshes:", bold=True))
+        average = statistic.refresh_time / statistic.refreshes
+        parts = [
+            f"  {click.style(str(statistic.refreshes), bold=True)} total",
+            f"{average:.2f}s on average",
+            f"{statistic.max_refresh_time:.2f}s at most",
+        ]
+        if statistic.failed_background_refreshes > 0:
+            parts.append(
+                f"{click.style(str(statistic.failed_background_refreshes), bold=True)} failed in the background"
+            )
+        if statistic.stalls > 0:
+            suffix = "" if statistic.stalls == 1 else "s"
+            parts.append(
+                f"tests waited {click.style(str(statistic.stalls), bold=True)} time{suffix} "
+                f"for {statistic.stall_time:.2f}s in total"
+            )
         click.echo(_style(", ".join(parts) + "\n"))
 
     def display_failures_summary(self, ctx: ExecutionContext) -> None:
@@ -1649,6 +1701,9 @@ class OutputHandler(EventHandler):
             _print_lines(ctx.summary_lines)
             click.echo()
 
+        if event.auth is not None:
+            self.display_auth_refreshes(event.auth)
+
         self.display_test_cases(ctx)
         self.display_reports()
         self.display_seed()
@@ -0,0 +1,84 @@
+"""Testing only operations that changed since a previous version of the schema.
+
+Operations are compared by fingerprints of their definitions, including everything they reference and the operations
+they link to. The previous version is either a schema file or a manifest with fingerprints saved by an earlier run.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import click
+
+from schemathesis.specs.openapi.fingerprints import FINGERPRINT_VERSION, compute_fingerprints
+
+if TYPE_CHECKING:
+    from schemathesis.filters import HasAPIOperation
+    from schemathesis.schemas import BaseSchema
+    from schemathesis.specs.openapi.schemas import OpenApiSchema
+
+# Identifies manifest files and the fingerprint version they were created with
+MANIFEST_KEY = "schemathesis-fingerprints"
+
+
+def ensure_openapi(schema: BaseSchema) -> OpenApiSchema:
+    from schemathesis.specs.openapi.schemas import OpenApiSchema
+
+    if not isinstance(schema, OpenApiSchema):
+        raise click.UsageError("`--changed-since` and `--save-fingerprints` are supported only for Open API schemas")
+    return schema
+
+
+def load_previous_fingerprints(path: str) -> dict[str, str]:
+    """Load fingerprints from a manifest, or compute them for a schema file."""
+    import schemathesis
+    from schemathesis.config import SchemathesisConfig
+
+    try:
+        manifest = json.loads(Path(path).read_text(encoding="utf-8"))
+    except (ValueError, UnicodeDecodeError):
+        manifest = None
+    if isinstance(manifest, dict) and MANIFEST_KEY in manifest:
+        operations = manifest.get("operations")
+        if manifest[MANIFEST_KEY] != FINGERPRINT_VERSION or not isinstance(operations, dict):
+            # Created by a different Schemathesis version - nothing can be considered unchanged
+            return {}
+        return operations
+    schema = schemathesis.openapi.from_path(path, config=SchemathesisConfig())
+    return compute_fingerprints(ensure_openapi(schema))
+
+
+def save_fingerprints(path: str, fingerprints: dict[str, str]) -> None:
+    manifest = {MANIFEST_KEY: FINGERPRINT_VERSION, "operations": fingerprints}
+    Path(path).write_text(json.dumps(manifest, indent=2, sort_keys=True), encoding="utf-8")
+
+
+def apply_incremental(schema: BaseSchema, *, changed_since: str | None, save_fingerprints_to: str | None) -> int | None:
+    """Narrow the selection to changed operations and save fingerprints if needed.
+
+    Returns the number of selected operations that were skipped as unchanged.
+    """
+    openapi_schema = ensure_openapi(schema)
+    # Read before writing, as both could be the same file
+    previous = load_previous_fingerprints(changed_since) if changed_since is not None else None
+    current = compute_fingerprints(openapi_schema)
+    if save_fingerprints_to is not None:
+        save_fingerprints(save_fingerprints_to, current)
+    if previous is None:
+        return None
+    return apply_changed_since(openapi_schema, current, previous)
+
+
+def apply_changed_since(schema: OpenApiSchema, current: dict[str, str], previous: dict[str, str]) -> int:
+    """Exclude operations that did not change and return how many of the selected operations were excluded."""
+    unchanged = {label for label, fingerprint in current.items() if previous.get(label) == fingerprint}
+    # Counted without building operations, only those that other filters keep are relevant
+    skipped = sum(1 for method, path, _ in schema._operation_iter() if f"{method.upper()} {path}" in unchanged)
+
+    def is_unchanged(ctx: HasAPIOperation) -> bool:
+        return ctx.operation.label in unchanged
+
+    schema.filter_set.exclude(is_unchanged)
+    return skipped
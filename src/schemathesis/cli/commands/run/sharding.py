@@ -0,0 +1,100 @@
+"""Splitting a test run across multiple nodes.
+
+Every node loads the same schema and selects its own subset of operations, so the assignment has to depend only on
+data all nodes agree on - operation labels and their schemas.
+"""
+
+from __future__ import annotations
+
+import heapq
+import zlib
+from dataclasses import dataclass
+from enum import Enum
+from typing import TYPE_CHECKING
+
+from schemathesis.core.result import Ok
+
+if TYPE_CHECKING:
+    from schemathesis.filters import HasAPIOperation
+    from schemathesis.schemas import BaseSchema
+
+
+class ShardStrategy(str, Enum):
+    """How operations are assigned to shards."""
+
+    # By a stable hash of the operation label. Assignment of an operation does not depend on other operations
+    HASH = "hash"
+    # Greedily balance the estimated testing cost of shards
+    COST = "cost"
+
+
+@dataclass
+class Shard:
+    """A part of the test run, `index` is 1-based."""
+
+    index: int
+    count: int
+
+    __slots__ = ("index", "count")
+
+    @classmethod
+    def parse(cls, value: str) -> Shard:
+        index, sep, count = value.partition("/")
+        if not sep:
+            raise ValueError(f"Expected `<index>/<count>`, got `{value}`")
+        shard = cls(index=int(index), count=int(count))
+        if shard.count < 1 or not 1 <= shard.index <= shard.count:
+            raise ValueError(f"Shard index must be between 1 and {max(shard.count, 1)}, got `{value}`")
+        return shard
+
+    def __str__(self) -> str:
+        return f"{self.index}/{self.count}"
+
+
+def hash_shard(label: str, count: int) -> int:
+    """Get the 1-based shard index of an operation with the given label."""
+    # `hash` is randomized per process, CRC32 is the same on all nodes
+    return zlib.crc32(label.encode("utf-8")) % count + 1
+
+
+def assign_by_cost(schema: BaseSchema, count: int) -> dict[str, int]:
+    """Assign operations to shards, so that shards have a similar estimated testing cost.
+
+    Uses the longest-processing-time-first rule: the most expensive operation goes to the cheapest shard so far.
+    """
+    from schemathesis.engine.phases import PhaseName
+    from schemathesis.engine.phases.unit._cost import estimate_static_cost
+
+    costs = []
+    for result in schema.get_all_operations():
+        if isinstance(result, Ok):
+            operation = result.ok()
+            phases = [
+                estimate_static_cost(operation, config=schema.config, phase=phase)
+                for phase in (PhaseName.EXAMPLES, PhaseName.COVERAGE, PhaseName.FUZZING)
+            ]
+            costs.append((sum(phases), operation.label))
+    # Ties are broken by label, so the assignment does not depend on the schema order
+    costs.sort(key=lambda item: (-item[0], item[1]))
+    shards = [(0.0, index) for index in range(1, count + 1)]
+    assignment = {}
+    for cost, label in costs:
+        total, index = heapq.heappop(shards)
+        assignment[label] = index
+        heapq.heappush(shards, (total + cost, index))
+    return assignment
+
+
+def apply_shard(schema: BaseSchema, shard: Shard, strategy: ShardStrategy) -> None:
+    """Exclude operations that belong to other shards."""
+    assignment = assign_by_cost(schema, shard.count) if strategy == ShardStrategy.COST else {}
+
+    def is_other_shard(ctx: HasAPIOperation) -> bool:
+        label = ctx.operation.label
+        # Operations that failed to build are not in the cost-based assignment
+        index = assignment.get(label)
+        if index is None:
+            index = hash_shard(label, shard.count)
+        return index != shard.index
+
+    schema.filter_set.exclude(is_other_shard)
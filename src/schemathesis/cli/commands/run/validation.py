@@ -10,8 +10,9 @@ from urllib.parse import urlparse
 
 import click
 
+from schemathesis.cli.commands.run.sharding import Shard
 from schemathesis.cli.ext.options import CsvEnumChoice
-from schemathesis.config import ReportFormat, SchemathesisWarning, get_workers_count
+from schemathesis.config import HttpClient, ReportFormat, SchemathesisWarning, WorkersMode, get_workers_count
 from schemathesis.core import errors, rate_limit, string_to_boolean
 from schemathesis.core.fs import file_exists
 from schemathesis.core.validation import has_invalid_characters, is_latin_1_encodable
@@ -33,6 +34,10 @@ INVALID_BASE_URL_MESSAGE = (
     "The provided base URL is invalid. This URL serves as a prefix for all API endpoints you want to test. "
     "Make sure it is a properly formatted URL."
 )
+UNSUPPORTED_WORKERS_MODE_MESSAGE = (
+    "`--workers-mode=process` requires the `fork` process start method, which is not available on this platform."
+)
+MISSING_H2_MESSAGE = "`--http-client=http2` requires the `h2` package. Install it with `pip install 'httpx[http2]'`."
 MISSING_REQUEST_CERT_MESSAGE = "The `--request-cert` option must be specified if `--request-cert-key` is used."
 
 
@@ -89,12 +94,21 @@ def validate_rate_limit(ctx: click.core.Context, param: click.core.Parameter, ra
     if raw_value is None:
         return raw_value
     try:
-        rate_limit.parse_units(raw_value)
+        rate_limit.validate(raw_value)
         return raw_value
     except errors.IncorrectUsage as exc:
         raise click.UsageError(exc.args[0]) from exc
 
 
+def validate_shard(ctx: click.core.Context, param: click.core.Parameter, raw_value: str | None) -> Shard | None:
+    if raw_value is None:
+        return raw_value
+    try:
+        return Shard.parse(raw_value)
+    except ValueError as exc:
+        raise click.BadParameter(str(exc)) from exc
+
+
 def validate_hypothesis_database(
     ctx: click.core.Context, param: click.core.Parameter, raw_value: str | None
 ) -> str | None:
@@ -242,6 +256,22 @@ def convert_workers(ctx: click.core.Context, param: click.core.Parameter, value:
     return int(value)
 
 
+def validate_workers_mode(ctx: click.core.Context, param: click.core.Parameter, value: str | None) -> str | None:
+    from schemathesis.engine.phases.unit._process_pool import is_supported
+
+    if value == WorkersMode.PROCESS and not is_supported():
+        raise click.UsageError(UNSUPPORTED_WORKERS_MODE_MESSAGE)
+    return value
+
+
+def validate_http_client(ctx: click.core.Context, param: click.core.Parameter, value: str | None) -> str | None:
+    from importlib.util import find_spec
+
+    if value == HttpClient.HTTP2 and find_spec("h2") is None:
+        raise click.UsageError(MISSING_H2_MESSAGE)
+    return value
+
+
 WARNINGS_CHOICE = CsvEnumChoice(SchemathesisWarning)
 
 
@@ -30,8 +30,20 @@ from schemathesis.config._phases import (
     PhasesConfig,
     StatefulPhaseConfig,
 )
-from schemathesis.config._projects import ProjectConfig, ProjectsConfig, get_workers_count
-from schemathesis.config._report import DEFAULT_REPORT_DIRECTORY, ReportConfig, ReportFormat, ReportsConfig
+from schemathesis.config._projects import (
+    HttpClient,
+    ProjectConfig,
+    ProjectsConfig,
+    WorkersMode,
+    get_workers_count,
+)
+from schemathesis.config._report import (
+    DEFAULT_REPORT_DIRECTORY,
+    CassetteFilter,
+    ReportConfig,
+    ReportFormat,
+    ReportsConfig,
+)
 from schemathesis.config._warnings import SchemathesisWarning, WarningsConfig
 
 if sys.version_info < (3, 11):
@@ -46,6 +58,7 @@ __all__ = [
     "ReportConfig",
     "ReportsConfig",
     "ReportFormat",
+    "CassetteFilter",
     "DEFAULT_REPORT_DIRECTORY",
     "GenerationConfig",
     "OutputConfig",
@@ -67,6 +80,8 @@ __all__ = [
     "ProjectsConfig",
     "ProjectConfig",
     "get_workers_count",
+    "WorkersMode",
+    "HttpClient",
     "SchemathesisWarning",
     "WarningsConfig",
     "ApiKeyAuthConfig",
@@ -83,6 +98,7 @@ class SchemathesisConfig(DiffBase):
     _config_path: str | None
     wait_for_schema: float | int | None
     max_failures: int | None
+    schema_cache: str | None
     reports: ReportsConfig
     output: OutputConfig
     projects: ProjectsConfig
@@ -94,6 +110,7 @@ class SchemathesisConfig(DiffBase):
         "_config_path",
         "wait_for_schema",
         "max_failures",
+        "schema_cache",
         "reports",
         "output",
         "projects",
@@ -107,6 +124,7 @@ class SchemathesisConfig(DiffBase):
         seed: int | None = None,
         wait_for_schema: float | int | None = None,
         max_failures: int | None = None,
+        schema_cache: str | None = None,
         reports: ReportsConfig | None = None,
         output: OutputConfig | None = None,
         projects: ProjectsConfig | None = None,
@@ -117,6 +135,7 @@ class SchemathesisConfig(DiffBase):
         self._config_path = None
         self.wait_for_schema = wait_for_schema
         self.max_failures = max_failures
+        self.schema_cache = schema_cache
         self.reports = reports or ReportsConfig()
         self.output = output or OutputConfig()
         self.projects = projects or ProjectsConfig()
@@ -176,6 +195,7 @@ class SchemathesisConfig(DiffBase):
         seed: int | None = None,
         wait_for_schema: float | int | None = None,
         max_failures: int | None,
+        schema_cache: str | None = None,
     ) -> None:
         """Set top-level configuration options."""
         if color is not None:
@@ -188,6 +208,8 @@ class SchemathesisConfig(DiffBase):
             self.wait_for_schema = wait_for_schema
         if max_failures is not None:
             self.max_failures = max_failures
+        if schema_cache is not None:
+            self.schema_cache = schema_cache
 
     @classmethod
     def from_path(cls, path: PathLike | str) -> SchemathesisConfig:
@@ -220,6 +242,7 @@ class SchemathesisConfig(DiffBase):
             seed=data.get("seed"),
             wait_for_schema=data.get("wait-for-schema"),
             max_failures=data.get("max-failures"),
+            schema_cache=data.get("schema-cache"),
             reports=ReportsConfig.from_dict(data.get("reports", {})),
             output=OutputConfig.from_dict(data.get("output", {})),
             projects=ProjectsConfig.from_dict(data),
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable, Generator, Hashable
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+from weakref import WeakKeyDictionary
+
+if TYPE_CHECKING:
+    from schemathesis.schemas import APIOperation
+
+T = TypeVar("T")
+
+# Incremented whenever an existing config is modified in-place. Values derived from configs are valid only for the
+# version they were computed for
+_version = 0
+_local = threading.local()
+
+
+def bump_version() -> None:
+    global _version
+    if not getattr(_local, "untracked", False):
+        _version += 1
+
+
+@contextmanager
+def untracked() -> Generator[None, None, None]:
+    """Do not count modifications within the block, e.g. while filling a new config that is not shared yet."""
+    previous = getattr(_local, "untracked", False)
+    _local.untracked = True
+    try:
+        yield
+    finally:
+        _local.untracked = previous
+
+
+class OperationCache(Generic[T]):
+    """Values derived from configs for individual API operations, until any config is modified."""
+
+    __slots__ = ("_entries",)
+
+    def __init__(self) -> None:
+        # Weak keys, so the cache does not keep operations alive after they are rebuilt
+        self._entries: WeakKeyDictionary[APIOperation, dict[Hashable, tuple[int, Any]]] = WeakKeyDictionary()
+
+    def get(self, operation: APIOperation, key: Hashable, compute: Callable[[], T]) -> T:
+        # Captured before computing, so a value built from a config modified concurrently is not reused
+        version = _version
+        entries = self._entries.get(operation)
+        if entries is None:
+            entries = self._entries.setdefault(operation, {})
+        entry = entries.get(key)
+        if entry is not None and entry[0] == version:
+            return entry[1]
+        value = compute()
+        entries[key] = (version, value)
+        return value
@@ -4,6 +4,7 @@ from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, ClassVar
 
+from schemathesis.config._cache import bump_version
 from schemathesis.config._diff_base import DiffBase
 from schemathesis.config._error import ConfigError
 
@@ -267,3 +268,5 @@ class ChecksConfig(DiffBase):
         for name in excluded_check_names or []:
             if name not in known_names and name != "all":
                 self._unknown[name] = SimpleCheckConfig(enabled=False)
+        # Changes to `_unknown` are not reassignments of config options
+        bump_version()
@@ -2,13 +2,21 @@ from __future__ import annotations
 
 from dataclasses import dataclass, fields, is_dataclass
 from itertools import starmap
-from typing import TypeVar
+from typing import Any, TypeVar
+
+from schemathesis.config._cache import bump_version, untracked
 
 T = TypeVar("T", bound="DiffBase")
 
 
 @dataclass
 class DiffBase:
+    def __setattr__(self, name: str, value: Any) -> None:
+        if hasattr(self, name):
+            # Options set in `__init__` are not tracked, only modifications of existing configs
+            bump_version()
+        super().__setattr__(name, value)
+
     def __repr__(self) -> str:
         """Show only the fields that differ from the default."""
         assert is_dataclass(self)
@@ -73,25 +81,27 @@ class DiffBase:
         if len(configs) == 1:
             return configs[0]
         output = cls()
-        for option in cls.__slots__:  # type: ignore[attr-defined]
-            if option.startswith("_"):
-                continue
-            default = getattr(output, option)
-            if hasattr(default, "__dataclass_fields__"):
-                # Sub-configs require merging of nested config options
-                sub_configs = [getattr(config, option) for config in configs]
-                merged = type(default).from_hierarchy(sub_configs)
-                setattr(output, option, merged)
-            else:
-                # Primitive config options can be compared directly and do not
-                # require merging of nested options
-                for config in configs:
-                    current = getattr(config, option)
-                    if current != default:
-                        setattr(output, option, current)
-                        # As we go from the highest priority to the lowest one,
-                        # we can just stop on the first non-default value
-                        break
+        # `output` is a new config, nothing derived from it has to be invalidated
+        with untracked():
+            for option in cls.__slots__:  # type: ignore[attr-defined]
+                if option.startswith("_"):
+                    continue
+                default = getattr(output, option)
+                if hasattr(default, "__dataclass_fields__"):
+                    # Sub-configs require merging of nested config options
+                    sub_configs = [getattr(config, option) for config in configs]
+                    merged = type(default).from_hierarchy(sub_configs)
+                    setattr(output, option, merged)
+                else:
+                    # Primitive config options can be compared directly and do not
+                    # require merging of nested options
+                    for config in configs:
+                        current = getattr(config, option)
+                        if current != default:
+                            setattr(output, option, current)
+                            # As we go from the highest priority to the lowest one,
+                            # we can just stop on the first non-default value
+                            break
         return output  # type: ignore[return-value]
 
 
@@ -9,6 +9,8 @@ from schemathesis.generation.modes import GenerationMode
 if TYPE_CHECKING:
     from schemathesis.generation.metrics import MetricFunction
 
+DEFAULT_UNIQUE_INPUTS_CACHE_SIZE = 10_000
+
 
 @dataclass(repr=False)
 class GenerationConfig(DiffBase):
@@ -29,6 +31,8 @@ class GenerationConfig(DiffBase):
     graphql_allow_null: bool
     database: str | None
     unique_inputs: bool
+    # The maximum number of stored outcomes used to skip duplicate test cases
+    unique_inputs_cache_size: int
     exclude_header_characters: str | None
     _is_default: bool
 
@@ -45,6 +49,7 @@ class GenerationConfig(DiffBase):
         "graphql_allow_null",
         "database",
         "unique_inputs",
+        "unique_inputs_cache_size",
         "exclude_header_characters",
         "_is_default",
     )
@@ -64,6 +69,7 @@ class GenerationConfig(DiffBase):
         graphql_allow_null: bool = True,
         database: str | None = None,
         unique_inputs: bool = False,
+        unique_inputs_cache_size: int = DEFAULT_UNIQUE_INPUTS_CACHE_SIZE,
         exclude_header_characters: str | None = None,
     ) -> None:
         from schemathesis.generation import GenerationMode
@@ -80,6 +86,7 @@ class GenerationConfig(DiffBase):
         self.graphql_allow_null = graphql_allow_null
         self.database = database
         self.unique_inputs = unique_inputs
+        self.unique_inputs_cache_size = unique_inputs_cache_size
         self.exclude_header_characters = exclude_header_characters
 
         # Check if all parameters match their default values
@@ -98,6 +105,7 @@ class GenerationConfig(DiffBase):
             and graphql_allow_null is True
             and database is None
             and unique_inputs is False
+            and unique_inputs_cache_size == DEFAULT_UNIQUE_INPUTS_CACHE_SIZE
             and exclude_header_characters is None,
         )
 
@@ -106,7 +114,7 @@ class GenerationConfig(DiffBase):
         # Mark as modified if we're setting a field (not _is_default itself) after init
         if name != "_is_default" and hasattr(self, "_is_default"):
             object.__setattr__(self, "_is_default", False)
-        object.__setattr__(self, name, value)
+        super().__setattr__(name, value)
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> GenerationConfig:
@@ -131,6 +139,7 @@ class GenerationConfig(DiffBase):
             graphql_allow_null=data.get("graphql-allow-null", True),
             database=data.get("database"),
             unique_inputs=data.get("unique-inputs", False),
+            unique_inputs_cache_size=data.get("unique-inputs-cache-size", DEFAULT_UNIQUE_INPUTS_CACHE_SIZE),
             exclude_header_characters=data.get("exclude-header-characters"),
         )
 
@@ -149,6 +158,7 @@ class GenerationConfig(DiffBase):
         graphql_allow_null: bool | None = None,
         database: str | None = None,
         unique_inputs: bool | None = None,
+        unique_inputs_cache_size: int | None = None,
         exclude_header_characters: str | None = None,
     ) -> None:
         if modes is not None:
@@ -169,6 +179,8 @@ class GenerationConfig(DiffBase):
         if database is not None:
             self.database = database
         self.unique_inputs = unique_inputs or False
+        if unique_inputs_cache_size is not None:
+            self.unique_inputs_cache_size = unique_inputs_cache_size
         if exclude_header_characters is not None:
             self.exclude_header_characters = exclude_header_characters
 
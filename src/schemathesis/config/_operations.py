@@ -7,6 +7,7 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
 from schemathesis.config._auth import AuthConfig
+from schemathesis.config._cache import OperationCache
 from schemathesis.config._checks import ChecksConfig
 from schemathesis.config._diff_base import DiffBase
 from schemathesis.config._env import resolve
@@ -22,6 +23,7 @@ from schemathesis.filters import FilterSet, HasAPIOperation, expression_to_filte
 if TYPE_CHECKING:
     from pyrate_limiter import Limiter
 
+    from schemathesis.core.rate_limit import AdaptiveLimiter
     from schemathesis.schemas import APIOperation
 
 FILTER_ATTRIBUTES = [
@@ -53,11 +55,14 @@ def reraise_filter_error(attr: str) -> Generator:
 class OperationsConfig(DiffBase):
     operations: list[OperationConfig]
 
-    __slots__ = ("operations", "_cache")
+    __slots__ = ("operations", "_cache", "_matching")
 
     def __init__(self, *, operations: list[OperationConfig] | None = None):
         self.operations = operations or []
         self._cache: dict[APIOperation, OperationConfig] = {}
+        # Evaluating filters is the costly part of resolving per-operation configs. Matches are dropped when any config
+        # is modified, including replacing `operations`
+        self._matching: OperationCache[list[OperationConfig]] = OperationCache()
 
     def __repr__(self) -> str:
         if self.operations:
@@ -77,6 +82,14 @@ class OperationsConfig(DiffBase):
                 self._cache[operation] = OperationConfig.from_hierarchy(configs)
         return self._cache[operation]
 
+    def get_matching(self, operation: APIOperation) -> list[OperationConfig]:
+        """Operation configs whose filters apply to the given operation."""
+        return self._matching.get(
+            operation,
+            None,
+            lambda: [config for config in self.operations if config._filter_set.applies_to(operation=operation)],
+        )
+
     def create_filter_set(
         self,
         *,
@@ -205,7 +218,7 @@ class OperationConfig(DiffBase):
     proxy: str | None
     continue_on_failure: bool | None
     tls_verify: bool | str | None
-    rate_limit: Limiter | None
+    rate_limit: Limiter | AdaptiveLimiter | None
     max_redirects: int | None
     request_timeout: float | int | None
     request_cert: str | None
@@ -49,6 +49,9 @@ class OperationOrdering(str, Enum):
     NONE = "none"
     """No ordering - operations execute in schema iteration order"""
 
+    COST = "cost"
+    """Most expensive operations first, so the phase does not end with a single long-running operation"""
+
 
 @dataclass(repr=False)
 class FuzzingPhaseConfig(DiffBase):
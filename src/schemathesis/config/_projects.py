@@ -2,9 +2,11 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass
+from enum import Enum
 from typing import TYPE_CHECKING, Any, Literal
 
 from schemathesis.config._auth import AuthConfig
+from schemathesis.config._cache import OperationCache
 from schemathesis.config._checks import ChecksConfig
 from schemathesis.config._diff_base import DiffBase
 from schemathesis.config._env import resolve
@@ -26,11 +28,35 @@ if TYPE_CHECKING:
     from pyrate_limiter import Limiter
 
     from schemathesis.config import SchemathesisConfig
+    from schemathesis.core.rate_limit import AdaptiveLimiter
     from schemathesis.schemas import APIOperation
 
 DEFAULT_WORKERS = 1
 
 
+class WorkersMode(str, Enum):
+    """How concurrent workers are executed during unit test phases."""
+
+    THREAD = "thread"
+    """Workers are threads within the main process"""
+
+    PROCESS = "process"
+    """Workers are separate processes, each running its own generation and checks"""
+
+
+class HttpClient(str, Enum):
+    """Library that sends requests to the API during a test run."""
+
+    REQUESTS = "requests"
+    """Each worker has its own `requests` session"""
+
+    HTTPX = "httpx"
+    """All workers share one `httpx` client and its connection pool"""
+
+    HTTP2 = "http2"
+    """All workers share one `httpx` client that multiplexes requests over HTTP/2 connections"""
+
+
 def get_workers_count() -> int:
     """Detect the number of available CPUs for the current process, if possible.
 
@@ -51,9 +77,11 @@ class ProjectConfig(DiffBase):
     hooks: str | None
     proxy: str | None
     workers: int
+    workers_mode: WorkersMode
+    http_client: HttpClient
     continue_on_failure: bool | None
     tls_verify: bool | str | None
-    rate_limit: Limiter | None
+    rate_limit: Limiter | AdaptiveLimiter | None
     max_redirects: int | None
     request_timeout: float | int | None
     request_cert: str | None
@@ -73,6 +101,8 @@ class ProjectConfig(DiffBase):
         "hooks",
         "proxy",
         "workers",
+        "workers_mode",
+        "http_client",
         "continue_on_failure",
         "tls_verify",
         "rate_limit",
@@ -88,6 +118,7 @@ class ProjectConfig(DiffBase):
         "phases",
         "generation",
         "operations",
+        "_resolved",
     )
 
     def __init__(
@@ -98,6 +129,8 @@ class ProjectConfig(DiffBase):
         headers: dict | None = None,
         hooks_: str | None = None,
         workers: int | Literal["auto"] = DEFAULT_WORKERS,
+        workers_mode: WorkersMode | str = WorkersMode.THREAD,
+        http_client: HttpClient | str = HttpClient.REQUESTS,
         proxy: str | None = None,
         continue_on_failure: bool | None = None,
         tls_verify: bool | str = True,
@@ -128,6 +161,8 @@ class ProjectConfig(DiffBase):
             self.workers = workers
         else:
             self.workers = get_workers_count()
+        self.workers_mode = WorkersMode(workers_mode) if isinstance(workers_mode, str) else workers_mode
+        self.http_client = HttpClient(http_client) if isinstance(http_client, str) else http_client
         self.proxy = proxy
         self.continue_on_failure = continue_on_failure
         self.tls_verify = tls_verify
@@ -147,6 +182,9 @@ class ProjectConfig(DiffBase):
         self.phases = phases or PhasesConfig()
         self.generation = generation or GenerationConfig()
         self.operations = operations or OperationsConfig()
+        # Per-operation configs are requested many times during a run. They are resolved again only after any
+        # config is modified, e.g. via `update()`
+        self._resolved: OperationCache[Any] = OperationCache()
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> ProjectConfig:
@@ -157,6 +195,8 @@ class ProjectConfig(DiffBase):
             else None,
             hooks_=resolve(data.get("hooks")),
             workers=data.get("workers", DEFAULT_WORKERS),
+            workers_mode=data.get("workers-mode", WorkersMode.THREAD),
+            http_client=data.get("http-client", HttpClient.REQUESTS),
             proxy=resolve(data.get("proxy")),
             continue_on_failure=data.get("continue-on-failure", None),
             tls_verify=resolve(data.get("tls-verify", True)),
@@ -183,6 +223,8 @@ class ProjectConfig(DiffBase):
         headers: dict | None = None,
         basic_auth: tuple[str, str] | None = None,
         workers: int | Literal["auto"] | None = None,
+        workers_mode: WorkersMode | str | None = None,
+        http_client: HttpClient | str | None = None,
         continue_on_failure: bool | None = None,
         rate_limit: str | None = None,
         max_redirects: int | None = None,
@@ -213,6 +255,12 @@ class ProjectConfig(DiffBase):
             else:
                 self.workers = get_workers_count()
 
+        if workers_mode is not None:
+            self.workers_mode = WorkersMode(workers_mode)
+
+        if http_client is not None:
+            self.http_client = HttpClient(http_client)
+
         if continue_on_failure is not None:
             self.continue_on_failure = continue_on_failure
 
@@ -324,7 +372,7 @@ class ProjectConfig(DiffBase):
             return self.proxy
         return None
 
-    def rate_limit_for(self, *, operation: APIOperation | None = None) -> Limiter | None:
+    def rate_limit_for(self, *, operation: APIOperation | None = None) -> Limiter | AdaptiveLimiter | None:
         if operation is not None:
             config = self.operations.get_for_operation(operation=operation)
             if config.rate_limit is not None:
@@ -342,11 +390,15 @@ class ProjectConfig(DiffBase):
         return self.warnings
 
     def phases_for(self, *, operation: APIOperation | None) -> PhasesConfig:
+        if operation is None:
+            return self.phases
+        return self._resolved.get(operation, ("phases", None), lambda: self._resolve_phases(operation=operation))
+
+    def _resolve_phases(self, *, operation: APIOperation | None) -> PhasesConfig:
         configs = []
         if operation is not None:
-            for op in self.operations.operations:
-                if op._filter_set.applies_to(operation=operation):
-                    configs.append(op.phases)
+            for op in self.operations.get_matching(operation):
+                configs.append(op.phases)
         if not configs:
             return self.phases
         configs.append(self.phases)
@@ -358,14 +410,20 @@ class ProjectConfig(DiffBase):
         operation: APIOperation | None = None,
         phase: str | None = None,
     ) -> GenerationConfig:
+        if operation is None:
+            return self._resolve_generation(operation=operation, phase=phase)
+        return self._resolved.get(
+            operation, ("generation", phase), lambda: self._resolve_generation(operation=operation, phase=phase)
+        )
+
+    def _resolve_generation(self, *, operation: APIOperation | None, phase: str | None) -> GenerationConfig:
         configs = []
         if operation is not None:
-            for op in self.operations.operations:
-                if op._filter_set.applies_to(operation=operation):
-                    if phase is not None:
-                        phase_config = op.phases.get_by_name(name=phase)
-                        configs.append(phase_config.generation)
-                    configs.append(op.generation)
+            for op in self.operations.get_matching(operation):
+                if phase is not None:
+                    phase_config = op.phases.get_by_name(name=phase)
+                    configs.append(phase_config.generation)
+                configs.append(op.generation)
         if phase is not None:
             phases = self.phases_for(operation=operation)
             phase_config = phases.get_by_name(name=phase)
@@ -382,14 +440,20 @@ class ProjectConfig(DiffBase):
         operation: APIOperation | None = None,
         phase: str | None = None,
     ) -> ChecksConfig:
+        if operation is None:
+            return self._resolve_checks(operation=operation, phase=phase)
+        return self._resolved.get(
+            operation, ("checks", phase), lambda: self._resolve_checks(operation=operation, phase=phase)
+        )
+
+    def _resolve_checks(self, *, operation: APIOperation | None, phase: str | None) -> ChecksConfig:
         configs = []
         if operation is not None:
-            for op in self.operations.operations:
-                if op._filter_set.applies_to(operation=operation):
-                    if phase is not None:
-                        phase_config = op.phases.get_by_name(name=phase)
-                        configs.append(phase_config.checks)
-                    configs.append(op.checks)
+            for op in self.operations.get_matching(operation):
+                if phase is not None:
+                    phase_config = op.phases.get_by_name(name=phase)
+                    configs.append(phase_config.checks)
+                configs.append(op.checks)
         if phase is not None:
             phases = self.phases_for(operation=operation)
             phase_config = phases.get_by_name(name=phase)
@@ -454,6 +518,10 @@ class ProjectConfig(DiffBase):
     def wait_for_schema(self) -> float | int | None:
         return self._get_parent().wait_for_schema
 
+    @property
+    def schema_cache(self) -> str | None:
+        return self._get_parent().schema_cache
+
     @property
     def max_failures(self) -> int | None:
         return self._get_parent().max_failures
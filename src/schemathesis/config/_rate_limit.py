@@ -9,8 +9,10 @@ from schemathesis.core.errors import InvalidRateLimit
 if TYPE_CHECKING:
     from pyrate_limiter import Limiter
 
+    from schemathesis.core.rate_limit import AdaptiveLimiter
 
-def build_limiter(value: str) -> Limiter:
+
+def build_limiter(value: str) -> Limiter | AdaptiveLimiter:
     try:
         return rate_limit.build_limiter(value)
     except InvalidRateLimit as exc:
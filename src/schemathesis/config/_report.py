@@ -31,6 +31,14 @@ class ReportFormat(str, Enum):
         }[self]
 
 
+class CassetteFilter(str, Enum):
+    """Which scenarios are recorded to VCR and HAR cassettes."""
+
+    ALL = "all"
+    # Only scenarios that failed or errored
+    FAILURES = "failures"
+
+
 @dataclass(repr=False)
 class ReportConfig(DiffBase):
     enabled: bool
@@ -55,19 +63,33 @@ class ReportConfig(DiffBase):
 class ReportsConfig(DiffBase):
     directory: Path
     preserve_bytes: bool
+    cassette_filter: CassetteFilter
+    cassette_max_size: int | None
     junit: ReportConfig
     vcr: ReportConfig
     har: ReportConfig
     ndjson: ReportConfig
     _timestamp: str
 
-    __slots__ = ("directory", "preserve_bytes", "junit", "vcr", "har", "ndjson", "_timestamp")
+    __slots__ = (
+        "directory",
+        "preserve_bytes",
+        "cassette_filter",
+        "cassette_max_size",
+        "junit",
+        "vcr",
+        "har",
+        "ndjson",
+        "_timestamp",
+    )
 
     def __init__(
         self,
         *,
         directory: str | None = None,
         preserve_bytes: bool = False,
+        cassette_filter: CassetteFilter = CassetteFilter.ALL,
+        cassette_max_size: int | None = None,
         junit: ReportConfig | None = None,
         vcr: ReportConfig | None = None,
         har: ReportConfig | None = None,
@@ -75,6 +97,8 @@ class ReportsConfig(DiffBase):
     ) -> None:
         self.directory = Path(resolve(directory) or DEFAULT_REPORT_DIRECTORY)
         self.preserve_bytes = preserve_bytes
+        self.cassette_filter = cassette_filter
+        self.cassette_max_size = cassette_max_size
         self.junit = junit or ReportConfig()
         self.vcr = vcr or ReportConfig()
         self.har = har or ReportConfig()
@@ -86,6 +110,8 @@ class ReportsConfig(DiffBase):
         return cls(
             directory=data.get("directory"),
             preserve_bytes=data.get("preserve-bytes", False),
+            cassette_filter=CassetteFilter(data.get("cassette-filter", CassetteFilter.ALL.value)),
+            cassette_max_size=data.get("cassette-max-size"),
             junit=ReportConfig.from_dict(data.get("junit", {})),
             vcr=ReportConfig.from_dict(data.get("vcr", {})),
             har=ReportConfig.from_dict(data.get("har", {})),
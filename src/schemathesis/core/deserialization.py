@@ -9,6 +9,7 @@ from typing import TYPE_CHECKING, Any, BinaryIO, TextIO
 from typing_extensions import NotRequired, TypedDict
 
 from schemathesis.core import NOT_SET, media_types
+from schemathesis.core.errors import MalformedMediaType
 from schemathesis.core.transport import Response
 
 if TYPE_CHECKING:
@@ -75,6 +76,19 @@ def has_deserializer(media_type: str) -> bool:
     )
 
 
+def has_builtin_deserializer(media_type: str) -> bool:
+    """Check if the given media type is deserialized by a built-in deserializer.
+
+    Built-in deserializers depend only on the response, unlike custom ones that may use the deserialization context.
+    """
+    try:
+        for _, deserializer in _iter_matching_deserializers(media_type):
+            return deserializer.__module__ == __name__
+    except MalformedMediaType:
+        pass
+    return False
+
+
 def register_deserializer(func: ResponseDeserializer, *media_types: str) -> ResponseDeserializer:
     for media_type in media_types:
         _DESERIALIZERS[media_type] = func
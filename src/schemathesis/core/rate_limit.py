@@ -1,7 +1,19 @@
 from __future__ import annotations
 
-from contextlib import AbstractContextManager, nullcontext
-from typing import TYPE_CHECKING
+import asyncio
+import threading
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from contextlib import (
+    AbstractAsyncContextManager,
+    AbstractContextManager,
+    asynccontextmanager,
+    contextmanager,
+    nullcontext,
+)
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Any, Protocol, TypeVar
 from urllib.parse import urlparse
 
 from schemathesis.core.errors import InvalidRateLimit
@@ -10,14 +22,72 @@ if TYPE_CHECKING:
     from pyrate_limiter import Limiter
 
 
-def ratelimit(rate_limiter: Limiter | None, base_url: str | None) -> AbstractContextManager[None]:
-    """Limit the rate of sending generated requests."""
-    label = urlparse(base_url).netloc
+class _Response(Protocol):
+    status_code: int
+    elapsed: Any
+    headers: Any
+
+
+R = TypeVar("R", bound=_Response)
+
+ADAPTIVE = "adaptive"
+# Responses signalling that the server is overloaded
+OVERLOAD_STATUS_CODES = frozenset({429, 503})
+# Concurrent requests allowed per host before any feedback is received
+INITIAL_CONCURRENCY = 8
+MAX_CONCURRENCY = 256
+# Multiplicative decrease applied to concurrency & rate on overload
+DECREASE_FACTOR = 0.5
+# Lowest rate (requests per second) the adaptive limiter may drop to
+MIN_RATE = 0.5
+# A response slower than this multiple of the smoothed latency is a sign of congestion
+LATENCY_FACTOR = 4.0
+# Responses faster than this are never treated as slow, regardless of the smoothed latency
+MIN_SLOW_LATENCY = 0.5
+LATENCY_SMOOTHING = 0.2
+# The longest `Retry-After` delay that is honored, in seconds
+MAX_RETRY_AFTER = 60.0
+# How many times a request is repeated after an overload response with `Retry-After`
+MAX_RETRIES = 3
+
+
+def ratelimit(
+    rate_limiter: Limiter | AdaptiveLimiter | None, base_url: str | None
+) -> AbstractContextManager[RequestSlot | None]:
+    """Limit the rate of sending generated requests.
+
+    Adaptive limiters provide a slot to report the response to.
+    """
+    label = _get_label(base_url)
+    if isinstance(rate_limiter, AdaptiveLimiter):
+        return rate_limiter.slot(label)
     if rate_limiter is not None:
         rate_limiter.try_acquire(label)
     return nullcontext()
 
 
+def ratelimit_async(
+    rate_limiter: Limiter | AdaptiveLimiter | None, base_url: str | None
+) -> AbstractAsyncContextManager[RequestSlot | None]:
+    """Limit the rate of sending generated requests without blocking the event loop."""
+    label = _get_label(base_url)
+    if isinstance(rate_limiter, AdaptiveLimiter):
+        return rate_limiter.slot_async(label)
+    return _fixed_ratelimit_async(rate_limiter, label)
+
+
+def _get_label(base_url: str | None) -> str:
+    # Limits are tracked per host
+    return urlparse(base_url or "").netloc
+
+
+@asynccontextmanager
+async def _fixed_ratelimit_async(rate_limiter: Limiter | None, label: str) -> AsyncIterator[None]:
+    if rate_limiter is not None:
+        await rate_limiter.try_acquire_async(label)
+    yield None
+
+
 def parse_units(rate: str) -> tuple[int, int]:
     from pyrate_limiter import Duration
 
@@ -36,9 +106,277 @@ def parse_units(rate: str) -> tuple[int, int]:
         raise InvalidRateLimit(rate) from exc
 
 
-def build_limiter(rate: str) -> Limiter:
+def parse_adaptive(rate: str) -> float | None:
+    """Parse the maximum rate (requests per second) of the `adaptive[:<limit>/<duration>]` form."""
+    _, _, max_rate = rate.partition(":")
+    if not max_rate:
+        return None
+    limit, interval = parse_units(max_rate)
+    # Intervals are in milliseconds
+    return limit * 1000 / int(interval)
+
+
+def validate(rate: str) -> None:
+    if is_adaptive(rate):
+        parse_adaptive(rate)
+    else:
+        parse_units(rate)
+
+
+def is_adaptive(rate: str) -> bool:
+    return rate == ADAPTIVE or rate.startswith(f"{ADAPTIVE}:")
+
+
+def build_limiter(rate: str) -> Limiter | AdaptiveLimiter:
+    if is_adaptive(rate):
+        return AdaptiveLimiter(max_rate=parse_adaptive(rate))
+
     from pyrate_limiter import Limiter, Rate
 
     limit, interval = parse_units(rate)
-    rate = Rate(limit, interval)
-    return Limiter(rate)
+    return Limiter(Rate(limit, interval))
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse the `Retry-After` header, either in seconds or as an HTTP date."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        delay = float(value)
+    else:
+        try:
+            date = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        delay = date.timestamp() - time.time()
+    return min(max(delay, 0.0), MAX_RETRY_AFTER)
+
+
+@dataclass
+class HostState:
+    """Adaptive limits for a single host."""
+
+    concurrency: float
+    # Requests per second, `None` until the server signals overload for the first time
+    rate: float | None
+    in_flight: int
+    # Monotonic time before which no requests are sent
+    next_send: float
+    blocked_until: float
+    latency: float | None
+
+    __slots__ = ("concurrency", "rate", "in_flight", "next_send", "blocked_until", "latency")
+
+
+class AdaptiveLimiter:
+    """Limits concurrency and rate of requests per host based on server feedback (AIMD).
+
+    Both limits grow additively while responses are fine, and are cut multiplicatively when the server responds with
+    429 / 503 or gets noticeably slower. `Retry-After` pauses all requests to the host.
+    """
+
+    __slots__ = ("max_rate", "_hosts", "_condition", "_async_waiters")
+
+    def __init__(self, max_rate: float | None = None) -> None:
+        self.max_rate = max_rate
+        self._hosts: dict[str, HostState] = {}
+        self._condition = threading.Condition()
+        # Tasks waiting for a slot, woken up when a request finishes
+        self._async_waiters: list[tuple[asyncio.AbstractEventLoop, asyncio.Future[None]]] = []
+
+    def get_state(self, label: str) -> HostState:
+        state = self._hosts.get(label)
+        if state is None:
+            state = HostState(
+                concurrency=INITIAL_CONCURRENCY,
+                rate=self.max_rate,
+                in_flight=0,
+                next_send=0.0,
+                blocked_until=0.0,
+                latency=None,
+            )
+            self._hosts[label] = state
+        return state
+
+    def _try_acquire(self, label: str) -> float | None:
+        """Take a slot for a request, or return how long to wait before trying again.
+
+        `None` means waiting for another request to finish.
+        """
+        now = time.monotonic()
+        state = self.get_state(label)
+        delay = max(state.blocked_until, state.next_send) - now
+        if delay > 0:
+            return delay
+        if state.in_flight >= int(state.concurrency):
+            return None
+        state.in_flight += 1
+        if state.rate is not None:
+            state.next_send = max(now, state.next_send) + 1 / state.rate
+        return 0.0
+
+    def acquire(self, label: str) -> None:
+        with self._condition:
+            while True:
+                delay = self._try_acquire(label)
+                if delay == 0.0:
+                    return
+                self._condition.wait(timeout=delay)
+
+    async def acquire_async(self, label: str) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._condition:
+                delay = self._try_acquire(label)
+                if delay == 0.0:
+                    return
+                waiter = loop.create_future()
+                self._async_waiters.append((loop, waiter))
+            try:
+                # Sleep until the next request is allowed, or until another request finishes
+                await asyncio.wait((waiter,), timeout=delay)
+            finally:
+                with self._condition:
+                    if (loop, waiter) in self._async_waiters:
+                        self._async_waiters.remove((loop, waiter))
+                waiter.cancel()
+
+    def release(self, label: str, slot: RequestSlot) -> None:
+        """Adjust limits based on the outcome of a request."""
+        with self._condition:
+            state = self.get_state(label)
+            state.in_flight -= 1
+            now = time.monotonic()
+            status_code = slot.status_code
+            elapsed = slot.elapsed
+            if slot.failed or status_code in OVERLOAD_STATUS_CODES:
+                self._decrease(state, now)
+                if slot.retry_after is not None:
+                    state.blocked_until = max(state.blocked_until, now + slot.retry_after)
+            elif status_code is None:
+                # Nothing is known about the outcome
+                pass
+            elif elapsed is not None and self._is_slow(state, elapsed):
+                self._decrease(state, now)
+            else:
+                self._increase(state)
+            if elapsed is not None:
+                if state.latency is None:
+                    state.latency = elapsed
+                else:
+                    state.latency += LATENCY_SMOOTHING * (elapsed - state.latency)
+            self._condition.notify_all()
+            for loop, waiter in self._async_waiters:
+                try:
+                    loop.call_soon_threadsafe(_wake_up, waiter)
+                except RuntimeError:
+                    # The event loop is closed
+                    pass
+            self._async_waiters.clear()
+
+    def _is_slow(self, state: HostState, elapsed: float) -> bool:
+        return state.latency is not None and elapsed > MIN_SLOW_LATENCY and elapsed > state.latency * LATENCY_FACTOR
+
+    def _decrease(self, state: HostState, now: float) -> None:
+        state.concurrency = max(state.concurrency * DECREASE_FACTOR, 1.0)
+        if state.rate is None:
+            # Start from the throughput the reduced concurrency allows (Little's law)
+            latency = state.latency or 1.0
+            state.rate = max(state.concurrency / latency, MIN_RATE)
+        else:
+            state.rate = max(state.rate * DECREASE_FACTOR, MIN_RATE)
+        state.next_send = max(state.next_send, now + 1 / state.rate)
+
+    def _increase(self, state: HostState) -> None:
+        # Grows by one per "window" of successful requests
+        state.concurrency = min(state.concurrency + 1 / state.concurrency, MAX_CONCURRENCY)
+        if state.rate is not None:
+            state.rate += 1 / state.rate
+            if self.max_rate is not None:
+                state.rate = min(state.rate, self.max_rate)
+
+    @contextmanager
+    def slot(self, label: str) -> Iterator[RequestSlot]:
+        self.acquire(label)
+        slot = RequestSlot()
+        try:
+            yield slot
+        except Exception:
+            # Network errors & timeouts are treated as signs of overload
+            slot.failed = True
+            raise
+        finally:
+            self.release(label, slot)
+
+    @asynccontextmanager
+    async def slot_async(self, label: str) -> AsyncIterator[RequestSlot]:
+        await self.acquire_async(label)
+        slot = RequestSlot()
+        try:
+            yield slot
+        except Exception:
+            slot.failed = True
+            raise
+        finally:
+            self.release(label, slot)
+
+
+def _wake_up(waiter: asyncio.Future[None]) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+class RequestSlot:
+    """Outcome of a request sent under an adaptive limiter."""
+
+    __slots__ = ("status_code", "elapsed", "retry_after", "failed")
+
+    def __init__(self) -> None:
+        self.status_code: int | None = None
+        self.elapsed: float | None = None
+        self.retry_after: float | None = None
+        self.failed = False
+
+    def record(self, *, status_code: int, elapsed: float, retry_after: str | None) -> bool:
+        """Store the response outcome and return whether the request should be repeated after `Retry-After`."""
+        self.status_code = status_code
+        self.elapsed = elapsed
+        if status_code in OVERLOAD_STATUS_CODES:
+            self.retry_after = parse_retry_after(retry_after)
+        return self.retry_after is not None
+
+
+def send_with_rate_limit(
+    rate_limiter: Limiter | AdaptiveLimiter | None, base_url: str | None, send: Callable[[], R]
+) -> R:
+    """Send a request under the rate limit, repeating it if an adaptive limiter gets `Retry-After`."""
+    retries = 0
+    while True:
+        with ratelimit(rate_limiter, base_url) as slot:
+            response = send()
+            retry = slot is not None and slot.record(
+                status_code=response.status_code,
+                elapsed=response.elapsed.total_seconds(),
+                retry_after=response.headers.get("Retry-After"),
+            )
+        if not retry or retries == MAX_RETRIES:
+            return response
+        retries += 1
+
+
+async def send_with_rate_limit_async(
+    rate_limiter: Limiter | AdaptiveLimiter | None, base_url: str | None, send: Callable[[], Awaitable[R]]
+) -> R:
+    retries = 0
+    while True:
+        async with ratelimit_async(rate_limiter, base_url) as slot:
+            response = await send()
+            retry = slot is not None and slot.record(
+                status_code=response.status_code,
+                elapsed=response.elapsed.total_seconds(),
+                retry_after=response.headers.get("Retry-After"),
+            )
+        if not retry or retries == MAX_RETRIES:
+            return response
+        retries += 1
@@ -0,0 +1,96 @@
+"""Content-addressed on-disk cache of parsed schema documents.
+
+Parsing large YAML documents takes a lot longer than reading an already parsed document in the `marshal` format.
+Entries are keyed by a hash of the raw content, so a changed document never reuses a stale entry.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import marshal
+import os
+import sys
+import tempfile
+from collections.abc import Callable
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+# Bump to invalidate entries written by older versions, e.g. when parsing rules change
+CACHE_FORMAT_VERSION = 1
+# `marshal` data is not portable across Python versions
+_KEY_PREFIX = f"{CACHE_FORMAT_VERSION}:{marshal.version}:{sys.version_info[0]}.{sys.version_info[1]}".encode()
+
+
+class SchemaCache:
+    """Stores parsed documents in a directory, one file per distinct document.
+
+    Cache failures are never fatal - unreadable entries are parsed again and overwritten.
+    """
+
+    __slots__ = ("directory",)
+
+    def __init__(self, directory: str | os.PathLike) -> None:
+        self.directory = Path(directory)
+
+    def key(self, content: str | bytes, kind: str) -> str:
+        if isinstance(content, str):
+            content = content.encode("utf-8", "surrogatepass")
+        digest = hashlib.sha256(_KEY_PREFIX)
+        digest.update(kind.encode())
+        digest.update(b"\x00")
+        digest.update(content)
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / key
+
+    def get(self, key: str) -> tuple[bool, Any]:
+        """Get a cached document, along with whether it was found."""
+        try:
+            with self._path(key).open("rb") as fd:
+                return True, marshal.load(fd)
+        except (OSError, EOFError, ValueError, TypeError):
+            return False, None
+
+    def set(self, key: str, document: Any) -> None:
+        try:
+            data = marshal.dumps(document)
+        except ValueError:
+            # Contains values that `marshal` can't store, e.g. from custom YAML tags
+            return
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Other processes may read the same entry, therefore it should appear atomically
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+            try:
+                with os.fdopen(fd, "wb") as file:
+                    file.write(data)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError:
+            pass
+
+    def load(self, content: str | bytes, kind: str, parse: Callable[[], Any]) -> Any:
+        """Get the parsed document from the cache, or parse it and store the result.
+
+        `kind` distinguishes parsers that may produce different documents from the same content.
+        """
+        key = self.key(content, kind)
+        found, document = self.get(key)
+        if found:
+            return document
+        document = parse()
+        self.set(key, document)
+        return document
+
+
+@lru_cache
+def get_schema_cache(directory: str | None) -> SchemaCache | None:
+    """Get a cache stored in the given directory, if any."""
+    if directory is None:
+        return None
+    return SchemaCache(directory)
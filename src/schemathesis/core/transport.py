@@ -146,7 +146,7 @@ class Response:
             method=response.request.method,
             url=str(response.request.url),
             headers=dict(response.request.headers),
-            params=dict(response.request.url.params),
+            # The URL already contains the query string
             data=response.request.content,
         ).prepare()
         return Response(
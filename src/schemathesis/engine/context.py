@@ -2,21 +2,24 @@ from __future__ import annotations
 
 import threading
 import time
+from contextlib import ExitStack
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
-from schemathesis.config import ProjectConfig
-from schemathesis.core import NOT_SET, NotSet
+from schemathesis.config import HttpClient, ProjectConfig
+from schemathesis.core import NotSet
 from schemathesis.engine.control import ExecutionControl
+from schemathesis.engine.deduplication import OutcomeCache
 from schemathesis.engine.observations import Observations
-from schemathesis.generation.case import Case
 from schemathesis.schemas import APIOperation, BaseSchema
 
 if TYPE_CHECKING:
     import requests
 
+    from schemathesis.auths import CachingAuthProvider
     from schemathesis.engine.recorder import ScenarioRecorder
     from schemathesis.resources import ExtraDataSource
+    from schemathesis.transport.httpx import ClientPool
 
 
 @dataclass
@@ -25,9 +28,11 @@ class EngineContext:
 
     schema: BaseSchema
     control: ExecutionControl
-    outcome_cache: dict[int, BaseException | None]
+    outcome_cache: OutcomeCache
     start_time: float
     observations: Observations | None
+    # Testing time per test case of each operation in the most recent phase that tested it
+    durations: dict[str, float]
 
     __slots__ = (
         "schema",
@@ -35,7 +40,13 @@ class EngineContext:
         "outcome_cache",
         "start_time",
         "observations",
+        "durations",
         "_thread_local",
+        "_app_clients",
+        "_app_clients_local",
+        "_app_clients_lock",
+        "_httpx_clients",
+        "_httpx_clients_lock",
         "_transport_kwargs_cache",
         "_extra_data_source",
         "_extra_data_source_lock",
@@ -50,13 +61,19 @@ class EngineContext:
     ) -> None:
         self.schema = schema
         self.control = ExecutionControl(stop_event=stop_event, max_failures=schema.config.max_failures)
-        self.outcome_cache = {}
+        self.outcome_cache = OutcomeCache(capacity=schema.config.generation.unique_inputs_cache_size)
         self.start_time = time.monotonic()
         self.observations = observations
         self._thread_local = threading.local()
+        self._app_clients = ExitStack()
+        self._app_clients_local = threading.local()
+        self._app_clients_lock = threading.Lock()
+        self._httpx_clients: ClientPool | None = None
+        self._httpx_clients_lock = threading.Lock()
         self._transport_kwargs_cache: dict[str | None, dict[str, Any]] = {}
         self._extra_data_source: ExtraDataSource | None = None
         self._extra_data_source_lock = threading.Lock()
+        self.durations = {}
 
     def _repr_pretty_(self, *args: Any, **kwargs: Any) -> None: ...
 
@@ -97,6 +114,9 @@ class EngineContext:
             # Generate links from collected Location headers
             for operation, entries in self.observations.location_headers.items():
                 injected += self.schema.analysis.inferencer.inject_links(operation.responses, entries)
+        if injected:
+            # Injection modifies response definitions, compiled operations have to be rebuilt
+            self.schema.invalidate_operations()
         if isinstance(self.schema, OpenApiSchema) and self.schema.analysis.should_inject_links():
             injected += self.schema.analysis.inject_links()
         return injected
@@ -104,11 +124,46 @@ class EngineContext:
     def stop(self) -> None:
         self.control.stop()
 
-    def cache_outcome(self, case: Case, outcome: BaseException | None) -> None:
-        self.outcome_cache[hash(case)] = outcome
+    def prepare_subprocess(self, stop_event: threading.Event) -> None:
+        """Adjust a context inherited by a forked worker process.
 
-    def get_cached_outcome(self, case: Case) -> BaseException | None | NotSet:
-        return self.outcome_cache.get(hash(case), NOT_SET)
+        Sessions created in the parent process must not be shared as their connection pools hold the same sockets,
+        and the stop signal has to come from an event shared between processes.
+        """
+        self._thread_local = threading.local()
+        # Clients of in-process apps are bound to threads of the parent process and are closed there
+        self._app_clients = ExitStack()
+        self._app_clients_local = threading.local()
+        self._app_clients_lock = threading.Lock()
+        # Shared `httpx` clients are left to the parent process too
+        self._httpx_clients = None
+        self._httpx_clients_lock = threading.Lock()
+        self.control.fork(stop_event)
+        # Outcomes are sent back to the main process when the worker finishes
+        self.outcome_cache.fork()
+        for provider in self.caching_auth_providers():
+            provider.fork()
+
+    def close(self) -> None:
+        """Release resources held for the test run, e.g. clients of in-process ASGI / WSGI apps."""
+        with self._app_clients_lock:
+            self._app_clients.close()
+            self._app_clients_local = threading.local()
+        with self._httpx_clients_lock:
+            if self._httpx_clients is not None:
+                self._httpx_clients.close()
+                self._httpx_clients = None
+
+    def caching_auth_providers(self) -> list[CachingAuthProvider]:
+        from schemathesis import auths
+
+        return self.schema.auth.caching_providers() + auths.GLOBAL_AUTH_STORAGE.caching_providers()
+
+    def cache_outcome(self, key: bytes, outcome: BaseException | None) -> None:
+        self.outcome_cache.store(key, outcome)
+
+    def get_cached_outcome(self, key: bytes) -> BaseException | None | NotSet:
+        return self.outcome_cache.get(key)
 
     def get_session(self, *, operation: APIOperation | None = None) -> requests.Session:
         session = getattr(self._thread_local, "session", None)
@@ -136,6 +191,45 @@ class EngineContext:
         self._thread_local.session = session
         return session
 
+    def get_httpx_client(self, kwargs: dict[str, Any]) -> Any:
+        """Get an `httpx` client shared by all workers, matching client-level settings in transport `kwargs`."""
+        pool = self._httpx_clients
+        if pool is None:
+            from schemathesis.transport.httpx import ClientPool
+
+            with self._httpx_clients_lock:
+                pool = self._httpx_clients
+                if pool is None:
+                    pool = ClientPool(http2=self.config.http_client == HttpClient.HTTP2)
+                    self._httpx_clients = pool
+        proxies = kwargs.get("proxies")
+        return pool.get(
+            verify=kwargs.get("verify"),
+            cert=kwargs.get("cert"),
+            max_redirects=kwargs.get("max_redirects"),
+            proxy=proxies["all"] if proxies else None,
+        )
+
+    def get_app_client(self) -> Any:
+        """Get a client for the in-process application, reused by all requests from the current thread.
+
+        ASGI clients run the application lifespan when created and keep it running until `close` is called.
+        """
+        client = getattr(self._app_clients_local, "client", None)
+        if client is not None:
+            return client
+        from schemathesis.python import asgi, wsgi
+        from schemathesis.transport.asgi import ASGI_TRANSPORT
+
+        app = self.schema.app
+        if self.schema.transport is ASGI_TRANSPORT:
+            with self._app_clients_lock:
+                client = self._app_clients.enter_context(asgi.get_client(app))
+        else:
+            client = wsgi.get_client(app)
+        self._app_clients_local.client = client
+        return client
+
     def get_transport_kwargs(self, operation: APIOperation | None = None) -> dict[str, Any]:
         key = operation.label if operation is not None else None
         cached = self._transport_kwargs_cache.get(key)
@@ -153,7 +247,17 @@ class EngineContext:
                 cached["proxies"] = {"all": proxy}
             self._transport_kwargs_cache[key] = cached
         kwargs = cached.copy()
-        kwargs["session"] = self.get_session(operation=operation)
+        if self.schema.app is not None:
+            from schemathesis.transport.wsgi import WSGI_TRANSPORT
+
+            if self.schema.transport is WSGI_TRANSPORT:
+                # Network-level options are not applicable to WSGI apps
+                kwargs = {"headers": kwargs["headers"]}
+            kwargs["session"] = self.get_app_client()
+        elif self.config.http_client != HttpClient.REQUESTS:
+            kwargs["session"] = self.get_httpx_client(kwargs)
+        else:
+            kwargs["session"] = self.get_session(operation=operation)
         return kwargs
 
     @property
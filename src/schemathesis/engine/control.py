@@ -14,14 +14,17 @@ class ExecutionControl:
     max_failures: int | None
     _failures_counter: int
     has_reached_the_failure_limit: bool
+    _lock: threading.Lock
 
-    __slots__ = ("stop_event", "max_failures", "_failures_counter", "has_reached_the_failure_limit")
+    __slots__ = ("stop_event", "max_failures", "_failures_counter", "has_reached_the_failure_limit", "_lock")
 
     def __init__(self, stop_event: threading.Event, max_failures: int | None) -> None:
         self.stop_event = stop_event
         self.max_failures = max_failures
         self._failures_counter = 0
         self.has_reached_the_failure_limit = False
+        # Failures are counted from multiple worker threads
+        self._lock = threading.Lock()
 
     @property
     def is_stopped(self) -> bool:
@@ -39,6 +42,13 @@ class ExecutionControl:
     def count_failure(self) -> None:
         # N failures limit
         if self.max_failures is not None:
-            self._failures_counter += 1
-            if self._failures_counter >= self.max_failures:
-                self.has_reached_the_failure_limit = True
+            with self._lock:
+                self._failures_counter += 1
+                if self._failures_counter >= self.max_failures:
+                    self.has_reached_the_failure_limit = True
+
+    def fork(self, stop_event: threading.Event) -> None:
+        """Prepare for use in a forked worker process."""
+        self.stop_event = stop_event
+        # The lock could be held by another thread at the time of fork
+        self._lock = threading.Lock()
@@ -125,7 +125,15 @@ class ExecutionPlan:
 
     def execute(self, engine: EngineContext) -> EventGenerator:
         """Execute all phases in sequence."""
+        # All phases work with the same operations, there is no need to build them multiple times
+        with engine.schema.operation_registry():
+            yield from self._execute(engine)
+
+    def _execute(self, engine: EngineContext) -> EventGenerator:
         yield events.EngineStarted()
+        # Auth providers may be reused between runs, e.g. the global ones
+        for provider in engine.caching_auth_providers():
+            provider.reset_statistic()
         try:
             if engine.is_interrupted:
                 yield from self._finish(engine)
@@ -146,7 +154,11 @@ class ExecutionPlan:
                     continue
                 yield events.PhaseStarted(phase=phase, payload=payload)
                 if phase.should_execute(engine):
-                    yield from phases.execute(engine, phase)
+                    try:
+                        yield from phases.execute(engine, phase)
+                    finally:
+                        # Worker threads are not reused between phases, neither are their clients
+                        engine.close()
                 else:
                     if engine.has_reached_the_failure_limit:
                         phase.skip_reason = PhaseSkipReason.FAILURE_LIMIT_REACHED
@@ -163,7 +175,11 @@ class ExecutionPlan:
 
     def _finish(self, ctx: EngineContext) -> EventGenerator:
         """Finish the test run."""
-        yield events.EngineFinished(running_time=ctx.running_time)
+        ctx.close()
+        cache = ctx.outcome_cache
+        deduplication = cache.statistic if cache.hits or cache.misses else None
+        auth = _combine_refresh_statistics(ctx.schema.auth, auths.GLOBAL_AUTH_STORAGE)
+        yield events.EngineFinished(running_time=ctx.running_time, deduplication=deduplication, auth=auth)
 
     def _adapt_execution(self, engine: EngineContext, phase: Phase) -> StatefulPhasePayload | None:
         if engine.has_reached_the_failure_limit:
@@ -207,3 +223,15 @@ class EventStream:
         """Stop the event stream & return the last event."""
         self.stop()
         return next(self)
+
+
+def _combine_refresh_statistics(*storages: auths.AuthStorage) -> auths.RefreshStatistic | None:
+    combined: auths.RefreshStatistic | None = None
+    for storage in storages:
+        statistic = storage.refresh_statistic()
+        if statistic is not None:
+            if combined is None:
+                combined = statistic
+            else:
+                combined.merge(statistic)
+    return combined
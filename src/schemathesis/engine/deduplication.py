@@ -0,0 +1,189 @@
+"""Deduplication of test cases for `generation.unique-inputs`.
+
+Test cases are identified by a fingerprint of the request they produce, and outcomes of already executed requests
+are stored in a bounded cache, so long runs do not grow memory without limit.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlencode
+
+from schemathesis.config._generation import DEFAULT_UNIQUE_INPUTS_CACHE_SIZE
+from schemathesis.core import NOT_SET, SCHEMATHESIS_TEST_CASE_HEADER, NotSet
+
+if TYPE_CHECKING:
+    from schemathesis.generation.case import Case
+
+
+def fingerprint(case: Case, headers: Mapping[str, Any] | None = None) -> bytes:
+    """Compute a fingerprint of the request produced by a test case.
+
+    Cases with the same fingerprint send the same method, URL, headers, cookies, and payload.
+    The order of headers & cookies, the case of header names, and key order in payloads are not significant.
+    Extra `headers` are sent on top of the generated ones, e.g. the ones passed via config.
+    With output sanitization, sensitive values are sanitized first, so cases are unique in the same way as
+    their reproduction commands are.
+    """
+    from schemathesis.transport.prepare import sanitize_request_kwargs
+    from schemathesis.transport.requests import REQUESTS_TRANSPORT
+
+    extra_headers = dict(headers) if headers else {}
+    # The test case ID header is unique for every case and does not affect the API behavior
+    extra_headers[SCHEMATHESIS_TEST_CASE_HEADER] = "0"
+    kwargs = REQUESTS_TRANSPORT.serialize_case(case, headers=extra_headers)
+    sanitization = case.operation.schema.config.output.sanitization
+    if sanitization.enabled:
+        sanitize_request_kwargs(kwargs, config=sanitization)
+    # Parameters are sent as strings, therefore e.g. `1` and `"1"` produce the same request
+    request = {
+        "method": str(kwargs.pop("method")).upper(),
+        "url": kwargs.pop("url"),
+        "params": _encode(kwargs.pop("params", None)),
+        "headers": {str(name).lower(): _as_text(value) for name, value in (kwargs.pop("headers", None) or {}).items()},
+        "cookies": {str(name): _as_text(value) for name, value in (kwargs.pop("cookies", None) or {}).items()},
+    }
+    if isinstance(kwargs.get("data"), Mapping):
+        kwargs["data"] = _encode(kwargs["data"])
+    # The payload & other arguments
+    request.update(kwargs)
+    return hashlib.blake2b(repr(_canonicalize(request)).encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+
+def _encode(value: Any) -> Any:
+    if value is None or isinstance(value, str | bytes):
+        return value
+    # The same pairs `requests` sends: any non-string iterable is expanded into repeated keys (a mapping into its keys),
+    # `None` values are omitted
+    items = value.items() if isinstance(value, Mapping) else value
+    try:
+        pairs = [
+            (key, item)
+            for key, values in items
+            for item in (values if _is_expandable(values) else [values])
+            if item is not None
+        ]
+        return urlencode(pairs, doseq=True)
+    except (TypeError, ValueError):
+        return value
+
+
+def _is_expandable(value: Any) -> bool:
+    return not isinstance(value, str | bytes) and hasattr(value, "__iter__")
+
+
+def _as_text(value: Any) -> Any:
+    if isinstance(value, str | bytes):
+        return value
+    return str(value)
+
+
+def _canonicalize(value: Any) -> Any:
+    if isinstance(value, Mapping):
+        return ("mapping", tuple(sorted((repr(key), _canonicalize(item)) for key, item in value.items())))
+    if isinstance(value, list | tuple):
+        return (type(value).__name__, tuple(_canonicalize(item) for item in value))
+    return value
+
+
+@dataclass
+class DeduplicationStatistic:
+    """How many test cases were skipped as duplicates of already executed ones."""
+
+    hits: int
+    misses: int
+    evictions: int
+
+    __slots__ = ("hits", "misses", "evictions")
+
+
+class OutcomeCache:
+    """Bounded storage of test outcomes keyed by request fingerprints.
+
+    The least recently used entries are evicted once the capacity is reached.
+    """
+
+    __slots__ = ("capacity", "hits", "misses", "evictions", "_entries", "_lock", "_stored")
+
+    def __init__(self, capacity: int = DEFAULT_UNIQUE_INPUTS_CACHE_SIZE) -> None:
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[bytes, BaseException | None] = OrderedDict()
+        self._lock = threading.Lock()
+        # Keys stored since the cache was inherited by a worker process
+        self._stored: set[bytes] | None = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: bytes) -> BaseException | None | NotSet:
+        with self._lock:
+            try:
+                outcome = self._entries[key]
+            except KeyError:
+                self.misses += 1
+                return NOT_SET
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return outcome
+
+    def store(self, key: bytes, outcome: BaseException | None) -> None:
+        with self._lock:
+            self._store(key, outcome)
+            if self._stored is not None:
+                self._stored.add(key)
+
+    def _store(self, key: bytes, outcome: BaseException | None) -> None:
+        entries = self._entries
+        entries[key] = outcome
+        entries.move_to_end(key)
+        while len(entries) > self.capacity:
+            entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Remove all stored outcomes, keeping the statistic."""
+        with self._lock:
+            self._entries.clear()
+
+    def fork(self) -> None:
+        """Prepare a copy inherited by a worker process to collect only its own outcomes and statistic."""
+        # The lock could be held by another thread of the parent process at the moment of forking
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._stored = set()
+
+    def export(self) -> tuple[DeduplicationStatistic, list[tuple[bytes, BaseException | None]]]:
+        """Statistic and outcomes collected since `fork`, to be merged into the cache of the parent process."""
+        with self._lock:
+            stored = self._stored or ()
+            entries = [(key, self._entries[key]) for key in stored if key in self._entries]
+            return self.statistic, entries
+
+    def merge(self, statistic: DeduplicationStatistic, entries: list[tuple[bytes, BaseException | None]]) -> None:
+        """Merge outcomes and statistic exported by a worker process."""
+        with self._lock:
+            for key, outcome in entries:
+                self._store(key, outcome)
+            self.hits += statistic.hits
+            self.misses += statistic.misses
+            self.evictions += statistic.evictions
+
+    def merge_statistic(self, other: OutcomeCache) -> None:
+        with self._lock:
+            self.hits += other.hits
+            self.misses += other.misses
+            self.evictions += other.evictions
+
+    @property
+    def statistic(self) -> DeduplicationStatistic:
+        return DeduplicationStatistic(hits=self.hits, misses=self.misses, evictions=self.evictions)
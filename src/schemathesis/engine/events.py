@@ -13,7 +13,9 @@ from schemathesis.engine.phases import Phase, PhaseName
 from schemathesis.engine.recorder import ScenarioRecorder
 
 if TYPE_CHECKING:
+    from schemathesis.auths import RefreshStatistic
     from schemathesis.engine import Status
+    from schemathesis.engine.deduplication import DeduplicationStatistic
     from schemathesis.engine.phases.probes import ProbePayload
 
 EventGenerator = Generator["EngineEvent", None, None]
@@ -276,10 +278,22 @@ class EngineFinished(EngineEvent):
 
     is_terminal = True
     running_time: float
+    # Statistic of skipping duplicate test cases, if `generation.unique-inputs` is enabled
+    deduplication: DeduplicationStatistic | None
+    # Timings of auth data refreshes, if a caching auth provider was used
+    auth: RefreshStatistic | None
 
-    __slots__ = ("id", "timestamp", "running_time")
+    __slots__ = ("id", "timestamp", "running_time", "deduplication", "auth")
 
-    def __init__(self, *, running_time: float) -> None:
+    def __init__(
+        self,
+        *,
+        running_time: float,
+        deduplication: DeduplicationStatistic | None = None,
+        auth: RefreshStatistic | None = None,
+    ) -> None:
         self.id = uuid.uuid4()
         self.timestamp = time.time()
         self.running_time = running_time
+        self.deduplication = deduplication
+        self.auth = auth
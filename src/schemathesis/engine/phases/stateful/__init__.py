@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import ast
 import queue
+import sys
 import threading
-from typing import TYPE_CHECKING
+from collections.abc import Generator
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any
 
 from schemathesis.engine import Status, events
 from schemathesis.engine.phases import Phase, PhaseName, PhaseSkipReason
@@ -16,6 +20,7 @@ EVENT_QUEUE_TIMEOUT = 0.01
 
 def execute(engine: EngineContext, phase: Phase) -> events.EventGenerator:
     from schemathesis.engine.phases.stateful._executor import execute_state_machine_loop
+    from schemathesis.engine.phases.stateful.context import SharedState
 
     try:
         state_machine = engine.schema.as_state_machine()
@@ -25,16 +30,37 @@ def execute(engine: EngineContext, phase: Phase) -> events.EventGenerator:
         return
 
     event_queue: queue.Queue = queue.Queue()
+    # Every worker runs its own state machine
+    workers_num = max(engine.config.workers, 1)
+    shared = SharedState(workers_num=workers_num)
 
-    thread = threading.Thread(
-        target=execute_state_machine_loop,
-        kwargs={"state_machine": state_machine, "event_queue": event_queue, "engine": engine},
-        name="schemathesis_stateful_tests",
-    )
+    threads = [
+        threading.Thread(
+            target=execute_state_machine_loop,
+            kwargs={
+                "state_machine": state_machine,
+                "event_queue": event_queue,
+                "engine": engine,
+                "worker_id": worker_id,
+                "shared": shared,
+            },
+            name=f"schemathesis_stateful_tests_{worker_id}",
+        )
+        for worker_id in range(workers_num)
+    ]
+
+    with _serialized_ast_parsing(enabled=workers_num > 1):
+        yield from _run_workers(threads, event_queue, engine, phase)
+
+
+def _run_workers(
+    threads: list[threading.Thread], event_queue: queue.Queue, engine: EngineContext, phase: Phase
+) -> events.EventGenerator:
     status: Status | None = None
     is_executed = False
 
-    thread.start()
+    for thread in threads:
+        thread.start()
     try:
         while True:
             try:
@@ -50,7 +76,7 @@ def execute(engine: EngineContext, phase: Phase) -> events.EventGenerator:
                     status = event.status
                 yield event
             except queue.Empty:
-                if not thread.is_alive():
+                if not any(thread.is_alive() for thread in threads):
                     break
     except KeyboardInterrupt:
         # Immediately notify the engine thread to stop, even though that the event will be set below in `finally`
@@ -58,7 +84,8 @@ def execute(engine: EngineContext, phase: Phase) -> events.EventGenerator:
         status = Status.INTERRUPTED
         yield events.Interrupted(phase=PhaseName.STATEFUL_TESTING)
     finally:
-        thread.join()
+        for thread in threads:
+            thread.join()
 
     if not is_executed:
         phase.skip_reason = PhaseSkipReason.NOTHING_TO_TEST
@@ -66,3 +93,28 @@ def execute(engine: EngineContext, phase: Phase) -> events.EventGenerator:
     elif status is None:
         status = Status.SKIP
     yield events.PhaseFinished(phase=phase, status=status, payload=None)
+
+
+@contextmanager
+def _serialized_ast_parsing(*, enabled: bool) -> Generator[None, None, None]:
+    """Prevent concurrent `ast.parse` calls while state machines run in parallel.
+
+    Hypothesis parses source code in many places, e.g. to compute database keys or to collect constants from
+    loaded modules. Before Python 3.13, AST conversion tracks its recursion depth per interpreter, and concurrent
+    calls fail with "AST constructor recursion depth mismatch".
+    """
+    if not enabled or sys.version_info >= (3, 13):
+        yield
+        return
+    original = ast.parse
+    lock = threading.Lock()
+
+    def parse(*args: Any, **kwargs: Any) -> Any:
+        with lock:
+            return original(*args, **kwargs)
+
+    ast.parse = parse
+    try:
+        yield
+    finally:
+        ast.parse = original
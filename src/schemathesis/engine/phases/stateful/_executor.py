@@ -1,5 +1,6 @@
 from __future__ import annotations  # noqa: I001
 
+import math
 import queue
 import time
 import unittest
@@ -20,6 +21,7 @@ from schemathesis.core.failures import Failure, FailureGroup
 from schemathesis.core.transport import Response
 from schemathesis.engine import Status, events
 from schemathesis.engine.context import EngineContext
+from schemathesis.engine.deduplication import OutcomeCache, fingerprint
 from schemathesis.engine.control import ExecutionControl
 from schemathesis.engine.errors import (
     TestingState,
@@ -28,7 +30,7 @@ from schemathesis.engine.errors import (
     is_unrecoverable_network_error,
 )
 from schemathesis.engine.phases import PhaseName
-from schemathesis.engine.phases.stateful.context import StatefulContext
+from schemathesis.engine.phases.stateful.context import SharedState, StatefulContext
 from schemathesis.engine.recorder import ScenarioRecorder
 from schemathesis.generation import overrides
 from schemathesis.generation.case import Case
@@ -74,14 +76,27 @@ def execute_state_machine_loop(
     state_machine: type[APIStateMachine],
     event_queue: queue.Queue,
     engine: EngineContext,
+    worker_id: int = 0,
+    shared: SharedState | None = None,
 ) -> None:
-    """Execute the state machine testing loop."""
+    """Execute the state machine testing loop.
+
+    With multiple workers, each of them runs its own state machine with a distinct seed and a share of examples.
+    """
+    shared = shared or SharedState()
+    workers_num = shared.workers_num
     configured_hypothesis_settings = engine.config.get_hypothesis_settings(phase="stateful")
     kwargs = _get_hypothesis_settings_kwargs_override(configured_hypothesis_settings)
+    if workers_num > 1:
+        kwargs["max_examples"] = math.ceil(configured_hypothesis_settings.max_examples / workers_num)
     hypothesis_settings = hypothesis.settings(configured_hypothesis_settings, **kwargs)
     generation = engine.config.generation_for(phase="stateful")
 
-    ctx = StatefulContext(metric_collector=MetricCollector(metrics=generation.maximize))
+    ctx = StatefulContext(
+        metric_collector=MetricCollector(metrics=generation.maximize),
+        step_outcomes=OutcomeCache(capacity=generation.unique_inputs_cache_size),
+        shared=shared,
+    )
     state = TestingState()
 
     # Caches for validate_response to avoid repeated config lookups per operation
@@ -117,9 +132,14 @@ def execute_state_machine_loop(
             # The idea is to stop the execution as soon as possible
             if engine.has_to_stop:
                 raise KeyboardInterrupt
+            # Stays unset if computing the fingerprint fails, so the original error is not masked
+            key: bytes | None = None
             try:
                 if generation.unique_inputs:
-                    cached = ctx.get_step_outcome(input.case)
+                    key = fingerprint(
+                        input.case, engine.get_transport_kwargs(operation=input.case.operation).get("headers")
+                    )
+                    cached = ctx.get_step_outcome(key)
                     if isinstance(cached, BaseException):
                         raise cached
                     elif cached is None:
@@ -127,9 +147,9 @@ def execute_state_machine_loop(
                 result = super().step(input)
                 ctx.step_succeeded()
             except FailureGroup as exc:
-                if generation.unique_inputs:
+                if key is not None:
                     for failure in exc.exceptions:
-                        ctx.store_step_outcome(input.case, failure)
+                        ctx.store_step_outcome(key, failure)
                 ctx.step_failed()
                 raise
             except Exception as exc:
@@ -149,20 +169,20 @@ def execute_state_machine_loop(
                         )
                     )
 
-                if generation.unique_inputs:
-                    ctx.store_step_outcome(input.case, exc)
+                if key is not None:
+                    ctx.store_step_outcome(key, exc)
                 ctx.step_errored()
                 raise
             except KeyboardInterrupt:
                 ctx.step_interrupted()
                 raise
             except BaseException as exc:
-                if generation.unique_inputs:
-                    ctx.store_step_outcome(input.case, exc)
+                if key is not None:
+                    ctx.store_step_outcome(key, exc)
                 raise exc
             else:
-                if generation.unique_inputs:
-                    ctx.store_step_outcome(input.case, None)
+                if key is not None:
+                    ctx.store_step_outcome(key, None)
             return result
 
         def validate_response(
@@ -223,7 +243,8 @@ def execute_state_machine_loop(
             ctx.reset_scenario()
             super().teardown()
 
-    seed = engine.config.seed
+    # Workers use non-overlapping seed sequences
+    seed = engine.config.seed + worker_id
 
     while True:
         # This loop is running until no new failures are found in a single iteration
@@ -244,7 +265,7 @@ def execute_state_machine_loop(
         InstrumentedStateMachine = hypothesis.seed(seed)(_InstrumentedStateMachine)
         # Predictably change the seed to avoid re-running the same sequences if tests fail
         # yet have reproducible results
-        seed += 1
+        seed += workers_num
         try:
             with catch_warnings(), ignore_hypothesis_output():
                 InstrumentedStateMachine.run(settings=hypothesis_settings)
@@ -313,6 +334,7 @@ def execute_state_machine_loop(
             ctx.reset()
         # Exit on the first successful state machine execution
         break
+    engine.outcome_cache.merge_statistic(ctx.step_outcomes)
 
 
 def validate_response(
@@ -346,7 +368,8 @@ def validate_response(
             code_sample="\n".join(commands),
             failure=failure,
         )
-        control.count_failure()
+        if stateful_ctx.is_first_occurrence(failure):
+            control.count_failure()
         stateful_ctx.mark_as_seen_in_suite(failure)
         collected.add(failure)
 
@@ -1,15 +1,41 @@
 from __future__ import annotations
 
+import threading
 from dataclasses import dataclass, field
 
-from schemathesis.core import NOT_SET, NotSet
+from schemathesis.core import NotSet
 from schemathesis.core.failures import Failure
 from schemathesis.core.transport import Response
 from schemathesis.engine import Status
+from schemathesis.engine.deduplication import OutcomeCache
 from schemathesis.generation.case import Case
 from schemathesis.generation.metrics import MetricCollector
 
 
+class SharedState:
+    """State shared by state machines running in parallel."""
+
+    __slots__ = ("workers_num", "_counted_failures", "_lock")
+
+    def __init__(self, workers_num: int = 1) -> None:
+        self.workers_num = workers_num
+        self._counted_failures: set[Failure] = set()
+        self._lock = threading.Lock()
+
+    def is_first_occurrence(self, failure: Failure) -> bool:
+        """Whether no worker has found this failure before.
+
+        Used only for counting towards `max-failures`, as check outcomes must not depend on other workers.
+        Otherwise, the same input could fail in one run of a test and pass when Hypothesis replays or shrinks it.
+        Failures found by several workers are deduplicated by event consumers, the same way as in other phases.
+        """
+        with self._lock:
+            if failure in self._counted_failures:
+                return False
+            self._counted_failures.add(failure)
+            return True
+
+
 @dataclass
 class StatefulContext:
     """Mutable context for state machine execution."""
@@ -28,7 +54,10 @@ class StatefulContext:
     completed_scenarios: int = 0
     # Metrics collector for targeted testing
     metric_collector: MetricCollector = field(default_factory=MetricCollector)
-    step_outcomes: dict[int, BaseException | None] = field(default_factory=dict)
+    # Outcomes of steps in the current scenario
+    step_outcomes: OutcomeCache = field(default_factory=OutcomeCache)
+    # State shared with other workers
+    shared: SharedState = field(default_factory=SharedState)
 
     @property
     def current_scenario_status(self) -> Status | None:
@@ -67,6 +96,10 @@ class StatefulContext:
     def is_seen_in_suite(self, exc: Failure) -> bool:
         return exc in self.seen_in_suite
 
+    def is_first_occurrence(self, exc: Failure) -> bool:
+        """Whether this failure was not found by any worker before."""
+        return self.shared.is_first_occurrence(exc)
+
     def collect_metric(self, case: Case, response: Response) -> None:
         self.metric_collector.store(case, response)
 
@@ -78,8 +111,8 @@ class StatefulContext:
         self.reset_scenario()
         self.metric_collector.reset()
 
-    def store_step_outcome(self, case: Case, outcome: BaseException | None) -> None:
-        self.step_outcomes[hash(case)] = outcome
+    def store_step_outcome(self, key: bytes, outcome: BaseException | None) -> None:
+        self.step_outcomes.store(key, outcome)
 
-    def get_step_outcome(self, case: Case) -> BaseException | None | NotSet:
-        return self.step_outcomes.get(hash(case), NOT_SET)
+    def get_step_outcome(self, key: bytes) -> BaseException | None | NotSet:
+        return self.step_outcomes.get(key)
@@ -19,6 +19,7 @@ from schemathesis.config import (
     ExamplesPhaseConfig,
     FuzzingPhaseConfig,
     OperationOrdering,
+    WorkersMode,
 )
 from schemathesis.core.errors import (
     AuthenticationError,
@@ -30,9 +31,11 @@ from schemathesis.core.errors import (
 from schemathesis.core.result import Ok, Result
 from schemathesis.engine import Status, events
 from schemathesis.engine.phases import PhaseName, PhaseSkipReason
-from schemathesis.engine.phases.unit._layered_scheduler import LayeredScheduler
-from schemathesis.engine.phases.unit._ordering import compute_operation_layers
+from schemathesis.engine.phases.unit._cost import CostScheduler, estimate_costs
+from schemathesis.engine.phases.unit._dependency_scheduler import DependencyScheduler
+from schemathesis.engine.phases.unit._ordering import compute_operation_dependencies, compute_operation_layers
 from schemathesis.engine.phases.unit._pool import DefaultScheduler, WorkerPool
+from schemathesis.engine.phases.unit._process_pool import EventSender, ProcessWorkerPool, RemoteScheduler
 from schemathesis.engine.recorder import ScenarioRecorder
 from schemathesis.generation import overrides
 from schemathesis.generation.hypothesis.builder import HypothesisTestConfig, HypothesisTestMode
@@ -47,18 +50,20 @@ if TYPE_CHECKING:
 WORKER_TIMEOUT = 0.1
 
 
-def _create_scheduler(engine: EngineContext, phase: Phase) -> DefaultScheduler | LayeredScheduler:
+def _create_scheduler(
+    engine: EngineContext, phase: Phase, operations: list[Result[APIOperation, InvalidSchema]]
+) -> DefaultScheduler | DependencyScheduler:
     """Create the appropriate scheduler based on ordering configuration.
 
     Args:
         engine: Engine context
         phase: Current phase
+        operations: All API operations & errors collected from the schema
 
     Returns:
-        Task scheduler (default or layered)
+        Task scheduler (default, dependency-aware, or cost-aware)
 
     """
-    operations: list[Result[APIOperation, InvalidSchema]] = list(engine.schema.get_all_operations())
     # Check if this is an OpenAPI schema (ordering only works for OpenAPI)
     if not isinstance(engine.schema, OpenApiSchema):
         return DefaultScheduler(operations=operations)
@@ -84,14 +89,21 @@ def _create_scheduler(engine: EngineContext, phase: Phase) -> DefaultScheduler |
     if not successes:
         return DefaultScheduler(operations=operations)
 
+    if ordering == OperationOrdering.COST:
+        costs = estimate_costs(successes, config=engine.config, phase=phase.name, durations=engine.durations)
+        return CostScheduler(operations, costs)
+
     layers = compute_operation_layers(engine.schema, successes)
 
     # If only one layer or no layers, no coordination needed - use default scheduler
     if len(layers) <= 1:
         return DefaultScheduler(operations=operations)
 
+    dependencies = compute_operation_dependencies(engine.schema, layers)
+    # Layers define the preferred order among operations that are ready at the same time
+    ordered = [operation for layer in layers for operation in layer]
     # Pass errors so they are reported after all successful operations are processed
-    return LayeredScheduler(layers, errors=errors)
+    return DependencyScheduler(ordered, dependencies, errors=errors, stop_event=engine.control.stop_event)
 
 
 def execute(engine: EngineContext, phase: Phase) -> events.EventGenerator:
@@ -109,7 +121,8 @@ def execute(engine: EngineContext, phase: Phase) -> events.EventGenerator:
 
     # Create scheduler based on ordering configuration
     try:
-        scheduler = _create_scheduler(engine, phase)
+        operations: list[Result[APIOperation, InvalidSchema]] = list(engine.schema.get_all_operations())
+        scheduler = _create_scheduler(engine, phase, operations)
     except HookExecutionError as exc:
         yield events.NonFatalError(
             error=exc, phase=phase.name, label=f"`{exc.hook_name}` hook", related_to_operation=False
@@ -123,17 +136,26 @@ def execute(engine: EngineContext, phase: Phase) -> events.EventGenerator:
 
     status = None
     is_executed = False
+    # Testing time & the number of test cases per operation, skipped scenarios are not counted
+    durations: dict[str, tuple[float, int]] = {}
+
+    pool_kwargs: dict[str, Any] = {
+        "workers_num": engine.config.workers,
+        "scheduler": scheduler,
+        "worker_factory": worker_task,
+        "ctx": engine,
+        "mode": mode,
+        "phase": phase.name,
+        "suite_id": suite_started.id,
+    }
+    pool: WorkerPool | ProcessWorkerPool
+    if engine.config.workers_mode == WorkersMode.PROCESS:
+        pool = ProcessWorkerPool(operations=operations, **pool_kwargs)
+    else:
+        pool = WorkerPool(**pool_kwargs)
 
     try:
-        with WorkerPool(
-            workers_num=engine.config.workers,
-            scheduler=scheduler,
-            worker_factory=worker_task,
-            ctx=engine,
-            mode=mode,
-            phase=phase.name,
-            suite_id=suite_started.id,
-        ) as pool:
+        with pool:
             try:
                 while True:
                     try:
@@ -149,6 +171,12 @@ def execute(engine: EngineContext, phase: Phase) -> events.EventGenerator:
                                 status = event.status
                             if event.status in (Status.ERROR, Status.FAILURE):
                                 engine.control.count_failure()
+                            if event.label is not None and event.status != Status.SKIP:
+                                elapsed, cases = durations.get(event.label, (0.0, 0))
+                                durations[event.label] = (
+                                    elapsed + event.elapsed_time,
+                                    cases + len(event.recorder.cases),
+                                )
                             engine.record_observations(event.recorder)
                         if isinstance(event, events.Interrupted) or engine.is_interrupted:
                             status = Status.INTERRUPTED
@@ -167,6 +195,9 @@ def execute(engine: EngineContext, phase: Phase) -> events.EventGenerator:
     except KeyboardInterrupt:
         # Hard stop, don't wait for worker threads
         pass
+    # Used to estimate costs of operations in the next phases. Phases generate different numbers of test cases,
+    # hence only the time per test case is comparable between them
+    engine.durations.update({label: elapsed / cases for label, (elapsed, cases) in durations.items() if cases})
 
     if not is_executed:
         phase.skip_reason = PhaseSkipReason.NOTHING_TO_TEST
@@ -180,8 +211,8 @@ def execute(engine: EngineContext, phase: Phase) -> events.EventGenerator:
 
 def worker_task(
     *,
-    events_queue: Queue,
-    scheduler: DefaultScheduler | LayeredScheduler,
+    events_queue: Queue | EventSender,
+    scheduler: DefaultScheduler | DependencyScheduler | RemoteScheduler,
     ctx: EngineContext,
     mode: HypothesisTestMode,
     phase: PhaseName,
@@ -232,52 +263,56 @@ def worker_task(
                     # All operations exhausted
                     break
 
-                if isinstance(result, Ok):
-                    operation = result.ok()
-                    phases = ctx.config.phases_for(operation=operation)
-                    # Skip tests if this phase is disabled
-                    if (
-                        (phase == PhaseName.EXAMPLES and not phases.examples.enabled)
-                        or (phase == PhaseName.FUZZING and not phases.fuzzing.enabled)
-                        or (phase == PhaseName.COVERAGE and not phases.coverage.enabled)
-                    ):
-                        continue
-                    as_strategy_kwargs = get_strategy_kwargs(ctx, operation=operation, phase=phase)
-                    scenario_started = events.ScenarioStarted(label=operation.label, phase=phase, suite_id=suite_id)
-                    events_queue.put(scenario_started)
-                    try:
-                        test_function = create_test(
+                try:
+                    if isinstance(result, Ok):
+                        operation = result.ok()
+                        phases = ctx.config.phases_for(operation=operation)
+                        # Skip tests if this phase is disabled
+                        if (
+                            (phase == PhaseName.EXAMPLES and not phases.examples.enabled)
+                            or (phase == PhaseName.FUZZING and not phases.fuzzing.enabled)
+                            or (phase == PhaseName.COVERAGE and not phases.coverage.enabled)
+                        ):
+                            continue
+                        as_strategy_kwargs = get_strategy_kwargs(ctx, operation=operation, phase=phase)
+                        scenario_started = events.ScenarioStarted(label=operation.label, phase=phase, suite_id=suite_id)
+                        events_queue.put(scenario_started)
+                        try:
+                            test_function = create_test(
+                                operation=operation,
+                                test_func=test_func,
+                                config=HypothesisTestConfig(
+                                    modes=[mode],
+                                    settings=ctx.config.get_hypothesis_settings(operation=operation, phase=phase.name),
+                                    seed=ctx.config.seed,
+                                    project=ctx.config,
+                                    as_strategy_kwargs=as_strategy_kwargs,
+                                ),
+                            )
+                        except (InvalidSchema, InvalidArgument, AuthenticationError, ValidationError) as exc:
+                            if is_regex_validation_error(exc):
+                                exc = InvalidRegexPattern.from_jsonschema_rs_error(exc)
+                            on_error(exc, method=operation.method, path=operation.path)
+                            continue
+
+                        # The test is blocking, meaning that even if CTRL-C comes to the main thread, this tasks will continue
+                        # executing. However, as we set a stop event, it will be checked before the next network request.
+                        # However, this is still suboptimal, as there could be slow requests and they will block for longer
+                        for event in run_test(
                             operation=operation,
-                            test_func=test_func,
-                            config=HypothesisTestConfig(
-                                modes=[mode],
-                                settings=ctx.config.get_hypothesis_settings(operation=operation, phase=phase.name),
-                                seed=ctx.config.seed,
-                                project=ctx.config,
-                                as_strategy_kwargs=as_strategy_kwargs,
-                            ),
-                        )
-                    except (InvalidSchema, InvalidArgument, AuthenticationError, ValidationError) as exc:
-                        if is_regex_validation_error(exc):
-                            exc = InvalidRegexPattern.from_jsonschema_rs_error(exc)
-                        on_error(exc, method=operation.method, path=operation.path)
-                        continue
-
-                    # The test is blocking, meaning that even if CTRL-C comes to the main thread, this tasks will continue
-                    # executing. However, as we set a stop event, it will be checked before the next network request.
-                    # However, this is still suboptimal, as there could be slow requests and they will block for longer
-                    for event in run_test(
-                        operation=operation,
-                        test_function=test_function,
-                        ctx=ctx,
-                        phase=phase,
-                        suite_id=suite_id,
-                        scenario_id=scenario_started.id,
-                    ):
-                        events_queue.put(event)
-                else:
-                    error = result.err()
-                    on_error(error, method=error.method, path=error.path)
+                            test_function=test_function,
+                            ctx=ctx,
+                            phase=phase,
+                            suite_id=suite_id,
+                            scenario_id=scenario_started.id,
+                        ):
+                            events_queue.put(event)
+                    else:
+                        error = result.err()
+                        on_error(error, method=error.method, path=error.path)
+                finally:
+                    # Operations depending on this one may be waiting for it
+                    scheduler.finish(result)
         except KeyboardInterrupt:
             events_queue.put(events.Interrupted(phase=phase))
 
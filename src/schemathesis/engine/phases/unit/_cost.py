@@ -0,0 +1,115 @@
+"""Cost-aware task scheduler that dispatches the most expensive operations first.
+
+With a shared queue of operations, a phase lasts at least as long as its slowest operation takes to test. When such
+operation is picked up last, all other workers are idle until it is done. Dispatching operations longest-first lets
+the cheap ones fill the gaps at the end of the phase instead.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any
+
+from schemathesis.core.errors import InvalidSchema
+from schemathesis.core.result import Err, Ok, Result
+from schemathesis.engine.phases.unit._pool import DefaultScheduler
+
+if TYPE_CHECKING:
+    from schemathesis.config import ProjectConfig
+    from schemathesis.engine.phases import PhaseName
+    from schemathesis.schemas import APIOperation
+
+# Schemas bigger than this are not counted further, they are expensive anyway
+MAX_SCHEMA_NODES = 10000
+COMBINATOR_KEYWORDS = ("oneOf", "anyOf", "allOf")
+
+
+class CostScheduler(DefaultScheduler):
+    """Schedules operations from the most expensive to the cheapest.
+
+    Schema errors are reported after all operations are dispatched.
+    """
+
+    def __init__(self, operations: list[Result[APIOperation, InvalidSchema]], costs: Mapping[str, float]) -> None:
+        successes = [result.ok() for result in operations if isinstance(result, Ok)]
+        # Sorting is stable, so operations with the same cost keep the schema order
+        successes.sort(key=lambda operation: costs.get(operation.label, 0.0), reverse=True)
+        queue: list[Result[APIOperation, InvalidSchema]] = [Ok(operation) for operation in successes]
+        queue.extend(result for result in operations if isinstance(result, Err))
+        super().__init__(queue)
+
+
+def estimate_costs(
+    operations: list[APIOperation],
+    *,
+    config: ProjectConfig,
+    phase: PhaseName,
+    durations: Mapping[str, float],
+) -> dict[str, float]:
+    """Estimate how long testing each operation takes, in arbitrary units.
+
+    `durations` are the average testing times per test case measured in previous phases. Phases generate different
+    numbers of test cases, hence these times are multiplied by the number of examples in the given phase.
+    For the remaining operations, the time per test case is estimated from the size of their schemas,
+    scaled to match the measured times.
+    """
+    sizes = {operation.label: estimate_size(operation) for operation in operations}
+    measured = {label: duration for label, duration in durations.items() if label in sizes}
+    size_total = sum(sizes[label] for label in measured)
+    scale = sum(measured.values()) / size_total if measured and size_total else 1.0
+    return {
+        operation.label: measured.get(operation.label, sizes[operation.label] * scale)
+        * _max_examples(operation, config=config, phase=phase)
+        for operation in operations
+    }
+
+
+def estimate_static_cost(operation: APIOperation, *, config: ProjectConfig, phase: PhaseName) -> float:
+    return estimate_size(operation) * _max_examples(operation, config=config, phase=phase)
+
+
+def estimate_size(operation: APIOperation) -> float:
+    # Every test case goes through generation of all parameters, roughly proportional to their schema sizes.
+    # In the coverage phase, the number of scenarios grows with the number of constrained schema nodes
+    size = 1
+    for parameter in operation.iter_parameters():
+        size += _component_size(parameter)
+    body_sizes = [_component_size(body) for body in operation.body]
+    if body_sizes:
+        # One media type is generated per test case
+        size += max(body_sizes)
+    return float(size)
+
+
+def _max_examples(operation: APIOperation, *, config: ProjectConfig, phase: PhaseName) -> int:
+    return config.generation_for(operation=operation, phase=phase.name).max_examples or 1
+
+
+def _component_size(component: Any) -> int:
+    try:
+        schema = getattr(component, "optimized_schema", None)
+    except Exception:
+        # Invalid schemas are reported when the operation is tested
+        return 0
+    return _schema_size(schema)
+
+
+def _schema_size(schema: Any) -> int:
+    """Count schema nodes, weighting alternatives in combinators."""
+    if not isinstance(schema, dict | list):
+        return 0
+    size = 0
+    stack = [schema]
+    while stack and size < MAX_SCHEMA_NODES:
+        item = stack.pop()
+        if isinstance(item, dict):
+            size += 1
+            for keyword in COMBINATOR_KEYWORDS:
+                alternatives = item.get(keyword)
+                if isinstance(alternatives, list):
+                    # Each alternative is explored separately
+                    size += len(alternatives)
+            stack.extend(value for value in item.values() if isinstance(value, dict | list))
+        elif isinstance(item, list):
+            stack.extend(value for value in item if isinstance(value, dict | list))
+    return size
@@ -0,0 +1,118 @@
+"""Task scheduler for dependency-aware operation ordering."""
+
+from __future__ import annotations
+
+import heapq
+import threading
+from collections import defaultdict
+from collections.abc import Mapping, Set
+from typing import TYPE_CHECKING
+
+from schemathesis.core.errors import InvalidSchema
+from schemathesis.core.result import Err, Ok, Result
+
+if TYPE_CHECKING:
+    from schemathesis.schemas import APIOperation
+
+# How often waiting workers check whether the run is stopped
+WAIT_TIMEOUT = 0.1
+
+
+class DependencyScheduler:
+    """Schedules operations so that each one starts only after all operations it depends on are finished.
+
+    An operation is released as soon as its own producers are tested, without waiting for unrelated operations.
+    Therefore, resources created by producers are already captured when their consumers are tested, while
+    independent chains of operations run in parallel.
+
+    Workers have to call `finish` after testing each operation they received. When no operation is ready,
+    `next_operation` blocks until another worker finishes one.
+    """
+
+    def __init__(
+        self,
+        operations: list[APIOperation],
+        dependencies: Mapping[str, Set[str]],
+        errors: list[InvalidSchema] | None = None,
+        stop_event: threading.Event | None = None,
+    ) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            operations: Operations in the preferred execution order, used when several operations are ready
+            dependencies: Labels of operations that each operation depends on. Must not contain cycles
+            errors: Schema errors to return after all operations are dispatched
+            stop_event: Releases waiting workers when the test run is stopped
+
+        """
+        self._operations = {operation.label: operation for operation in operations}
+        self._positions = {operation.label: idx for idx, operation in enumerate(operations)}
+        self._pending: dict[str, int] = {}
+        self._dependents: dict[str, list[str]] = defaultdict(list)
+        self._ready: list[tuple[int, str]] = []
+        for label in self._operations:
+            # Operations outside of the tested set will never finish
+            producers = {
+                producer
+                for producer in dependencies.get(label, ())
+                if producer in self._operations and producer != label
+            }
+            for producer in producers:
+                self._dependents[producer].append(label)
+            if producers:
+                self._pending[label] = len(producers)
+            else:
+                self._ready.append((self._positions[label], label))
+        heapq.heapify(self._ready)
+        self._in_progress = 0
+        self._errors = list(reversed(errors or []))
+        self._stop_event = stop_event
+        self._cancelled = False
+        self._condition = threading.Condition()
+
+    def next_operation(self) -> Result[APIOperation, InvalidSchema] | None:
+        """Get the next ready API operation, waiting for one if needed."""
+        with self._condition:
+            while True:
+                if self._ready:
+                    _, label = heapq.heappop(self._ready)
+                    self._in_progress += 1
+                    return Ok(self._operations[label])
+                if not self._pending:
+                    # All operations are dispatched
+                    if self._errors:
+                        return Err(self._errors.pop())
+                    return None
+                if self._cancelled or (self._stop_event is not None and self._stop_event.is_set()):
+                    return None
+                if self._in_progress == 0:
+                    # Nothing can release the remaining operations, e.g. if dependencies have a cycle
+                    self._release(min(self._pending, key=self._positions.__getitem__))
+                    continue
+                self._condition.wait(timeout=WAIT_TIMEOUT)
+
+    def finish(self, result: Result[APIOperation, InvalidSchema]) -> None:
+        """Mark an operation as tested, releasing operations that depend on it."""
+        if not isinstance(result, Ok):
+            return
+        with self._condition:
+            self._in_progress -= 1
+            for label in self._dependents.pop(result.ok().label, ()):
+                remaining = self._pending.get(label)
+                if remaining is None:
+                    continue
+                if remaining == 1:
+                    self._release(label)
+                else:
+                    self._pending[label] = remaining - 1
+            self._condition.notify_all()
+
+    def cancel(self) -> None:
+        """Stop handing out operations to waiting workers."""
+        with self._condition:
+            self._cancelled = True
+            self._condition.notify_all()
+
+    def _release(self, label: str) -> None:
+        del self._pending[label]
+        heapq.heappush(self._ready, (self._positions[label], label))
@@ -35,6 +35,7 @@ from schemathesis.core.failures import Failure, FailureGroup
 from schemathesis.core.transport import Response
 from schemathesis.engine import Status, events
 from schemathesis.engine.context import EngineContext
+from schemathesis.engine.deduplication import fingerprint
 from schemathesis.engine.errors import (
     DeadlineExceeded,
     TestingState,
@@ -379,7 +380,8 @@ def cached_test_func(f: Callable) -> Callable:
             if ctx.has_to_stop:
                 raise KeyboardInterrupt
             if generation.unique_inputs:
-                cached = ctx.get_cached_outcome(case)
+                key = fingerprint(case, transport_kwargs.get("headers"))
+                cached = ctx.get_cached_outcome(key)
                 if isinstance(cached, BaseException):
                     raise cached
                 elif cached is None:
@@ -395,10 +397,10 @@ def cached_test_func(f: Callable) -> Callable:
                         continue_on_failure=continue_on_failure,
                     )
                 except BaseException as exc:
-                    ctx.cache_outcome(case, exc)
+                    ctx.cache_outcome(key, exc)
                     raise
                 else:
-                    ctx.cache_outcome(case, None)
+                    ctx.cache_outcome(key, None)
             else:
                 f(
                     ctx=ctx,
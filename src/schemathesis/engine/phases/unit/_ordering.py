@@ -32,6 +32,33 @@ def compute_operation_layers(schema: OpenApiSchema, operations: list[APIOperatio
     return _compute_restful_layers(operations)
 
 
+def compute_operation_dependencies(schema: OpenApiSchema, layers: list[list[APIOperation]]) -> dict[str, set[str]]:
+    """Compute operations each operation has to wait for.
+
+    Args:
+        schema: OpenAPI schema with analysis data
+        layers: Operation layers computed by `compute_operation_layers`
+
+    Returns:
+        Mapping of operation labels to labels of operations that have to be tested before them.
+
+    """
+    dependencies = schema.analysis.dependencies
+
+    if dependencies is not None:
+        return dependencies
+
+    # RESTful heuristic has no information about individual operations, each layer waits for the previous one
+    result: dict[str, set[str]] = {}
+    previous: set[str] = set()
+    for layer in layers:
+        labels = {op.label for op in layer}
+        for label in labels:
+            result[label] = previous
+        previous = labels
+    return result
+
+
 def _compute_restful_layers(operations: Iterable[APIOperation]) -> list[list[APIOperation]]:
     """Compute layers using RESTful heuristics based on HTTP methods.
 
@@ -14,7 +14,7 @@ from schemathesis.schemas import APIOperation
 
 if TYPE_CHECKING:
     from schemathesis.engine.context import EngineContext
-    from schemathesis.engine.phases.unit._layered_scheduler import LayeredScheduler
+    from schemathesis.engine.phases.unit._dependency_scheduler import DependencyScheduler
     from schemathesis.generation.hypothesis.builder import HypothesisTestMode
 
 
@@ -30,6 +30,12 @@ class DefaultScheduler:
         with self.lock:
             return next(self.operations, None)
 
+    def finish(self, result: Result[APIOperation, InvalidSchema]) -> None:
+        """Mark an operation as tested."""
+
+    def cancel(self) -> None:
+        """Stop handing out operations to waiting workers."""
+
 
 class WorkerPool:
     """Manages a pool of worker threads."""
@@ -37,7 +43,7 @@ class WorkerPool:
     def __init__(
         self,
         workers_num: int,
-        scheduler: DefaultScheduler | LayeredScheduler,
+        scheduler: DefaultScheduler | DependencyScheduler,
         worker_factory: Callable,
         ctx: EngineContext,
         mode: HypothesisTestMode,
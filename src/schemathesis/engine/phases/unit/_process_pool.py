@@ -0,0 +1,414 @@
+"""Process-based worker pool for CPU-bound unit test phases.
+
+Worker processes are forked from the main one, so each of them inherits the already loaded schema and
+does not need to re-parse it. Operations are handed out by the scheduler in the main process, while
+generation, network requests and checks happen in workers. Events are pickled and sent back, so the
+consumers of the event stream do not see any difference from the thread-based pool.
+"""
+
+from __future__ import annotations
+
+import io
+import multiprocessing
+import pickle
+import queue
+import threading
+import uuid
+from collections.abc import Callable
+from types import TracebackType
+from typing import TYPE_CHECKING, Any
+
+from schemathesis.core.errors import InternalError, InvalidSchema
+from schemathesis.core.result import Err, Ok, Result
+from schemathesis.engine import events
+from schemathesis.engine.phases import PhaseName
+from schemathesis.schemas import APIOperation, BaseSchema
+
+if TYPE_CHECKING:
+    from multiprocessing.process import BaseProcess
+
+    from schemathesis.engine.context import EngineContext
+    from schemathesis.engine.deduplication import DeduplicationStatistic, OutcomeCache
+    from schemathesis.engine.phases.unit._dependency_scheduler import DependencyScheduler
+    from schemathesis.engine.phases.unit._pool import DefaultScheduler
+    from schemathesis.generation.hypothesis.builder import HypothesisTestMode
+
+# Marks that there are no more operations for a worker
+_DONE: None = None
+# Tags outcomes of unique inputs that a worker sends back when it finishes
+_OUTCOMES = "outcomes"
+# Tags refresh statistics of caching auth providers, in the order of `EngineContext.caching_auth_providers`
+_AUTH_REFRESHES = "auth-refreshes"
+FEEDER_TIMEOUT = 0.1
+
+
+def is_supported() -> bool:
+    """Whether process-based workers can be used on the current platform."""
+    return "fork" in multiprocessing.get_all_start_methods()
+
+
+class _EventPickler(pickle.Pickler):
+    """Pickler that sends references to API operations & the schema instead of their content.
+
+    Both are available in worker processes and in the main one, and pickling them would mean
+    pickling the whole schema with hooks, apps, etc.
+    """
+
+    def persistent_id(self, obj: Any) -> Any:
+        from http.client import HTTPConnection
+
+        from urllib3.connectionpool import ConnectionPool
+
+        if isinstance(obj, APIOperation):
+            return ("operation", obj.label)
+        if isinstance(obj, BaseSchema):
+            return ("schema", None)
+        if isinstance(obj, ConnectionPool | HTTPConnection):
+            # Referenced by network errors, but hold sockets & locks and are not needed for reporting
+            return ("omitted", None)
+        return None
+
+    def reducer_override(self, obj: Any) -> Any:
+        if isinstance(obj, BaseException):
+            # Exceptions are pickled via their `args` by default, which does not work for ones with keyword-only
+            # arguments. Tracebacks are not picklable and are already rendered into the error info
+            return _restore_exception, (type(obj), obj.args, _get_exception_state(obj), obj.__cause__, obj.__context__)
+        return NotImplemented
+
+
+class _EventUnpickler(pickle.Unpickler):
+    def __init__(self, file: io.BytesIO, *, schema: BaseSchema, operations: dict[str, APIOperation]) -> None:
+        super().__init__(file)
+        self.schema = schema
+        self.operations = operations
+
+    def persistent_load(self, pid: Any) -> Any:
+        kind, key = pid
+        if kind == "operation":
+            return self.operations[key]
+        if kind == "schema":
+            return self.schema
+        return None
+
+
+def _get_exception_state(exc: BaseException) -> dict[str, Any]:
+    state = dict(getattr(exc, "__dict__", {}))
+    for cls in type(exc).__mro__:
+        for name in cls.__dict__.get("__slots__", ()):
+            if name not in ("__dict__", "__weakref__") and hasattr(exc, name):
+                state[name] = getattr(exc, name)
+    return state
+
+
+def _restore_exception(
+    cls: type[BaseException],
+    args: tuple,
+    state: dict[str, Any],
+    cause: BaseException | None,
+    context: BaseException | None,
+) -> BaseException:
+    exc = cls.__new__(cls, *args)
+    exc.args = args
+    for name, value in state.items():
+        object.__setattr__(exc, name, value)
+    exc.__cause__ = cause
+    exc.__context__ = context
+    return exc
+
+
+def serialize_event(event: events.EngineEvent) -> bytes:
+    if isinstance(event, events.NonFatalError):
+        # Render everything that depends on the traceback before it is lost
+        _ = event.info.traceback
+        _ = event.info._kind
+        _ = event.info.extras
+    buffer = io.BytesIO()
+    try:
+        _EventPickler(buffer, protocol=pickle.HIGHEST_PROTOCOL).dump(event)
+    except Exception as exc:
+        label = getattr(event, "label", None) or "-"
+        phase = getattr(event, "phase", None)
+        assert isinstance(phase, PhaseName)
+        try:
+            raise InternalError(f"Failed to transfer `{type(event).__name__}` from a worker process: {exc}") from None
+        except InternalError as error:
+            fallback = events.NonFatalError(error=error, phase=phase, label=label, related_to_operation=False)
+        _ = fallback.info.traceback
+        buffer = io.BytesIO()
+        _EventPickler(buffer, protocol=pickle.HIGHEST_PROTOCOL).dump(fallback)
+    return buffer.getvalue()
+
+
+def deserialize_event(data: bytes, *, schema: BaseSchema, operations: dict[str, APIOperation]) -> events.EngineEvent:
+    return _EventUnpickler(io.BytesIO(data), schema=schema, operations=operations).load()
+
+
+def serialize_outcomes(cache: OutcomeCache) -> bytes:
+    statistic, entries = cache.export()
+    try:
+        return _dump((statistic, entries))
+    except Exception:
+        # Some outcomes can't be transferred, the corresponding inputs will be tested again
+        transferable = []
+        for entry in entries:
+            try:
+                _dump(entry)
+            except Exception:
+                continue
+            transferable.append(entry)
+        return _dump((statistic, transferable))
+
+
+def deserialize_outcomes(
+    data: bytes, *, schema: BaseSchema, operations: dict[str, APIOperation]
+) -> tuple[DeduplicationStatistic, list[tuple[bytes, BaseException | None]]]:
+    return _EventUnpickler(io.BytesIO(data), schema=schema, operations=operations).load()
+
+
+def _dump(value: Any) -> bytes:
+    buffer = io.BytesIO()
+    _EventPickler(buffer, protocol=pickle.HIGHEST_PROTOCOL).dump(value)
+    return buffer.getvalue()
+
+
+class EventSender:
+    """Queue-like interface for workers that pickles events before sending them to the main process."""
+
+    def __init__(self, channel: multiprocessing.Queue) -> None:
+        self.channel = channel
+
+    def put(self, event: events.EngineEvent) -> None:
+        self.channel.put(serialize_event(event))
+
+
+class EventReceiver:
+    """Queue-like interface for the main process that restores events sent by workers."""
+
+    def __init__(
+        self, channel: multiprocessing.Queue, *, schema: BaseSchema, operations: dict[str, APIOperation]
+    ) -> None:
+        self.channel = channel
+        self.schema = schema
+        self.operations = operations
+
+    def get(self, timeout: float | None = None) -> events.EngineEvent:
+        # Raises `queue.Empty` the same way as the regular queue does
+        data = self.channel.get(timeout=timeout)
+        return deserialize_event(data, schema=self.schema, operations=self.operations)
+
+
+class RemoteScheduler:
+    """Scheduler used inside worker processes.
+
+    Receives positions of operations inherited from the main process and reports back finished ones.
+    """
+
+    def __init__(
+        self,
+        tasks: multiprocessing.Queue,
+        finished: multiprocessing.Queue,
+        operations: list[Result[APIOperation, InvalidSchema]],
+        stop_event: Any,
+    ) -> None:
+        self.tasks = tasks
+        self.finished = finished
+        self.operations = operations
+        self.stop_event = stop_event
+        self._positions = {id(_unwrap(result)): idx for idx, result in enumerate(operations)}
+
+    def next_operation(self) -> Result[APIOperation, InvalidSchema] | None:
+        while not self.stop_event.is_set():
+            try:
+                position = self.tasks.get(timeout=FEEDER_TIMEOUT)
+            except queue.Empty:
+                continue
+            if position is _DONE:
+                return None
+            return self.operations[position]
+        return None
+
+    def finish(self, result: Result[APIOperation, InvalidSchema]) -> None:
+        self.finished.put(self._positions[id(_unwrap(result))])
+
+
+def _run_worker(
+    *,
+    worker_factory: Callable,
+    ctx: EngineContext,
+    mode: HypothesisTestMode,
+    phase: PhaseName,
+    suite_id: uuid.UUID,
+    operations: list[Result[APIOperation, InvalidSchema]],
+    tasks: multiprocessing.Queue,
+    finished: multiprocessing.Queue,
+    channel: multiprocessing.Queue,
+    stop_event: Any,
+) -> None:
+    ctx.prepare_subprocess(stop_event)
+    try:
+        worker_factory(
+            ctx=ctx,
+            mode=mode,
+            phase=phase,
+            events_queue=EventSender(channel),
+            scheduler=RemoteScheduler(tasks, finished, operations, stop_event),
+            suite_id=suite_id,
+        )
+    finally:
+        ctx.close()
+        # Sent via the same queue as finished operations, so the main process drains it while workers are running
+        finished.put((_OUTCOMES, serialize_outcomes(ctx.outcome_cache)))
+        finished.put((_AUTH_REFRESHES, [provider.statistic for provider in ctx.caching_auth_providers()]))
+
+
+class ProcessWorkerPool:
+    """Manages a pool of worker processes.
+
+    Provides the same interface as `WorkerPool`, so the main loop of the phase does not depend on the execution mode.
+    """
+
+    def __init__(
+        self,
+        workers_num: int,
+        scheduler: DefaultScheduler | DependencyScheduler,
+        operations: list[Result[APIOperation, InvalidSchema]],
+        worker_factory: Callable,
+        ctx: EngineContext,
+        mode: HypothesisTestMode,
+        phase: PhaseName,
+        suite_id: uuid.UUID,
+    ) -> None:
+        self.workers_num = workers_num
+        self.scheduler = scheduler
+        self.operations = operations
+        self.worker_factory = worker_factory
+        self.ctx = ctx
+        self.mode = mode
+        self.phase = phase
+        self.suite_id = suite_id
+        self.workers: list[BaseProcess] = []
+        self._mp = multiprocessing.get_context("fork")
+        self._tasks: multiprocessing.Queue = self._mp.Queue(maxsize=workers_num)
+        self._finished: multiprocessing.Queue = self._mp.Queue()
+        self._channel: multiprocessing.Queue = self._mp.Queue()
+        self._stop_event = self._mp.Event()
+        self._feeder: threading.Thread | None = None
+        self._collector: threading.Thread | None = None
+        self._positions = {id(_unwrap(result)): idx for idx, result in enumerate(operations)}
+        self._operations_by_label = {result.ok().label: result.ok() for result in operations if isinstance(result, Ok)}
+        self.events_queue = EventReceiver(self._channel, schema=ctx.schema, operations=self._operations_by_label)
+
+    def _feed(self) -> None:
+        """Pass operations from the scheduler to workers as they become free."""
+        pending: list[Any] = []
+        exhausted = False
+        while not self._stop_event.is_set() and not self.ctx.has_to_stop:
+            if not pending:
+                if exhausted:
+                    return
+                result = self.scheduler.next_operation()
+                if result is None:
+                    exhausted = True
+                    pending = [_DONE] * self.workers_num
+                    continue
+                pending = [self._positions[id(_unwrap(result))]]
+            try:
+                self._tasks.put(pending[0], timeout=FEEDER_TIMEOUT)
+                pending.pop(0)
+            except queue.Full:
+                continue
+
+    def _collect(self) -> None:
+        """Pass operations finished by workers to the scheduler."""
+        while not self._stop_event.is_set():
+            try:
+                item = self._finished.get(timeout=FEEDER_TIMEOUT)
+            except queue.Empty:
+                continue
+            self._on_finished(item)
+
+    def _on_finished(self, item: int | tuple[str, Any]) -> None:
+        if isinstance(item, tuple):
+            tag, data = item
+            if tag == _AUTH_REFRESHES:
+                for provider, refreshes in zip(self.ctx.caching_auth_providers(), data, strict=True):
+                    provider.merge_statistic(refreshes)
+                return
+            statistic, entries = deserialize_outcomes(
+                data, schema=self.ctx.schema, operations=self._operations_by_label
+            )
+            self.ctx.outcome_cache.merge(statistic, entries)
+        else:
+            self.scheduler.finish(self.operations[item])
+
+    def _drain_finished(self) -> None:
+        while True:
+            try:
+                item = self._finished.get(timeout=FEEDER_TIMEOUT)
+            except queue.Empty:
+                return
+            if isinstance(item, tuple):
+                # Operations are not scheduled anymore, but outcomes & statistics are still relevant
+                self._on_finished(item)
+
+    def start(self) -> None:
+        """Start all worker processes."""
+        for i in range(self.workers_num):
+            worker = self._mp.Process(
+                target=_run_worker,
+                kwargs={
+                    "worker_factory": self.worker_factory,
+                    "ctx": self.ctx,
+                    "mode": self.mode,
+                    "phase": self.phase,
+                    "suite_id": self.suite_id,
+                    "operations": self.operations,
+                    "tasks": self._tasks,
+                    "finished": self._finished,
+                    "channel": self._channel,
+                    "stop_event": self._stop_event,
+                },
+                name=f"schemathesis_unit_tests_{i}",
+                daemon=True,
+            )
+            self.workers.append(worker)
+            worker.start()
+        self._feeder = threading.Thread(target=self._feed, name="schemathesis_unit_tests_feeder", daemon=True)
+        self._feeder.start()
+        self._collector = threading.Thread(target=self._collect, name="schemathesis_unit_tests_collector", daemon=True)
+        self._collector.start()
+
+    def stop(self) -> None:
+        """Stop all workers gracefully."""
+        self._stop_event.set()
+        # The feeder may wait for operations that are never finished, e.g. if a worker process crashed
+        self.scheduler.cancel()
+        if self._feeder is not None:
+            self._feeder.join()
+        if self._collector is not None:
+            self._collector.join()
+        for worker in self.workers:
+            while worker.is_alive():
+                # Workers can't exit until their pending events are flushed, but they are not needed anymore
+                try:
+                    self._channel.get(timeout=FEEDER_TIMEOUT)
+                except queue.Empty:
+                    pass
+                self._drain_finished()
+            worker.join()
+        self._drain_finished()
+        self._tasks.cancel_join_thread()
+        self._finished.cancel_join_thread()
+
+    def __enter__(self) -> ProcessWorkerPool:
+        self.start()
+        return self
+
+    def __exit__(self, ty: type[BaseException] | None, value: BaseException | None, tb: TracebackType | None) -> None:
+        self.stop()
+
+
+def _unwrap(result: Result[APIOperation, InvalidSchema]) -> APIOperation | InvalidSchema:
+    if isinstance(result, Err):
+        return result.err()
+    return result.ok()
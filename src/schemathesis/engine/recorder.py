@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import base64
+import bisect
+import heapq
 import time
-from collections.abc import Iterator
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, cast
 
@@ -33,29 +35,77 @@ class ScenarioRecorder:
     checks: dict[str, list[CheckNode]]
     # Network interactions by test case ID
     interactions: dict[str, Interaction]
-    __slots__ = ("label", "status", "roots", "cases", "checks", "interactions")
+    __slots__ = (
+        "label",
+        "status",
+        "roots",
+        "cases",
+        "checks",
+        "interactions",
+        "_children",
+        "_roots",
+        "_positions",
+        "_successful",
+    )
 
     def __init__(self, *, label: str) -> None:
         self.label = label
         self.cases = {}
         self.checks = {}
         self.interactions = {}
+        # Indexes for fast lookups in long scenarios
+        # Parent ID -> IDs of its children in execution order
+        self._children: dict[str, list[str]] = {}
+        # Case ID -> ID of the root of its tree
+        self._roots: dict[str, str] = {}
+        # Case ID -> position in execution order
+        self._positions: dict[str, int] = {}
+        # (METHOD, path template) -> positions & IDs of cases with successful (2xx) responses in execution order
+        self._successful: dict[tuple[str, str], list[tuple[int, str]]] = {}
 
     def record_case(
         self, *, parent_id: str | None, case: Case, transition: Transition | None, is_transition_applied: bool
     ) -> None:
         """Record a test case and its relationship to a parent, if applicable."""
-        self.cases[case.id] = CaseNode(
+        case_id = case.id
+        previous = self.cases.get(case_id)
+        self.cases[case_id] = CaseNode(
             value=case,
             parent_id=parent_id,
             transition=transition,
             is_transition_applied=is_transition_applied,
         )
+        if previous is None:
+            self._positions[case_id] = len(self._positions)
+        elif previous.parent_id == parent_id:
+            # Already indexed under the same parent
+            return
+        elif previous.parent_id is not None:
+            self._children[previous.parent_id].remove(case_id)
+        if parent_id is None:
+            self._roots[case_id] = case_id
+        else:
+            self._roots[case_id] = self._roots.get(parent_id, parent_id)
+            children = self._children.setdefault(parent_id, [])
+            if previous is None:
+                children.append(case_id)
+            else:
+                # Keep children in execution order
+                positions = self._positions
+                bisect.insort(children, case_id, key=positions.__getitem__)
 
     def record_response(self, *, case_id: str, response: Response) -> None:
         """Record the API response for a given test case."""
         request = Request.from_prepared_request(response.request)
         self.interactions[case_id] = Interaction(request=request, response=response)
+        node = self.cases.get(case_id)
+        if node is not None and 200 <= response.status_code < 300:
+            operation = node.value.operation
+            entries = self._successful.setdefault((operation.method.upper(), operation.path), [])
+            entry = (self._positions[case_id], case_id)
+            idx = bisect.bisect_left(entries, entry)
+            if idx == len(entries) or entries[idx] != entry:
+                entries.insert(idx, entry)
 
     def record_request(self, *, case_id: str, request: requests.PreparedRequest) -> None:
         """Record a network-level error for a given test case."""
@@ -99,35 +149,79 @@ class ScenarioRecorder:
             return parent.value
         return None
 
+    def find_root(self, *, case_id: str) -> str:
+        """Find the ID of the root case in the tree containing a given test case."""
+        return self._roots.get(case_id, case_id)
+
+    def find_position(self, *, case_id: str) -> int | None:
+        """Find the position of a test case in execution order, if it was recorded."""
+        return self._positions.get(case_id)
+
     def find_related(self, *, case_id: str) -> Iterator[Case]:
-        """Iterate over all cases in the tree, starting from the root."""
-        seen = {case_id}
+        """Iterate over all cases in the tree, starting from the root.
 
-        # First, find the root by going up
-        current_id = case_id
-        while True:
-            current_node = self.cases.get(current_id)
-            if current_node is None or current_node.parent_id is None:
-                root_id = current_id
-                break
-            current_id = current_node.parent_id
-
-        # Then traverse the whole tree from root
-        def traverse(node_id: str) -> Iterator[Case]:
-            # Get all children
-            for case_id, node in self.cases.items():
-                if node.parent_id == node_id and case_id not in seen:
-                    seen.add(case_id)
-                    yield node.value
-                    # Recurse into children
-                    yield from traverse(case_id)
+        The given case and its descendants are not included.
+        """
+        seen = {case_id}
+        root_id = self.find_root(case_id=case_id)
 
         # Start traversal from root
         root_node = self.cases.get(root_id)
         if root_node and root_id not in seen:
             seen.add(root_id)
             yield root_node.value
-        yield from traverse(root_id)
+
+        # Depth-first traversal without recursion, so deep scenarios do not hit the recursion limit
+        cases = self.cases
+        children = self._children
+        stack = [iter(children.get(root_id, ()))]
+        while stack:
+            for child_id in stack[-1]:
+                if child_id not in seen:
+                    seen.add(child_id)
+                    yield cases[child_id].value
+                    stack.append(iter(children.get(child_id, ())))
+                    break
+            else:
+                stack.pop()
+
+    def find_successful_cases(
+        self,
+        *,
+        operation_filter: Callable[[str, str], bool],
+        after: str | None = None,
+        before: str | None = None,
+    ) -> Iterator[Case]:
+        """Iterate over cases with successful (2xx) responses in execution order.
+
+        Only operations for which `operation_filter(method, path)` is true are considered. The `after` and `before`
+        case IDs limit the results to the cases recorded strictly between them. If `after` is not recorded, nothing is
+        returned, and if `before` is not recorded after `after`, the range is not limited from the right.
+        """
+        start = 0
+        if after is not None:
+            position = self._positions.get(after)
+            if position is None:
+                return
+            start = position + 1
+        end = None
+        if before is not None:
+            position = self._positions.get(before)
+            if position is not None and position >= start:
+                end = position
+        ranges = []
+        for (method, path), entries in self._successful.items():
+            if not operation_filter(method, path):
+                continue
+            lo = bisect.bisect_left(entries, (start, ""))
+            hi = len(entries) if end is None else bisect.bisect_left(entries, (end, ""))
+            if lo < hi:
+                ranges.append(entries[lo:hi])
+        for _, case_id in heapq.merge(*ranges):
+            # The case may have been re-sent with a different outcome
+            response = self.find_response(case_id=case_id)
+            if response is not None and 200 <= response.status_code < 300:
+                yield self.cases[case_id].value
 
     def find_all_cases(self) -> Iterator[Case]:
         """Iterate over all recorded cases in execution order."""
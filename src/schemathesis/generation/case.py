@@ -171,6 +171,12 @@ class Case:
             # Update hash immediately so future in-place modifications can be detected
             self._meta.update_validated_hash(location, self._hash_container(value))
 
+    def __setstate__(self, state: tuple[None, dict[str, Any]]) -> None:
+        # Restore slots directly, as modification tracking depends on the restored state itself
+        _, slots = state
+        for name, value in slots.items():
+            object.__setattr__(self, name, value)
+
     @property
     def _override(self) -> Override:
         return Override.from_components(self._components, self)
@@ -357,17 +363,7 @@ class Case:
             **kwargs: Additional transport-level arguments.
 
         """
-        hook_context = HookContext(operation=self.operation)
-        dispatch("before_call", hook_context, self, _with_dual_style_kwargs=True, **kwargs)
-
-        # Revalidate metadata if dirty before freezing (captures user modifications)
-        if self._meta and self._meta.is_dirty():
-            self._check_modifications()
-            self._revalidate_metadata()
-
-        # Freeze metadata to prevent revalidation after request preparation transforms the body
-        object.__setattr__(self, "_freeze_metadata", True)
-
+        hook_context = self._before_call(kwargs)
         if self.operation.app is not None:
             kwargs.setdefault("app", self.operation.app)
         if "app" in kwargs:
@@ -388,22 +384,86 @@ class Case:
             # Configuration errors - don't add reproduction code
             raise
         except Exception as exc:
-            # Add reproduction code for check failures and app errors (e.g., ASGI/WSGI internal errors)
-            if not hasattr(exc, "__notes__"):
-                exc.__notes__ = []  # type: ignore[attr-defined]
-            verify = kwargs.get("verify", True)
-            try:
-                curl = self.as_curl_command(headers=headers, verify=verify)
-                exc.__notes__.append(f"\nReproduce with:\n\n    {curl}")  # type: ignore[attr-defined]
-            except Exception:
-                # Curl generation can fail for the same reason as the original error
-                # (e.g., malformed path template). Skip adding curl command to avoid
-                # replacing the original exception with a secondary error.
-                pass
+            self._add_reproduction_note(exc, headers=headers, verify=kwargs.get("verify", True))
+            raise
+        dispatch("after_call", hook_context, self, response)
+        return response
+
+    async def call_async(
+        self,
+        base_url: str | None = None,
+        session: httpx.AsyncClient | None = None,
+        headers: dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+        cookies: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> Response:
+        """Make an HTTP request with an async `httpx` client using this test case's data without validation.
+
+        Share one `session` between concurrent calls to keep many requests in flight over a common connection pool.
+        Create it with `http2=True` to multiplex requests over HTTP/2 (requires the `h2` package).
+
+        Args:
+            base_url: Override the schema's base URL.
+            session: Reuse an existing `httpx.AsyncClient`.
+            headers: Additional headers.
+            params: Additional query parameters.
+            cookies: Additional cookies.
+            **kwargs: Additional transport-level arguments.
+
+        """
+        from schemathesis.transport.httpx import HTTPX_TRANSPORT
+
+        if self.operation.app is not None and session is None:
+            raise IncorrectUsage(
+                "`call_async` does not run in-process apps directly. Pass a client bound to your app as `session`, "
+                "for example `httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url=...)`"
+            )
+        hook_context = self._before_call(kwargs)
+        try:
+            response = await HTTPX_TRANSPORT.send_async(
+                self,
+                session=session,
+                base_url=base_url,
+                headers=headers,
+                params=params,
+                cookies=cookies,
+                **kwargs,
+            )
+        except IncorrectUsage:
+            raise
+        except Exception as exc:
+            self._add_reproduction_note(exc, headers=headers, verify=kwargs.get("verify", True))
             raise
         dispatch("after_call", hook_context, self, response)
         return response
 
+    def _before_call(self, kwargs: dict[str, Any]) -> HookContext:
+        hook_context = HookContext(operation=self.operation)
+        dispatch("before_call", hook_context, self, _with_dual_style_kwargs=True, **kwargs)
+
+        # Revalidate metadata if dirty before freezing (captures user modifications)
+        if self._meta and self._meta.is_dirty():
+            self._check_modifications()
+            self._revalidate_metadata()
+
+        # Freeze metadata to prevent revalidation after request preparation transforms the body
+        object.__setattr__(self, "_freeze_metadata", True)
+        return hook_context
+
+    def _add_reproduction_note(self, exc: Exception, *, headers: dict[str, Any] | None, verify: bool) -> None:
+        # Add reproduction code for check failures and app errors (e.g., ASGI/WSGI internal errors)
+        if not hasattr(exc, "__notes__"):
+            exc.__notes__ = []  # type: ignore[attr-defined]
+        try:
+            curl = self.as_curl_command(headers=headers, verify=verify)
+            exc.__notes__.append(f"\nReproduce with:\n\n    {curl}")  # type: ignore[attr-defined]
+        except Exception:
+            # Curl generation can fail for the same reason as the original error
+            # (e.g., malformed path template). Skip adding curl command to avoid
+            # replacing the original exception with a secondary error.
+            pass
+
     def validate_response(
         self,
         response: Response | httpx.Response | requests.Response | TestResponse,
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+import json
 import re
 from contextlib import contextmanager, suppress
 from dataclasses import dataclass
 from functools import lru_cache, partial
-from itertools import combinations
+from itertools import combinations, islice
 
 from schemathesis.core.jsonschema.bundler import BUNDLE_STORAGE_KEY
 from schemathesis.core.jsonschema.keywords import ALL_KEYWORDS
@@ -42,6 +43,8 @@ from schemathesis.core.validation import contains_unicode_surrogate_pair, has_in
 from schemathesis.generation import GenerationMode
 from schemathesis.generation.hypothesis import examples
 from schemathesis.generation.meta import CoverageScenario
+from schemathesis.generation.sampler import SAMPLER
+from schemathesis.generation.verdicts import ValidationVerdicts
 from schemathesis.openapi.generation.filters import is_invalid_path_parameter
 from schemathesis.transport.serialization import contains_binary
 
@@ -366,14 +369,17 @@ class CoverageContext:
             return 0
         keys = sorted([k for k in schema if not k.startswith("x-") and k not in ["description", "example", "examples"]])
         if keys == ["type"]:
-            return cached_draw(get_strategy_for_type(schema["type"]))
+            ty = schema["type"]
+            return SAMPLER.for_type(ty, lambda: get_strategy_for_type(ty))
         if keys == ["format", "type"]:
             if schema["type"] != "string":
-                return cached_draw(get_strategy_for_type(schema["type"]))
+                ty = schema["type"]
+                return SAMPLER.for_type(ty, lambda: get_strategy_for_type(ty))
             elif schema["format"] in FORMAT_STRATEGIES:
-                return cached_draw(FORMAT_STRATEGIES[schema["format"]])
+                fmt = schema["format"]
+                return SAMPLER.draw(("format", fmt), lambda: cast(st.SearchStrategy, FORMAT_STRATEGIES[fmt]))
         if (keys == ["maxLength", "minLength", "type"] or keys == ["maxLength", "type"]) and schema["type"] == "string":
-            return cached_draw(st.text(min_size=schema.get("minLength", 0), max_size=schema["maxLength"]))
+            return SAMPLER.text(schema.get("minLength", 0), schema["maxLength"])
         if (
             keys == ["properties", "required", "type"]
             or keys == ["properties", "required"]
@@ -390,12 +396,11 @@ class CoverageContext:
         if (
             keys == ["maximum", "minimum", "type"] or keys == ["maximum", "type"] or keys == ["minimum", "type"]
         ) and schema["type"] == "integer":
-            return cached_draw(st.integers(min_value=schema.get("minimum"), max_value=schema.get("maximum")))
+            return SAMPLER.integer(schema.get("minimum"), schema.get("maximum"))
         if "enum" in schema:
-            return cached_draw(st.sampled_from(schema["enum"]))
+            return SAMPLER.sampled_from(schema["enum"])
         if keys == ["multipleOf", "type"] and schema["type"] in ("integer", "number"):
-            step = schema["multipleOf"]
-            return cached_draw(st.integers().map(step.__mul__))
+            return SAMPLER.multiple_of(schema["multipleOf"])
         if "pattern" in schema:
             pattern = schema["pattern"]
             try:
@@ -406,15 +411,17 @@ class CoverageContext:
                 min_length = schema.get("minLength")
                 max_length = schema.get("maxLength")
                 pattern = update_quantifier(pattern, min_length, max_length)
-            return cached_draw(st.from_regex(pattern))
+            return SAMPLER.draw(("pattern", pattern), lambda: st.from_regex(pattern))
         if (keys == ["items", "type"] or keys == ["items", "minItems", "type"]) and isinstance(schema["items"], dict):
             items = schema["items"]
             min_items = schema.get("minItems", 0)
             if "enum" in items:
-                return cached_draw(st.lists(st.sampled_from(items["enum"]), min_size=min_items))
+                enum = items["enum"]
+                element = enum[0] if isinstance(enum, list) and enum else NOT_SET
+                return SAMPLER.list_of(element, min_items, lambda: st.lists(st.sampled_from(enum), min_size=min_items))
             sub_keys = sorted([k for k in items if not k.startswith("x-") and k not in ["description", "example"]])
             if sub_keys == ["type"] and items["type"] == "string":
-                return cached_draw(st.lists(st.text(), min_size=min_items))
+                return SAMPLER.list_of("", min_items, lambda: st.lists(st.text(), min_size=min_items))
             if (
                 sub_keys == ["properties", "required", "type"]
                 or sub_keys == ["properties", "type"]
@@ -1016,28 +1023,31 @@ def cover_schema_iter(
                     resolved_schemas = [
                         ctx.resolve_ref(s["$ref"]) if isinstance(s, dict) and "$ref" in s else s for s in value
                     ]
-                    # Use Draft7 for validation since schemas are converted to Draft7 format (prefixItems -> items)
-                    validators = [jsonschema_rs.Draft7Validator(sub_schema) for sub_schema in resolved_schemas]
+                    validators = [_get_sub_schema_verdicts(sub_schema) for sub_schema in resolved_schemas]
                     for idx, sub_schema in enumerate(value):
                         with nctx.at(idx):
-                            for value in cover_schema_iter(nctx, sub_schema, seen):
-                                # Negative value for this schema could be a positive value for another one
-                                if is_valid_for_others(value.value, idx, validators):
-                                    continue
-                                yield value
+                            # Negative value for this schema could be a positive value for another one
+                            for batch in _batched(cover_schema_iter(nctx, sub_schema, seen)):
+                                for candidate, is_valid in zip(
+                                    batch, are_valid_for_others([c.value for c in batch], idx, validators), strict=True
+                                ):
+                                    if not is_valid:
+                                        yield candidate
                 elif key == "oneOf":
                     nctx = ctx.with_negative()
                     # Resolve refs before creating validators
                     resolved_schemas = [
                         ctx.resolve_ref(s["$ref"]) if isinstance(s, dict) and "$ref" in s else s for s in value
                     ]
-                    # Use Draft7 for validation since schemas are converted to Draft7 format (prefixItems -> items)
-                    validators = [jsonschema_rs.Draft7Validator(sub_schema) for sub_schema in resolved_schemas]
+                    validators = [_get_sub_schema_verdicts(sub_schema) for sub_schema in resolved_schemas]
                     for idx, sub_schema in enumerate(value):
                         with nctx.at(idx):
-                            for value in cover_schema_iter(nctx, sub_schema, seen):
-                                if is_invalid_for_oneOf(value.value, idx, validators):
-                                    yield value
+                            for batch in _batched(cover_schema_iter(nctx, sub_schema, seen)):
+                                for candidate, is_invalid in zip(
+                                    batch, are_invalid_for_oneOf([c.value for c in batch], idx, validators), strict=True
+                                ):
+                                    if is_invalid:
+                                        yield candidate
                 elif key == "not" and isinstance(value, dict | bool):
                     # For 'not' schemas: generate positive cases of inner schema (valid values)
                     # These valid values are negative for the outer schema, so flip the mode
@@ -1045,34 +1055,62 @@ def cover_schema_iter(
                     yield from _flip_generation_mode_for_not(cover_schema_iter(pctx, value, seen))
 
 
-def is_valid_for_others(value: Any, idx: int, validators: list[jsonschema_rs.Validator]) -> bool:
-    if contains_binary(value):
-        return False
+# Candidates are checked in small batches, so consumers that stop early don't pay for generating all of them
+CANDIDATES_BATCH_SIZE = 16
+
+
+def _batched(values: Iterator[GeneratedValue]) -> Generator[list[GeneratedValue], None, None]:
+    while batch := list(islice(values, CANDIDATES_BATCH_SIZE)):
+        yield batch
+
+
+@lru_cache(maxsize=256)
+def _get_cached_sub_schema_verdicts(serialized: str) -> ValidationVerdicts:
+    # Use Draft7 for validation since schemas are converted to Draft7 format (prefixItems -> items)
+    return ValidationVerdicts(jsonschema_rs.Draft7Validator(json.loads(serialized)))
+
+
+def _get_sub_schema_verdicts(schema: JsonSchema) -> ValidationVerdicts:
+    """Validators for `anyOf` / `oneOf` sub-schemas are shared between all places where the same sub-schema is used."""
+    try:
+        serialized = jsonschema_rs.canonical.json.to_string(schema)
+    except (TypeError, ValueError):
+        return ValidationVerdicts(jsonschema_rs.Draft7Validator(cast(JsonSchemaObject, schema)))
+    return _get_cached_sub_schema_verdicts(serialized)
+
+
+def are_valid_for_others(values: list[Any], idx: int, validators: list[ValidationVerdicts]) -> list[bool]:
+    """Check which values are valid for at least one sub-schema except the one being negated."""
+    results = [False] * len(values)
+    # Binary values cannot be validated by jsonschema_rs; treat them as not matching other sub-schemas
+    pending = [position for position, value in enumerate(values) if not contains_binary(value)]
     for vidx, validator in enumerate(validators):
-        if idx == vidx:
+        if idx == vidx or not pending:
             # This one is being negated
             continue
-        if validator.is_valid(value):
-            return True
-    return False
-
-
-def is_invalid_for_oneOf(value: Any, idx: int, validators: list[jsonschema_rs.Validator]) -> bool:
-    if contains_binary(value):
-        # Binary values cannot be validated by jsonschema_rs; treat as not matching any other sub-schema
-        return True
-    valid_count = 0
+        verdicts = validator.are_valid([values[position] for position in pending])
+        for position, is_valid in zip(pending, verdicts, strict=True):
+            results[position] = is_valid
+        # Values valid for one of sub-schemas are decided already
+        pending = [position for position, is_valid in zip(pending, verdicts, strict=True) if not is_valid]
+    return results
+
+
+def are_invalid_for_oneOf(values: list[Any], idx: int, validators: list[ValidationVerdicts]) -> list[bool]:
+    """Check which values either match no other sub-schema or match more than one of them."""
+    counts = [0] * len(values)
+    pending = [position for position, value in enumerate(values) if not contains_binary(value)]
     for vidx, validator in enumerate(validators):
-        if idx == vidx:
+        if idx == vidx or not pending:
             # This one is being negated
             continue
-        if validator.is_valid(value):
-            valid_count += 1
-            # Should circuit - no need to validate more, it is already invalid
-            if valid_count > 1:
-                return True
-    # No matching at all - we successfully generated invalid value
-    return valid_count == 0
+        verdicts = validator.are_valid([values[position] for position in pending])
+        for position, is_valid in zip(pending, verdicts, strict=True):
+            counts[position] += is_valid
+        # Should circuit - values matching more than one sub-schema are already invalid
+        pending = [position for position in pending if counts[position] <= 1]
+    # No matching at all or matching multiple sub-schemas - we successfully generated invalid value
+    return [count != 1 for count in counts]
 
 
 def _get_properties(schema: JsonSchema) -> JsonSchema:
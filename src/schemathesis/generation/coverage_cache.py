@@ -0,0 +1,178 @@
+"""On-disk cache of test cases generated by the coverage phase.
+
+Coverage cases depend only on the operation definition, the generation config and the Schemathesis version.
+They are stored in the schema cache directory under a fingerprint of these inputs, so unchanged operations replay
+their cases in later runs instead of generating them again.
+"""
+
+from __future__ import annotations
+
+import marshal
+from collections.abc import Callable, Generator, Iterator
+from time import perf_counter
+from typing import TYPE_CHECKING, Any
+
+import jsonschema_rs
+
+from schemathesis.core import NOT_SET
+from schemathesis.core.parameters import ParameterLocation
+from schemathesis.core.version import SCHEMATHESIS_VERSION
+from schemathesis.generation import GenerationMode
+from schemathesis.generation.meta import (
+    CaseMetadata,
+    ComponentInfo,
+    CoveragePhaseData,
+    CoverageScenario,
+    GenerationInfo,
+    PhaseInfo,
+)
+
+if TYPE_CHECKING:
+    from schemathesis.config import GenerationConfig
+    from schemathesis.core.schema_cache import SchemaCache
+    from schemathesis.generation.case import Case
+    from schemathesis.schemas import APIOperation
+
+CACHE_KIND = "coverage"
+
+
+def fingerprint(
+    *,
+    operation: APIOperation,
+    generation_modes: list[GenerationMode],
+    generate_duplicate_query_parameters: bool,
+    unexpected_methods: set[str],
+    generation_config: GenerationConfig,
+) -> str | None:
+    """Serialize everything coverage cases are generated from, if possible.
+
+    Returns `None` when the result may depend on something outside of the schema, e.g. user-registered strategies.
+    """
+    from schemathesis.specs.openapi.formats import STRING_FORMATS
+    from schemathesis.specs.openapi.media_types import MEDIA_TYPES
+    from schemathesis.specs.openapi.schemas import OpenApiSchema
+
+    if STRING_FORMATS or MEDIA_TYPES or not isinstance(operation.schema, OpenApiSchema):
+        return None
+    inputs = [
+        SCHEMATHESIS_VERSION,
+        operation.method,
+        operation.path,
+        sorted(operation.schema[operation.path]),
+        [
+            [parameter.definition, parameter.unoptimized_schema, parameter.examples]
+            for parameter in operation.iter_parameters()
+        ],
+        [[body.media_type, body.is_required, body.unoptimized_schema, body.examples] for body in operation.body],
+        [list(example) for example in operation.responses.iter_examples()],
+        [mode.value for mode in generation_modes],
+        generate_duplicate_query_parameters,
+        sorted(unexpected_methods),
+        generation_config.allow_x00,
+        generation_config.allow_extra_parameters,
+        generation_config.codec,
+        generation_config.exclude_header_characters,
+        operation.schema.adapter.jsonschema_validator_cls.__name__,
+    ]
+    try:
+        return jsonschema_rs.canonical.json.to_string(inputs)
+    except (TypeError, ValueError):
+        # Non-JSON data, e.g. binary examples
+        return None
+
+
+def dump_case(case: Case) -> bytes:
+    """Serialize a coverage case into a standalone record."""
+    meta = case.meta
+    assert meta is not None
+    data = meta.phase.data
+    assert isinstance(data, CoveragePhaseData)
+    # Only built-in types, as required by `marshal`
+    record: tuple[Any, ...] = (
+        case.method,
+        case.path_parameters,
+        dict(case.headers),
+        case.cookies,
+        case.query,
+        # Distinguishes an absent body from `None`
+        () if case.body is NOT_SET else (case.body,),
+        case.media_type,
+        case.multipart_content_types,
+        meta.generation.mode.value,
+        tuple((location.value, info.mode.value) for location, info in meta.components.items()),
+        data.scenario.value,
+        data.description,
+        data.location,
+        data.parameter,
+        data.parameter_location.value if data.parameter_location is not None else None,
+    )
+    return marshal.dumps(record)
+
+
+def load_case(operation: APIOperation, record: bytes) -> Case:
+    start = perf_counter()
+    (
+        method,
+        path_parameters,
+        headers,
+        cookies,
+        query,
+        body,
+        media_type,
+        multipart_content_types,
+        mode,
+        components,
+        scenario,
+        description,
+        location,
+        parameter,
+        parameter_location,
+    ) = marshal.loads(record)
+    return operation.Case(
+        method=method,
+        path_parameters=path_parameters,
+        headers=headers,
+        cookies=cookies,
+        query=query,
+        body=body[0] if body else NOT_SET,
+        media_type=media_type,
+        multipart_content_types=multipart_content_types,
+        _meta=CaseMetadata(
+            generation=GenerationInfo(time=perf_counter() - start, mode=GenerationMode(mode)),
+            components={
+                ParameterLocation(component_location): ComponentInfo(mode=GenerationMode(component_mode))
+                for component_location, component_mode in components
+            },
+            phase=PhaseInfo.coverage(
+                scenario=CoverageScenario(scenario),
+                description=description,
+                location=location,
+                parameter=parameter,
+                parameter_location=ParameterLocation(parameter_location) if parameter_location is not None else None,
+            ),
+        ),
+    )
+
+
+def iter_cached(
+    cache: SchemaCache, content: str, operation: APIOperation, generate: Callable[[], Iterator[Case]]
+) -> Generator[Case, None, None]:
+    """Replay cached cases, or generate them and store them once the generation is finished."""
+    key = cache.key(content, CACHE_KIND)
+    found, records = cache.get(key)
+    if found and isinstance(records, list):
+        for record in records:
+            yield load_case(operation, record)
+        return
+    stored: list[bytes] | None = []
+    for case in generate():
+        if stored is not None:
+            try:
+                # Cases are modified after they are yielded, therefore they are serialized right away
+                stored.append(dump_case(case))
+            except ValueError:
+                # Values that can't be stored, e.g. instances of custom classes
+                stored = None
+        yield case
+    if stored is not None:
+        cache.set(key, stored)
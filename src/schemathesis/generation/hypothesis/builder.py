@@ -418,7 +418,7 @@ def generate_coverage_cases(
         warnings.filterwarnings(
             "ignore", message=".*but this is not valid syntax for a Python regular expression.*", category=UserWarning
         )
-        for case in _iter_coverage_cases(
+        for case in _iter_cached_coverage_cases(
             operation=operation,
             generation_modes=generation_modes,
             generate_duplicate_query_parameters=generate_duplicate_query_parameters,
@@ -613,6 +613,44 @@ def _generate_multipart_body_from_custom_strategies(body: OpenApiBody) -> dict[s
     return result if has_custom_strategy else None
 
 
+def _iter_cached_coverage_cases(
+    *,
+    operation: APIOperation,
+    generation_modes: list[GenerationMode],
+    generate_duplicate_query_parameters: bool,
+    unexpected_methods: set[str],
+    generation_config: GenerationConfig,
+) -> Generator[Case, None, None]:
+    from schemathesis.core.schema_cache import get_schema_cache
+    from schemathesis.generation import coverage_cache
+
+    def generate() -> Generator[Case, None, None]:
+        return _iter_coverage_cases(
+            operation=operation,
+            generation_modes=generation_modes,
+            generate_duplicate_query_parameters=generate_duplicate_query_parameters,
+            unexpected_methods=unexpected_methods,
+            generation_config=generation_config,
+        )
+
+    cache = get_schema_cache(operation.schema.config.schema_cache)
+    content = (
+        coverage_cache.fingerprint(
+            operation=operation,
+            generation_modes=generation_modes,
+            generate_duplicate_query_parameters=generate_duplicate_query_parameters,
+            unexpected_methods=unexpected_methods,
+            generation_config=generation_config,
+        )
+        if cache is not None
+        else None
+    )
+    if cache is None or content is None:
+        yield from generate()
+    else:
+        yield from coverage_cache.iter_cached(cache, content, operation, generate)
+
+
 def _iter_coverage_cases(
     *,
     operation: APIOperation,
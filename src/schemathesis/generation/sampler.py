@@ -0,0 +1,126 @@
+"""Fast value sampling for the coverage phase.
+
+The coverage phase needs a single representative value per schema, and a one-example Hypothesis run always
+produces the simplest value a strategy can generate. For common constraint shapes this value is known upfront,
+so it is computed directly instead of building and running a `@given` test for every draw.
+Anything else is drawn via Hypothesis once and kept in a bounded pool keyed by the schema shape.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable, Hashable
+from typing import Any
+
+from hypothesis import strategies as st
+
+from schemathesis.core import NOT_SET
+from schemathesis.core.transforms import deepclone
+from schemathesis.generation.hypothesis import examples
+
+DEFAULT_POOL_SIZE = 1024
+
+# The simplest value Hypothesis generates for each strategy in `coverage.STRATEGIES_FOR_TYPE`
+SIMPLEST_FOR_TYPE: dict[str, Any] = {
+    "integer": 0,
+    "number": 0,
+    "boolean": False,
+    "null": None,
+    "string": "",
+    "array": [None, None],
+    "object": {},
+}
+# `st.text()` shrinks towards this character
+SIMPLEST_CHARACTER = "0"
+
+
+def _is_int(value: object) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _fresh(value: Any) -> Any:
+    return deepclone(value) if isinstance(value, dict | list) else value
+
+
+class ValueSampler:
+    """Deterministic sampler for values of simple schemas."""
+
+    __slots__ = ("_pool", "_max_size", "_lock")
+
+    def __init__(self, max_size: int = DEFAULT_POOL_SIZE) -> None:
+        self._pool: dict[Hashable, Any] = {}
+        self._max_size = max_size
+        # The sampler is shared by all worker threads
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._pool)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._pool.clear()
+
+    def draw(self, key: Hashable, strategy: Callable[[], st.SearchStrategy]) -> Any:
+        """Draw a value via Hypothesis, reusing the previous draw for the same key."""
+        value = self._pool.get(key, NOT_SET)
+        if value is NOT_SET:
+            value = examples.generate_one(strategy())
+            with self._lock:
+                if len(self._pool) >= self._max_size:
+                    # Evict the oldest entry
+                    del self._pool[next(iter(self._pool))]
+                self._pool[key] = value
+        return _fresh(value)
+
+    def for_type(self, ty: str | list[str], strategy: Callable[[], st.SearchStrategy]) -> Any:
+        if isinstance(ty, str):
+            if ty in SIMPLEST_FOR_TYPE:
+                return _fresh(SIMPLEST_FOR_TYPE[ty])
+        elif isinstance(ty, list):
+            # `st.one_of` generates from its first branch
+            for item in ty:
+                if isinstance(item, str) and item in SIMPLEST_FOR_TYPE:
+                    return _fresh(SIMPLEST_FOR_TYPE[item])
+        return self.draw(("type", repr(ty)), strategy)
+
+    def text(self, min_size: Any, max_size: Any) -> Any:
+        if _is_int(min_size) and _is_int(max_size) and 0 <= min_size <= max_size:
+            return SIMPLEST_CHARACTER * min_size
+        return self.draw(
+            ("text", repr(min_size), repr(max_size)), lambda: st.text(min_size=min_size, max_size=max_size)
+        )
+
+    def integer(self, min_value: Any, max_value: Any) -> Any:
+        if (min_value is None or _is_int(min_value)) and (max_value is None or _is_int(max_value)):
+            if min_value is not None and max_value is not None and min_value > max_value:
+                # Let Hypothesis report invalid bounds
+                return examples.generate_one(st.integers(min_value=min_value, max_value=max_value))
+            # Integers shrink towards zero
+            if min_value is not None and min_value > 0:
+                return min_value
+            if max_value is not None and max_value < 0:
+                return max_value
+            return 0
+        return self.draw(
+            ("integer", repr(min_value), repr(max_value)),
+            lambda: st.integers(min_value=min_value, max_value=max_value),
+        )
+
+    def multiple_of(self, step: Any) -> Any:
+        if isinstance(step, int | float):
+            return step * 0
+        return self.draw(("multipleOf", repr(step)), lambda: st.integers().map(step.__mul__))
+
+    def sampled_from(self, values: list[Any]) -> Any:
+        if isinstance(values, list) and values:
+            return values[0]
+        return examples.generate_one(st.sampled_from(values))
+
+    def list_of(self, element: Any, min_size: Any, strategy: Callable[[], st.SearchStrategy]) -> Any:
+        """Sample a list whose elements all have the given simplest value."""
+        if _is_int(min_size) and min_size >= 0 and element is not NOT_SET:
+            return [_fresh(element) for _ in range(min_size)]
+        return self.draw(("list", repr(element), repr(min_size)), strategy)
+
+
+SAMPLER = ValueSampler()
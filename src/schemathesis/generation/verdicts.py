@@ -0,0 +1,81 @@
+"""Memoized validation verdicts for generated values.
+
+Negative generation checks every candidate against the original schema, and the same candidates come up many times:
+Hypothesis replays simple values and the coverage phase checks values of each sub-schema against all the others.
+Verdicts are stored under a canonical form of the value, so repeated candidates skip the round trip to the validator.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Hashable, Sequence
+from typing import Any
+
+import jsonschema_rs
+
+DEFAULT_MAX_SIZE = 4096
+_SCALAR_TYPES = frozenset((str, int, float, bool, type(None)))
+
+
+def verdict_key(value: Any) -> Hashable | None:
+    """A key equal for values that validate the same way, or `None` if the value can't be keyed."""
+    if type(value) in _SCALAR_TYPES:
+        # Types are part of the key, as `True == 1` in Python, but not in JSON Schema
+        return (type(value), value)
+    try:
+        return jsonschema_rs.canonical.json.to_string(value)
+    except (TypeError, ValueError):
+        # Non-JSON data, e.g. bytes
+        return None
+
+
+class ValidationVerdicts:
+    """Validation results of a single validator, memoized by the canonical form of validated values."""
+
+    __slots__ = ("validator", "_verdicts", "_max_size", "_lock")
+
+    def __init__(self, validator: jsonschema_rs.Validator, *, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        self.validator = validator
+        self._verdicts: dict[Hashable, bool] = {}
+        self._max_size = max_size
+        # Instances are shared between threads via module-level caches
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._verdicts)
+
+    def is_valid(self, value: Any) -> bool:
+        key = verdict_key(value)
+        if key is None:
+            return self.validator.is_valid(value)
+        verdict = self._verdicts.get(key)
+        if verdict is None:
+            verdict = self.validator.is_valid(value)
+            self._store(key, verdict)
+        return verdict
+
+    def are_valid(self, values: Sequence[Any]) -> list[bool]:
+        """Validate a batch of values, checking each distinct value only once."""
+        verdicts = []
+        pending: dict[Hashable, bool] = {}
+        for value in values:
+            key = verdict_key(value)
+            if key is None:
+                verdicts.append(self.validator.is_valid(value))
+                continue
+            verdict = self._verdicts.get(key)
+            if verdict is None:
+                verdict = pending.get(key)
+            if verdict is None:
+                verdict = pending[key] = self.validator.is_valid(value)
+            verdicts.append(verdict)
+        for key, verdict in pending.items():
+            self._store(key, verdict)
+        return verdicts
+
+    def _store(self, key: Hashable, verdict: bool) -> None:
+        with self._lock:
+            if key not in self._verdicts and len(self._verdicts) >= self._max_size:
+                # Evict the oldest entry
+                del self._verdicts[next(iter(self._verdicts))]
+            self._verdicts[key] = verdict
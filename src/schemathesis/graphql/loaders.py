@@ -246,6 +246,8 @@ def from_dict(schema: dict[str, Any], *, config: SchemathesisConfig | None = Non
     instance = GraphQLSchema(schema, config=project_config)
     instance.filter_set = project_config.operations.filter_set_with(include=instance.filter_set)
     dispatch("after_load_schema", hook_context, instance)
+    # The hook may build operations and modify the raw schema afterwards
+    instance.invalidate_operations()
     return instance
 
 
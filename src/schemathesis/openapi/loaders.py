@@ -13,6 +13,7 @@ from schemathesis.core import media_types
 from schemathesis.core.deserialization import deserialize_yaml
 from schemathesis.core.errors import LoaderError, LoaderErrorKind
 from schemathesis.core.loaders import load_from_url, prepare_request_kwargs, raise_for_status, require_relative_url
+from schemathesis.core.schema_cache import SchemaCache, get_schema_cache
 from schemathesis.hooks import HookContext, dispatch
 from schemathesis.python import asgi, wsgi
 
@@ -40,10 +41,12 @@ def from_asgi(path: str, app: Any, *, config: SchemathesisConfig | None = None,
 
     """
     require_relative_url(path)
+    if config is None:
+        config = SchemathesisConfig.discover()
     client = asgi.get_client(app)
     response = load_from_url(client.get, url=path, **kwargs)
     content_type = detect_content_type(headers=response.headers, path=path)
-    schema = load_content(response.text, content_type)
+    schema = load_content(response.text, content_type, cache=get_schema_cache(config.schema_cache))
     loaded = from_dict(schema=schema, config=config)
     loaded.app = app
     loaded.location = path
@@ -71,11 +74,13 @@ def from_wsgi(path: str, app: Any, *, config: SchemathesisConfig | None = None,
     """
     require_relative_url(path)
     prepare_request_kwargs(kwargs)
+    if config is None:
+        config = SchemathesisConfig.discover()
     client = wsgi.get_client(app)
     response = client.get(path=path, **kwargs)
     raise_for_status(response)
     content_type = detect_content_type(headers=response.headers, path=path)
-    schema = load_content(response.text, content_type)
+    schema = load_content(response.text, content_type, cache=get_schema_cache(config.schema_cache))
     loaded = from_dict(schema=schema, config=config)
     loaded.app = app
     loaded.location = path
@@ -112,14 +117,14 @@ def from_url(
     """
     import requests
 
+    if config is None:
+        config = SchemathesisConfig.discover()
     if wait_for_schema is None:
-        if config is None:
-            config = SchemathesisConfig.discover()
         wait_for_schema = config.wait_for_schema
 
     response = load_from_url(requests.get, url=url, wait_for_schema=wait_for_schema, **kwargs)
     content_type = detect_content_type(headers=response.headers, path=url)
-    schema = load_content(response.text, content_type)
+    schema = load_content(response.text, content_type, cache=get_schema_cache(config.schema_cache))
     loaded = from_dict(schema=schema, config=config)
     loaded.location = url
     return loaded
@@ -147,9 +152,11 @@ def from_path(
         ```
 
     """
+    if config is None:
+        config = SchemathesisConfig.discover()
     with open(path, encoding=encoding) as file:
         content_type = detect_content_type(headers=None, path=str(path))
-        schema = load_content(file.read(), content_type)
+        schema = load_content(file.read(), content_type, cache=get_schema_cache(config.schema_cache))
     loaded = from_dict(schema=schema, config=config)
     loaded.location = Path(path).absolute().as_uri()
     return loaded
@@ -233,6 +240,8 @@ def from_dict(schema: dict[str, Any], *, config: SchemathesisConfig | None = Non
     instance = OpenApiSchema(raw_schema=schema, config=project_config)
     instance.filter_set = project_config.operations.filter_set_with(include=instance.filter_set)
     dispatch("after_load_schema", hook_context, instance)
+    # The hook may build operations and modify the raw schema afterwards
+    instance.invalidate_operations()
     return instance
 
 
@@ -276,8 +285,13 @@ def _detect_from_path(path: str) -> ContentType:
     return ContentType.UNKNOWN
 
 
-def load_content(content: str, content_type: ContentType) -> dict[str, Any]:
-    """Load content using appropriate parser."""
+def load_content(content: str, content_type: ContentType, *, cache: SchemaCache | None = None) -> dict[str, Any]:
+    """Load content using appropriate parser.
+
+    With `cache`, documents parsed in previous runs are read from it instead of being parsed again.
+    """
+    if cache is not None:
+        return cache.load(content, content_type.name, lambda: load_content(content, content_type))
     if content_type == ContentType.JSON:
         return _load_json(content)
     if content_type == ContentType.YAML:
@@ -2,9 +2,9 @@ from __future__ import annotations
 
 import threading
 from collections import defaultdict, deque
-from collections.abc import Iterable, Sequence
+from collections.abc import Callable, Hashable, Iterable, Sequence
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, TypeAlias
 
 import jsonschema_rs
 
@@ -31,6 +31,55 @@ class ResourceInstance:
     context: dict[str, Any]
 
 
+# Extracts a deduplication key and a variant from an instance of the given resource type
+VariantExtractor: TypeAlias = Callable[[str, ResourceInstance], tuple[Hashable, Any] | None]
+
+
+class VariantIndex:
+    """Unique variants extracted from cached resource instances.
+
+    Counts how many cached instances produce each variant, so it can be updated as instances are stored and evicted.
+    """
+
+    __slots__ = ("_extract", "_entries", "_keys", "_variants")
+
+    def __init__(self, extract: VariantExtractor) -> None:
+        self._extract = extract
+        # Deduplication key -> [variant, number of instances producing it]
+        self._entries: dict[Hashable, list[Any]] = {}
+        # Keys of indexed instances, so they are not extracted again on eviction
+        self._keys: dict[int, Hashable] = {}
+        self._variants: list[Any] | None = None
+
+    def add(self, resource_name: str, instance: ResourceInstance) -> None:
+        extracted = self._extract(resource_name, instance)
+        if extracted is None:
+            return
+        key, variant = extracted
+        self._keys[id(instance)] = key
+        entry = self._entries.get(key)
+        if entry is None:
+            self._entries[key] = [variant, 1]
+            self._variants = None
+        else:
+            entry[1] += 1
+
+    def discard(self, instance: ResourceInstance) -> None:
+        key = self._keys.pop(id(instance), None)
+        if key is None:
+            return
+        entry = self._entries[key]
+        entry[1] -= 1
+        if entry[1] == 0:
+            del self._entries[key]
+            self._variants = None
+
+    def variants(self) -> list[Any]:
+        if self._variants is None:
+            self._variants = [variant for variant, _ in self._entries.values()]
+        return self._variants
+
+
 class ResourceRepository:
     """Thread-safe cache storing resources from API responses for test generation.
 
@@ -43,6 +92,8 @@ class ResourceRepository:
         "_descriptors_by_operation",
         "_resource_buckets",
         "_context_order",
+        "_variant_indexes",
+        "_indexes_by_resource",
         "_lock",
     )
 
@@ -52,6 +103,9 @@ class ResourceRepository:
         self._resource_buckets: dict[str, dict[str, deque[ResourceInstance]]] = {}
         # Track context insertion order for FIFO eviction of contexts
         self._context_order: dict[str, deque[str]] = {}
+        # Indexes of unique variants, maintained as instances are stored & evicted
+        self._variant_indexes: dict[Hashable, VariantIndex] = {}
+        self._indexes_by_resource: dict[str, list[VariantIndex]] = defaultdict(list)
         self._lock = threading.Lock()
 
         for descriptor in descriptors:
@@ -77,6 +131,24 @@ class ResourceRepository:
             instances.extend(bucket)
         return tuple(instances)
 
+    def get_variants(self, key: Hashable, resource_names: Iterable[str], extract: VariantExtractor) -> list[Any]:
+        """Get unique variants extracted from cached instances of the given resource types.
+
+        The index identified by `key` is built on the first call and then updated as instances are stored and
+        evicted, so subsequent calls do not scan the cache. The returned list must not be modified.
+        """
+        with self._lock:
+            index = self._variant_indexes.get(key)
+            if index is None:
+                index = VariantIndex(extract)
+                for resource_name in dict.fromkeys(resource_names):
+                    for bucket in self._resource_buckets.get(resource_name, {}).values():
+                        for instance in bucket:
+                            index.add(resource_name, instance)
+                    self._indexes_by_resource[resource_name].append(index)
+                self._variant_indexes[key] = index
+            return index.variants()
+
     def record_response(
         self, *, operation: str, status_code: int, payload: Any, context: dict[str, Any] | None = None
     ) -> None:
@@ -150,15 +222,27 @@ class ResourceRepository:
         )
 
         with self._lock:
+            indexes = self._indexes_by_resource.get(resource_name, ())
             # Get or create bucket for this context
-            if context_key not in context_buckets:
+            bucket = context_buckets.get(context_key)
+            if bucket is None:
                 # Check if we need to evict an old context
                 if len(context_buckets) >= MAX_CONTEXTS_PER_TYPE:
                     # Remove the oldest context
                     oldest_key = context_order.popleft()
-                    del context_buckets[oldest_key]
+                    evicted = context_buckets.pop(oldest_key)
+                    for index in indexes:
+                        for old in evicted:
+                            index.discard(old)
                 # Create new bucket for this context
-                context_buckets[context_key] = deque(maxlen=PER_CONTEXT_CAPACITY)
+                bucket = deque(maxlen=PER_CONTEXT_CAPACITY)
+                context_buckets[context_key] = bucket
                 context_order.append(context_key)
-
-            context_buckets[context_key].append(instance)
+            elif len(bucket) == bucket.maxlen:
+                # The oldest instance is dropped by the append below
+                for index in indexes:
+                    index.discard(bucket[0])
+
+            bucket.append(instance)
+            for index in indexes:
+                index.add(resource_name, instance)
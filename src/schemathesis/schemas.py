@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import threading
 from collections.abc import Callable, Generator, Iterator, Mapping
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from functools import cached_property, lru_cache, partial
 from itertools import chain
@@ -14,7 +16,7 @@ from typing import (
 from urllib.parse import quote, unquote, urljoin, urlsplit, urlunsplit
 
 from schemathesis import transport
-from schemathesis.config import ProjectConfig
+from schemathesis.config import HttpClient, ProjectConfig
 from schemathesis.core import NOT_SET, NotSet, media_types
 from schemathesis.core.adapter import OperationParameter, ResponsesContainer
 from schemathesis.core.errors import IncorrectUsage, InvalidSchema
@@ -24,7 +26,7 @@ from schemathesis.generation import GenerationMode
 from schemathesis.generation.case import Case
 from schemathesis.generation.hypothesis.given import GivenInput, given_proxy
 from schemathesis.generation.hypothesis.reporting import FilterCaseTracker
-from schemathesis.generation.meta import CaseMetadata
+from schemathesis.generation.meta import CaseMetadata, TestPhase
 from schemathesis.hooks import HookDispatcherMark, _should_skip_hook
 
 from .auths import AuthStorage
@@ -69,6 +71,38 @@ class FilteredCount:
         self.selected = 0
 
 
+class OperationRegistry:
+    """Stores API operations built from a schema, so they are compiled only once per run.
+
+    Parsing parameters, resolving references and building responses is repeated by every consumer of
+    `get_all_operations` otherwise - each test phase, schema analysis and the stateful test builder.
+    """
+
+    __slots__ = ("_operations", "_lock")
+
+    def __init__(self) -> None:
+        self._operations: list[Result[APIOperation, InvalidSchema]] | None = None
+        self._lock = threading.Lock()
+
+    def get(
+        self, build: Callable[[], Iterator[Result[APIOperation, InvalidSchema]]]
+    ) -> list[Result[APIOperation, InvalidSchema]]:
+        operations = self._operations
+        if operations is None:
+            with self._lock:
+                operations = self._operations
+                if operations is None:
+                    # Errors raised while building are not stored, so the next call fails the same way
+                    operations = list(build())
+                    self._operations = operations
+        return operations
+
+    def invalidate(self) -> None:
+        """Drop stored operations, e.g. after the underlying schema was modified."""
+        with self._lock:
+            self._operations = None
+
+
 @dataclass
 class ApiStatistic:
     """Statistics about API operations and links."""
@@ -110,6 +144,7 @@ class BaseSchema(Mapping):
 
     def __post_init__(self) -> None:
         self.hook = to_filterable_hook(self.hooks)  # type: ignore[method-assign]
+        self._operation_registry: OperationRegistry | None = None
 
     @property
     def specification(self) -> Specification:
@@ -117,6 +152,10 @@ class BaseSchema(Mapping):
 
     @property
     def transport(self) -> transport.BaseTransport:
+        if self.app is None and self.config.http_client != HttpClient.REQUESTS:
+            from schemathesis.transport.httpx import HTTPX_TRANSPORT
+
+            return HTTPX_TRANSPORT
         return transport.get(self.app)
 
     def apply_auth(self, case: Case, context: AuthContext) -> bool:
@@ -310,8 +349,50 @@ class BaseSchema(Mapping):
         raise NotImplementedError
 
     def get_all_operations(self) -> Generator[Result[APIOperation, InvalidSchema], None, None]:
+        """Iterate over all operations defined in the API.
+
+        If the operation registry is enabled, operations are built only once and the same instances
+        are returned on subsequent calls.
+        """
+        registry = self._operation_registry
+        if registry is None:
+            yield from self._iter_operations()
+        else:
+            yield from registry.get(self._iter_operations)
+
+    def _iter_operations(self) -> Generator[Result[APIOperation, InvalidSchema], None, None]:
         raise NotImplementedError
 
+    def enable_operation_registry(self) -> None:
+        """Build API operations once and share them between all consumers of this schema.
+
+        Operations are not rebuilt when `raw_schema` changes afterwards, e.g. by hooks, unless
+        `invalidate_operations` is called.
+        """
+        if self._operation_registry is None:
+            self._operation_registry = OperationRegistry()
+
+    def disable_operation_registry(self) -> None:
+        """Build API operations on every access again."""
+        self._operation_registry = None
+
+    @contextmanager
+    def operation_registry(self) -> Generator[None, None, None]:
+        """Enable the operation registry within the block and disable it afterwards if it was not enabled before."""
+        if self._operation_registry is not None:
+            yield
+            return
+        self.enable_operation_registry()
+        try:
+            yield
+        finally:
+            self.disable_operation_registry()
+
+    def invalidate_operations(self) -> None:
+        """Discard compiled operations, so they are rebuilt from the raw schema on the next access."""
+        if self._operation_registry is not None:
+            self._operation_registry.invalidate()
+
     def get_strategies_from_examples(self, operation: APIOperation, **kwargs: Any) -> list[SearchStrategy[Case]]:
         raise NotImplementedError
 
@@ -624,6 +705,11 @@ class APIOperation(Generic[P, R, S]):
     query: ParameterSet[P] = field(default_factory=ParameterSet)
     body: PayloadAlternatives[P] = field(default_factory=PayloadAlternatives)
     filter_case_tracker: FilterCaseTracker | None = field(default=None, repr=False, compare=False)
+    # Per-draw data that depends only on the operation, keyed by generation mode & phase.
+    # Not an `__init__` argument, so Hypothesis does not render it in strategy reprs while workers fill it
+    generation_plans: dict[tuple[GenerationMode, TestPhase], Any] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
         if self.label is None:
@@ -49,8 +49,10 @@ from .scalars import CUSTOM_SCALARS, get_extra_scalar_strategies
 if TYPE_CHECKING:
     import graphql
     from hypothesis.strategies import SearchStrategy
+    from hypothesis_graphql import Mode as GqlMode
 
     from schemathesis.auths import AuthContext, AuthStorage
+    from schemathesis.config import GenerationConfig
     from schemathesis.resources import ExtraDataSource
 
 
@@ -87,8 +89,19 @@ class GraphQLResponses:
         return None  # pragma: no cover
 
 
+# Operation label & generation settings that affect the body strategy
+BodyStrategyKey = tuple[str, bool, bool, str | None, tuple[tuple[str, "SearchStrategy"], ...]]
+
+
 @dataclass
 class GraphQLSchema(BaseSchema):
+    def __post_init__(self) -> None:
+        super().__post_init__()
+        # Building `hypothesis-graphql` strategies is expensive, therefore they are reused by all draws and phases
+        self._body_strategies: dict[tuple[BodyStrategyKey, GqlMode], SearchStrategy[graphql.Node]] = {}
+        # Operations for which negative mode is not possible
+        self._negative_infeasible: set[BodyStrategyKey] = set()
+
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__}>"
 
@@ -153,6 +166,36 @@ class GraphQLSchema(BaseSchema):
             self._client_schema = graphql.build_client_schema(self.raw_schema)
         return self._client_schema
 
+    def _get_body_strategy(
+        self, operation: APIOperation, key: BodyStrategyKey, mode: GqlMode
+    ) -> SearchStrategy[graphql.Node]:
+        strategy = self._body_strategies.get((key, mode))
+        if strategy is None:
+            from hypothesis_graphql import strategies as gql_st
+
+            definition = cast(GraphQLOperationDefinition, operation.definition)
+            strategy_factory = {
+                RootType.QUERY: gql_st.queries,
+                RootType.MUTATION: gql_st.mutations,
+            }[definition.root_type]
+            _, allow_x00, allow_null, codec, _ = key
+            # With `_noop` as `print_ast`, the strategy generates AST nodes instead of strings
+            strategy = cast(
+                "SearchStrategy[graphql.Node]",
+                strategy_factory(
+                    self.client_schema,
+                    fields=[definition.field_name],
+                    custom_scalars={**get_extra_scalar_strategies(), **CUSTOM_SCALARS},
+                    print_ast=_noop,
+                    allow_x00=allow_x00,
+                    allow_null=allow_null,
+                    codec=codec,
+                    mode=mode,
+                ),
+            )
+            self._body_strategies[(key, mode)] = strategy
+        return strategy
+
     @property
     def base_path(self) -> str:
         if self.config.base_url:
@@ -189,7 +232,7 @@ class GraphQLSchema(BaseSchema):
                                 statistic.operations.selected += 1
         return statistic
 
-    def get_all_operations(self) -> Generator[Result[APIOperation, InvalidSchema], None, None]:
+    def _iter_operations(self) -> Generator[Result[APIOperation, InvalidSchema], None, None]:
         schema = self.client_schema
         for root_type, operation_type in (
             (RootType.QUERY, schema.query_type),
@@ -349,52 +392,37 @@ def graphql_cases(
     import graphql
     from hypothesis.errors import InvalidArgument
     from hypothesis_graphql import Mode as GqlMode
-    from hypothesis_graphql import strategies as gql_st
 
     start = time.monotonic()
-    definition = cast(GraphQLOperationDefinition, operation.definition)
-    strategy_factory = {
-        RootType.QUERY: gql_st.queries,
-        RootType.MUTATION: gql_st.mutations,
-    }[definition.root_type]
+    schema = cast(GraphQLSchema, operation.schema)
     hook_context = HookContext(operation=operation)
-    custom_scalars = {**get_extra_scalar_strategies(), **CUSTOM_SCALARS}
-    generation = operation.schema.config.generation_for(operation=operation, phase="fuzzing")
-    gql_mode = GqlMode.NEGATIVE if generation_mode == GenerationMode.NEGATIVE else GqlMode.POSITIVE
+    generation = schema.config.generation_for(operation=operation, phase="fuzzing")
+    key = _body_strategy_key(operation, generation)
     effective_mode = generation_mode
-    strategy = strategy_factory(
-        operation.schema.client_schema,  # type: ignore[attr-defined]
-        fields=[definition.field_name],
-        custom_scalars=custom_scalars,
-        print_ast=_noop,
-        allow_x00=generation.allow_x00,
-        allow_null=generation.graphql_allow_null,
-        codec=generation.codec,
-        mode=gql_mode,
-    )
-    strategy = apply_to_all_dispatchers(operation, hook_context, hooks, strategy, "body").map(graphql.print_ast)
+    if generation_mode == GenerationMode.NEGATIVE and key in schema._negative_infeasible:
+        # Known from earlier draws, no need to try again
+        if generation.modes == [GenerationMode.NEGATIVE]:
+            raise SkipTest("Impossible to generate negative test cases for this GraphQL operation")
+        effective_mode = GenerationMode.POSITIVE
+    gql_mode = GqlMode.NEGATIVE if effective_mode == GenerationMode.NEGATIVE else GqlMode.POSITIVE
+    strategy = schema._get_body_strategy(operation, key, gql_mode)
+    body_strategy = apply_to_all_dispatchers(operation, hook_context, hooks, strategy, "body").map(graphql.print_ast)
     try:
-        body = draw(strategy)
+        body = draw(body_strategy)
     except InvalidArgument:
+        if effective_mode == GenerationMode.POSITIVE:
+            raise
         # Negative mode is not possible for this operation (no required arguments or scalar types to violate)
+        schema._negative_infeasible.add(key)
         if generation.modes == [GenerationMode.NEGATIVE]:
             raise SkipTest("Impossible to generate negative test cases for this GraphQL operation") from None
         # Fall back to positive mode when both modes are enabled
         effective_mode = GenerationMode.POSITIVE
-        fallback_strategy = strategy_factory(
-            operation.schema.client_schema,  # type: ignore[attr-defined]
-            fields=[definition.field_name],
-            custom_scalars=custom_scalars,
-            print_ast=_noop,
-            allow_x00=generation.allow_x00,
-            allow_null=generation.graphql_allow_null,
-            codec=generation.codec,
-            mode=GqlMode.POSITIVE,
-        )
-        fallback_strategy = apply_to_all_dispatchers(operation, hook_context, hooks, fallback_strategy, "body").map(
-            graphql.print_ast
-        )
-        body = draw(fallback_strategy)
+        fallback_strategy = schema._get_body_strategy(operation, key, GqlMode.POSITIVE)
+        fallback_body_strategy = apply_to_all_dispatchers(
+            operation, hook_context, hooks, fallback_strategy, "body"
+        ).map(graphql.print_ast)
+        body = draw(fallback_body_strategy)
 
     path_parameters_ = _generate_parameter(
         ParameterLocation.PATH, path_parameters, draw, operation, hook_context, hooks
@@ -453,6 +481,17 @@ def graphql_cases(
     return instance
 
 
+def _body_strategy_key(operation: APIOperation, generation: GenerationConfig) -> BodyStrategyKey:
+    return (
+        operation.label,
+        generation.allow_x00,
+        generation.graphql_allow_null,
+        generation.codec,
+        # Scalars may be registered at any time
+        tuple(CUSTOM_SCALARS.items()),
+    )
+
+
 def _generate_parameter(
     location: ParameterLocation,
     explicit: NotSet | dict[str, Any],
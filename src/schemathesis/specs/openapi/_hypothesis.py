@@ -93,12 +93,10 @@ def openapi_cases(
     """
     start = time.monotonic()
 
+    plan = get_generation_plan(operation, generation_mode, phase)
     generation_config = operation.schema.config.generation_for(operation=operation, phase=phase.value)
-
-    ctx = HookContext(operation=operation)
-
-    # Don't mix in schema examples during EXAMPLES phase - they're handled separately there
-    mix_examples = phase != TestPhase.EXAMPLES
+    ctx = plan.hook_context
+    mix_examples = plan.mix_examples
 
     path_parameters_ = generate_parameter(
         ParameterLocation.PATH,
@@ -107,7 +105,7 @@ def openapi_cases(
         draw,
         ctx,
         hooks,
-        generation_mode,
+        plan.generators[ParameterLocation.PATH],
         generation_config,
         extra_data_source=extra_data_source,
         mix_examples=mix_examples,
@@ -119,7 +117,7 @@ def openapi_cases(
         draw,
         ctx,
         hooks,
-        generation_mode,
+        plan.generators[ParameterLocation.HEADER],
         generation_config,
         extra_data_source=extra_data_source,
         mix_examples=mix_examples,
@@ -131,7 +129,7 @@ def openapi_cases(
         draw,
         ctx,
         hooks,
-        generation_mode,
+        plan.generators[ParameterLocation.COOKIE],
         generation_config,
         extra_data_source=extra_data_source,
         mix_examples=mix_examples,
@@ -143,7 +141,7 @@ def openapi_cases(
         draw,
         ctx,
         hooks,
-        generation_mode,
+        plan.generators[ParameterLocation.QUERY],
         generation_config,
         extra_data_source=extra_data_source,
         mix_examples=mix_examples,
@@ -151,17 +149,8 @@ def openapi_cases(
 
     if body is NOT_SET:
         if operation.body:
-            body_generator = generation_mode
-            if generation_mode.is_negative:
-                # Consider only schemas that are possible to negate
-                candidates = [item for item in operation.body.items if item.is_negatable]
-                # Not possible to negate body, fallback to positive data generation
-                if not candidates:
-                    candidates = operation.body.items
-                    body_generator = GenerationMode.POSITIVE
-            else:
-                candidates = operation.body.items
-            parameter = draw(st.sampled_from(candidates))
+            body_generator = plan.body_generator
+            parameter = draw(st.sampled_from(plan.body_candidates))
             strategy = _get_body_strategy(
                 parameter,
                 operation,
@@ -172,10 +161,7 @@ def openapi_cases(
                 mix_examples=mix_examples,
             )
             strategy = apply_hooks(operation, ctx, hooks, strategy, ParameterLocation.BODY)
-            # Parameter may have a wildcard media type. In this case, choose any supported one
-            possible_media_types = sorted(
-                operation.schema.transport.get_matching_media_types(parameter.media_type), key=lambda x: x[0]
-            )
+            possible_media_types = plan.media_types[parameter.media_type]
             if not possible_media_types:
                 all_media_types = operation.get_request_payload_content_types()
                 if all(
@@ -366,6 +352,82 @@ def openapi_cases(
     return instance
 
 
+@dataclass
+class GenerationPlan:
+    """Parts of `openapi_cases` that depend only on the operation, generation mode and phase.
+
+    Computed once and reused by all draws, so each draw only draws values.
+    The generation config is not a part of it, as it can be updated in-place between draws.
+    """
+
+    hook_context: HookContext
+    mix_examples: bool
+    # Generation mode for each parameter location, positive where negating is not possible
+    generators: dict[ParameterLocation, GenerationMode]
+    body_candidates: list[OpenApiBody]
+    body_generator: GenerationMode
+    # Supported media types & their serializers for each body media type
+    media_types: dict[str, list[tuple[str, Any]]]
+
+    __slots__ = (
+        "hook_context",
+        "mix_examples",
+        "generators",
+        "body_candidates",
+        "body_generator",
+        "media_types",
+    )
+
+    @classmethod
+    def compile(cls, operation: APIOperation, generation_mode: GenerationMode, phase: TestPhase) -> GenerationPlan:
+        generators = {}
+        for location in (ParameterLocation.PATH, ParameterLocation.HEADER, ParameterLocation.COOKIE):
+            generator = generation_mode
+            if generation_mode.is_negative and (
+                (location == ParameterLocation.PATH and not can_negate_path_parameters(operation))
+                or (location.is_in_header and not can_negate_headers(operation, location))
+            ):
+                # If we can't negate any parameter, generate positive ones
+                # If nothing else will be negated, then skip the test completely
+                generator = GenerationMode.POSITIVE
+            generators[location] = generator
+        generators[ParameterLocation.QUERY] = generation_mode
+
+        body_generator = generation_mode
+        candidates = operation.body.items
+        if generation_mode.is_negative:
+            # Consider only schemas that are possible to negate
+            candidates = [item for item in operation.body.items if item.is_negatable]
+            # Not possible to negate body, fallback to positive data generation
+            if not candidates:
+                candidates = operation.body.items
+                body_generator = GenerationMode.POSITIVE
+        transport = operation.schema.transport
+        media_types = {
+            # Parameter may have a wildcard media type. In this case, choose any supported one
+            item.media_type: sorted(transport.get_matching_media_types(item.media_type), key=lambda x: x[0])
+            for item in candidates
+        }
+        return cls(
+            hook_context=HookContext(operation=operation),
+            # Don't mix in schema examples during EXAMPLES phase - they're handled separately there
+            mix_examples=phase != TestPhase.EXAMPLES,
+            generators=generators,
+            body_candidates=candidates,
+            body_generator=body_generator,
+            media_types=media_types,
+        )
+
+
+def get_generation_plan(operation: APIOperation, generation_mode: GenerationMode, phase: TestPhase) -> GenerationPlan:
+    key = (generation_mode, phase)
+    plan = operation.generation_plans.get(key)
+    if plan is None:
+        plan = GenerationPlan.compile(operation, generation_mode, phase)
+        operation.generation_plans[key] = plan
+    return plan
+
+
 OPTIONAL_BODY_RATE = 0.05
 
 
@@ -669,15 +731,8 @@ def generate_parameter(
 ) -> ValueContainer:
     """Generate a value for a parameter.
 
-    Fallback to positive data generator if parameter can not be negated.
+    `generator` is expected to be already adjusted to what is possible for this location, see `GenerationPlan`.
     """
-    if generator.is_negative and (
-        (location == ParameterLocation.PATH and not can_negate_path_parameters(operation))
-        or (location.is_in_header and not can_negate_headers(operation, location))
-    ):
-        # If we can't negate any parameter, generate positive ones
-        # If nothing else will be negated, then skip the test completely
-        generator = GenerationMode.POSITIVE
     value, metadata = get_parameters_value(
         explicit,
         location,
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import inspect
+import threading
 from collections.abc import ItemsView, Iterator, Mapping
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, cast
@@ -18,10 +20,15 @@ from schemathesis.specs.openapi.converter import to_json_schema
 from schemathesis.specs.openapi.utils import expand_status_code
 
 if TYPE_CHECKING:
+    from schemathesis.core.failures import Failure
     from schemathesis.specs.openapi.content_keywords import SseValidator
 
 # Cache key when no Content-Type header is present
 _NO_MEDIA_TYPE = ""
+# Larger bodies are validated every time
+MAX_CACHED_BODY_SIZE = 64 * 1024
+# Number of distinct bodies remembered per response definition
+MAX_CACHED_OUTCOMES = 128
 
 
 @dataclass
@@ -46,6 +53,63 @@ class CachedValidation:
     name_to_uri: dict[str, str]
 
 
+class ValidationOutcomes:
+    """Failures found in response bodies that were already validated against a response definition.
+
+    APIs often return byte-identical bodies, e.g. the same error for most negative test cases. Such bodies are
+    neither deserialized nor validated again. Bodies themselves are used as keys, so different bodies never share
+    an outcome.
+    """
+
+    __slots__ = ("_outcomes", "_lock")
+
+    def __init__(self) -> None:
+        self._outcomes: dict[tuple[str | None, bytes], tuple[FrozenFailure, ...]] = {}
+        # Response definitions are shared by all threads testing the same operation
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._outcomes)
+
+    def get(self, content_type: str | None, content: bytes) -> list[Failure] | None:
+        frozen = self._outcomes.get((content_type, content))
+        if frozen is None:
+            return None
+        # Raised failures get tracebacks and reproduction notes of a particular test case, so they are never reused
+        return [cls(**dict(arguments)) for cls, arguments in frozen]
+
+    def set(self, content_type: str | None, content: bytes, failures: list[Failure]) -> None:
+        if len(content) > MAX_CACHED_BODY_SIZE:
+            return
+        frozen = []
+        for failure in failures:
+            arguments = _get_constructor_arguments(failure)
+            if arguments is None:
+                # Can't re-create this failure, validate such bodies every time
+                return
+            frozen.append((type(failure), arguments))
+        key = (content_type, content)
+        with self._lock:
+            if key not in self._outcomes and len(self._outcomes) >= MAX_CACHED_OUTCOMES:
+                # Evict the oldest entry
+                del self._outcomes[next(iter(self._outcomes))]
+            self._outcomes[key] = tuple(frozen)
+
+
+# Failure type with arguments to re-create it
+FrozenFailure = tuple[type["Failure"], tuple[tuple[str, Any], ...]]
+
+
+def _get_constructor_arguments(failure: Failure) -> tuple[tuple[str, Any], ...] | None:
+    # Failures store their constructor arguments in attributes with the same names
+    arguments = []
+    for name in inspect.signature(type(failure)).parameters:
+        if not hasattr(failure, name):
+            return None
+        arguments.append((name, getattr(failure, name)))
+    return tuple(arguments)
+
+
 @dataclass
 class OpenApiResponse:
     """OpenAPI response definition."""
@@ -66,10 +130,12 @@ class OpenApiResponse:
         "_sse_validator",
         "_headers",
         "_default_media_type",
+        "validation_outcomes",
     )
 
     def __post_init__(self) -> None:
         self._validation_cache: dict[str, CachedValidation] = {}
+        self.validation_outcomes = ValidationOutcomes()
         self._sse_validator: SseValidator | NotSet = NOT_SET
         self._headers: OpenApiResponseHeaders | NotSet = NOT_SET
         self._default_media_type = self._detect_default_media_type()
@@ -12,7 +12,10 @@ from schemathesis.resources import ExtraDataSource, ResourceRepository
 from schemathesis.specs.openapi.extra_data_source import OpenApiExtraDataSource, build_parameter_requirements
 from schemathesis.specs.openapi.resources import build_descriptors
 from schemathesis.specs.openapi.stateful import dependencies
-from schemathesis.specs.openapi.stateful.dependencies.layers import compute_dependency_layers
+from schemathesis.specs.openapi.stateful.dependencies.layers import (
+    compute_acyclic_dependencies,
+    compute_dependency_layers,
+)
 from schemathesis.specs.openapi.stateful.inference import LinkInferencer
 from schemathesis.specs.openapi.warnings import (
     detect_missing_deserializers,
@@ -37,6 +40,7 @@ class OpenAPIAnalysis:
         "_links_injected",
         "_dependency_graph",
         "_dependency_layers",
+        "_dependencies",
         "_resource_descriptors",
         "_extra_data_source",
         "_inferencer",
@@ -49,6 +53,7 @@ class OpenAPIAnalysis:
         self._links_injected = False
         self._dependency_graph: dependencies.DependencyGraph | None = None
         self._dependency_layers: list[list[str]] | None | NotSet = NOT_SET
+        self._dependencies: dict[str, set[str]] | None | NotSet = NOT_SET
         self._resource_descriptors: Sequence[ResourceDescriptor] | None = None
         self._extra_data_source: ExtraDataSource | None | NotSet = NOT_SET
         self._inferencer: LinkInferencer | None = None
@@ -80,6 +85,17 @@ class OpenAPIAnalysis:
         assert not isinstance(self._dependency_layers, NotSet)
         return self._dependency_layers
 
+    @property
+    def dependencies(self) -> dict[str, set[str]] | None:
+        """Operations that produce resources consumed by each operation.
+
+        Operations within dependency cycles do not depend on each other. Returns None if there are no dependencies.
+        """
+        if self._dependencies is NOT_SET:
+            self._dependencies = compute_acyclic_dependencies(self.dependency_graph)
+        assert not isinstance(self._dependencies, NotSet)
+        return self._dependencies
+
     @property
     def resource_descriptors(self) -> Sequence[ResourceDescriptor]:
         """Descriptors identifying resources that can be captured from API responses."""
@@ -157,6 +173,9 @@ class OpenAPIAnalysis:
             return 0
         injected = dependencies.inject_links(self.schema)
         self._links_injected = True
+        if injected:
+            # Compiled operations do not reflect new response definitions
+            self.schema.invalidate_operations()
         return injected
 
     @property
@@ -683,31 +683,19 @@ def _resource_recreated_after_delete(
 ) -> bool:
     """Return True if a resource was re-created after the DELETE and before the current case.
 
-    Scans all recorded cases in execution order (across every branch and every root
+    Looks at all recorded cases in execution order (across every branch and every root
     transition in the scenario).  Any successful creation whose path is a prefix of
     the DELETE path that occurs *between* the DELETE step and the current step means
     the resource may have been re-created — for example via a circular link
     (DELETE -> POST) or via a second root POST that reuses a freed resource ID.
     """
-    found_delete = False
-    for case in ctx._find_all_cases():
-        if case.id == delete_case_id:
-            found_delete = True
-            continue
-        if not found_delete:
-            continue
-        if case.id == current_case_id:
-            return False
-        resp = ctx._find_response(case_id=case.id)
-        if (
-            case.operation.method.lower() not in _NON_CREATION_METHODS
-            and resp is not None
-            and 200 <= resp.status_code < 300
-            and _is_prefix_operation(
-                ResourcePath(case.path, case.path_parameters or {}),
-                delete_path,
-            )
-        ):
+    delete_template = _split_path(delete_path.value)
+
+    def may_create(method: str, path: str) -> bool:
+        return method.lower() not in _NON_CREATION_METHODS and _is_prefix_template(_split_path(path), delete_template)
+
+    for case in ctx._find_successful_cases(operation_filter=may_create, after=delete_case_id, before=current_case_id):
+        if _is_prefix_operation(ResourcePath(case.path, case.path_parameters or {}), delete_path):
             return True
     return False
 
@@ -1079,9 +1067,25 @@ class ResourcePath:
         return self.variables[key.lstrip("{").rstrip("}")]
 
 
+def _split_path(path: str) -> list[str]:
+    return path.rstrip("/").split("/")
+
+
+def _is_prefix_template(lhs_parts: list[str], rhs_parts: list[str]) -> bool:
+    """Whether `_is_prefix_operation` may be true for some values of path variables."""
+    if len(lhs_parts) > len(rhs_parts):
+        return False
+    for left, right in zip(lhs_parts, rhs_parts, strict=False):
+        if left.startswith("{") and right.startswith("{"):
+            continue
+        if left != right and left.rstrip("s") != right.rstrip("s"):
+            return False
+    return True
+
+
 def _is_prefix_operation(lhs: ResourcePath, rhs: ResourcePath) -> bool:
-    lhs_parts = lhs.value.rstrip("/").split("/")
-    rhs_parts = rhs.value.rstrip("/").split("/")
+    lhs_parts = _split_path(lhs.value)
+    rhs_parts = _split_path(rhs.value)
 
     # Left has more parts, can't be a prefix
     if len(lhs_parts) > len(rhs_parts):
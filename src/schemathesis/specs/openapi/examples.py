@@ -3,7 +3,6 @@ from __future__ import annotations
 from collections.abc import Generator, Iterator
 from contextlib import suppress
 from dataclasses import dataclass
-from functools import lru_cache
 from itertools import cycle, islice
 from typing import TYPE_CHECKING, Any, cast, overload
 
@@ -15,7 +14,6 @@ from schemathesis.core.compat import RefResolutionError, RefResolver
 from schemathesis.core.errors import InfiniteRecursiveReference, UnresolvableReference
 from schemathesis.core.jsonschema.bundler import BUNDLE_STORAGE_KEY
 from schemathesis.core.transforms import deepclone
-from schemathesis.core.transport import DEFAULT_RESPONSE_TIMEOUT
 from schemathesis.generation.case import Case
 from schemathesis.generation.hypothesis import examples
 from schemathesis.generation.meta import TestPhase
@@ -23,6 +21,7 @@ from schemathesis.schemas import APIOperation
 from schemathesis.specs.openapi.adapter import OpenApiResponses
 from schemathesis.specs.openapi.adapter.parameters import OpenApiBody, OpenApiParameter
 from schemathesis.specs.openapi.adapter.security import OpenApiSecurityParameters
+from schemathesis.specs.openapi.prefetch import RemoteFetcher
 from schemathesis.specs.openapi.serialization import get_serializers_for_operation
 
 from ._hypothesis import get_default_format_strategies, openapi_cases
@@ -323,17 +322,16 @@ def extract_inner_examples(examples: dict[str, Any] | list, schema: OpenApiSchem
                 elif "externalValue" in example:
                     with suppress(requests.RequestException):
                         # Report a warning if not available?
-                        yield load_external_example(example["externalValue"])
+                        yield load_external_example(example["externalValue"], fetcher=schema.resolver.fetcher)
                 elif example:
                     yield example
     elif isinstance(examples, list):
         yield from examples
 
 
-@lru_cache
-def load_external_example(url: str) -> bytes:
+def load_external_example(url: str, fetcher: RemoteFetcher | None = None) -> bytes:
     """Load examples the `externalValue` keyword."""
-    response = requests.get(url, timeout=DEFAULT_RESPONSE_TIMEOUT)
+    response = (fetcher or RemoteFetcher()).fetch(url)
     response.raise_for_status()
     return response.content
 
@@ -11,7 +11,7 @@ from schemathesis.core import NOT_SET, deserialization
 from schemathesis.core.jsonschema.types import JsonSchema
 from schemathesis.core.parameters import ParameterLocation
 from schemathesis.resources import ExtraDataSource
-from schemathesis.resources.repository import ResourceRepository
+from schemathesis.resources.repository import ResourceInstance, ResourceRepository
 from schemathesis.specs.openapi.stateful.dependencies.models import DependencyGraph
 
 if TYPE_CHECKING:
@@ -217,65 +217,46 @@ class OpenApiExtraDataSource(ExtraDataSource):
 
     def _collect_object_variants(self, requirements: dict[str, ParameterRequirement]) -> list[dict[str, Any]]:
         """Collect complete value sets that preserve relationships between properties."""
-        # Get all resource types involved
-        resource_names = {req.resource_name for req in requirements.values()}
-
-        variants: list[dict[str, Any]] = []
-        seen: set[str] = set()
-
-        # For each resource instance, try to build a complete variant
-        for resource_name in resource_names:
-            for instance in self.repository.iter_instances(resource_name):
-                variant: dict[str, Any] = {}
-
-                for param_name, req in requirements.items():
-                    if req.resource_name == resource_name:
-                        # Value from the resource data (e.g., Pet.id from response)
-                        value = instance.data.get(req.resource_field)
-                    else:
-                        # Value from context (e.g., ownerId from request path)
-                        value = instance.context.get(param_name)
-
-                    if value is not None:
-                        variant[param_name] = value
-
-                # Only include if we filled ALL requirements
-                if len(variant) == len(requirements):
-                    # Deduplicate by serializing the variant
-                    key = jsonschema_rs.canonical.json.to_string(variant)
-                    if key not in seen:
-                        seen.add(key)
-                        variants.append(variant)
-
-        return variants
+        items = tuple(requirements.items())
+
+        def extract(resource_name: str, instance: ResourceInstance) -> tuple[str, dict[str, Any]] | None:
+            variant: dict[str, Any] = {}
+            for param_name, req in items:
+                if req.resource_name == resource_name:
+                    # Value from the resource data (e.g., Pet.id from response)
+                    value = instance.data.get(req.resource_field)
+                else:
+                    # Value from context (e.g., ownerId from request path)
+                    value = instance.context.get(param_name)
+
+                if value is None:
+                    # Only include if we filled ALL requirements
+                    return None
+                variant[param_name] = value
+            # Deduplicate by serializing the variant
+            return jsonschema_rs.canonical.json.to_string(variant), variant
+
+        # Each instance of any involved resource type may provide a complete variant
+        resource_names = [req.resource_name for _, req in items]
+        return self.repository.get_variants(("objects", items), resource_names, extract)
 
     def _collect_values(self, requirement: ParameterRequirement) -> list[Any]:
         """Collect unique values from captured resource instances."""
-        instances = self.repository.iter_instances(requirement.resource_name)
-        values: list[Any] = []
-        seen: set[DedupKey] = set()
 
-        for instance in instances:
+        def extract(resource_name: str, instance: ResourceInstance) -> tuple[DedupKey, Any] | None:
             value = instance.data.get(requirement.resource_field, NOT_SET)
             if value is NOT_SET:
-                continue
+                return None
 
-            dedup_key: DedupKey
             if isinstance(value, str | int | float | bool) or value is None:
-                dedup_key = (type(value), value)
-            else:
-                try:
-                    serialized = jsonschema_rs.canonical.json.to_string(value)
-                    dedup_key = (type(value), serialized)
-                except (TypeError, ValueError):
-                    continue
-
-            if dedup_key in seen:
-                continue
-            seen.add(dedup_key)
-            values.append(value)
+                return (type(value), value), value
+            try:
+                serialized = jsonschema_rs.canonical.json.to_string(value)
+            except (TypeError, ValueError):
+                return None
+            return (type(value), serialized), value
 
-        return values
+        return self.repository.get_variants(("values", requirement), [requirement.resource_name], extract)
 
     def should_record(self, *, operation: str) -> bool:
         """Check if responses should be recorded for this operation."""
@@ -0,0 +1,214 @@
+"""Fingerprints of API operations for finding operations that changed between two versions of a schema.
+
+A fingerprint covers the operation definition, the path-level parameters and every component reachable from them
+via `$ref`, as well as data the operation inherits from the schema root: the security schemes it uses and, in Open API 2,
+the default media types. It also covers fingerprints of operations the operation links to, so that a change in a link
+target selects the operations that lead to it as well.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Any
+from urllib.parse import unquote, urldefrag, urljoin
+
+from schemathesis.core.compat import RefResolutionError
+from schemathesis.specs.openapi.adapter.security import get_security_requirements
+from schemathesis.specs.openapi.prefetch import DATA_KEYWORDS, NAMED_CONTAINERS
+
+if TYPE_CHECKING:
+    from schemathesis.specs.openapi.references import ReferenceResolver
+    from schemathesis.specs.openapi.schemas import OpenApiSchema
+
+# Bump when the set of hashed data changes, so older manifests don't match any operation
+FINGERPRINT_VERSION = 2
+# Root-level keywords that apply to all operations that don't override them
+INHERITED_KEYWORDS = ("consumes", "produces")
+
+
+def compute_fingerprints(schema: OpenApiSchema) -> dict[str, str]:
+    """Fingerprints of all operations in the schema, keyed by operation labels."""
+    from schemathesis.specs.openapi.schemas import HTTP_METHODS
+
+    resolver = schema.resolver
+    root_scope = resolver.resolution_scope
+    base = urldefrag(root_scope)[0]
+    links_keyword = schema.adapter.links_keyword
+    own: dict[str, str] = {}
+    links: dict[str, list[tuple[str, str]]] = {}
+    by_operation_id: dict[str, str] = {}
+    by_pointer: dict[tuple[str, str], str] = {}
+    raw_schema = schema.raw_schema
+    paths = raw_schema.get("paths")
+    if not isinstance(paths, dict):
+        return {}
+    inherited = {keyword: raw_schema[keyword] for keyword in INHERITED_KEYWORDS if keyword in raw_schema}
+    try:
+        security_definitions = schema.security.security_definitions
+    except (RefResolutionError, ValueError, LookupError, OSError):
+        security_definitions = {}
+    for path, path_item in paths.items():
+        scope = root_scope
+        if isinstance(path_item, dict) and "$ref" in path_item:
+            try:
+                scope, path_item = resolver.resolve(path_item["$ref"])
+            except RefResolutionError:
+                pass
+        if not isinstance(path_item, dict):
+            continue
+        shared_parameters = path_item.get("parameters", [])
+        for method, definition in path_item.items():
+            if method not in HTTP_METHODS or not isinstance(definition, dict):
+                continue
+            label = f"{method.upper()} {path}"
+            # Security requirements may be inherited from the root and refer to schemes defined elsewhere
+            security = definition.get("security", raw_schema.get("security", []))
+            schemes = {
+                name: security_definitions.get(name) for name in get_security_requirements(raw_schema, definition)
+            }
+            references = _collect_references(resolver, [definition, shared_parameters], scope)
+            # Security schemes are defined at the root
+            references.update(_collect_references(resolver, schemes, root_scope))
+            # The previous version of the schema may be stored elsewhere, therefore absolute URLs are not compared
+            relative_references = sorted((_relative_to(url, base), value) for url, value in references.items())
+            own[label] = _digest(
+                [
+                    FINGERPRINT_VERSION,
+                    method,
+                    path,
+                    definition,
+                    shared_parameters,
+                    security,
+                    schemes,
+                    inherited,
+                    relative_references,
+                ]
+            )
+            links[label] = list(_iter_link_targets(resolver, definition, scope, links_keyword))
+            operation_id = definition.get("operationId")
+            if isinstance(operation_id, str):
+                by_operation_id[operation_id] = label
+            by_pointer[(path, method)] = label
+
+    fingerprints = {}
+    for label, digest in own.items():
+        targets = set()
+        for kind, target in links[label]:
+            if kind == "operationId":
+                target_label = by_operation_id.get(target)
+            else:
+                target_label = _find_by_operation_ref(target, by_pointer)
+            if target_label is not None and target_label != label:
+                targets.add(target_label)
+        fingerprints[label] = _digest([digest, sorted(own[target] for target in targets)])
+    return fingerprints
+
+
+def _collect_references(resolver: ReferenceResolver, document: Any, scope: str) -> dict[str, Any]:
+    """Resolve all references reachable from the document, keyed by their absolute URLs."""
+    references: dict[str, Any] = {}
+    stack: list[tuple[Any, str, bool]] = [(document, scope, False)]
+    while stack:
+        item, scope, is_named = stack.pop()
+        if isinstance(item, dict):
+            reference = item.get("$ref")
+            if isinstance(reference, str) and not is_named:
+                url = urljoin(scope, reference)
+                if url not in references:
+                    try:
+                        new_scope, resolved = resolver.resolve(url)
+                    except (RefResolutionError, ValueError, LookupError, OSError):
+                        # Unresolvable references are compared by their URLs only
+                        references[url] = None
+                        continue
+                    references[url] = resolved
+                    stack.append((resolved, new_scope, False))
+            for key, value in item.items():
+                if is_named:
+                    stack.append((value, scope, False))
+                elif key not in DATA_KEYWORDS:
+                    stack.append((value, scope, key in NAMED_CONTAINERS))
+        elif isinstance(item, list):
+            for value in item:
+                stack.append((value, scope, False))
+    return references
+
+
+def _relative_to(url: str, base: str) -> str:
+    document, fragment = urldefrag(url)
+    if document == base:
+        return f"#{fragment}"
+    directory = base.rsplit("/", 1)[0] + "/"
+    if document.startswith(directory):
+        return f"{document[len(directory) :]}#{fragment}"
+    return url
+
+
+def _iter_link_targets(
+    resolver: ReferenceResolver, definition: dict[str, Any], scope: str, links_keyword: str
+) -> Iterator[tuple[str, str]]:
+    responses = definition.get("responses")
+    if not isinstance(responses, dict):
+        return
+    for response in responses.values():
+        response = _maybe_resolve(resolver, response, scope)
+        if not isinstance(response, dict):
+            continue
+        links = response.get(links_keyword)
+        if not isinstance(links, dict):
+            continue
+        for link in links.values():
+            link = _maybe_resolve(resolver, link, scope)
+            if not isinstance(link, dict):
+                continue
+            if isinstance(link.get("operationId"), str):
+                yield "operationId", link["operationId"]
+            elif isinstance(link.get("operationRef"), str):
+                yield "operationRef", link["operationRef"]
+
+
+def _maybe_resolve(resolver: ReferenceResolver, item: Any, scope: str) -> Any:
+    if isinstance(item, dict) and isinstance(item.get("$ref"), str):
+        try:
+            return resolver.resolve(urljoin(scope, item["$ref"]))[1]
+        except (RefResolutionError, ValueError, LookupError, OSError):
+            return None
+    return item
+
+
+def _find_by_operation_ref(reference: str, by_pointer: dict[tuple[str, str], str]) -> str | None:
+    # Only local references, e.g. `#/paths/~1users~1{user_id}/get`
+    url, fragment = urldefrag(reference)
+    if url:
+        return None
+    parts = unquote(fragment).split("/")
+    if len(parts) != 4 or parts[0] != "" or parts[1] != "paths":
+        return None
+    path = parts[2].replace("~1", "/").replace("~0", "~")
+    return by_pointer.get((path, parts[3].lower()))
+
+
+def _digest(value: Any) -> str:
+    digest = hashlib.sha256()
+    _update(digest, value)
+    return digest.hexdigest()
+
+
+def _update(digest: Any, value: Any) -> None:
+    # Type-tagged, so e.g. `1` and `"1"` are different. Mapping keys are not necessarily strings in YAML documents
+    if isinstance(value, dict):
+        digest.update(b"{")
+        for key, item in sorted(value.items(), key=lambda entry: (type(entry[0]).__name__, str(entry[0]))):
+            _update(digest, key)
+            _update(digest, item)
+        digest.update(b"}")
+    elif isinstance(value, list | tuple):
+        digest.update(b"[")
+        for item in value:
+            _update(digest, item)
+        digest.update(b"]")
+    else:
+        encoded = repr(value).encode("utf-8", "surrogatepass")
+        digest.update(f"{type(value).__name__}:{len(encoded)}:".encode())
+        digest.update(encoded)
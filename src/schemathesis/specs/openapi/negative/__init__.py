@@ -15,6 +15,7 @@ from schemathesis.core.jsonschema import ALL_KEYWORDS, FANCY_REGEX_OPTIONS
 from schemathesis.core.jsonschema.types import JsonSchema
 from schemathesis.core.media_types import is_json
 from schemathesis.core.parameters import ParameterLocation
+from schemathesis.generation.verdicts import ValidationVerdicts
 from schemathesis.transport.serialization import contains_binary
 
 from .mutations import MutationContext, MutationMetadata
@@ -110,6 +111,12 @@ def get_validator(cache_key: CacheKey) -> jsonschema_rs.Validator:
     )
 
 
+@lru_cache
+def get_verdicts(cache_key: CacheKey) -> ValidationVerdicts:
+    """Get memoized validation verdicts for the given schema."""
+    return ValidationVerdicts(get_validator(cache_key))
+
+
 @lru_cache
 def split_schema(cache_key: CacheKey) -> tuple[Schema, Schema]:
     """Split the schema in two parts.
@@ -146,7 +153,7 @@ def negative_schema(
     # The mutated schema is passed to `from_schema` and guarded against producing instances valid against
     # the original schema.
     cache_key = CacheKey(operation_name, location, schema, validator_cls, frozenset(custom_formats))
-    validator = get_validator(cache_key)
+    verdicts = get_verdicts(cache_key)
     keywords, non_keywords = split_schema(cache_key)
 
     # For unconstrained binary/byte schemas, skip the validation filter entirely.
@@ -158,13 +165,13 @@ def negative_schema(
 
         def filter_values(value: dict[str, Any]) -> bool:
             return is_non_empty_query(value) and (
-                skip_validation_filter or contains_binary(value) or not validator.is_valid(value)
+                skip_validation_filter or contains_binary(value) or not verdicts.is_valid(value)
             )
 
     else:
 
         def filter_values(value: dict[str, Any]) -> bool:
-            return skip_validation_filter or contains_binary(value) or not validator.is_valid(value)
+            return skip_validation_filter or contains_binary(value) or not verdicts.is_valid(value)
 
     def generate_value_with_metadata(value: tuple[dict, MutationMetadata]) -> st.SearchStrategy:
         schema, metadata = value
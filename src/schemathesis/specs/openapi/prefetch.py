@@ -0,0 +1,191 @@
+"""Fetching remote documents referenced by a schema before they are needed.
+
+Without prefetching, every remote `$ref` or `externalValue` is fetched the first time it is resolved, one request at
+a time. Schemas split across many remote files spend most of their loading time waiting for these requests.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urldefrag, urljoin, urlparse
+
+from schemathesis.core.transport import DEFAULT_RESPONSE_TIMEOUT
+
+if TYPE_CHECKING:
+    import requests
+
+    from schemathesis.core.schema_cache import SchemaCache
+
+MAX_PREFETCH_WORKERS = 16
+REMOTE_SCHEMES = frozenset({"http", "https"})
+# Keywords with arbitrary data, where `$ref` is not a reference
+DATA_KEYWORDS = frozenset({"example", "default", "const", "enum", "value"})
+# Keywords whose keys are user-defined names, that may coincide with keywords above
+NAMED_CONTAINERS = frozenset(
+    {"properties", "patternProperties", "definitions", "$defs", "schemas", "parameters", "responses", "paths"}
+)
+
+
+@dataclass
+class RemoteResponse:
+    """Relevant parts of a response with a remote document."""
+
+    url: str
+    status_code: int
+    content_type: str
+    content: bytes
+
+    __slots__ = ("url", "status_code", "content_type", "content")
+
+    @property
+    def is_success(self) -> bool:
+        return 200 <= self.status_code < 300
+
+    def raise_for_status(self) -> None:
+        if not self.is_success:
+            import requests
+
+            raise requests.HTTPError(f"{self.status_code} Error for url: {self.url}")
+
+
+class RemoteFetcher:
+    """Fetches remote documents over a pooled session, once per URL.
+
+    With a schema cache, successful responses are stored on disk together with their `ETag` & `Last-Modified`
+    headers, and later runs only revalidate them with conditional requests.
+    """
+
+    __slots__ = ("_cache", "_session", "_responses", "_lock")
+
+    def __init__(self, cache: SchemaCache | None = None) -> None:
+        self._cache = cache
+        self._session: requests.Session | None = None
+        self._responses: dict[str, RemoteResponse] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def session(self) -> requests.Session:
+        with self._lock:
+            if self._session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=MAX_PREFETCH_WORKERS, pool_maxsize=MAX_PREFETCH_WORKERS)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                self._session = session
+            return self._session
+
+    def fetch(self, url: str) -> RemoteResponse:
+        """Get the response for the given URL, sending a request only if it was not fetched before."""
+        response = self._responses.get(url)
+        if response is None:
+            response = self._fetch(url)
+            with self._lock:
+                # Another thread may have fetched it in the meantime
+                response = self._responses.setdefault(url, response)
+        return response
+
+    def fetch_many(self, urls: Iterable[str]) -> None:
+        """Fetch all given URLs concurrently.
+
+        Errors are not raised here - they are reported when the document is actually needed.
+        """
+        pending = [url for url in dict.fromkeys(urls) if url not in self._responses]
+        if not pending:
+            return
+        if len(pending) == 1:
+            self._fetch_quietly(pending[0])
+            return
+        with ThreadPoolExecutor(max_workers=min(len(pending), MAX_PREFETCH_WORKERS)) as executor:
+            # Consume the iterator so all requests finish before returning
+            list(executor.map(self._fetch_quietly, pending))
+
+    def _fetch_quietly(self, url: str) -> None:
+        try:
+            self.fetch(url)
+        except Exception:
+            pass
+
+    def _fetch(self, url: str) -> RemoteResponse:
+        cache = self._cache
+        cached = None
+        key = ""
+        headers = {}
+        if cache is not None:
+            key = cache.key(url, "HTTP")
+            found, cached = cache.get(key)
+            if found and isinstance(cached, dict):
+                if cached.get("etag"):
+                    headers["If-None-Match"] = cached["etag"]
+                if cached.get("last_modified"):
+                    headers["If-Modified-Since"] = cached["last_modified"]
+            else:
+                cached = None
+        response = self.session.get(url, headers=headers, timeout=DEFAULT_RESPONSE_TIMEOUT)
+        if response.status_code == 304 and cached is not None:
+            return RemoteResponse(
+                url=url, status_code=200, content_type=cached["content_type"], content=cached["content"]
+            )
+        result = RemoteResponse(
+            url=url,
+            status_code=response.status_code,
+            content_type=response.headers.get("Content-Type", ""),
+            content=response.content or b"",
+        )
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if cache is not None and result.is_success and (etag or last_modified):
+            cache.set(
+                key,
+                {
+                    "etag": etag,
+                    "last_modified": last_modified,
+                    "content_type": result.content_type,
+                    "content": result.content,
+                },
+            )
+        return result
+
+
+def iter_remote_urls(document: Any, base_uri: str) -> Iterator[tuple[str, bool]]:
+    """Find remote documents referenced via `$ref` or `externalValue`.
+
+    Yields absolute URLs without fragments, along with whether they are references to other schema documents.
+    """
+    # Items are paired with whether their keys are names (e.g. of properties) rather than keywords
+    stack: list[tuple[Any, bool]] = [(document, False)]
+    while stack:
+        item, has_names = stack.pop()
+        if isinstance(item, dict):
+            for key, value in item.items():
+                if isinstance(value, str):
+                    if has_names:
+                        continue
+                    if key == "$ref" and not value.startswith("#"):
+                        url = _to_remote_url(value, base_uri)
+                        if url is not None:
+                            yield url, True
+                    elif key == "externalValue":
+                        url = _to_remote_url(value, base_uri)
+                        if url is not None:
+                            yield url, False
+                elif isinstance(value, dict | list) and (has_names or key not in DATA_KEYWORDS):
+                    stack.append((value, not has_names and key in NAMED_CONTAINERS))
+        elif isinstance(item, list):
+            stack.extend((value, False) for value in item if isinstance(value, dict | list))
+
+
+def _to_remote_url(reference: str, base_uri: str) -> str | None:
+    try:
+        url, _ = urldefrag(urljoin(base_uri, reference))
+    except ValueError:
+        return None
+    if urlparse(url).scheme not in REMOTE_SCHEMES:
+        return None
+    return url
@@ -2,34 +2,44 @@ from __future__ import annotations
 
 import sys
 from collections.abc import Callable
-from functools import lru_cache
-from typing import Any
+from functools import lru_cache, partial
+from typing import TYPE_CHECKING, Any
 from urllib.request import urlopen
 
-import requests
-
 from schemathesis.core.compat import RefResolutionError, RefResolver
 from schemathesis.core.deserialization import deserialize_yaml
 from schemathesis.core.errors import RemoteDocumentError
-from schemathesis.core.transport import DEFAULT_RESPONSE_TIMEOUT
+from schemathesis.specs.openapi.prefetch import RemoteFetcher, iter_remote_urls
+
+if TYPE_CHECKING:
+    from schemathesis.core.schema_cache import SchemaCache
+
 
+def parse_document(content: str | bytes, cache: SchemaCache | None = None) -> Any:
+    """Parse a YAML / JSON document, reusing the result from previous runs if `cache` is provided."""
+    if cache is None:
+        return deserialize_yaml(content)
+    return cache.load(content, "YAML", lambda: deserialize_yaml(content))
 
-def load_file_impl(location: str, opener: Callable) -> dict[str, Any]:
+
+def load_file_impl(location: str, opener: Callable, cache: SchemaCache | None = None) -> dict[str, Any]:
     """Load a schema from the given file."""
     with opener(location) as fd:
-        return deserialize_yaml(fd)
+        if cache is None:
+            return deserialize_yaml(fd)
+        return parse_document(fd.read(), cache)
 
 
 @lru_cache
-def load_file(location: str) -> dict[str, Any]:
+def load_file(location: str, cache: SchemaCache | None = None) -> dict[str, Any]:
     """Load a schema from the given file."""
-    return load_file_impl(location, open)
+    return load_file_impl(location, open, cache)
 
 
 @lru_cache
-def load_file_uri(location: str) -> dict[str, Any]:
+def load_file_uri(location: str, cache: SchemaCache | None = None) -> dict[str, Any]:
     """Load a schema from the given file uri."""
-    return load_file_impl(location, urlopen)
+    return load_file_impl(location, urlopen, cache)
 
 
 _HTML_MARKERS = (b"<!doctype", b"<html", b"<head", b"<body")
@@ -42,22 +52,22 @@ def _looks_like_html(content_type: str | None, body: bytes) -> bool:
     return any(head.startswith(m) for m in _HTML_MARKERS)
 
 
-def load_remote_uri(uri: str) -> Any:
+def load_remote_uri(uri: str, cache: SchemaCache | None = None, fetcher: RemoteFetcher | None = None) -> Any:
     """Load the resource and parse it as YAML / JSON."""
-    response = requests.get(uri, timeout=DEFAULT_RESPONSE_TIMEOUT)
-    content_type = response.headers.get("Content-Type", "")
-    body = response.content or b""
+    response = (fetcher or RemoteFetcher(cache)).fetch(uri)
+    content_type = response.content_type
+    body = response.content
 
     def _suffix() -> str:
         return f"(HTTP {response.status_code}, Content-Type={content_type}, size={len(body)})"
 
-    if not (200 <= response.status_code < 300):
+    if not response.is_success:
         raise RemoteDocumentError(f"Failed to fetch {_suffix()}")
 
     if _looks_like_html(content_type, body):
         raise RemoteDocumentError(f"Expected YAML/JSON, got HTML {_suffix()}")
 
-    document = deserialize_yaml(response.content)
+    document = parse_document(body, cache)
 
     if not isinstance(document, dict | list):
         raise RemoteDocumentError(
@@ -71,12 +81,55 @@ JSONType = None | bool | float | str | list | dict[str, Any]
 
 
 class ReferenceResolver(RefResolver):
-    def __init__(self, *args: Any, **kwargs: Any) -> None:
-        kwargs.setdefault(
-            "handlers", {"file": load_file_uri, "": load_file, "http": load_remote_uri, "https": load_remote_uri}
-        )
+    def __init__(
+        self, *args: Any, cache: SchemaCache | None = None, fetcher: RemoteFetcher | None = None, **kwargs: Any
+    ) -> None:
+        if fetcher is None:
+            fetcher = RemoteFetcher(cache)
+        self.fetcher = fetcher
+        remote = partial(load_remote_uri, cache=cache, fetcher=fetcher)
+        if cache is None:
+            handlers = {"file": load_file_uri, "": load_file, "http": remote, "https": remote}
+        else:
+            handlers = {
+                "file": partial(load_file_uri, cache=cache),
+                "": partial(load_file, cache=cache),
+                "http": remote,
+                "https": remote,
+            }
+        self._schema_cache = cache
+        kwargs.setdefault("handlers", handlers)
         super().__init__(*args, **kwargs)
 
+    def prefetch(self) -> None:
+        """Fetch all remote documents reachable from the root document concurrently.
+
+        Documents referenced from the fetched ones are fetched in the next wave. Errors are not reported here, they
+        surface when the failing reference is resolved.
+        """
+        documents = [(self.referrer, self.resolution_scope)]
+        seen: set[str] = set()
+        while documents:
+            references = []
+            urls = []
+            for document, base_uri in documents:
+                for url, is_reference in iter_remote_urls(document, base_uri):
+                    if url in seen:
+                        continue
+                    seen.add(url)
+                    urls.append(url)
+                    if is_reference and url not in self.store:
+                        references.append(url)
+            self.fetcher.fetch_many(urls)
+            documents = []
+            for url in references:
+                try:
+                    document = load_remote_uri(url, cache=self._schema_cache, fetcher=self.fetcher)
+                except Exception:
+                    continue
+                self.store[url] = document
+                documents.append((document, url))
+
     if sys.version_info >= (3, 11):
 
         def resolve(self, ref: str) -> tuple[str, Any]:
@@ -31,6 +31,7 @@ from schemathesis.core.jsonschema import Bundler
 from schemathesis.core.jsonschema.bundler import BundleCache
 from schemathesis.core.parameters import ParameterLocation
 from schemathesis.core.result import Err, Ok, Result
+from schemathesis.core.schema_cache import get_schema_cache
 from schemathesis.core.transforms import get_template_fields
 from schemathesis.core.transport import Response
 from schemathesis.generation.case import Case
@@ -59,6 +60,7 @@ if TYPE_CHECKING:
 
     from schemathesis.auths import AuthContext, AuthStorage
     from schemathesis.generation.stateful import APIStateMachine
+    from schemathesis.specs.openapi.adapter.responses import ValidationOutcomes
 
 HTTP_METHODS = frozenset({"get", "put", "post", "delete", "options", "head", "patch", "trace", "query"})
 SCHEMA_PARSING_ERRORS = (KeyError, AttributeError, RefResolutionError, InvalidSchema, InfiniteRecursiveReference)
@@ -292,8 +294,8 @@ class OpenApiSchema(BaseSchema):
             except SCHEMA_PARSING_ERRORS:
                 continue
 
-    def get_all_operations(self) -> Generator[Result[APIOperation, InvalidSchema], None, None]:
-        """Iterate over all operations defined in the API.
+    def _iter_operations(self) -> Generator[Result[APIOperation, InvalidSchema], None, None]:
+        """Build all operations defined in the API.
 
         Each yielded item is either `Ok` or `Err`, depending on the presence of errors during schema processing.
 
@@ -479,7 +481,9 @@ class OpenApiSchema(BaseSchema):
     @property
     def resolver(self) -> ReferenceResolver:
         if not hasattr(self, "_resolver"):
-            self._resolver = ReferenceResolver(self.location or "", self.raw_schema)
+            cache = get_schema_cache(self.config.schema_cache)
+            self._resolver = ReferenceResolver(self.location or "", self.raw_schema, cache=cache)
+            self._resolver.prefetch()
         return self._resolver
 
     def get_content_types(self, operation: APIOperation, response: Response) -> list[str]:
@@ -668,11 +672,20 @@ class OpenApiSchema(BaseSchema):
 
         context = deserialization.DeserializationContext(operation=operation, case=case)
 
+        outcomes = None
+        if sse_validator is None and deserialization.has_builtin_deserializer(content_type):
+            # The outcome depends only on the body, reuse it for bodies that were already validated
+            outcomes = definition.validation_outcomes
+            cached = outcomes.get(resolved_content_type, response.content)
+            if cached is not None:
+                _maybe_raise_one_or_more(cached)
+                return None
+
         try:
             data = deserialization.deserialize_response(response, content_type, context=context)
         except JSONDecodeError as exc:
             failures.append(MalformedJson.from_exception(operation=operation.label, exc=exc))
-            _maybe_raise_one_or_more(failures)
+            _store_and_raise(outcomes, resolved_content_type, response.content, failures)
             return None
         except NotImplementedError:
             # No deserializer available for this media type - skip validation
@@ -686,7 +699,7 @@ class OpenApiSchema(BaseSchema):
                     message=f"Failed to deserialize response content:\n\n  {exc}",
                 )
             )
-            _maybe_raise_one_or_more(failures)
+            _store_and_raise(outcomes, resolved_content_type, response.content, failures)
             return None
 
         if sse_validator is not None:
@@ -762,7 +775,7 @@ class OpenApiSchema(BaseSchema):
                         message=f"Response contains invalid JSON (lone Unicode surrogate characters are not valid per RFC 8259):\n\n  {exc}",
                     )
                 )
-        _maybe_raise_one_or_more(failures)
+        _store_and_raise(outcomes, resolved_content_type, response.content, failures)
         return None  # explicitly return None for mypy
 
 
@@ -781,6 +794,14 @@ def _find_surrogate_location(doc: str) -> tuple[int, int, int]:
     return pos, lineno, colno
 
 
+def _store_and_raise(
+    outcomes: ValidationOutcomes | None, content_type: str | None, content: bytes, failures: list[Failure]
+) -> None:
+    if outcomes is not None:
+        outcomes.set(content_type, content, failures)
+    _maybe_raise_one_or_more(failures)
+
+
 def _maybe_raise_one_or_more(failures: list[Failure]) -> None:
     if not failures:
         return
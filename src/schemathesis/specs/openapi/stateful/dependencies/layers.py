@@ -48,26 +48,7 @@ def compute_dependency_layers(graph: DependencyGraph) -> list[list[str]] | None:
         Layer 2: [GET /orders/{id}]  # Depends on layer 1
 
     """
-    # Build dependency mapping: operation -> set of operations it depends on
-    dependencies: dict[str, set[str]] = defaultdict(set)
-    # Track which operations produce which resources
-    producers: dict[int, set[str]] = defaultdict(set)
-
-    # Index producers by resource ID
-    for label, node in graph.operations.items():
-        for output_slot in node.outputs:
-            resource_id = id(output_slot.resource)
-            producers[resource_id].add(label)
-
-    # Build dependency edges
-    for label, node in graph.operations.items():
-        for input_slot in node.inputs:
-            resource_id = id(input_slot.resource)
-            # This operation depends on all operations that produce this resource
-            for producer_label in producers[resource_id]:
-                # Don't create self-dependencies
-                if producer_label != label:
-                    dependencies[label].add(producer_label)
+    dependencies = _compute_dependencies(graph)
 
     # If no dependencies exist, return None (no useful ordering)
     if not any(dependencies.values()):
@@ -124,6 +105,54 @@ def compute_dependency_layers(graph: DependencyGraph) -> list[list[str]] | None:
     return layers or None
 
 
+def compute_acyclic_dependencies(graph: DependencyGraph) -> dict[str, set[str]] | None:
+    """Compute operations each operation depends on, without cycles.
+
+    Operations that depend on each other (directly or transitively) are not ordered between themselves,
+    the same way as they are placed in the same layer by `compute_dependency_layers`.
+
+    Returns:
+        Mapping of operation labels to labels of operations producing resources they consume, or None if
+        there are no dependencies.
+
+    """
+    dependencies = _compute_dependencies(graph)
+    if not any(dependencies.values()):
+        return None
+    components: dict[str, int] = {}
+    for idx, component in enumerate(_find_sccs(graph, dependencies)):
+        for label in component:
+            components[label] = idx
+    return {
+        label: {dependency for dependency in dependencies.get(label, ()) if components[dependency] != components[label]}
+        for label in graph.operations
+    }
+
+
+def _compute_dependencies(graph: DependencyGraph) -> dict[str, set[str]]:
+    """Build dependency mapping: operation -> set of operations it depends on."""
+    dependencies: dict[str, set[str]] = defaultdict(set)
+    # Track which operations produce which resources
+    producers: dict[int, set[str]] = defaultdict(set)
+
+    # Index producers by resource ID
+    for label, node in graph.operations.items():
+        for output_slot in node.outputs:
+            resource_id = id(output_slot.resource)
+            producers[resource_id].add(label)
+
+    # Build dependency edges
+    for label, node in graph.operations.items():
+        for input_slot in node.inputs:
+            resource_id = id(input_slot.resource)
+            # This operation depends on all operations that produce this resource
+            for producer_label in producers[resource_id]:
+                # Don't create self-dependencies
+                if producer_label != label:
+                    dependencies[label].add(producer_label)
+    return dependencies
+
+
 def _compute_layers_with_cycles(
     graph: DependencyGraph,
     dependencies: dict[str, set[str]],
@@ -118,7 +118,7 @@ class SerializerRegistry:
     """Registry for serializers with aliasing support."""
 
     def __call__(self, *media_types: str) -> Callable[[_Serializer], None]:
-        """Register a serializer for specified media types on HTTP, ASGI, and WSGI transports.
+        """Register a serializer for specified media types on HTTP (`requests` & `httpx`), ASGI, and WSGI transports.
 
         Args:
             *media_types: One or more MIME types (e.g., "application/json") this serializer handles.
@@ -138,10 +138,12 @@ class SerializerRegistry:
 
         def register(func: _Serializer) -> None:
             from schemathesis.transport.asgi import ASGI_TRANSPORT
+            from schemathesis.transport.httpx import HTTPX_TRANSPORT
             from schemathesis.transport.requests import REQUESTS_TRANSPORT
             from schemathesis.transport.wsgi import WSGI_TRANSPORT
 
             @ASGI_TRANSPORT.serializer(*media_types)
+            @HTTPX_TRANSPORT.serializer(*media_types)
             @REQUESTS_TRANSPORT.serializer(*media_types)
             @WSGI_TRANSPORT.serializer(*media_types)
             def inner(ctx: SerializationContext, value: Any) -> dict[str, bytes]:
@@ -184,6 +186,7 @@ class SerializerRegistry:
 
         """
         from schemathesis.transport.asgi import ASGI_TRANSPORT
+        from schemathesis.transport.httpx import HTTPX_TRANSPORT
         from schemathesis.transport.requests import REQUESTS_TRANSPORT
         from schemathesis.transport.wsgi import WSGI_TRANSPORT
 
@@ -205,6 +208,7 @@ class SerializerRegistry:
         # Register for all targets across all transports
         for t in targets:
             REQUESTS_TRANSPORT._serializers[t] = serializer_func
+            HTTPX_TRANSPORT._serializers[t] = serializer_func
             ASGI_TRANSPORT._serializers[t] = serializer_func
             WSGI_TRANSPORT._serializers[t] = serializer_func
 
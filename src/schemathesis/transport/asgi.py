@@ -18,6 +18,11 @@ class ASGITransport(RequestsTransport):
             kwargs["base_url"] = normalize_base_url(case.operation.base_url)
         application = kwargs.pop("app", case.operation.app)
 
+        from starlette_testclient import TestClient
+
+        if isinstance(session, TestClient):
+            # An already running client, e.g. the one kept by the engine for the whole test run
+            return super().send(case, session=session, **kwargs)
         with asgi.get_client(application) as client:
             return super().send(case, session=client, **kwargs)
 
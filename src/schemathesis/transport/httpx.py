@@ -0,0 +1,297 @@
+"""Transport based on `httpx`.
+
+Its async variant allows keeping many requests in flight from a single thread. With a shared `httpx.AsyncClient`,
+requests reuse one connection pool, and with `http2=True` (requires the `h2` package) they are multiplexed over
+a few connections.
+
+With the `http-client` config option, the engine sends requests via blocking `httpx` clients shared by all workers.
+Each worker still runs one Hypothesis test at a time, but workers do not hold connections of their own.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from schemathesis.core.rate_limit import AdaptiveLimiter, send_with_rate_limit, send_with_rate_limit_async
+from schemathesis.core.transport import DEFAULT_RESPONSE_TIMEOUT, Response
+from schemathesis.transport.prepare import get_exclude_headers
+from schemathesis.transport.requests import REQUESTS_TRANSPORT, RequestsTransport, validate_vanilla_requests_kwargs
+
+if TYPE_CHECKING:
+    import ssl
+
+    import httpx
+    import requests
+    from pyrate_limiter import Limiter
+
+    from schemathesis.generation.case import Case
+
+
+class HttpxTransport(RequestsTransport):
+    """Sends requests via `httpx` clients.
+
+    Cases are serialized the same way as for `requests`, then arguments are adjusted to the `httpx` API.
+    """
+
+    def _prepare(
+        self, case: Case, session: httpx.Client | httpx.AsyncClient | None, kwargs: dict[str, Any]
+    ) -> _PreparedRequest:
+        config = case.operation.schema.config
+
+        data = self.serialize_case(case, **kwargs)
+
+        timeout = config.request_timeout_for(operation=case.operation)
+        if timeout is not None:
+            data.setdefault("timeout", timeout)
+        kwargs.pop("base_url", None)
+        for key, value in kwargs.items():
+            if key not in ("headers", "cookies", "params") or key not in data:
+                data[key] = value
+        data.setdefault("timeout", DEFAULT_RESPONSE_TIMEOUT)
+
+        # Arguments that are set per client in `httpx`, but per request in `requests`
+        verify = data.pop("verify", None)
+        if verify is None:
+            verify = config.tls_verify_for(operation=case.operation)
+        if verify is None:
+            verify = True
+        cert = data.pop("cert", None) or config.request_cert_for(operation=case.operation)
+        max_redirects = data.pop("max_redirects", None) or config.max_redirects_for(operation=case.operation)
+        proxies = data.pop("proxies", None)
+        proxy = (proxies.get("all") or next(iter(proxies.values()))) if proxies else None
+        proxy = proxy or config.proxy_for(operation=case.operation)
+        client_kwargs = get_client_arguments(verify=verify, cert=cert, max_redirects=max_redirects, proxy=proxy)
+
+        basic_auth = config.auth_for(operation=case.operation)
+        if basic_auth is not None and "auth" not in data and "Authorization" not in get_exclude_headers(case):
+            # `requests` sessions in the engine apply it the same way
+            data["auth"] = basic_auth
+
+        if session is None:
+            validate_vanilla_requests_kwargs(data)
+        _adjust_arguments(data)
+        return _PreparedRequest(
+            arguments=data,
+            client_arguments=client_kwargs,
+            verify=verify is not False,
+            rate_limit=config.rate_limit_for(operation=case.operation),
+        )
+
+    def send(self, case: Case, *, session: httpx.Client | None = None, **kwargs: Any) -> Response:
+        """Send the case with a blocking `httpx` client.
+
+        Network errors are raised as their `requests` counterparts, so they are reported the same way as with
+        the default transport.
+        """
+        import httpx
+
+        prepared = self._prepare(case, session, kwargs)
+        close_session = session is None
+        if session is None:
+            session = httpx.Client(**prepared.client_arguments)
+        try:
+            client = session
+            response = send_with_rate_limit(
+                prepared.rate_limit,
+                case.operation.schema.config.base_url,
+                lambda: client.request(**prepared.arguments),
+            )
+            return Response.from_httpx(response, verify=prepared.verify)
+        except (httpx.TransportError, httpx.TooManyRedirects) as exc:
+            raise _as_requests_error(exc, prepared.arguments) from exc
+        finally:
+            if close_session:
+                session.close()
+
+    async def send_async(self, case: Case, *, session: httpx.AsyncClient | None = None, **kwargs: Any) -> Response:
+        """Send the case with an async `httpx` client.
+
+        Concurrent calls with the same `session` share its connection pool. TLS, redirect, and proxy settings
+        from the config are applied only to clients created by this method.
+        """
+        import httpx
+
+        prepared = self._prepare(case, session, kwargs)
+        close_session = session is None
+        if session is None:
+            session = httpx.AsyncClient(**prepared.client_arguments)
+        try:
+            client = session
+            response = await send_with_rate_limit_async(
+                prepared.rate_limit,
+                case.operation.schema.config.base_url,
+                lambda: client.request(**prepared.arguments),
+            )
+            return Response.from_httpx(response, verify=prepared.verify)
+        finally:
+            if close_session:
+                await session.aclose()
+
+
+@dataclass
+class _PreparedRequest:
+    arguments: dict[str, Any]
+    client_arguments: dict[str, Any]
+    verify: bool
+    rate_limit: Limiter | AdaptiveLimiter | None
+
+    __slots__ = ("arguments", "client_arguments", "verify", "rate_limit")
+
+
+class ClientPool:
+    """Blocking `httpx` clients shared by all workers of a test run.
+
+    Clients are created lazily, one for each distinct set of client-level settings, e.g. TLS verification
+    configured for specific operations.
+    """
+
+    __slots__ = ("http2", "_clients", "_lock")
+
+    def __init__(self, *, http2: bool = False) -> None:
+        self.http2 = http2
+        self._clients: dict[tuple[Any, ...], httpx.Client] = {}
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        *,
+        verify: bool | str | None,
+        cert: str | tuple[str, str] | None,
+        max_redirects: int | None,
+        proxy: str | None,
+    ) -> httpx.Client:
+        key = (verify, cert, max_redirects, proxy)
+        client = self._clients.get(key)
+        if client is None:
+            import httpx
+
+            with self._lock:
+                client = self._clients.get(key)
+                if client is None:
+                    arguments = get_client_arguments(
+                        verify=True if verify is None else verify, cert=cert, max_redirects=max_redirects, proxy=proxy
+                    )
+                    client = httpx.Client(http2=self.http2, **arguments)
+                    self._clients[key] = client
+        return client
+
+    def close(self) -> None:
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        for client in clients:
+            client.close()
+
+
+def get_client_arguments(
+    *, verify: bool | str, cert: str | tuple[str, str] | None, max_redirects: int | None, proxy: str | None
+) -> dict[str, Any]:
+    """Arguments for `httpx` clients, which are set per request in `requests`."""
+    arguments: dict[str, Any] = {
+        "verify": verify if cert is None and isinstance(verify, bool) else _ssl_context(verify, cert)
+    }
+    if max_redirects is not None:
+        arguments["max_redirects"] = max_redirects
+    if proxy is not None:
+        arguments["proxy"] = proxy
+    return arguments
+
+
+def _as_requests_error(
+    exc: httpx.TransportError | httpx.TooManyRedirects, arguments: dict[str, Any]
+) -> requests.RequestException:
+    # Errors are wrapped the same way as `requests` does, as error reporting relies on their structure
+    import ssl
+
+    import httpx
+    import requests
+    from urllib3 import exceptions
+
+    url = arguments["url"]
+    request = requests.Request(
+        method=arguments["method"], url=url, headers=arguments.get("headers"), params=arguments.get("params")
+    )
+    message = str(exc) or exc.__class__.__name__
+    if isinstance(exc, httpx.TooManyRedirects):
+        return requests.TooManyRedirects(message, request=request)
+    if isinstance(exc, httpx.ReadTimeout):
+        timeout = arguments.get("timeout")
+        inner = exceptions.ReadTimeoutError(None, url, f"Read timed out. (read timeout={timeout})")  # type: ignore[arg-type]
+        return requests.ReadTimeout(inner, request=request)
+    if isinstance(exc, httpx.TimeoutException) and not isinstance(exc, httpx.ConnectTimeout):
+        return requests.Timeout(message, request=request)
+    reason: Exception
+    error_type: type[requests.RequestException]
+    if isinstance(exc, httpx.ConnectTimeout):
+        reason, error_type = exceptions.ConnectTimeoutError(message), requests.ConnectTimeout
+    elif isinstance(exc, httpx.ProxyError):
+        reason, error_type = exceptions.ProxyError("Unable to connect to proxy", exc), requests.exceptions.ProxyError
+    elif isinstance(exc, httpx.ConnectError) and _is_caused_by(exc, ssl.SSLError):
+        reason, error_type = exceptions.SSLError(message), requests.exceptions.SSLError
+    elif isinstance(exc, httpx.ConnectError):
+        reason = exceptions.NewConnectionError(None, f"Failed to establish a new connection: {message}")  # type: ignore[arg-type]
+        error_type = requests.ConnectionError
+    else:
+        # The connection was dropped after it had been established
+        return requests.ConnectionError(exceptions.ProtocolError("Connection aborted.", exc), request=request)
+    return error_type(exceptions.MaxRetryError(None, url, reason), request=request)  # type: ignore[arg-type]
+
+
+def _is_caused_by(exc: BaseException, error_type: type[BaseException]) -> bool:
+    inner: BaseException | None = exc
+    while inner is not None:
+        if isinstance(inner, error_type):
+            return True
+        inner = inner.__cause__ or inner.__context__
+    return False
+
+
+def _ssl_context(verify: bool | str, cert: str | tuple[str, str] | None) -> ssl.SSLContext:
+    import ssl
+
+    import httpx
+
+    if isinstance(verify, str):
+        if os.path.isdir(verify):
+            context = ssl.create_default_context(capath=verify)
+        else:
+            context = ssl.create_default_context(cafile=verify)
+    else:
+        context = httpx.create_ssl_context(verify=verify)
+    if isinstance(cert, tuple):
+        context.load_cert_chain(*cert)
+    elif cert is not None:
+        context.load_cert_chain(cert)
+    return context
+
+
+def _adjust_arguments(data: dict[str, Any]) -> None:
+    """Convert `requests.request` arguments to their `httpx` counterparts in place."""
+    body = data.pop("data", None)
+    if isinstance(body, bytes | str):
+        data["content"] = body
+    elif body is not None:
+        data["data"] = body
+    data["follow_redirects"] = data.pop("allow_redirects", True)
+    params = data.get("params")
+    if isinstance(params, Mapping):
+        # `requests` skips parameters with `None` values
+        data["params"] = {key: value for key, value in params.items() if value is not None}
+    cookies = data.pop("cookies", None)
+    if cookies:
+        # Per-request cookies are deprecated in `httpx`
+        headers = data["headers"]
+        header = "; ".join(f"{name}={value}" for name, value in cookies.items())
+        existing = next((name for name in headers if name.lower() == "cookie"), None)
+        if existing is None:
+            headers["Cookie"] = header
+        else:
+            headers[existing] = f"{headers[existing]}; {header}"
+
+
+HTTPX_TRANSPORT = HttpxTransport()
+HTTPX_TRANSPORT._copy_serializers_from(REQUESTS_TRANSPORT)
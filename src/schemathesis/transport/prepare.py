@@ -129,22 +129,27 @@ def prepare_request(case: Case, headers: Mapping[str, Any] | None, *, config: Sa
     base_url = normalize_base_url(case.operation.base_url)
     kwargs = REQUESTS_TRANSPORT.serialize_case(case, base_url=base_url, headers=headers)
     if config.enabled:
-        kwargs["url"] = sanitize_url(kwargs["url"], config=config)
-        kwargs["headers"] = dict(kwargs["headers"])
-        sanitize_value(kwargs["headers"], config=config)
-        if kwargs["cookies"]:
-            kwargs["cookies"] = dict(kwargs["cookies"])
-            sanitize_value(kwargs["cookies"], config=config)
-        if kwargs["params"]:
-            if isinstance(kwargs["params"], Mapping):
-                kwargs["params"] = dict(kwargs["params"])
-                sanitize_value(kwargs["params"], config=config)
-            elif isinstance(kwargs["params"], str):
-                kwargs["params"] = _sanitize_query_string(kwargs["params"], config=config)
+        sanitize_request_kwargs(kwargs, config=config)
 
     return requests.Request(**kwargs).prepare()
 
 
+def sanitize_request_kwargs(kwargs: dict[str, Any], *, config: SanitizationConfig) -> None:
+    """Sanitize URL, headers, cookies & query of serialized request arguments without changing the originals."""
+    kwargs["url"] = sanitize_url(kwargs["url"], config=config)
+    kwargs["headers"] = dict(kwargs["headers"])
+    sanitize_value(kwargs["headers"], config=config)
+    if kwargs["cookies"]:
+        kwargs["cookies"] = dict(kwargs["cookies"])
+        sanitize_value(kwargs["cookies"], config=config)
+    if kwargs["params"]:
+        if isinstance(kwargs["params"], Mapping):
+            kwargs["params"] = dict(kwargs["params"])
+            sanitize_value(kwargs["params"], config=config)
+        elif isinstance(kwargs["params"], str):
+            kwargs["params"] = _sanitize_query_string(kwargs["params"], config=config)
+
+
 def _sanitize_query_string(query: str, *, config: SanitizationConfig) -> str:
     parts = []
     for chunk in query.split("&"):
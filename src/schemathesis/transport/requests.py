@@ -11,7 +11,7 @@ from urllib.parse import urlencode, urlparse
 from schemathesis.core import NotSet
 from schemathesis.core.errors import IncorrectUsage
 from schemathesis.core.parameters import RAW_QUERY_STRING_KEY, RawQueryString
-from schemathesis.core.rate_limit import ratelimit
+from schemathesis.core.rate_limit import send_with_rate_limit
 from schemathesis.core.transforms import merge_at
 from schemathesis.core.transport import DEFAULT_RESPONSE_TIMEOUT, Response
 from schemathesis.generation.overrides import Override
@@ -181,8 +181,7 @@ class RequestsTransport(BaseTransport["requests.Session"]):
 
         try:
             rate_limit = config.rate_limit_for(operation=case.operation)
-            with ratelimit(rate_limit, config.base_url):
-                response = session.request(**data)
+            response = send_with_rate_limit(rate_limit, config.base_url, lambda: session.request(**data))
             return Response.from_requests(
                 response,
                 verify=verify,
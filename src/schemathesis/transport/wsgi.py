@@ -7,7 +7,7 @@ from typing import TYPE_CHECKING, Any
 
 from schemathesis.core import NotSet
 from schemathesis.core.parameters import RAW_QUERY_STRING_KEY, RawQueryString
-from schemathesis.core.rate_limit import ratelimit
+from schemathesis.core.rate_limit import MAX_RETRIES, ratelimit
 from schemathesis.core.transforms import merge_at
 from schemathesis.core.transport import Response
 from schemathesis.generation.case import Case
@@ -83,6 +83,7 @@ class WSGITransport(BaseTransport["werkzeug.Client"]):
         **kwargs: Any,
     ) -> Response:
         import requests
+        import werkzeug
 
         headers = kwargs.pop("headers", None)
         params = kwargs.pop("params", None)
@@ -96,15 +97,26 @@ class WSGITransport(BaseTransport["werkzeug.Client"]):
         for name in excluded_headers:
             data["headers"].pop(name, None)
 
-        client = session or wsgi.get_client(application)
+        client = session if isinstance(session, werkzeug.Client) else wsgi.get_client(application)
         cookies = {**(case.cookies or {}), **(cookies or {})}
 
         config = case.operation.schema.config
         rate_limit = config.rate_limit_for(operation=case.operation)
-        with cookie_handler(client, cookies), ratelimit(rate_limit, config.base_url):
-            start = time.monotonic()
-            response = client.open(**data)
-            elapsed = time.monotonic() - start
+        retries = 0
+        while True:
+            with cookie_handler(client, cookies), ratelimit(rate_limit, config.base_url) as slot:
+                start = time.monotonic()
+                response = client.open(**data)
+                elapsed = time.monotonic() - start
+                # Report the response to an adaptive limiter, the same way `send_with_rate_limit` does
+                retry = slot is not None and slot.record(
+                    status_code=response.status_code,
+                    elapsed=elapsed,
+                    retry_after=response.headers.get("Retry-After"),
+                )
+            if not retry or retries == MAX_RETRIES:
+                break
+            retries += 1
 
         requests_kwargs = REQUESTS_TRANSPORT.serialize_case(
             case,
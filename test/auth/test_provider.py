@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import threading
+
 import pytest
 
 import schemathesis
-from schemathesis.auths import AuthContext, AuthStorage, CachingAuthProvider
+from schemathesis.auths import AuthContext, AuthStorage, CachingAuthProvider, KeyedCachingAuthProvider
+from schemathesis.config import WorkersMode
 from schemathesis.core.errors import IncorrectUsage
 from schemathesis.engine import from_schema
+from schemathesis.engine.phases.unit._process_pool import is_supported as is_process_mode_supported
 from schemathesis.generation.case import Case
 
 TOKEN = "EXAMPLE-TOKEN"
@@ -60,6 +64,131 @@ def test_cache(auth_provider_class, token, mocker):
     assert provider.provider.get_calls == 2  # No increase
 
 
+class SequentialAuth:
+    def __init__(self, fail_after=None):
+        self.get_calls = 0
+        self.fail_after = fail_after
+
+    def get(self, case, context):
+        self.get_calls += 1
+        if self.fail_after is not None and self.get_calls > self.fail_after:
+            raise ValueError("Unavailable")
+        return f"TOKEN-{self.get_calls}"
+
+    def set(self, case, data, context):
+        pass
+
+
+def wait_for_background_refreshes():
+    for thread in threading.enumerate():
+        if thread.name == "SchemathesisAuthRefresh":
+            thread.join()
+
+
+@pytest.fixture
+def clock():
+    class Clock:
+        now = 0.0
+
+        def __call__(self):
+            return self.now
+
+    return Clock()
+
+
+def test_refresh_ahead(mocker, clock):
+    context = mocker.create_autospec(AuthContext)
+    provider = CachingAuthProvider(SequentialAuth(), refresh_interval=10, refresh_ahead=2, timer=clock)
+    # The first call has to wait for the token
+    assert provider.get(None, context) == "TOKEN-1"
+    clock.now = 7
+    assert provider.get(None, context) == "TOKEN-1"
+    assert provider.provider.get_calls == 1
+    # When the token is close to expiration
+    clock.now = 9
+    # Then the current token is still used
+    assert provider.get(None, context) == "TOKEN-1"
+    wait_for_background_refreshes()
+    # And the new one is fetched in the background
+    assert provider.provider.get_calls == 2
+    assert provider.get(None, context) == "TOKEN-2"
+    statistic = provider.statistic
+    assert statistic.refreshes == 2
+    assert statistic.background_refreshes == 1
+    assert statistic.stalls == 1
+
+
+def test_refresh_ahead_failure(mocker, clock):
+    context = mocker.create_autospec(AuthContext)
+    provider = CachingAuthProvider(SequentialAuth(fail_after=1), refresh_interval=10, refresh_ahead=2, timer=clock)
+    assert provider.get(None, context) == "TOKEN-1"
+    clock.now = 9
+    # When the background refresh fails
+    assert provider.get(None, context) == "TOKEN-1"
+    wait_for_background_refreshes()
+    # Then the still valid token is used
+    assert provider.get(None, context) == "TOKEN-1"
+    wait_for_background_refreshes()
+    assert provider.provider.get_calls == 2
+    # And the refresh is not retried right away
+    assert provider.get(None, context) == "TOKEN-1"
+    wait_for_background_refreshes()
+    assert provider.provider.get_calls == 2
+    # But only after a delay
+    clock.now = 9.5
+    assert provider.get(None, context) == "TOKEN-1"
+    wait_for_background_refreshes()
+    assert provider.provider.get_calls == 3
+    assert provider.statistic.failed_background_refreshes == 2
+
+
+def test_refresh_ahead_by_key(mocker, clock):
+    context = mocker.create_autospec(AuthContext)
+    provider = KeyedCachingAuthProvider(
+        SequentialAuth(),
+        refresh_interval=10,
+        refresh_ahead=2,
+        timer=clock,
+        cache_by_key=lambda case, _: case,
+    )
+    assert provider.get("a", context) == "TOKEN-1"
+    clock.now = 5
+    assert provider.get("b", context) == "TOKEN-2"
+    clock.now = 9
+    # Only the entry that is close to expiration is refreshed
+    assert provider.get("a", context) == "TOKEN-1"
+    assert provider.get("b", context) == "TOKEN-2"
+    wait_for_background_refreshes()
+    assert provider.get("a", context) == "TOKEN-3"
+    assert provider.get("b", context) == "TOKEN-2"
+
+
+def test_fork_releases_parent_state(mocker, clock):
+    context = mocker.create_autospec(AuthContext)
+    provider = CachingAuthProvider(SequentialAuth(), refresh_interval=10, refresh_ahead=2, timer=clock)
+    assert provider.get(None, context) == "TOKEN-1"
+    # When a worker process is forked while another thread holds the lock
+    provider._refresh_lock.acquire()
+    provider._background_refreshes[None] = threading.Thread(target=lambda: None)
+    provider.fork()
+    # Then the copy does not wait for threads that do not exist in it
+    clock.now = 9
+    assert provider.get(None, context) == "TOKEN-1"
+    wait_for_background_refreshes()
+    assert provider.get(None, context) == "TOKEN-2"
+    # And only its own refreshes are counted
+    assert provider.statistic.refreshes == 1
+
+
+@pytest.mark.parametrize(
+    ("refresh_interval", "refresh_ahead"),
+    [(None, 10), (300, 0), (300, 300)],
+)
+def test_invalid_refresh_ahead(auth_storage, auth_provider_class, refresh_interval, refresh_ahead):
+    with pytest.raises(IncorrectUsage, match="`refresh_ahead` should be a positive number"):
+        auth_storage.auth(refresh_interval=refresh_interval, refresh_ahead=refresh_ahead)(auth_provider_class)
+
+
 def test_register_invalid(auth_storage):
     # When the class implementation is wrong
     # Then it should not be possible to register it
@@ -216,3 +345,48 @@ def test_auth_cache_with_scopes(openapi3_base_url):
     list(from_schema(schema).execute())
     assert counts["list"] == 1
     assert counts["create"] == 1
+
+
+@pytest.mark.parametrize(
+    "workers_mode",
+    [
+        WorkersMode.THREAD,
+        pytest.param(
+            WorkersMode.PROCESS, marks=pytest.mark.skipif(not is_process_mode_supported(), reason="Requires `fork`")
+        ),
+    ],
+)
+@pytest.mark.parametrize("refresh_ahead", [None, 10])
+@pytest.mark.operations("success")
+def test_refresh_statistic(real_app_schema, workers_mode, refresh_ahead):
+    real_app_schema.config.update(workers=2, workers_mode=workers_mode)
+    real_app_schema.config.phases.update(phases=["fuzzing"])
+    real_app_schema.config.generation.update(max_examples=1)
+
+    @real_app_schema.auth(refresh_interval=300, refresh_ahead=refresh_ahead)
+    class Auth:
+        def get(self, case, context):
+            return TOKEN
+
+        def set(self, case, data, context):
+            case.headers = {"Authorization": f"Bearer {data}"}
+
+    def run():
+        return list(from_schema(real_app_schema).execute())[-1].auth
+
+    statistic = run()
+    if refresh_ahead is None:
+        # Refreshes are reported only for providers that refresh ahead
+        assert statistic is None
+        return
+    # Refreshes made in worker processes are reported too
+    assert statistic is not None
+    assert statistic.refreshes == 1
+    statistic = run()
+    if workers_mode == WorkersMode.THREAD:
+        # The token is still cached, and refreshes from the previous run are not counted again
+        assert statistic is None
+    else:
+        # Worker processes don't pass their cache back to the main one
+        assert statistic is not None
+        assert statistic.refreshes == 1
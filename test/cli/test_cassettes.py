@@ -1,4 +1,5 @@
 import base64
+import gzip
 import io
 import json
 import platform
@@ -369,6 +370,65 @@ def test_report_dir(cli, schema_url, tmp_path, in_config):
     assert list(report_dir.glob("*.ndjson"))
 
 
+@pytest.mark.parametrize("suffix", [".yaml", ".har"])
+@pytest.mark.operations("success")
+def test_gzip_compression(cli, schema_url, cassette_path, suffix):
+    # When the cassette path has the `.gz` suffix
+    cassette_path = cassette_path.with_suffix(f"{suffix}.gz")
+    option = "--report-vcr-path" if suffix == ".yaml" else "--report-har-path"
+    cli.run_and_assert(schema_url, f"{option}={cassette_path}", "--max-examples=1", "--phases=fuzzing")
+    # Then it is compressed with gzip
+    with gzip.open(cassette_path, "rt", encoding="utf-8") as fd:
+        content = fd.read()
+    if suffix == ".yaml":
+        assert yaml.safe_load(content)["http_interactions"]
+    else:
+        assert json.loads(content)["log"]["entries"]
+
+
+@pytest.mark.parametrize("suffix", [".yaml", ".har"])
+@pytest.mark.operations("success", "failure", "multiple_failures")
+def test_rotation(cli, schema_url, cassette_path, suffix):
+    cassette_path = cassette_path.with_suffix(suffix)
+    option = "--report-vcr-path" if suffix == ".yaml" else "--report-har-path"
+    # When cassettes are limited in size
+    cli.run(
+        schema_url,
+        f"{option}={cassette_path}",
+        "--max-examples=5",
+        "--phases=fuzzing",
+        config={"reports": {"cassette-max-size": 1}},
+    )
+    # Then every file starts after a scenario that exceeded the limit
+    paths = sorted(cassette_path.parent.glob(f"output*{suffix}"))
+    assert len(paths) > 1
+    assert cassette_path.with_name(f"output.1{suffix}") in paths
+    # And all of them are complete cassettes
+    for path in paths:
+        if suffix == ".yaml":
+            assert "seed" in load_cassette(path)
+        else:
+            with path.open(encoding="utf-8") as fd:
+                assert "entries" in json.load(fd)["log"]
+
+
+@pytest.mark.operations("success", "failure")
+def test_record_failures_only(cli, schema_url, cassette_path):
+    # When only failures should be recorded
+    cli.run(
+        schema_url,
+        f"--report-vcr-path={cassette_path}",
+        "--max-examples=1",
+        "--phases=fuzzing",
+        "--checks=not_a_server_error",
+        config={"reports": {"cassette-filter": "failures"}},
+    )
+    interactions = load_cassette(cassette_path)["http_interactions"]
+    # Then successful scenarios are not recorded
+    assert interactions
+    assert all(interaction["request"]["uri"].endswith("/failure") for interaction in interactions)
+
+
 @given(text=st.text())
 @example("Test")
 @example("\ufeff")
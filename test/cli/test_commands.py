@@ -6,6 +6,7 @@ import platform
 import sys
 import time
 from http.client import RemoteDisconnected
+from importlib.util import find_spec
 from urllib.parse import urljoin
 
 import hypothesis
@@ -19,6 +20,7 @@ from flask import Flask, jsonify, redirect, request, url_for
 from urllib3.exceptions import ProtocolError
 
 from schemathesis.core.shell import ShellType
+from schemathesis.engine.phases.unit._process_pool import is_supported as is_process_mode_supported
 from schemathesis.schemas import APIOperation
 from schemathesis.specs.openapi import unregister_string_format
 from test.apps._graphql._flask import create_app as create_graphql_app
@@ -500,6 +502,50 @@ def test_connection_error(cli, schema_url, workers, snapshot_cli):
     )
 
 
+@pytest.mark.skipif(not is_process_mode_supported(), reason="Requires `fork`")
+def test_workers_mode_process_rate_limit(cli, schema_url, snapshot_cli):
+    # Each worker process would have its own limiter
+    assert cli.run(schema_url, "--workers=2", "--workers-mode=process", "--rate-limit=10/s") == snapshot_cli
+
+
+def test_http_client_connection_error(cli, schema_url, snapshot_cli):
+    # Network errors raised by `httpx` are reported the same way as with `requests`
+    assert (
+        cli.run(schema_url, "--url=http://127.0.0.1:1/api", "--workers=2", "--http-client=httpx", "--mode=positive")
+        == snapshot_cli
+    )
+
+
+@pytest.mark.skipif(find_spec("h2") is not None, reason="Requires `h2` to be missing")
+def test_http2_requires_h2(cli, schema_url, snapshot_cli):
+    assert cli.run(schema_url, "--http-client=http2") == snapshot_cli
+
+
+@pytest.mark.operations("success", "failure", "multiple_failures")
+def test_workers_mode_process(cli, schema_url, snapshot_cli):
+    # Failures found in worker processes are reported the same way as with threads
+    assert (
+        cli.run(
+            schema_url,
+            "--workers=2",
+            "--workers-mode=process",
+            "--mode=positive",
+            "--phases=fuzzing",
+            "--generation-deterministic",
+            "-c not_a_server_error",
+        )
+        == snapshot_cli
+    )
+
+
+def test_workers_mode_process_connection_error(cli, schema_url, snapshot_cli):
+    # Network errors hold unpicklable connection pools, but they are still reported
+    assert (
+        cli.run(schema_url, "--url=http://127.0.0.1:1/api", "--workers=2", "--workers-mode=process", "--mode=positive")
+        == snapshot_cli
+    )
+
+
 @pytest.mark.openapi_version("3.0")
 @pytest.mark.operations("success")
 def test_chunked_encoding_error(mocker, cli, schema_url, app, snapshot_cli):
@@ -2282,12 +2328,65 @@ class EventCounter(cli.EventHandler):
     )
 
 
+@pytest.mark.openapi_version("3.0")
+@pytest.mark.operations("success", "failure")
+def test_threaded_handler(ctx, cli, schema_url):
+    module = ctx.write_pymodule(
+        r"""
+import threading
+import time
+
+from schemathesis import cli, engine
+
+@cli.handler()
+class SlowHandler(cli.EventHandler):
+    threaded = True
+
+    def __init__(self, *args, **params):
+        self.events = []
+
+    def handle_event(self, ctx, event) -> None:
+        assert threading.current_thread() is not threading.main_thread()
+        time.sleep(0.01)
+        self.events.append(type(event).__name__)
+        if isinstance(event, engine.events.EngineFinished):
+            ctx.add_summary_line(f"EVENTS: {self.events[0]} .. {self.events[-1]} ({len(self.events)})")
+"""
+    )
+    result = cli.run(schema_url, "--max-examples=1", "--phases=fuzzing", hooks=module)
+    # Then all events are delivered in order and summary lines are added before the summary is rendered
+    assert "EVENTS: LoadingStarted .. EngineFinished" in result.stdout
+
+
+@pytest.mark.openapi_version("3.0")
+@pytest.mark.operations("success")
+def test_threaded_handler_error(ctx, cli, schema_url):
+    module = ctx.write_pymodule(
+        r"""
+from schemathesis import cli, engine
+
+@cli.handler()
+class FailingHandler(cli.EventHandler):
+    threaded = True
+
+    def handle_event(self, ctx, event) -> None:
+        if isinstance(event, engine.events.PhaseStarted):
+            raise ZeroDivisionError("Oops")
+"""
+    )
+    # Then the error is re-raised in the main thread
+    with pytest.raises(ZeroDivisionError, match="Oops"):
+        cli.run(schema_url, "--max-examples=1", "--phases=fuzzing", hooks=module)
+
+
 @pytest.mark.parametrize(
     ["ordering_mode", "expected"],
     [
         pytest.param("none", ["GET /users/{id}", "DELETE /users/{id}", "POST /users", "GET /users"], id="none"),
         # auto mode: Layer 0 (sorted): GET /users, POST /users -> Layer 1: GET /users/{id} -> Layer 2: DELETE /users/{id}
         pytest.param("auto", ["POST /users", "GET /users", "GET /users/{id}", "DELETE /users/{id}"], id="auto"),
+        # cost mode: operations with parameters are more expensive, ties keep the schema order
+        pytest.param("cost", ["GET /users/{id}", "DELETE /users/{id}", "POST /users", "GET /users"], id="cost"),
     ],
 )
 def test_operation_ordering(ctx, cli, app_runner, ordering_mode, expected):
@@ -0,0 +1,193 @@
+import json
+
+import pytest
+from _pytest.main import ExitCode
+
+import schemathesis
+from schemathesis.cli.commands.run.incremental import (
+    MANIFEST_KEY,
+    apply_changed_since,
+    load_previous_fingerprints,
+    save_fingerprints,
+)
+from schemathesis.specs.openapi.fingerprints import FINGERPRINT_VERSION, compute_fingerprints
+
+
+def make_schema(ctx, *, user_name=None, order_total=None, link_target="getUser"):
+    user = {"type": "object", "properties": {"name": user_name or {"type": "string"}}}
+    return ctx.openapi.build_schema(
+        {
+            "/users": {
+                "post": {
+                    "operationId": "createUser",
+                    "requestBody": {
+                        "required": True,
+                        "content": {"application/json": {"schema": {"$ref": "#/components/schemas/User"}}},
+                    },
+                    "responses": {
+                        "201": {
+                            "description": "Created",
+                            "links": {"Next": {"operationId": link_target}},
+                        }
+                    },
+                }
+            },
+            "/users/{id}": {
+                "parameters": [{"in": "path", "name": "id", "required": True, "schema": {"type": "integer"}}],
+                "get": {
+                    "operationId": "getUser",
+                    "responses": {"200": {"description": "OK"}},
+                },
+            },
+            "/orders": {
+                "post": {
+                    "operationId": "createOrder",
+                    "requestBody": {
+                        "required": True,
+                        "content": {"application/json": {"schema": {"$ref": "#/components/schemas/Order"}}},
+                    },
+                    "responses": {"201": {"description": "Created"}},
+                },
+                "get": {"responses": {"200": {"description": "OK"}}},
+            },
+        },
+        components={
+            "schemas": {
+                "User": user,
+                "Order": {
+                    "type": "object",
+                    "properties": {
+                        "total": order_total or {"type": "integer"},
+                        "owner": {"$ref": "#/components/schemas/Owner"},
+                    },
+                },
+                "Owner": {"type": "string"},
+            }
+        },
+    )
+
+
+def changed_labels(old, new):
+    previous = compute_fingerprints(schemathesis.openapi.from_dict(old))
+    current = compute_fingerprints(schemathesis.openapi.from_dict(new))
+    return {label for label, fingerprint in current.items() if previous.get(label) != fingerprint}
+
+
+def test_unchanged_schema(ctx):
+    assert changed_labels(make_schema(ctx), make_schema(ctx)) == set()
+
+
+def test_referenced_component_changed(ctx):
+    # `Order` refers to `Owner` that is not changed, but `Order` itself is
+    new = make_schema(ctx, order_total={"type": "number"})
+    assert changed_labels(make_schema(ctx), new) == {"POST /orders"}
+
+
+def test_nested_reference_changed(ctx):
+    new = make_schema(ctx)
+    new["components"]["schemas"]["Owner"]["minLength"] = 1
+    assert changed_labels(make_schema(ctx), new) == {"POST /orders"}
+
+
+def test_shared_parameters_changed(ctx):
+    new = make_schema(ctx)
+    new["paths"]["/users/{id}"]["parameters"][0]["schema"]["minimum"] = 1
+    # `POST /users` links to `GET /users/{id}`
+    assert changed_labels(make_schema(ctx), new) == {"GET /users/{id}", "POST /users"}
+
+
+def test_link_changed(ctx):
+    new = make_schema(ctx, link_target="createOrder")
+    assert changed_labels(make_schema(ctx), new) == {"POST /users"}
+
+
+def with_security(schema):
+    schema["security"] = [{"ApiKey": []}]
+    schema["paths"]["/orders"]["get"]["security"] = [{"Bearer": []}]
+    schema["components"]["securitySchemes"] = {
+        "ApiKey": {"type": "apiKey", "name": "X-Key", "in": "header"},
+        "Bearer": {"$ref": "#/components/schemas/BearerScheme"},
+    }
+    schema["components"]["schemas"]["BearerScheme"] = {"type": "http", "scheme": "bearer"}
+    return schema
+
+
+def test_inherited_security_scheme_changed(ctx):
+    new = with_security(make_schema(ctx))
+    new["components"]["securitySchemes"]["ApiKey"]["name"] = "X-Other-Key"
+    # `GET /orders` overrides the root-level security requirement
+    assert changed_labels(with_security(make_schema(ctx)), new) == {
+        "GET /users/{id}",
+        "POST /orders",
+        "POST /users",
+    }
+
+
+def test_referenced_security_scheme_changed(ctx):
+    new = with_security(make_schema(ctx))
+    new["components"]["schemas"]["BearerScheme"]["bearerFormat"] = "JWT"
+    assert changed_labels(with_security(make_schema(ctx)), new) == {"GET /orders"}
+
+
+def test_root_security_changed(ctx):
+    new = with_security(make_schema(ctx))
+    del new["security"]
+    assert changed_labels(with_security(make_schema(ctx)), new) == {
+        "GET /users/{id}",
+        "POST /orders",
+        "POST /users",
+    }
+
+
+def test_inherited_media_types_changed(ctx):
+    def make(produces):
+        return ctx.openapi.build_schema(
+            {
+                "/users": {"get": {"responses": {"200": {"description": "OK"}}}},
+                "/orders": {"get": {"produces": ["application/xml"], "responses": {"200": {"description": "OK"}}}},
+            },
+            version="2.0",
+            produces=produces,
+        )
+
+    assert changed_labels(make(["application/json"]), make(["text/plain"])) == {"GET /users", "GET /orders"}
+
+
+def test_apply_changed_since(ctx):
+    previous = compute_fingerprints(schemathesis.openapi.from_dict(make_schema(ctx)))
+    schema = schemathesis.openapi.from_dict(make_schema(ctx, order_total={"type": "number"}))
+    schema.filter_set.exclude(method="GET")
+    # Excluded operations are not counted as skipped
+    assert apply_changed_since(schema, compute_fingerprints(schema), previous) == 1
+    assert [result.ok().label for result in schema.get_all_operations()] == ["POST /orders"]
+
+
+def test_manifest_roundtrip(ctx, tmp_path):
+    fingerprints = compute_fingerprints(schemathesis.openapi.from_dict(make_schema(ctx)))
+    path = tmp_path / "fingerprints.json"
+    save_fingerprints(str(path), fingerprints)
+    assert load_previous_fingerprints(str(path)) == fingerprints
+    # Manifests from other versions don't match anything
+    path.write_text(json.dumps({MANIFEST_KEY: -1, "operations": fingerprints}))
+    assert load_previous_fingerprints(str(path)) == {}
+
+
+def test_previous_schema_file(ctx, tmp_path):
+    path = tmp_path / "previous.json"
+    path.write_text(json.dumps(make_schema(ctx)))
+    expected = compute_fingerprints(schemathesis.openapi.from_dict(make_schema(ctx)))
+    assert load_previous_fingerprints(str(path)) == expected
+
+
+@pytest.mark.operations("success", "failure", "text")
+def test_cli_changed_since(cli, schema_url, tmp_path):
+    manifest = tmp_path / "fingerprints.json"
+    args = (schema_url, "--max-examples=1", "--phases=fuzzing", "--checks=not_a_server_error")
+    result = cli.run(*args, f"--save-fingerprints={manifest}")
+    assert result.exit_code == ExitCode.TESTS_FAILED, result.stdout
+    assert json.loads(manifest.read_text())[MANIFEST_KEY] == FINGERPRINT_VERSION
+    # Nothing changed since the previous run
+    result = cli.run(*args, f"--changed-since={manifest}")
+    assert result.exit_code == ExitCode.OK, result.stdout
+    assert "0 selected / 3 total / 3 unchanged" in result.stdout
+    assert "Unchanged: 3" in result.stdout
@@ -0,0 +1,220 @@
+import gzip
+import json
+import sys
+from xml.etree import ElementTree
+
+import pytest
+from _pytest.main import ExitCode
+
+import schemathesis
+from schemathesis.cli.commands.run.sharding import Shard, ShardStrategy, apply_shard, assign_by_cost, hash_shard
+
+OPERATIONS = ("success", "failure", "text", "flaky", "multiple_failures", "path_variable")
+
+
+def load_ndjson(path):
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def get_tested_labels(events):
+    return {event["ScenarioFinished"]["recorder"]["label"] for event in events if "ScenarioFinished" in event}
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("1/1", Shard(index=1, count=1)),
+        ("3/40", Shard(index=3, count=40)),
+    ],
+)
+def test_parse_shard(value, expected):
+    assert Shard.parse(value) == expected
+
+
+@pytest.mark.parametrize("value", ["1", "0/2", "3/2", "1/0", "a/b"])
+def test_parse_invalid_shard(value):
+    with pytest.raises(ValueError):
+        Shard.parse(value)
+
+
+def test_invalid_shard_option(cli):
+    result = cli.run("http://127.0.0.1/openapi.json", "--shard=5/4")
+    assert result.exit_code == ExitCode.INTERRUPTED, result.stdout
+    assert "Invalid value for '--shard'" in result.output
+
+
+def test_hash_shard_is_stable():
+    # Must not depend on the process-specific hash seed
+    assert hash_shard("GET /users", 40) == 33
+    assert hash_shard("GET /users", 1) == 1
+
+
+def build_schema(ctx, count):
+    return schemathesis.openapi.from_dict(
+        ctx.openapi.build_schema(
+            {
+                f"/items/{idx}": {
+                    "post": {
+                        "requestBody": {
+                            "required": True,
+                            "content": {
+                                "application/json": {
+                                    "schema": {
+                                        "type": "object",
+                                        # Operations get bigger schemas, therefore different costs
+                                        "properties": {f"field_{field}": {"type": "integer"} for field in range(idx)},
+                                    }
+                                }
+                            },
+                        },
+                        "responses": {"200": {"description": "OK"}},
+                    }
+                }
+                for idx in range(count)
+            }
+        )
+    )
+
+
+@pytest.mark.parametrize("strategy", list(ShardStrategy))
+def test_shards_are_disjoint_and_complete(ctx, strategy):
+    count = 3
+    all_labels = [result.ok().label for result in build_schema(ctx, 10).get_all_operations()]
+    selected = []
+    for index in range(1, count + 1):
+        schema = build_schema(ctx, 10)
+        apply_shard(schema, Shard(index=index, count=count), strategy)
+        selected.append([result.ok().label for result in schema.get_all_operations()])
+    assert sorted(label for labels in selected for label in labels) == sorted(all_labels)
+    assert all(labels for labels in selected)
+
+
+def test_cost_assignment_is_balanced(ctx):
+    schema = build_schema(ctx, 10)
+    assignment = assign_by_cost(schema, 2)
+    # Costs grow with the number of fields: the most expensive operations are split between shards first
+    assert assignment["POST /items/9"] != assignment["POST /items/8"]
+    sizes = [sum(1 for index in assignment.values() if index == shard) for shard in (1, 2)]
+    assert sizes == [5, 5]
+    # The assignment does not depend on the order of operations
+    assert assign_by_cost(schema, 2) == assignment
+
+
+@pytest.mark.operations(*OPERATIONS)
+def test_merge_sharded_reports(cli, schema_url, tmp_path):
+    reports = {}
+    for index in (1, 2):
+        directory = tmp_path / str(index)
+        cli.run(
+            schema_url,
+            f"--shard={index}/2",
+            "--max-examples=1",
+            "--phases=fuzzing",
+            "--checks=not_a_server_error",
+            f"--report-ndjson-path={directory / 'events.ndjson'}",
+            f"--report-junit-path={directory / 'junit.xml'}",
+            f"--report-vcr-path={directory / 'vcr.yaml'}",
+            f"--report-har-path={directory / 'har.json'}",
+        )
+        reports[index] = directory
+    # Each operation is tested on exactly one node
+    first = get_tested_labels(load_ndjson(reports[1] / "events.ndjson"))
+    second = get_tested_labels(load_ndjson(reports[2] / "events.ndjson"))
+    assert not first & second
+    assert len(first | second) == len(OPERATIONS)
+
+    # NDJSON
+    merged = tmp_path / "merged.ndjson"
+    result = cli.main("merge-reports", "-o", str(merged), *(str(reports[index] / "events.ndjson") for index in (1, 2)))
+    assert result.exit_code == ExitCode.OK, result.stdout
+    assert "Merged 2 NDJSON reports" in result.stdout
+    assert f"Tested operations: {len(OPERATIONS)}" in result.stdout
+    events = load_ndjson(merged)
+    names = [next(iter(event)) for event in events]
+    assert names[0] == "Initialize"
+    assert names.count("Initialize") == names.count("LoadingFinished") == names.count("EngineFinished") == 1
+    assert names[-1] == "EngineFinished"
+    assert get_tested_labels(events) == first | second
+
+    # JUnit XML
+    merged = tmp_path / "merged.xml"
+    result = cli.main("merge-reports", "-o", str(merged), *(str(reports[index] / "junit.xml") for index in (1, 2)))
+    assert result.exit_code == ExitCode.OK, result.stdout
+    root = ElementTree.parse(merged).getroot()
+    assert root.attrib["tests"] == str(len(OPERATIONS))
+    (suite,) = list(root)
+    assert suite.attrib["name"] == "schemathesis"
+    assert {testcase.attrib["name"] for testcase in suite} == first | second
+    failures = sum(1 for testcase in suite if testcase.find("failure") is not None)
+    assert root.attrib["failures"] == suite.attrib["failures"] == str(failures)
+
+    # VCR
+    merged = tmp_path / "merged.yaml"
+    result = cli.main("merge-reports", "-o", str(merged), *(str(reports[index] / "vcr.yaml") for index in (1, 2)))
+    assert result.exit_code == ExitCode.OK, result.stdout
+    import yaml
+
+    cassette = yaml.safe_load(merged.read_text())
+    expected = sum(
+        len(yaml.safe_load((reports[index] / "vcr.yaml").read_text())["http_interactions"]) for index in (1, 2)
+    )
+    assert len(cassette["http_interactions"]) == expected
+
+    # HAR
+    merged = tmp_path / "merged.har"
+    result = cli.main("merge-reports", "-o", str(merged), *(str(reports[index] / "har.json") for index in (1, 2)))
+    assert result.exit_code == ExitCode.OK, result.stdout
+    expected = sum(len(json.loads((reports[index] / "har.json").read_text())["log"]["entries"]) for index in (1, 2))
+    assert len(json.loads(merged.read_text())["log"]["entries"]) == expected
+
+
+def test_merge_compressed_cassettes(cli, tmp_path):
+    for index in (1, 2):
+        with gzip.open(tmp_path / f"vcr-{index}.yaml.gz", "wt", encoding="utf-8") as fd:
+            fd.write(f"command: 'st'\nseed: 1\nhttp_interactions:\n- id: '{index}'\n  status: 'SUCCESS'")
+    merged = tmp_path / "merged.yaml"
+    result = cli.main("merge-reports", "-o", str(merged), *(str(tmp_path / f"vcr-{index}.yaml.gz") for index in (1, 2)))
+    assert result.exit_code == ExitCode.OK, result.stdout
+    assert "Merged 2 VCR reports" in result.stdout
+    assert "Interactions: 2" in result.stdout
+
+
+@pytest.mark.skipif(sys.version_info >= (3, 14), reason="Zstandard is available since Python 3.14")
+def test_merge_zstd_unavailable(cli, tmp_path):
+    paths = [tmp_path / f"vcr-{index}.yaml.zst" for index in (1, 2)]
+    for path in paths:
+        path.write_bytes(b"")
+    result = cli.main("merge-reports", "-o", str(tmp_path / "merged.yaml"), *map(str, paths))
+    assert result.exit_code == ExitCode.INTERRUPTED, result.stdout
+    assert "Zstandard compression requires Python 3.14 or later" in result.output
+
+
+def test_merge_mixed_formats(cli, tmp_path):
+    junit = tmp_path / "junit.xml"
+    junit.write_text('<?xml version="1.0" ?><testsuites/>')
+    ndjson = tmp_path / "events.ndjson"
+    ndjson.write_text('{"Initialize":{}}\n')
+    result = cli.main("merge-reports", "-o", str(tmp_path / "out"), str(junit), str(ndjson))
+    assert result.exit_code == ExitCode.INTERRUPTED, result.stdout
+    assert "All reports must have the same format" in result.output
+
+
+def test_merge_ndjson_statistics(cli, tmp_path):
+    for index, (refreshes, longest) in enumerate(((2, 0.5), (3, 0.25)), 1):
+        finished = {
+            "running_time": float(index),
+            "deduplication": {"hits": index, "misses": 1, "evictions": 0},
+            "auth": {"refreshes": refreshes, "refresh_time": 1.0, "max_refresh_time": longest, "stalls": 1},
+        }
+        (tmp_path / f"events-{index}.ndjson").write_text(
+            json.dumps({"Initialize": {}}) + "\n" + json.dumps({"EngineFinished": finished}) + "\n"
+        )
+    merged = tmp_path / "merged.ndjson"
+    result = cli.main(
+        "merge-reports", "-o", str(merged), *(str(tmp_path / f"events-{index}.ndjson") for index in (1, 2))
+    )
+    assert result.exit_code == ExitCode.OK, result.stdout
+    finished = load_ndjson(merged)[-1]["EngineFinished"]
+    assert finished["deduplication"] == {"evictions": 0, "hits": 3, "misses": 2}
+    # Counters and times are summed, except for the longest refresh
+    assert finished["auth"] == {"max_refresh_time": 0.5, "refresh_time": 2.0, "refreshes": 5, "stalls": 2}
@@ -47,7 +47,7 @@ def test_warnings_for_without_operations():
 
 
 def test_project_key_config_sync():
-    ignored_in_operations_config = {"operations", "hooks", "workers", "base_url"}
+    ignored_in_operations_config = {"operations", "hooks", "workers", "workers_mode", "http_client", "base_url"}
     for key in ProjectConfig.__slots__:
         if key.startswith("_"):
             continue
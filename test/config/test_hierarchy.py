@@ -4,6 +4,8 @@ from hypothesis.database import DirectoryBasedExampleDatabase, InMemoryExampleDa
 
 from schemathesis.config import SchemathesisConfig
 from schemathesis.core import HYPOTHESIS_IN_MEMORY_DATABASE_IDENTIFIER
+from schemathesis.filters import FilterSet
+from schemathesis.generation import GenerationMode
 from schemathesis.schemas import APIOperation, OperationDefinition
 
 LABEL = "PUT /users/{user_id}"
@@ -157,3 +159,68 @@ def test_hypothesis_max_examples_and_no_shrink_override(operation):
     assert hypothesis.Phase.reuse in op_settings.phases
 
     assert op_settings.derandomize is False
+
+
+def test_operation_filters_are_evaluated_once(operation, mocker):
+    cfg = SchemathesisConfig.from_dict(
+        {
+            "operations": [
+                {
+                    "include-name": LABEL,
+                    "generation": {"max-examples": 42},
+                    "phases": {"fuzzing": {"generation": {"no-shrink": True}}},
+                }
+            ],
+        }
+    )
+    project = cfg.projects.get_default()
+    applies_to = mocker.spy(FilterSet, "applies_to")
+
+    generation = project.generation_for(operation=operation, phase="fuzzing")
+    assert generation.max_examples == 42
+    assert generation.no_shrink
+    project.phases_for(operation=operation)
+    project.checks_config_for(operation=operation, phase="fuzzing")
+    assert not project.generation_for(operation=operation, phase="examples").no_shrink
+    assert applies_to.call_count == 1
+
+
+def test_in_place_updates_are_visible_after_resolving(operation):
+    cfg = SchemathesisConfig.from_dict({"operations": [{"include-name": LABEL, "generation": {"max-examples": 5}}]})
+    project = cfg.projects.get_default()
+    assert project.generation_for(operation=operation, phase="fuzzing").max_examples == 5
+    assert project.generation_for(operation=operation).modes == [GenerationMode.POSITIVE, GenerationMode.NEGATIVE]
+
+    project.operations.operations[0].generation.update(max_examples=9)
+    project.generation.update(modes=[GenerationMode.NEGATIVE])
+
+    assert project.generation_for(operation=operation, phase="fuzzing").max_examples == 9
+    assert project.generation_for(operation=operation).modes == [GenerationMode.NEGATIVE]
+
+
+def test_resolved_configs_are_reused(operation):
+    cfg = SchemathesisConfig.from_dict({"operations": [{"include-name": LABEL, "generation": {"max-examples": 5}}]})
+    project = cfg.projects.get_default()
+    generation = project.generation_for(operation=operation, phase="fuzzing")
+    assert project.generation_for(operation=operation, phase="fuzzing") is generation
+    assert project.generation_for(operation=operation, phase="examples") is not generation
+    assert project.phases_for(operation=operation) is project.phases_for(operation=operation)
+    checks = project.checks_config_for(operation=operation, phase="fuzzing")
+    assert project.checks_config_for(operation=operation, phase="fuzzing") is checks
+    # Any modification invalidates them
+    project.generation.codec = "ascii"
+    assert project.generation_for(operation=operation, phase="fuzzing").codec == "ascii"
+    checks = project.checks_config_for(operation=operation, phase="fuzzing")
+    project.checks.update(excluded_check_names=["custom"])
+    assert project.checks_config_for(operation=operation, phase="fuzzing") is not checks
+
+
+def test_replaced_operations_are_matched_again(operation):
+    cfg = SchemathesisConfig.from_dict({"operations": [{"include-name": LABEL, "generation": {"max-examples": 5}}]})
+    project = cfg.projects.get_default()
+    assert project.generation_for(operation=operation).max_examples == 5
+
+    project.operations.operations = []
+
+    assert project.operations.get_matching(operation) == []
+    assert project.generation_for(operation=operation).max_examples is None
@@ -41,6 +41,7 @@ from schemathesis.core.version import SCHEMATHESIS_VERSION
 from schemathesis.specs.openapi import media_types
 from schemathesis.specs.openapi.formats import STRING_FORMATS
 from schemathesis.transport.asgi import ASGI_TRANSPORT
+from schemathesis.transport.httpx import HTTPX_TRANSPORT
 from schemathesis.transport.requests import REQUESTS_TRANSPORT
 from schemathesis.transport.wsgi import WSGI_TRANSPORT
 
@@ -79,14 +80,14 @@ def reset_hooks():
     CUSTOM_HANDLERS.clear()
     hooks.unregister_all()
     auths.unregister()
-    for transport in (ASGI_TRANSPORT, WSGI_TRANSPORT, REQUESTS_TRANSPORT):
+    for transport in (ASGI_TRANSPORT, WSGI_TRANSPORT, REQUESTS_TRANSPORT, HTTPX_TRANSPORT):
         transport.unregister_serializer(*media_types.MEDIA_TYPES.keys())
     media_types.unregister_all()
     yield
     CUSTOM_HANDLERS.clear()
     hooks.unregister_all()
     auths.unregister()
-    for transport in (ASGI_TRANSPORT, WSGI_TRANSPORT, REQUESTS_TRANSPORT):
+    for transport in (ASGI_TRANSPORT, WSGI_TRANSPORT, REQUESTS_TRANSPORT, HTTPX_TRANSPORT):
         transport.unregister_serializer(*media_types.MEDIA_TYPES.keys())
     media_types.unregister_all()
     # Restore built-in deserializers
@@ -323,6 +324,7 @@ class CliSnapshotConfig:
     replace_seed: bool = True
     replace_reproduce_with: bool = False
     replace_test_cases: bool = True
+    replace_duplicates: bool = False
     replace_phase_statistic: bool = False
     replace_stateful_statistic: bool = True
     remove_last_line: bool = False
@@ -342,6 +344,9 @@ class CliSnapshotConfig:
     def serialize(self, data: str) -> str:
         if not self.replace:
             return data
+        if self.replace_duplicates:
+            # Depends on how many duplicates Hypothesis generates, which is not stable across runs
+            data = re.sub(r", \d+ duplicates skipped\n", "\n", data)
         if self.replace_test_cases:
             data = re.sub(r"Test cases:\n  (\d+) generated, \1 skipped", "Test cases:\n  N generated, N skipped", data)
             # Cases with failures and skips
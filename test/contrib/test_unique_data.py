@@ -1,4 +1,5 @@
 import platform
+import re
 
 import pytest
 
@@ -130,6 +131,7 @@ def test_cli_failure(unique_hook, cli, openapi3_schema_url, hypothesis_max_examp
     )
 
 
+@pytest.mark.snapshot(replace_duplicates=True)
 def test_graphql_url(cli, unique_hook, graphql_url, snapshot_cli):
     assert (
         cli.main(
@@ -145,6 +147,7 @@ def test_graphql_url(cli, unique_hook, graphql_url, snapshot_cli):
 
 
 @pytest.mark.parametrize("workers", [1, 2])
+@pytest.mark.snapshot(replace_duplicates=True)
 def test_explicit_headers(
     ctx,
     unique_hook,
@@ -192,3 +195,22 @@ def test_explicit_headers(
         )
         == snapshot_cli
     )
+
+
+def test_duplicates_summary(ctx, unique_hook, cli, openapi3_base_url):
+    schema = ctx.openapi.build_schema(
+        {
+            "/success": {
+                "get": {
+                    "parameters": [{"name": "token", "in": "query", "required": True, "schema": {"type": "string"}}],
+                    "responses": {"200": {"description": "OK"}},
+                }
+            }
+        }
+    )
+    # When the only generated value is sanitized
+    result = run(ctx, cli, unique_hook, schema, openapi3_base_url, 10, "--phases=fuzzing")
+    # Then test cases that send the same sanitized requests are skipped as duplicates and reported in the summary
+    match = re.search(r"Test cases:\n  (\d+) generated, \1 passed, (\d+) duplicates skipped\n", result.stdout)
+    assert match is not None, result.stdout
+    assert int(match.group(2)) > 0
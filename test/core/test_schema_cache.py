@@ -0,0 +1,92 @@
+import pytest
+import yaml
+
+import schemathesis
+from schemathesis.config import SchemathesisConfig
+from schemathesis.core.schema_cache import SchemaCache, get_schema_cache
+from schemathesis.specs.openapi.references import load_file
+
+SCHEMA = """
+openapi: 3.0.0
+info:
+  title: Test
+  version: 0.1.0
+paths:
+  /users:
+    get:
+      parameters:
+        - $ref: "components.yaml#/Limit"
+      responses:
+        200:
+          description: OK
+"""
+COMPONENTS = """
+Limit:
+  name: limit
+  in: query
+  schema:
+    type: integer
+    minimum: 1
+"""
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return SchemaCache(tmp_path / "cache")
+
+
+def stored_files(directory):
+    return [path for path in directory.rglob("*") if path.is_file()]
+
+
+def test_load_parses_once(cache):
+    calls = []
+
+    def parse():
+        calls.append(1)
+        return {"key": [1, 2.5, None, True, "value"], 200: {"nested": "value"}}
+
+    first = cache.load("content", "YAML", parse)
+    second = cache.load("content", "YAML", parse)
+    assert first == second == {"key": [1, 2.5, None, True, "value"], 200: {"nested": "value"}}
+    assert len(calls) == 1
+    # Different content or parser is a different entry
+    cache.load("other", "YAML", parse)
+    cache.load("content", "JSON", parse)
+    assert len(calls) == 3
+
+
+def test_corrupted_entry(cache):
+    cache.load("content", "YAML", lambda: {"a": 1})
+    (path,) = stored_files(cache.directory)
+    path.write_bytes(b"\xff\x00garbage")
+    # Parsed again and overwritten
+    assert cache.load("content", "YAML", lambda: {"a": 2}) == {"a": 2}
+    assert cache.load("content", "YAML", lambda: {"a": 3}) == {"a": 2}
+
+
+def test_unsupported_values_are_not_stored(cache):
+    cache.load("content", "YAML", lambda: {"a": object()})
+    assert not stored_files(cache.directory)
+
+
+def test_from_path_uses_cache(tmp_path, mocker):
+    (tmp_path / "openapi.yaml").write_text(SCHEMA)
+    (tmp_path / "components.yaml").write_text(COMPONENTS)
+    config = SchemathesisConfig(schema_cache=str(tmp_path / "cache"))
+
+    def load():
+        schema = schemathesis.openapi.from_path(tmp_path / "openapi.yaml", config=config)
+        operation = schema["/users"]["GET"]
+        return schema.raw_schema, [parameter.definition for parameter in operation.query]
+
+    expected = load()
+    # Both the root document and the referenced one are stored
+    assert len(stored_files(tmp_path / "cache")) == 2
+    # As if it is a new process
+    load_file.cache_clear()
+    get_schema_cache.cache_clear()
+    spy = mocker.spy(yaml, "load")
+    assert load() == expected
+    # Neither document is parsed again
+    assert spy.call_count == 0
@@ -14,6 +14,7 @@ from requests import Request
 from requests.models import RequestEncodingMixin
 
 import schemathesis
+from schemathesis.config import SchemathesisConfig
 from schemathesis.config._projects import ProjectConfig
 from schemathesis.core import NOT_SET
 from schemathesis.core.errors import MalformedMediaType
@@ -21,11 +22,13 @@ from schemathesis.core.parameters import LOCATION_TO_CONTAINER, ParameterLocatio
 from schemathesis.core.result import Ok
 from schemathesis.generation import GenerationMode
 from schemathesis.generation import coverage as coverage_generation
+from schemathesis.generation.hypothesis import builder
 from schemathesis.generation.hypothesis.builder import (
     HypothesisTestConfig,
     HypothesisTestMode,
     _iter_coverage_cases,
     create_test,
+    generate_coverage_cases,
 )
 from schemathesis.generation.meta import CoverageScenario, TestPhase
 from test.utils import assert_requests_call
@@ -3290,3 +3293,65 @@ def test_hostname_negative_format_respects_validator_draft(monkeypatch, validato
     else:
         with pytest.raises(Unsatisfiable):
             next(generator)
+
+
+def test_coverage_cases_are_cached_between_runs(ctx, tmp_path, mocker):
+    raw_schema = build_schema(
+        ctx,
+        [
+            {"in": "path", "name": "id", "schema": {"type": "integer", "minimum": 1}, "required": True},
+            {"in": "query", "name": "q", "schema": {"$ref": "#/components/schemas/Key"}},
+            {"in": "header", "name": "X-Key", "schema": {"type": "string", "format": "uuid"}, "required": True},
+        ],
+        request_body={
+            "required": True,
+            "content": {"application/json": {"schema": {"$ref": "#/components/schemas/Item"}}},
+        },
+        path="/items/{id}",
+    )
+    raw_schema["components"] = {
+        "schemas": {
+            "Key": {"type": "string", "enum": ["a", "b"]},
+            "Item": {"type": "object", "properties": {"key": {"$ref": "#/components/schemas/Key"}}},
+        }
+    }
+    config = SchemathesisConfig(schema_cache=str(tmp_path / "cache"))
+
+    def generate(raw_schema):
+        schema = schemathesis.openapi.from_dict(raw_schema, config=config)
+        operation = schema["/items/{id}"]["POST"]
+        return [
+            (
+                case.method,
+                case.path_parameters,
+                dict(case.headers),
+                case.cookies,
+                case.query,
+                case.body,
+                case.media_type,
+                case.meta.generation.mode,
+                case.meta.components,
+                case.meta.phase,
+            )
+            for case in generate_coverage_cases(
+                operation=operation,
+                generation_modes=ALL_MODES,
+                auth_storage=None,
+                as_strategy_kwargs={},
+                generate_duplicate_query_parameters=True,
+                unexpected_methods={"PATCH"},
+                generation_config=schema.config.generation,
+            )
+        ]
+
+    expected = generate(raw_schema)
+    assert expected
+    spy = mocker.spy(builder, "_iter_coverage_cases")
+    # Then the same cases are replayed without generating them again
+    assert generate(raw_schema) == expected
+    assert spy.call_count == 0
+    # And changing a referenced component invalidates the cache
+    raw_schema["components"]["schemas"]["Key"]["enum"].append("c")
+    changed = generate(raw_schema)
+    assert spy.call_count == 1
+    assert changed != expected
@@ -0,0 +1,93 @@
+import threading
+from unittest.mock import patch
+
+import pytest
+from hypothesis import strategies as st
+
+from schemathesis.generation.coverage import get_strategy_for_type
+from schemathesis.generation.hypothesis.examples import generate_one
+from schemathesis.generation.sampler import ValueSampler
+
+
+@pytest.mark.parametrize(
+    ("sample", "strategy"),
+    [
+        (lambda s: s.for_type("integer", None), st.integers()),
+        (lambda s: s.for_type("array", None), get_strategy_for_type("array")),
+        (lambda s: s.for_type("object", None), get_strategy_for_type("object")),
+        (lambda s: s.for_type(["null", "string"], None), get_strategy_for_type(["null", "string"])),
+        (lambda s: s.for_type(["unknown", "boolean"], None), get_strategy_for_type(["unknown", "boolean"])),
+        (lambda s: s.text(0, 5), st.text(max_size=5)),
+        (lambda s: s.text(3, 5), st.text(min_size=3, max_size=5)),
+        (lambda s: s.integer(None, None), st.integers()),
+        (lambda s: s.integer(5, 10), st.integers(min_value=5, max_value=10)),
+        (lambda s: s.integer(-5, -1), st.integers(min_value=-5, max_value=-1)),
+        (lambda s: s.integer(None, -3), st.integers(max_value=-3)),
+        (lambda s: s.integer(-3, 3), st.integers(min_value=-3, max_value=3)),
+        (lambda s: s.multiple_of(3), st.integers().map((3).__mul__)),
+        (lambda s: s.multiple_of(-2.5), st.integers().map((-2.5).__mul__)),
+        (lambda s: s.sampled_from([{"a": 1}, 2]), st.sampled_from([{"a": 1}, 2])),
+        (lambda s: s.list_of("", 2, None), st.lists(st.text(), min_size=2)),
+        (lambda s: s.list_of("A", 0, None), st.lists(st.sampled_from(["A"]))),
+    ],
+)
+def test_matches_hypothesis(sample, strategy):
+    # The sampler should produce exactly what a one-example Hypothesis run does
+    with patch("schemathesis.generation.hypothesis.examples.generate_one") as generate:
+        value = sample(ValueSampler())
+    generate.assert_not_called()
+    expected = generate_one(strategy)
+    assert value == expected
+    assert type(value) is type(expected)
+
+
+def test_draw_is_pooled():
+    sampler = ValueSampler(max_size=2)
+    calls = []
+
+    def strategy():
+        calls.append(None)
+        return st.from_regex("^[a-z]{3}$", fullmatch=True)
+
+    first = sampler.draw("a", strategy)
+    assert sampler.draw("a", strategy) == first
+    assert len(calls) == 1
+    # The oldest entry is evicted once the pool is full
+    sampler.draw("b", strategy)
+    sampler.draw("c", strategy)
+    assert len(sampler) == 2
+    sampler.draw("a", strategy)
+    assert len(calls) == 4
+
+
+def test_concurrent_draws_evict_safely():
+    sampler = ValueSampler(max_size=8)
+    errors = []
+
+    def draw(worker):
+        try:
+            for idx in range(500):
+                sampler.draw((worker, idx), lambda: None)
+        except Exception as exc:
+            errors.append(exc)
+
+    with patch("schemathesis.generation.hypothesis.examples.generate_one", return_value=0):
+        threads = [threading.Thread(target=draw, args=(worker,)) for worker in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    assert not errors
+    assert len(sampler) == 8
+
+
+def test_containers_are_not_shared():
+    sampler = ValueSampler()
+    value = sampler.for_type("array", None)
+    value.append(1)
+    assert sampler.for_type("array", None) == [None, None]
+
+
+def test_invalid_bounds_are_reported_by_hypothesis():
+    with pytest.raises(Exception, match="min_value"):
+        ValueSampler().integer(10, 1)
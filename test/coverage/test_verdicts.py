@@ -0,0 +1,126 @@
+import threading
+from itertools import count
+
+import jsonschema_rs
+import pytest
+
+from schemathesis.generation.coverage import (
+    CANDIDATES_BATCH_SIZE,
+    _batched,
+    _get_sub_schema_verdicts,
+    are_invalid_for_oneOf,
+    are_valid_for_others,
+)
+from schemathesis.generation.verdicts import ValidationVerdicts, verdict_key
+from schemathesis.transport.serialization import Binary
+
+
+class CountingValidator:
+    def __init__(self, schema):
+        self.validator = jsonschema_rs.Draft7Validator(schema)
+        self.calls = []
+
+    def is_valid(self, value):
+        self.calls.append(value)
+        return self.validator.is_valid(value)
+
+
+def test_verdicts_are_memoized():
+    validator = CountingValidator({"type": "object", "required": ["a"]})
+    verdicts = ValidationVerdicts(validator)
+    assert not verdicts.is_valid({"b": 1, "c": 2})
+    # Key order does not matter
+    assert not verdicts.is_valid({"c": 2, "b": 1})
+    assert verdicts.is_valid({"a": 1})
+    assert validator.calls == [{"b": 1, "c": 2}, {"a": 1}]
+
+
+def test_batch_validates_distinct_values_once():
+    validator = CountingValidator({"type": "integer"})
+    verdicts = ValidationVerdicts(validator)
+    assert verdicts.is_valid(1)
+    assert verdicts.are_valid([1, "1", True, "1", 2.5]) == [True, False, False, False, False]
+    assert validator.calls == [1, "1", True, 2.5]
+    assert len(verdicts) == 4
+
+
+def test_oldest_verdicts_are_evicted():
+    verdicts = ValidationVerdicts(jsonschema_rs.Draft7Validator({}), max_size=2)
+    verdicts.are_valid([1, 2, 3])
+    assert len(verdicts) == 2
+
+
+def test_concurrent_checks_evict_safely():
+    verdicts = ValidationVerdicts(jsonschema_rs.Draft7Validator({}), max_size=8)
+    errors = []
+
+    def check(worker):
+        try:
+            for idx in range(500):
+                verdicts.is_valid([worker, idx])
+        except Exception as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=check, args=(worker,)) for worker in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors
+    assert len(verdicts) == 8
+
+
+def test_candidates_are_consumed_lazily():
+    values = count()
+    batches = _batched(values)
+    assert next(batches) == list(range(CANDIDATES_BATCH_SIZE))
+    # Only the first batch is taken from the source
+    assert next(values) == CANDIDATES_BATCH_SIZE
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (True, (bool, True)),
+        (1, (int, 1)),
+        ({"b": [1], "a": None}, '{"a":null,"b":[1]}'),
+        ({"a": b"1"}, None),
+        (Binary(b"1"), None),
+    ],
+)
+def test_verdict_key(value, expected):
+    assert verdict_key(value) == expected
+
+
+def test_sub_schema_verdicts_are_shared():
+    assert _get_sub_schema_verdicts({"type": "string", "minLength": 1}) is _get_sub_schema_verdicts(
+        {"minLength": 1, "type": "string"}
+    )
+
+
+SUB_SCHEMAS = [{"type": "integer"}, {"type": "number", "minimum": 5}, {"type": "string"}]
+VALUES = [1, 10, 2.5, 7.5, "a", None, Binary(b"x"), [1]]
+
+
+def is_valid_for_others(value, idx, validators):
+    if isinstance(value, Binary):
+        return False
+    return any(validator.is_valid(value) for vidx, validator in enumerate(validators) if vidx != idx)
+
+
+def is_invalid_for_oneOf(value, idx, validators):
+    if isinstance(value, Binary):
+        return True
+    return sum(validator.is_valid(value) for vidx, validator in enumerate(validators) if vidx != idx) != 1
+
+
+@pytest.mark.parametrize("idx", range(len(SUB_SCHEMAS)))
+def test_batched_checks_match_per_value_checks(idx):
+    validators = [jsonschema_rs.Draft7Validator(schema) for schema in SUB_SCHEMAS]
+    verdicts = [ValidationVerdicts(validator) for validator in validators]
+    assert are_valid_for_others(VALUES, idx, verdicts) == [
+        is_valid_for_others(value, idx, validators) for value in VALUES
+    ]
+    assert are_invalid_for_oneOf(VALUES, idx, verdicts) == [
+        is_invalid_for_oneOf(value, idx, validators) for value in VALUES
+    ]
@@ -869,6 +869,58 @@ def test_deduplication(ctx, response_factory):
     )
 
 
+def test_recorder_indexes(ctx, response_factory):
+    schema = ctx.openapi.build_schema(
+        {
+            "/users": {"post": {"responses": {"201": {"description": "OK"}}}},
+            "/users/{id}": {
+                "get": {"responses": {"200": {"description": "OK"}}},
+                "delete": {"responses": {"204": {"description": "OK"}}},
+            },
+        }
+    )
+    schema = schemathesis.openapi.from_dict(schema)
+    create = schema["/users"]["POST"]
+    get = schema["/users/{id}"]["GET"]
+    delete = schema["/users/{id}"]["DELETE"]
+    recorder = ScenarioRecorder(label="test")
+
+    def record(operation, parent, status_code):
+        case = operation.Case(path_parameters={"id": 1} if "{id}" in operation.path else None)
+        recorder.record_case(
+            parent_id=parent.id if parent is not None else None, case=case, transition=None, is_transition_applied=False
+        )
+        response = Response.from_requests(response_factory.requests(status_code=status_code), True)
+        recorder.record_response(case_id=case.id, response=response)
+        return case
+
+    root = record(create, None, 201)
+    first = record(get, root, 200)
+    removed = record(delete, first, 204)
+    second = record(get, root, 404)
+    after = record(get, removed, 200)
+    other_root = record(create, None, 500)
+
+    # Trees are traversed depth-first, in execution order
+    assert [case.id for case in recorder.find_related(case_id=second.id)] == [root.id, first.id, removed.id, after.id]
+    # The case itself & its descendants are not included
+    assert [case.id for case in recorder.find_related(case_id=first.id)] == [root.id, second.id]
+    assert recorder.find_root(case_id=after.id) == root.id
+    assert recorder.find_root(case_id=other_root.id) == other_root.id
+    assert recorder.find_position(case_id=removed.id) == 2
+
+    def find(method, **kwargs):
+        return [case.id for case in recorder.find_successful_cases(operation_filter=lambda m, _: m == method, **kwargs)]
+
+    # Only successful responses are indexed
+    assert find("POST") == [root.id]
+    assert find("GET") == [first.id, after.id]
+    # And the range is exclusive
+    assert find("GET", after=first.id) == [after.id]
+    assert find("GET", after=root.id, before=after.id) == [first.id]
+    assert find("GET", after="unknown") == []
+
+
 @pytest.fixture(params=["2.0", "3.0"])
 def schema_with_optional_headers(ctx, request):
     if request.param == "2.0":
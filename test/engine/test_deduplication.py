@@ -0,0 +1,153 @@
+import pytest
+
+import schemathesis
+from schemathesis.config import WorkersMode
+from schemathesis.core import NOT_SET
+from schemathesis.engine import events, from_schema
+from schemathesis.engine.deduplication import OutcomeCache, fingerprint
+from schemathesis.engine.phases.unit._process_pool import is_supported as is_process_mode_supported
+
+
+@pytest.fixture
+def operation(ctx):
+    schema = ctx.openapi.build_schema(
+        {
+            "/users/{user_id}": {
+                "post": {
+                    "parameters": [
+                        {"name": "user_id", "in": "path", "required": True, "schema": {"type": "integer"}},
+                        {"name": "q", "in": "query", "schema": {"type": "string"}},
+                        {"name": "X-Key", "in": "header", "schema": {"type": "string"}},
+                    ],
+                    "requestBody": {
+                        "content": {"application/json": {"schema": {"type": "object"}}},
+                    },
+                    "responses": {"200": {"description": "OK"}},
+                }
+            }
+        }
+    )
+    return schemathesis.openapi.from_dict(schema)["/users/{user_id}"]["POST"]
+
+
+def test_fingerprint_ignores_case_id(operation):
+    # Every case has a unique ID that is sent in a header
+    first = operation.Case(path_parameters={"user_id": 1}, body={"a": 1})
+    second = operation.Case(path_parameters={"user_id": 1}, body={"a": 1})
+    assert fingerprint(first) == fingerprint(second)
+
+
+def test_fingerprint_is_canonical(operation):
+    first = operation.Case(path_parameters={"user_id": 1}, headers={"X-Key": "v"}, body={"a": 1, "b": [1, 2]})
+    second = operation.Case(path_parameters={"user_id": 1}, headers={"x-key": "v"}, body={"b": [1, 2], "a": 1})
+    assert fingerprint(first) == fingerprint(second)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"path_parameters": {"user_id": 2}},
+        {"query": {"q": "x"}},
+        {"headers": {"X-Key": "v"}},
+        {"body": {"a": "1"}},
+        {"body": [1]},
+        {"body": (1,)},
+    ],
+)
+def test_fingerprint_differs(operation, kwargs):
+    base = {"path_parameters": {"user_id": 1}, "body": {"a": 1}}
+    assert fingerprint(operation.Case(**base)) != fingerprint(operation.Case(**{**base, **kwargs}))
+
+
+@pytest.mark.parametrize("sanitize", [True, False])
+def test_fingerprint_sanitization(operation, sanitize):
+    operation.schema.config.output.sanitization.update(enabled=sanitize)
+    first = operation.Case(path_parameters={"user_id": 1}, headers={"Authorization": "Bearer A"})
+    second = operation.Case(path_parameters={"user_id": 1}, headers={"Authorization": "Bearer B"})
+    # Sanitized values are not distinguishable in reproduction commands, and cases are unique in the same way
+    assert (fingerprint(first) == fingerprint(second)) is sanitize
+
+
+@pytest.mark.parametrize(
+    ("first", "second"),
+    [
+        # `requests` sends only keys of nested mappings
+        ({"q": {"x": 1}}, {"q": {"x": 2}}),
+        ({"q": [{"x": 1}, "y"]}, {"q": [{"x": 2}, "y"]}),
+        ({"q": [1, None, 2]}, {"q": ("1", "2")}),
+        ({"q": [[1, 2]]}, {"q": [[1, 2]]}),
+    ],
+)
+def test_fingerprint_matches_sent_query(operation, first, second):
+    first = operation.Case(path_parameters={"user_id": 1}, query=first)
+    second = operation.Case(path_parameters={"user_id": 1}, query=second)
+    assert first.as_curl_command() == second.as_curl_command()
+    assert fingerprint(first) == fingerprint(second)
+
+
+def test_outcome_cache():
+    cache = OutcomeCache(capacity=2)
+    error = ValueError("Error")
+    assert cache.get(b"a") is NOT_SET
+    cache.store(b"a", None)
+    cache.store(b"b", error)
+    assert cache.get(b"a") is None
+    # The least recently used entry is evicted
+    cache.store(b"c", None)
+    assert len(cache) == 2
+    assert cache.get(b"b") is NOT_SET
+    assert cache.get(b"c") is None
+    statistic = cache.statistic
+    assert (statistic.hits, statistic.misses, statistic.evictions) == (2, 2, 1)
+    # Clearing keeps the statistic
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.statistic.hits == 2
+
+
+@pytest.mark.operations("success")
+def test_statistic_is_reported(real_app_schema):
+    real_app_schema.config.generation.update(unique_inputs=True, max_examples=5)
+    real_app_schema.config.phases.update(phases=["fuzzing"])
+    event = list(from_schema(real_app_schema).execute())[-1]
+    assert isinstance(event, events.EngineFinished)
+    assert event.deduplication is not None
+    assert event.deduplication.misses > 0
+
+
+def test_outcome_cache_fork_and_merge():
+    parent = OutcomeCache(capacity=10)
+    parent.store(b"a", None)
+    assert parent.get(b"a") is None
+    # A copy inherited by a worker process
+    worker = OutcomeCache(capacity=10)
+    worker.store(b"a", None)
+    worker.fork()
+    assert worker.get(b"a") is None
+    worker.store(b"b", ValueError("Error"))
+    statistic, entries = worker.export()
+    # Only its own statistic & outcomes are exported
+    assert (statistic.hits, statistic.misses) == (1, 0)
+    assert [key for key, _ in entries] == [b"b"]
+    parent.merge(statistic, entries)
+    assert isinstance(parent.get(b"b"), ValueError)
+    assert (parent.hits, parent.misses) == (3, 0)
+
+
+@pytest.mark.skipif(not is_process_mode_supported(), reason="Requires `fork`")
+@pytest.mark.operations("success")
+def test_statistic_is_reported_from_worker_processes(real_app_schema):
+    real_app_schema.config.update(workers=2, workers_mode=WorkersMode.PROCESS)
+    real_app_schema.config.generation.update(unique_inputs=True, max_examples=5)
+    real_app_schema.config.phases.update(phases=["examples", "fuzzing"])
+    event = list(from_schema(real_app_schema).execute())[-1]
+    assert isinstance(event, events.EngineFinished)
+    assert event.deduplication is not None
+    assert event.deduplication.misses > 0
+
+
+@pytest.mark.operations("success")
+def test_no_statistic_without_unique_inputs(real_app_schema):
+    real_app_schema.config.phases.update(phases=["fuzzing"])
+    event = list(from_schema(real_app_schema).execute())[-1]
+    assert event.deduplication is None
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import platform
+import threading
+from contextlib import asynccontextmanager
 from dataclasses import asdict
 from typing import TYPE_CHECKING
 from unittest.mock import ANY
@@ -16,6 +18,7 @@ from schemathesis.config import SchemathesisWarning
 from schemathesis.core import SCHEMATHESIS_TEST_CASE_HEADER
 from schemathesis.core.transport import USER_AGENT
 from schemathesis.engine import Status, events, from_schema
+from schemathesis.engine.control import ExecutionControl
 from schemathesis.engine.phases import PhaseName
 from schemathesis.engine.recorder import Request
 from schemathesis.generation import GenerationMode
@@ -91,6 +94,20 @@ def test_execute(app, real_app_schema):
     assert_request(app, 1, "GET", "/api/success", headers)
 
 
+@pytest.mark.operations("success", "create_user", "get_user")
+def test_operations_are_built_once(mocker, real_app_schema):
+    spy = mocker.spy(real_app_schema, "_iter_operations")
+    EventStream(
+        real_app_schema,
+        phases=[PhaseName.EXAMPLES, PhaseName.COVERAGE, PhaseName.FUZZING, PhaseName.STATEFUL_TESTING],
+        max_examples=1,
+    ).execute()
+    # Links are not injected, therefore all phases share the same operations
+    assert spy.call_count == 1
+    # The registry is used only during the run
+    assert real_app_schema._operation_registry is None
+
+
 @pytest.mark.parametrize("workers", [1, 2])
 def test_interactions(openapi3_base_url, real_app_schema, workers):
     stream = EventStream(real_app_schema, workers=workers).execute()
@@ -220,6 +237,40 @@ def test_root_url():
     stream.assert_no_failures()
 
 
+def test_asgi_client_is_reused():
+    lifespan_events = []
+    calls = []
+
+    @asynccontextmanager
+    async def lifespan(_):
+        lifespan_events.append("startup")
+        yield
+        lifespan_events.append("shutdown")
+
+    app = FastAPI(lifespan=lifespan)
+
+    @app.get("/items")
+    def items(limit: int = 0):
+        calls.append(limit)
+        return {}
+
+    schema = schemathesis.openapi.from_asgi("/openapi.json", app=app)
+    stream = execute(schema, phases=[PhaseName.FUZZING], max_examples=10)
+    stream.assert_no_failures()
+    # Then the app lifespan runs once for the whole phase, and is shut down at the end
+    assert len(calls) > 1
+    assert lifespan_events == ["startup", "shutdown"]
+
+
+@pytest.mark.operations("success")
+def test_wsgi_app(flask_app):
+    schema = schemathesis.openapi.from_wsgi("/schema.yaml", flask_app)
+    stream = execute(schema, phases=[PhaseName.FUZZING], max_examples=5)
+    stream.assert_no_errors()
+    stream.assert_no_failures()
+    assert stream.find_all_interactions()
+
+
 def test_execute_with_headers(app, real_app_schema):
     # When headers are specified for the `execute` call
     headers = {"Authorization": "Bearer 123"}
@@ -1358,3 +1409,19 @@ def test_stateful_phase_missing_deserializer_warnings(ctx, openapi3_base_url):
     warning_messages = {(w.operation_label, w.status_code, w.content_type) for w in warning_event.warnings}
     assert ("POST /users", "201", "application/msgpack") in warning_messages
     assert ("GET /users/{userId}", "200", "application/msgpack") in warning_messages
+
+
+def test_failures_are_counted_from_multiple_threads():
+    control = ExecutionControl(stop_event=threading.Event(), max_failures=4000)
+
+    def count():
+        for _ in range(1000):
+            control.count_failure()
+
+    threads = [threading.Thread(target=count) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert control._failures_counter == 4000
+    assert control.has_reached_the_failure_limit
@@ -1,12 +1,19 @@
 import threading
-from queue import Queue
 
 import pytest
 
 import schemathesis
-from schemathesis.engine.phases.unit._layered_scheduler import LayeredScheduler
+from schemathesis.core.errors import InvalidSchema
+from schemathesis.core.result import Err, Ok
+from schemathesis.engine.context import EngineContext
+from schemathesis.engine.phases import Phase, PhaseName, unit
+from schemathesis.engine.phases.unit._cost import CostScheduler, estimate_costs
+from schemathesis.engine.phases.unit._dependency_scheduler import DependencyScheduler
 from schemathesis.engine.phases.unit._ordering import compute_operation_layers
-from schemathesis.specs.openapi.stateful.dependencies.layers import compute_dependency_layers
+from schemathesis.specs.openapi.stateful.dependencies.layers import (
+    compute_acyclic_dependencies,
+    compute_dependency_layers,
+)
 
 
 def test_restful_heuristic_ordering(ctx):
@@ -56,7 +63,7 @@ def test_restful_heuristic_ordering(ctx):
         assert "DELETE" in layer_2_methods
 
 
-def test_layered_scheduler_single_layer(ctx):
+def test_dependency_scheduler_without_dependencies(ctx):
     schema_dict = ctx.openapi.build_schema(
         {
             "/health": {"get": {"responses": {"200": {"description": "OK"}}}},
@@ -68,24 +75,24 @@ def test_layered_scheduler_single_layer(ctx):
     operations = list(loaded.get_all_operations())
     ops = [op.ok() for op in operations]
 
-    scheduler = LayeredScheduler([ops])
+    scheduler = DependencyScheduler(ops, {})
 
-    # Should be able to get both operations
+    # Both operations are available without waiting for each other
     result1 = scheduler.next_operation()
     assert result1 is not None
 
     result2 = scheduler.next_operation()
     assert result2 is not None
 
-    # Layer exhausted - with single worker, returns None immediately
-    result3 = scheduler.next_operation()
-    assert result3 is None
+    # All operations dispatched
+    assert scheduler.next_operation() is None
 
 
-def test_layered_scheduler_multiple_layers(ctx):
+def test_dependency_scheduler_waits_for_producers(ctx):
     schema_dict = ctx.openapi.build_schema(
         {
             "/users": {"post": {"responses": {"201": {"description": "Created"}}}},
+            "/products": {"post": {"responses": {"201": {"description": "Created"}}}},
             "/users/{id}": {
                 "get": {
                     "parameters": [{"in": "path", "name": "id", "required": True, "schema": {"type": "integer"}}],
@@ -95,32 +102,29 @@ def test_layered_scheduler_multiple_layers(ctx):
         }
     )
     loaded = schemathesis.openapi.from_dict(schema_dict)
+    ops = {op.ok().label: op.ok() for op in loaded.get_all_operations()}
 
-    operations = list(loaded.get_all_operations())
-    ops = [op.ok() for op in operations]
-
-    # Manually create layers: POST first, then GET
-    post_ops = [op for op in ops if op.method.upper() == "POST"]
-    get_ops = [op for op in ops if op.method.upper() == "GET"]
-
-    scheduler = LayeredScheduler([post_ops, get_ops])
+    scheduler = DependencyScheduler(
+        [ops["POST /users"], ops["POST /products"], ops["GET /users/{id}"]],
+        {"GET /users/{id}": {"POST /users"}},
+        errors=[InvalidSchema("Broken")],
+    )
 
-    # Get POST operation from layer 0
-    result = scheduler.next_operation()
-    assert result is not None
-    assert result.ok().method.upper() == "POST"
+    create_user = scheduler.next_operation()
+    assert create_user.ok().label == "POST /users"
+    create_product = scheduler.next_operation()
+    assert create_product.ok().label == "POST /products"
 
-    # Layer 0 exhausted, automatically advances to layer 1
-    result = scheduler.next_operation()
-    assert result is not None
-    assert result.ok().method.upper() == "GET"
+    # The consumer is released once its producer is finished, without waiting for unrelated operations
+    scheduler.finish(create_user)
+    assert scheduler.next_operation().ok().label == "GET /users/{id}"
 
-    # All layers exhausted
-    result = scheduler.next_operation()
-    assert result is None
+    # Schema errors are returned after all operations are dispatched
+    assert isinstance(scheduler.next_operation(), Err)
+    assert scheduler.next_operation() is None
 
 
-def test_layered_scheduler_multi_worker_coordination(ctx):
+def test_dependency_scheduler_multi_worker_coordination(ctx):
     schema_dict = ctx.openapi.build_schema(
         {
             "/users/{id}": {
@@ -149,24 +153,31 @@ def test_layered_scheduler_multi_worker_coordination(ctx):
     )
     loaded = schemathesis.openapi.from_dict(schema_dict)
 
-    operations = list(loaded.get_all_operations())
-    ops = [op.ok() for op in operations]
-
-    post_ops = [op for op in ops if op.method.upper() == "POST"]
-    get_ops = [op for op in ops if op.method.upper() == "GET"]
-    delete_ops = [op for op in ops if op.method.upper() == "DELETE"]
+    ops = [op.ok() for op in loaded.get_all_operations()]
+    dependencies = {
+        "GET /users/{id}": {"POST /users"},
+        "DELETE /users/{id}": {"GET /users/{id}"},
+        "GET /products/{id}": {"POST /products"},
+        "DELETE /products/{id}": {"GET /products/{id}"},
+    }
 
-    scheduler = LayeredScheduler([post_ops, get_ops, delete_ops])
+    scheduler = DependencyScheduler(ops, dependencies)
 
-    results_queue = Queue()
+    finished = []
+    lock = threading.Lock()
+    violations = []
 
     def worker():
         while True:
             result = scheduler.next_operation()
             if result is None:
                 break
-            op = result.ok()
-            results_queue.put((threading.get_ident(), op.method.upper(), op.path))
+            label = result.ok().label
+            with lock:
+                violations.extend(label for dependency in dependencies.get(label, ()) if dependency not in finished)
+            with lock:
+                finished.append(label)
+            scheduler.finish(result)
 
     threads = []
     workers_num = 3
@@ -178,19 +189,32 @@ def test_layered_scheduler_multi_worker_coordination(ctx):
     for t in threads:
         t.join(timeout=5.0)
 
-    all_results = []
-    while not results_queue.empty():
-        all_results.append(results_queue.get())
-
-    assert len(all_results) == len(post_ops) + len(get_ops) + len(delete_ops)
+    # Every operation starts only after its producers are finished
+    assert not violations
+    assert sorted(finished) == sorted(op.label for op in ops)
 
-    methods = [method for _, method, _ in all_results]
-    paths = [path for _, _, path in all_results]
 
-    assert sorted(methods) == sorted(["POST"] * len(post_ops) + ["GET"] * len(get_ops) + ["DELETE"] * len(delete_ops))
+def test_dependency_scheduler_stop(ctx):
+    schema_dict = ctx.openapi.build_schema(
+        {
+            "/users": {"post": {"responses": {"201": {"description": "Created"}}}},
+            "/users/{id}": {
+                "get": {
+                    "parameters": [{"in": "path", "name": "id", "required": True, "schema": {"type": "integer"}}],
+                    "responses": {"200": {"description": "OK"}},
+                }
+            },
+        }
+    )
+    loaded = schemathesis.openapi.from_dict(schema_dict)
+    ops = [op.ok() for op in loaded.get_all_operations()]
+    stop_event = threading.Event()
 
-    expected_paths = sorted([op.path for op in post_ops + get_ops + delete_ops])
-    assert sorted(paths) == expected_paths
+    scheduler = DependencyScheduler(ops, {"GET /users/{id}": {"POST /users"}}, stop_event=stop_event)
+    assert scheduler.next_operation().ok().label == "POST /users"
+    # The producer is still running, waiting workers are released when the run is stopped
+    stop_event.set()
+    assert scheduler.next_operation() is None
 
 
 def test_dependency_layers_restful_order_within_layer(ctx):
@@ -564,3 +588,101 @@ def test_cycle_detection_inferred_dependencies(ctx, operations, expected_layers)
     assert len(layers) == len(expected_layers)
     for i, expected_layer in enumerate(expected_layers):
         assert set(layers[i]) == expected_layer
+
+    # Producers of each operation are in earlier layers, operations in cycles do not wait for each other
+    positions = {label: idx for idx, layer in enumerate(layers) for label in layer}
+    dependencies = compute_acyclic_dependencies(graph)
+    assert dependencies is not None
+    for label, producers in dependencies.items():
+        assert all(positions[producer] < positions[label] for producer in producers)
+
+
+COST_SCHEMA = {
+    "/health": {"get": {"responses": {"200": {"description": "OK"}}}},
+    "/users": {
+        "post": {
+            "requestBody": {
+                "required": True,
+                "content": {
+                    "application/json": {
+                        "schema": {
+                            "type": "object",
+                            "properties": {
+                                "name": {"type": "string"},
+                                "contact": {"oneOf": [{"type": "string"}, {"type": "integer"}, {"type": "null"}]},
+                            },
+                        }
+                    }
+                },
+            },
+            "responses": {"201": {"description": "Created"}},
+        }
+    },
+    "/users/{id}": {
+        "get": {
+            "parameters": [{"in": "path", "name": "id", "required": True, "schema": {"type": "integer"}}],
+            "responses": {"200": {"description": "OK"}},
+        }
+    },
+}
+
+
+def test_cost_scheduler_longest_first(ctx):
+    schema = schemathesis.openapi.from_dict(ctx.openapi.build_schema(COST_SCHEMA))
+    operations = list(schema.get_all_operations())
+    error = Err(InvalidSchema("Broken"))
+    costs = estimate_costs(
+        [result.ok() for result in operations], config=schema.config, phase=PhaseName.FUZZING, durations={}
+    )
+    scheduler = CostScheduler([error, *operations], costs)
+
+    order = []
+    while (result := scheduler.next_operation()) is not None:
+        order.append(result.ok().label if isinstance(result, Ok) else result.err())
+    # The biggest schema goes first, schema errors are reported last
+    assert order == ["POST /users", "GET /users/{id}", "GET /health", error.err()]
+
+
+def test_cost_estimate_prefers_measured_durations(ctx):
+    schema = schemathesis.openapi.from_dict(ctx.openapi.build_schema(COST_SCHEMA))
+    schema.config.generation.update(max_examples=10)
+    operations = [result.ok() for result in schema.get_all_operations()]
+    static = estimate_costs(operations, config=schema.config, phase=PhaseName.FUZZING, durations={})
+
+    costs = estimate_costs(
+        operations,
+        config=schema.config,
+        phase=PhaseName.FUZZING,
+        durations={"GET /health": 0.5, "GET /users/{id}": 0.1, "DELETE /unknown": 100.0},
+    )
+    # Measured durations per test case are multiplied by the number of examples in the phase
+    assert costs["GET /health"] == pytest.approx(5.0)
+    assert costs["GET /users/{id}"] == pytest.approx(1.0)
+    # Other estimates are scaled to the measured ones
+    scale = 6.0 / (static["GET /health"] + static["GET /users/{id}"])
+    assert costs["POST /users"] == pytest.approx(static["POST /users"] * scale)
+    assert "DELETE /unknown" not in costs
+
+
+def test_skipped_scenarios_are_not_measured(ctx):
+    schema = schemathesis.openapi.from_dict(
+        ctx.openapi.build_schema(
+            {
+                "/health": {"get": {"responses": {"200": {"description": "OK"}}}},
+                "/users": {
+                    "get": {
+                        "parameters": [{"in": "query", "name": "q", "schema": {"type": "string"}, "example": "x"}],
+                        "responses": {"200": {"description": "OK"}},
+                    }
+                },
+            }
+        )
+    )
+    schema.config.update(base_url="http://127.0.0.1:1")
+    schema.config.phases.update(phases=["examples"])
+    engine = EngineContext(schema=schema, stop_event=threading.Event())
+    phase = Phase(name=PhaseName.EXAMPLES, is_supported=True, is_enabled=True)
+    list(unit.execute(engine, phase))
+    # The operation without examples is skipped and its duration is unknown
+    assert "GET /health" not in engine.durations
+    assert engine.durations["GET /users"] > 0
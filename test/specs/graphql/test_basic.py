@@ -428,6 +428,26 @@ def test_negative_mode_fallback_to_positive(graphql_schema):
         assert case.meta.generation.mode == GenerationMode.POSITIVE
 
     test_()
+    # And the infeasible negative mode is not tried again
+    assert len(graphql_schema._negative_infeasible) == 1
+
+
+def test_body_strategies_are_reused(graphql_schema):
+    operation = graphql_schema["Query"]["getBooks"]
+
+    @given(operation.as_strategy())
+    @settings(max_examples=5)
+    def test_(case):
+        pass
+
+    test_()
+    test_()
+    # Then one body strategy is built for all draws in all tests
+    assert len(graphql_schema._body_strategies) == 1
+    # And changing generation settings builds a new one
+    graphql_schema.config.generation.update(allow_x00=False)
+    test_()
+    assert len(graphql_schema._body_strategies) == 2
 
 
 def _make_graphql_case_with_mode(graphql_schema, mode):
@@ -511,6 +511,7 @@ def engine_factory(app_factory, app_runner, stop_event):
         include=None,
         headers=None,
         max_response_time=None,
+        workers=1,
     ):
         app = app_factory(**(app_kwargs or {}))
         port = app_runner.run_flask_app(app)
@@ -529,7 +530,7 @@ def engine_factory(app_factory, app_runner, stop_event):
             max_examples=max_examples,
             maximize=maximize,
         )
-        config.projects.override.update(headers=headers)
+        config.projects.override.update(headers=headers, workers=workers)
         schema = schemathesis.openapi.from_url(f"http://127.0.0.1:{port}/openapi.json", config=config)
 
         if hypothesis_settings is not None:
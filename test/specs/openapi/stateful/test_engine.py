@@ -68,6 +68,16 @@ def test_find_independent_5xx(engine_factory, max_failures):
         assert len(result.failures) == 2
 
 
+def test_parallel_workers(engine_factory):
+    engine = engine_factory(app_kwargs={"independent_500": True}, checks=[not_a_server_error], workers=2)
+    result = collect_result(engine)
+    assert result.events[-1].status == Status.FAILURE, result.errors
+    # Then each worker runs its own state machine
+    assert len([event for event in result.events if isinstance(event, events.SuiteStarted)]) >= 2
+    # And both failures are found, possibly by several workers
+    assert len({check.failure_info.failure for check in result.failures}) == 2
+
+
 def test_works_on_single_link(engine_factory):
     engine = engine_factory(app_kwargs={"single_link": True, "independent_500": True})
     result = collect_result(engine)
@@ -771,6 +781,16 @@ def test_unique_inputs(engine_factory):
             assert len(cases) == len(set(cases)), "Duplicate cases found"
 
 
+def test_unique_inputs_fingerprint_error(engine_factory, mocker):
+    # When computing a fingerprint fails
+    mocker.patch("schemathesis.engine.phases.stateful._executor.fingerprint", side_effect=ValueError("Unserializable"))
+    engine = engine_factory(unique_inputs=True, max_steps=5, max_examples=1)
+    result = collect_result(engine)
+    # Then the original error is reported
+    assert result.errors
+    assert all(isinstance(event.value, ValueError) for event in result.errors), result.errors
+
+
 def test_ignored_auth_valid(engine_factory):
     # When auth works properly
     token = "Test"
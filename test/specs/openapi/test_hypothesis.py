@@ -11,6 +11,7 @@ import schemathesis
 from schemathesis.config import GenerationConfig
 from schemathesis.core.parameters import ParameterLocation
 from schemathesis.generation import GenerationMode
+from schemathesis.generation.meta import TestPhase
 from schemathesis.openapi.generation import filters
 from schemathesis.openapi.generation.filters import is_valid_header
 from schemathesis.specs.openapi import _hypothesis, formats
@@ -67,6 +68,35 @@ def test_explicit_attributes(operation, values, expected):
     test()
 
 
+def test_generation_plan_is_reused(operation):
+    @given(operation.as_strategy())
+    @settings(max_examples=5)
+    def test(case):
+        pass
+
+    test()
+    # Then the plan is compiled once and reused by all draws
+    assert list(operation.generation_plans) == [(GenerationMode.POSITIVE, TestPhase.FUZZING)]
+    plan = operation.generation_plans[(GenerationMode.POSITIVE, TestPhase.FUZZING)]
+    assert _hypothesis.get_generation_plan(operation, GenerationMode.POSITIVE, TestPhase.FUZZING) is plan
+    assert plan.media_types["application/json"][0][0] == "application/json"
+    # And other modes get their own plans
+    assert _hypothesis.get_generation_plan(operation, GenerationMode.NEGATIVE, TestPhase.FUZZING) is not plan
+
+
+def test_generation_plan_falls_back_to_positive(make_openapi_3_schema):
+    schema = make_openapi_3_schema(
+        body={"required": True, "content": {"application/json": {"schema": {}}}},
+        parameters=[{"in": "header", "name": "h1", "required": True, "schema": {"type": "string"}}],
+    )
+    operation = schemathesis.openapi.from_dict(schema)["/users"]["POST"]
+    plan = _hypothesis.get_generation_plan(operation, GenerationMode.NEGATIVE, TestPhase.FUZZING)
+    # Any string is a valid header and any value is a valid body
+    assert plan.generators[ParameterLocation.HEADER] == GenerationMode.POSITIVE
+    assert plan.generators[ParameterLocation.QUERY] == GenerationMode.NEGATIVE
+    assert plan.body_generator == GenerationMode.POSITIVE
+
+
 @pytest.fixture
 def deeply_nested_schema(ctx):
     return ctx.openapi.build_schema(
@@ -0,0 +1,117 @@
+from collections import Counter
+
+import pytest
+from flask import Flask, request
+
+import schemathesis
+from schemathesis.core.schema_cache import SchemaCache
+from schemathesis.specs.openapi.prefetch import RemoteFetcher, iter_remote_urls
+
+BASE_URI = "http://127.0.0.1/root.json"
+
+
+@pytest.mark.parametrize(
+    ("document", "expected"),
+    [
+        ({"$ref": "#/definitions/Local"}, []),
+        ({"$ref": "other.json#/User"}, [("http://127.0.0.1/other.json", True)]),
+        ({"$ref": "https://example.com/a.yaml"}, [("https://example.com/a.yaml", True)]),
+        ({"$ref": "file:///tmp/a.yaml"}, []),
+        ({"examples": {"a": {"externalValue": "answer.json"}}}, [("http://127.0.0.1/answer.json", False)]),
+        # Data keywords may contain anything
+        ({"example": {"$ref": "other.json"}, "enum": [{"$ref": "other.json"}]}, []),
+        # Property names are not keywords
+        (
+            {"properties": {"$ref": {"type": "string"}, "example": {"$ref": "other.json"}}},
+            [("http://127.0.0.1/other.json", True)],
+        ),
+        (
+            {"allOf": [{"$ref": "a.json"}, {"$ref": "b.json#/B"}]},
+            [("http://127.0.0.1/b.json", True), ("http://127.0.0.1/a.json", True)],
+        ),
+    ],
+)
+def test_iter_remote_urls(document, expected):
+    assert list(iter_remote_urls(document, BASE_URI)) == expected
+
+
+@pytest.fixture
+def remote_documents(ctx, app_runner):
+    app = Flask(__name__)
+    hits = Counter()
+
+    @app.before_request
+    def count():
+        hits[request.path] += 1
+
+    @app.route("/openapi.json")
+    def openapi():
+        return ctx.openapi.build_schema(
+            {
+                "/users": {
+                    "post": {
+                        "requestBody": {
+                            "content": {
+                                "application/json": {
+                                    "schema": {"$ref": "/user.json#/User"},
+                                    "examples": {"answer": {"externalValue": "/answer.json"}},
+                                }
+                            },
+                        },
+                        "responses": {"200": {"description": "OK"}},
+                    }
+                }
+            }
+        )
+
+    @app.route("/user.json")
+    def user():
+        # Refers to another remote document
+        return {"User": {"type": "object", "properties": {"name": {"$ref": "/name.json"}}}}
+
+    @app.route("/name.json")
+    def name():
+        if request.headers.get("If-None-Match") == '"name-v1"':
+            return "", 304
+        return {"type": "string"}, 200, {"ETag": '"name-v1"'}
+
+    @app.route("/answer.json")
+    def answer():
+        return "42"
+
+    port = app_runner.run_flask_app(app)
+    return f"http://127.0.0.1:{port}", hits
+
+
+def test_prefetch_fetches_each_document_once(remote_documents):
+    base_url, hits = remote_documents
+    schema = schemathesis.openapi.from_url(f"{base_url}/openapi.json")
+    # When the resolver is created
+    assert schema.resolver is not None
+    # Then all remote documents, including nested ones, are fetched up front
+    assert hits == {"/openapi.json": 1, "/user.json": 1, "/name.json": 1, "/answer.json": 1}
+    # And resolving them or loading examples does not send more requests
+    for operation in schema.get_all_operations():
+        operation.ok().get_strategies_from_examples()
+    assert hits == {"/openapi.json": 1, "/user.json": 1, "/name.json": 1, "/answer.json": 1}
+
+
+def test_revalidates_cached_documents(remote_documents, tmp_path):
+    base_url, hits = remote_documents
+    cache = SchemaCache(tmp_path)
+    url = f"{base_url}/name.json"
+    first = RemoteFetcher(cache).fetch(url)
+    # When the document is fetched again in another run
+    second = RemoteFetcher(cache).fetch(url)
+    # Then it is revalidated with a conditional request and served from the cache
+    assert hits["/name.json"] == 2
+    assert second.status_code == 200
+    assert second.content == first.content
+
+
+def test_fetch_many_does_not_raise(remote_documents):
+    base_url, _ = remote_documents
+    fetcher = RemoteFetcher()
+    # Connection errors are reported only when the document is needed
+    fetcher.fetch_many(["http://127.0.0.1:1/unavailable.json", f"{base_url}/answer.json"])
+    assert fetcher.fetch(f"{base_url}/answer.json").content == b"42"
@@ -241,6 +241,26 @@ def test_collect_values(user_data_source, payloads, expected):
         assert values == expected
 
 
+def test_collect_values_tracks_evictions(user_data_source):
+    repository = user_data_source.repository
+    requirement = ParameterRequirement(USER_RESOURCE, "id")
+    # The index is built before anything is stored and then updated incrementally
+    assert user_data_source._collect_values(requirement) == []
+    for i in range(PER_CONTEXT_CAPACITY + 1):
+        repository.record_response(operation=POST_USERS, status_code=CREATED, payload={"id": str(i % 2 or i)})
+    values = user_data_source._collect_values(requirement)
+    # The oldest instance is evicted, but the same value is still provided by other instances
+    assert "0" not in values
+    assert values.count("1") == 1
+    assert len(values) == len({instance.data["id"] for instance in repository.iter_instances(USER_RESOURCE)})
+    # Evicting whole contexts removes their values too
+    for i in range(MAX_CONTEXTS_PER_TYPE):
+        repository.record_response(
+            operation=POST_USERS, status_code=CREATED, payload={"id": f"owner-{i}"}, context={"owner": i}
+        )
+    assert user_data_source._collect_values(requirement) == [f"owner-{i}" for i in range(MAX_CONTEXTS_PER_TYPE)]
+
+
 @pytest.mark.parametrize(
     ("field", "payloads", "expected_values"),
     [
@@ -0,0 +1,94 @@
+import asyncio
+
+import httpx
+import pytest
+import requests
+
+import schemathesis
+from schemathesis.core.errors import IncorrectUsage
+from schemathesis.engine import Status, events
+from schemathesis.engine.phases import PhaseName
+from schemathesis.generation import GenerationMode
+from schemathesis.transport.httpx import HTTPX_TRANSPORT
+from test.utils import EventStream
+
+
+@pytest.mark.operations("success")
+async def test_concurrent_calls_share_client(real_app_schema):
+    operation = real_app_schema["/success"]["GET"]
+    async with httpx.AsyncClient() as client:
+        responses = await asyncio.gather(*(operation.Case().call_async(session=client) for _ in range(10)))
+    assert [response.status_code for response in responses] == [200] * 10
+    assert responses[0].json() == {"success": True}
+
+
+@pytest.mark.operations("payload")
+async def test_payload(real_app_schema):
+    case = real_app_schema["/payload"]["POST"].Case(body={"name": "John"}, media_type="application/json")
+    response = await case.call_async()
+    assert response.status_code == 200
+    assert response.json() == {"name": "John"}
+    case.validate_response(response)
+
+
+@pytest.mark.operations("headers")
+def test_blocking_send(real_app_schema):
+    case = real_app_schema["/headers"]["GET"].Case(headers={"X-Key": "foo"}, query={"q": "1", "empty": None})
+    response = HTTPX_TRANSPORT.send(case, cookies={"session": "abc"})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["X-Key"] == "foo"
+    assert data["Cookie"] == "session=abc"
+    # Query is not duplicated & `None` values are skipped as in `requests`
+    assert response.request.url.endswith("/headers?q=1")
+
+
+@pytest.mark.operations("success")
+async def test_hooks(real_app_schema):
+    calls = []
+
+    @schemathesis.hook
+    def after_call(context, case, response):
+        calls.append(response.status_code)
+
+    await real_app_schema["/success"]["GET"].Case().call_async()
+    assert calls == [200]
+
+
+@pytest.mark.operations("success")
+async def test_in_process_app_requires_session(wsgi_app_schema):
+    with pytest.raises(IncorrectUsage, match="does not run in-process apps"):
+        await wsgi_app_schema["/success"]["GET"].Case().call_async()
+
+
+@pytest.mark.operations("success")
+def test_network_errors_are_raised_as_in_requests(real_app_schema):
+    real_app_schema.config.update(base_url="http://127.0.0.1:1/api")
+    case = real_app_schema["/success"]["GET"].Case()
+    with pytest.raises(requests.ConnectionError) as exc_info:
+        HTTPX_TRANSPORT.send(case)
+    assert isinstance(exc_info.value.__cause__, httpx.ConnectError)
+    assert exc_info.value.request.url == "http://127.0.0.1:1/api/success"
+
+
+@pytest.mark.operations("basic", "success")
+def test_engine_shares_client(real_app_schema, mocker):
+    real_app_schema.config.update(http_client="httpx")
+    send = mocker.spy(httpx.Client, "request")
+    stream = EventStream(
+        real_app_schema,
+        auth=("test", "test"),
+        workers=2,
+        max_examples=5,
+        phases=[PhaseName.FUZZING],
+        modes=[GenerationMode.POSITIVE],
+    ).execute()
+    scenarios = stream.find_all(events.ScenarioFinished)
+    assert scenarios
+    assert all(event.status == Status.SUCCESS for event in scenarios)
+    responses = [interaction.response for event in scenarios for interaction in event.recorder.interactions.values()]
+    # Basic auth from the config is sent with every request
+    assert {response.status_code for response in responses} == {200}
+    assert send.call_count == len(responses)
+    # All workers use the same client
+    assert len({call.args[0] for call in send.call_args_list}) == 1
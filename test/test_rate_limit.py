@@ -1,10 +1,27 @@
+import asyncio
 import threading
+import time
+from datetime import timedelta
 
 import pytest
+import requests
 from pyrate_limiter import Duration
 
 import schemathesis.graphql
-from schemathesis.core.rate_limit import parse_units
+from schemathesis.core.errors import InvalidRateLimit
+from schemathesis.core.rate_limit import (
+    INITIAL_CONCURRENCY,
+    MAX_RETRIES,
+    MAX_RETRY_AFTER,
+    AdaptiveLimiter,
+    RequestSlot,
+    build_limiter,
+    parse_retry_after,
+    parse_units,
+    send_with_rate_limit,
+    send_with_rate_limit_async,
+    validate,
+)
 
 
 @pytest.mark.parametrize(
@@ -52,3 +69,196 @@ def test_parse_units(rate_str, expected_limit, expected_interval):
     limit, interval = parse_units(rate_str)
     assert limit == expected_limit
     assert interval == expected_interval
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (None, None),
+        ("", None),
+        ("5", 5.0),
+        ("3600", MAX_RETRY_AFTER),
+        ("Wed, 21 Oct 2015 07:28:00 GMT", 0.0),
+        ("soon", None),
+    ],
+)
+def test_parse_retry_after(value, expected):
+    assert parse_retry_after(value) == expected
+
+
+@pytest.mark.parametrize("value", ["adaptive", "adaptive:10/s"])
+def test_validate_adaptive(value):
+    validate(value)
+
+
+def test_validate_adaptive_invalid():
+    with pytest.raises(InvalidRateLimit):
+        validate("adaptive:fast")
+
+
+def test_build_adaptive_limiter():
+    assert build_limiter("adaptive").max_rate is None
+    assert build_limiter("adaptive:10/s").max_rate == 10
+    assert build_limiter("adaptive:120/m").max_rate == 2
+
+
+def release(limiter, **outcome):
+    limiter.acquire("host")
+    slot = RequestSlot()
+    slot.record(**outcome)
+    limiter.release("host", slot)
+    return limiter.get_state("host")
+
+
+def test_adaptive_decrease_on_overload():
+    limiter = AdaptiveLimiter()
+    state = release(limiter, status_code=200, elapsed=0.1, retry_after=None)
+    assert state.rate is None
+    concurrency = state.concurrency
+    state = release(limiter, status_code=429, elapsed=0.1, retry_after="2")
+    assert state.concurrency == concurrency / 2
+    # The rate starts to be limited based on the observed throughput
+    assert state.rate is not None
+    assert state.blocked_until > time.monotonic() + 1
+    assert state.in_flight == 0
+
+
+def test_adaptive_decrease_on_slow_response():
+    limiter = AdaptiveLimiter()
+    release(limiter, status_code=200, elapsed=0.2, retry_after=None)
+    concurrency = limiter.get_state("host").concurrency
+    state = release(limiter, status_code=200, elapsed=5.0, retry_after=None)
+    assert state.concurrency < concurrency
+
+
+def test_adaptive_increase_is_capped():
+    limiter = AdaptiveLimiter(max_rate=10)
+    state = limiter.get_state("host")
+    state.rate = 9.95
+    release(limiter, status_code=200, elapsed=0.01, retry_after=None)
+    assert state.rate == 10
+    assert state.concurrency > INITIAL_CONCURRENCY
+
+
+def test_adaptive_failure_releases_slot():
+    limiter = AdaptiveLimiter()
+    with pytest.raises(ConnectionError):
+        with limiter.slot("host"):
+            raise ConnectionError
+    state = limiter.get_state("host")
+    assert state.in_flight == 0
+    assert state.concurrency == INITIAL_CONCURRENCY / 2
+
+
+def test_adaptive_interrupt_is_not_overload():
+    limiter = AdaptiveLimiter()
+    with pytest.raises(KeyboardInterrupt):
+        with limiter.slot("host"):
+            raise KeyboardInterrupt
+    state = limiter.get_state("host")
+    assert state.in_flight == 0
+    assert state.concurrency == INITIAL_CONCURRENCY
+
+
+async def test_async_waiter_is_woken_up_by_release():
+    limiter = AdaptiveLimiter()
+    state = limiter.get_state("host")
+    state.concurrency = 1
+    limiter.acquire("host")
+    waiter = asyncio.create_task(limiter.acquire_async("host"))
+    await asyncio.sleep(0.05)
+    assert not waiter.done()
+    # When another thread finishes its request
+    thread = threading.Thread(target=limiter.release, args=("host", RequestSlot()))
+    thread.start()
+    thread.join()
+    # Then the waiting task takes the slot without polling
+    await asyncio.wait_for(waiter, timeout=1)
+    assert state.in_flight == 1
+    assert not limiter._async_waiters
+
+
+async def test_async_acquire_waits_for_the_next_request_time():
+    limiter = AdaptiveLimiter()
+    state = limiter.get_state("host")
+    state.rate = 20
+    await limiter.acquire_async("host")
+    start = time.monotonic()
+    await limiter.acquire_async("host")
+    assert time.monotonic() - start >= 0.04
+
+
+def make_response(status_code, headers=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    response.elapsed = timedelta(milliseconds=10)
+    return response
+
+
+def test_retry_after_is_honored():
+    responses = [make_response(429, {"Retry-After": "0"}), make_response(503, {"Retry-After": "0"}), make_response(200)]
+    limiter = AdaptiveLimiter()
+    response = send_with_rate_limit(limiter, "http://127.0.0.1", lambda: responses.pop(0))
+    assert response.status_code == 200
+    assert not responses
+
+
+def test_retries_are_limited():
+    calls = 0
+
+    def send():
+        nonlocal calls
+        calls += 1
+        return make_response(429, {"Retry-After": "0"})
+
+    response = send_with_rate_limit(AdaptiveLimiter(), "http://127.0.0.1", send)
+    assert response.status_code == 429
+    assert calls == MAX_RETRIES + 1
+
+
+def test_fixed_rate_limit_does_not_retry():
+    responses = [make_response(429, {"Retry-After": "0"}), make_response(200)]
+    response = send_with_rate_limit(build_limiter("10/s"), "http://127.0.0.1", lambda: responses.pop(0))
+    assert response.status_code == 429
+
+
+async def test_retry_after_is_honored_async():
+    responses = [make_response(429, {"Retry-After": "0"}), make_response(200)]
+
+    async def send():
+        return responses.pop(0)
+
+    response = await send_with_rate_limit_async(AdaptiveLimiter(), "http://127.0.0.1", send)
+    assert response.status_code == 200
+
+
+def test_retry_after_is_honored_wsgi():
+    from flask import Flask, jsonify
+
+    app = Flask(__name__)
+    calls = 0
+
+    @app.route("/schema.json")
+    def schema():
+        return jsonify(
+            {
+                "openapi": "3.0.2",
+                "info": {"title": "Test", "version": "0.1.0"},
+                "paths": {"/items": {"get": {"responses": {"200": {"description": "OK"}}}}},
+            }
+        )
+
+    @app.route("/items")
+    def items():
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            return jsonify({}), 429, {"Retry-After": "0"}
+        return jsonify({})
+
+    api_schema = schemathesis.openapi.from_wsgi("/schema.json", app=app)
+    api_schema.config.update(rate_limit="adaptive")
+    response = api_schema["/items"]["GET"].Case().call()
+    assert response.status_code == 200
+    assert calls == 2
@@ -1,10 +1,12 @@
 import platform
+import threading
 
 import jsonschema_rs
 import pytest
 import requests
 
 import schemathesis
+from schemathesis.core import deserialization
 from schemathesis.core.errors import InvalidSchema, LoaderError, OperationNotFound
 from schemathesis.core.failures import Failure
 from schemathesis.core.parameters import ParameterLocation
@@ -14,6 +16,7 @@ from schemathesis.openapi.checks import JsonSchemaError
 from schemathesis.specs.openapi import adapter
 from schemathesis.specs.openapi._operation_lookup import OperationLookup
 from schemathesis.specs.openapi.adapter import validators
+from schemathesis.specs.openapi.adapter.responses import MAX_CACHED_OUTCOMES, ValidationOutcomes
 
 
 @pytest.mark.parametrize("base_path", ["/v1", "/v1/"])
@@ -137,6 +140,57 @@ def test_not_recoverable_schema_error(simple_schema):
         list(schema.get_all_operations())
 
 
+def test_operation_registry(simple_schema):
+    schema = schemathesis.openapi.from_dict(simple_schema)
+    # By default, operations are built on every call
+    assert list(schema.get_all_operations())[0].ok() is not list(schema.get_all_operations())[0].ok()
+    # When the registry is enabled
+    schema.enable_operation_registry()
+    first = [result.ok() for result in schema.get_all_operations()]
+    # Then the same instances are returned
+    second = [result.ok() for result in schema.get_all_operations()]
+    assert len(second) == len(first)
+    assert all(a is b for a, b in zip(first, second, strict=True))
+    # And they are rebuilt after invalidation
+    schema.invalidate_operations()
+    assert list(schema.get_all_operations())[0].ok() is not first[0]
+
+
+def test_operation_registry_ignores_raw_schema_changes(simple_schema):
+    schema = schemathesis.openapi.from_dict(simple_schema)
+    with schema.operation_registry():
+        assert len(list(schema.get_all_operations())) == 1
+        # Changes to the raw schema are not visible until operations are invalidated
+        schema.raw_schema["paths"]["/bar"] = {"get": RESPONSES}
+        assert len(list(schema.get_all_operations())) == 1
+        schema.invalidate_operations()
+        assert len(list(schema.get_all_operations())) == 2
+    # The registry is disabled after the block
+    schema.raw_schema["paths"]["/baz"] = {"get": RESPONSES}
+    assert len(list(schema.get_all_operations())) == 3
+
+
+def test_operation_registry_after_load_schema_hook(simple_schema):
+    @schemathesis.hook
+    def after_load_schema(context, schema):
+        schema.enable_operation_registry()
+        assert len(list(schema.get_all_operations())) == 1
+        schema.raw_schema["paths"]["/bar"] = {"get": RESPONSES}
+
+    schema = schemathesis.openapi.from_dict(simple_schema)
+    # Operations built inside the hook are not reused
+    assert len(list(schema.get_all_operations())) == 2
+
+
+def test_operation_registry_does_not_store_errors(simple_schema):
+    del simple_schema["paths"]
+    schema = schemathesis.openapi.from_dict(simple_schema)
+    schema.enable_operation_registry()
+    for _ in range(2):
+        with pytest.raises(InvalidSchema):
+            list(schema.get_all_operations())
+
+
 def test_invalid_parameter_schema_type(ctx):
     # When a parameter's schema is not a dict or bool (e.g., a list)
     raw_schema = ctx.openapi.build_schema(
@@ -403,6 +457,133 @@ def test_response_validation_selects_media_type(ctx):
     schema.validate_response(operation, make_response("application/problem+json", '{"title": "Oops"}'))
 
 
+def test_response_validation_outcomes_are_reused(ctx, mocker):
+    raw_schema = ctx.openapi.build_schema(
+        {
+            "/value": {
+                "get": {
+                    "responses": {
+                        "default": {
+                            "description": "Error",
+                            "content": {
+                                "application/json": {
+                                    "schema": {"type": "object", "required": ["id"]},
+                                }
+                            },
+                        }
+                    }
+                }
+            }
+        }
+    )
+    schema = schemathesis.openapi.from_dict(raw_schema)
+    operation = schema["/value"]["GET"]
+    request = requests.Request("GET", "http://example.com/value").prepare()
+
+    def make_response(status_code: int, payload: bytes) -> HTTPResponse:
+        return HTTPResponse(
+            status_code=status_code,
+            headers={"content-type": ["application/json"]},
+            content=payload,
+            request=request,
+            elapsed=0.0,
+            verify=False,
+        )
+
+    deserialize = mocker.spy(deserialization, "deserialize_response")
+    raised = []
+    for status_code in (400, 404, 400):
+        with pytest.raises(JsonSchemaError) as exc_info:
+            schema.validate_response(operation, make_response(status_code, b'{"error": "Oops"}'))
+        # Notes added for one test case don't leak into failures for other ones
+        assert not hasattr(exc_info.value, "__notes__")
+        exc_info.value.__notes__ = ["Reproduce with ..."]
+        raised.append(exc_info.value)
+    schema.validate_response(operation, make_response(400, b'{"id": 1}'))
+    schema.validate_response(operation, make_response(400, b'{"id": 1}'))
+    # Identical bodies are deserialized and validated only once
+    assert deserialize.call_count == 2
+    # Every response gets its own failure with the same details
+    assert raised[0] == raised[1] == raised[2]
+    assert raised[0] is not raised[1]
+    assert raised[0].message == raised[2].message
+    schema.validate_response(operation, make_response(400, b'{"id": 2}'))
+    assert deserialize.call_count == 3
+
+
+def test_response_validation_outcomes_are_stored_safely_from_multiple_threads():
+    outcomes = ValidationOutcomes()
+    errors = []
+
+    def store(worker):
+        try:
+            for idx in range(500):
+                outcomes.set("application/json", f"{worker}-{idx}".encode(), [])
+        except Exception as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=store, args=(worker,)) for worker in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors
+    assert len(outcomes) == MAX_CACHED_OUTCOMES
+
+
+class OpaqueFailure(Failure):
+    def __init__(self, *, details):
+        super().__init__(operation="GET /value", title="Opaque", message=str(details))
+
+
+def test_response_validation_outcomes_skip_failures_that_cannot_be_recreated():
+    outcomes = ValidationOutcomes()
+    outcomes.set("application/json", b"{}", [OpaqueFailure(details=42)])
+    assert outcomes.get("application/json", b"{}") is None
+
+
+def test_response_validation_outcomes_with_custom_deserializer(ctx, mocker):
+    raw_schema = ctx.openapi.build_schema(
+        {
+            "/value": {
+                "get": {
+                    "responses": {
+                        "200": {
+                            "description": "OK",
+                            "content": {"application/vnd.custom": {"schema": {"type": "integer"}}},
+                        }
+                    }
+                }
+            }
+        }
+    )
+    schema = schemathesis.openapi.from_dict(raw_schema)
+    operation = schema["/value"]["GET"]
+    request = requests.Request("GET", "http://example.com/value").prepare()
+    calls = []
+
+    def custom(ctx, response):
+        calls.append(ctx.case)
+        return len(calls)
+
+    deserialization.register_deserializer(custom, "application/vnd.custom")
+    try:
+        for _ in range(2):
+            response = HTTPResponse(
+                status_code=200,
+                headers={"content-type": ["application/vnd.custom"]},
+                content=b"1",
+                request=request,
+                elapsed=0.0,
+                verify=False,
+            )
+            schema.validate_response(operation, response)
+    finally:
+        deserialization.unregister_deserializer("application/vnd.custom")
+    # Custom deserializers may depend on the test case, their results are not reused
+    assert len(calls) == 2
+
+
 @pytest.mark.parametrize(
     ("content_type", "payload", "expect_error"),
     [